@@ -3,6 +3,8 @@
 This package contains all API versions and shared utilities.
 Currently provides:
 - v1: Version 1.0.0 API endpoints
+- graphql: Strawberry GraphQL schema (a top-level ``graphql`` package would
+  shadow graphql-core, which Strawberry imports)
 
 Future versions will be added as separate modules (v2, v3, etc).
 """
@@ -7,7 +7,3 @@ This package provides a complete GraphQL API for the Naga SIS system with:
 - Mutations for data modification operations
 - Advanced filtering and pagination support
 """
-
-from .schema import schema
-
-__all__ = ["schema"]
\ No newline at end of file
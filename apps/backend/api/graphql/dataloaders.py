@@ -0,0 +1,118 @@
+"""Per-request loaders for GraphQL resolvers.
+
+Each request gets a fresh ``GraphQLLoaders`` on its Strawberry context.
+List resolvers queue the keys of all parents up front, so a page of
+students costs one query per relation instead of one per student.
+"""
+
+from collections import defaultdict
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import Any
+
+from django.db.models import F
+from strawberry.django.context import StrawberryDjangoContext
+from strawberry.django.views import GraphQLView
+
+from apps.common.dataloaders import BatchLoader
+from apps.enrollment.models import ClassHeaderEnrollment
+from apps.finance.models import Invoice, Payment
+from apps.grading.models import ClassPartGrade
+from apps.people.models import StudentProfile
+from apps.scheduling.models import ClassHeader
+
+
+class GraphQLLoaders:
+    """Loaders shared by all resolvers of one GraphQL request.
+
+    Loading enrollments also queues their class headers and grades, so
+    enrollment fields resolved for a whole page of students are fetched
+    in one query per relation.
+    """
+
+    def __init__(self):
+        self.students: BatchLoader[int, StudentProfile | None] = BatchLoader(self._load_students)
+        self.enrollments_by_student: BatchLoader[int, list[ClassHeaderEnrollment]] = BatchLoader(
+            self._load_enrollments_by_student, list
+        )
+        self.class_headers: BatchLoader[int, ClassHeader | None] = BatchLoader(self._load_class_headers)
+        self.grades_by_enrollment: BatchLoader[int, list[ClassPartGrade]] = BatchLoader(
+            self._load_grades_by_enrollment, list
+        )
+        self.invoices_by_student: BatchLoader[int, list[Invoice]] = BatchLoader(self._load_invoices_by_student, list)
+        self.payments_by_student: BatchLoader[int, list[Payment]] = BatchLoader(self._load_payments_by_student, list)
+
+    def prime_students(self, students: Iterable[StudentProfile]) -> None:
+        """Cache already-fetched students and queue their related rows."""
+        student_ids = []
+        for student in students:
+            self.students.prime(student.pk, student)
+            student_ids.append(student.pk)
+        self.enrollments_by_student.queue(student_ids)
+        self.invoices_by_student.queue(student_ids)
+        self.payments_by_student.queue(student_ids)
+
+    def _load_students(self, keys: list[int]) -> dict[int, StudentProfile]:
+        return StudentProfile.objects.select_related("person").in_bulk(keys)
+
+    def _load_enrollments_by_student(self, keys: list[int]) -> dict[int, list[ClassHeaderEnrollment]]:
+        grouped: dict[int, list[ClassHeaderEnrollment]] = defaultdict(list)
+        enrollments = ClassHeaderEnrollment.objects.filter(student_id__in=keys).order_by("-created_at")
+        for enrollment in enrollments:
+            grouped[enrollment.student_id].append(enrollment)
+            self.class_headers.queue([enrollment.class_header_id])
+            self.grades_by_enrollment.queue([enrollment.pk])
+        return grouped
+
+    def _load_class_headers(self, keys: list[int]) -> dict[int, ClassHeader]:
+        return ClassHeader.objects.select_related("course", "term").in_bulk(keys)
+
+    def _load_grades_by_enrollment(self, keys: list[int]) -> dict[int, list[ClassPartGrade]]:
+        grouped: dict[int, list[ClassPartGrade]] = defaultdict(list)
+        grades = ClassPartGrade.objects.filter(enrollment_id__in=keys).select_related("class_part")
+        for grade in grades.order_by("entered_at"):
+            grouped[grade.enrollment_id].append(grade)
+        return grouped
+
+    def _load_invoices_by_student(self, keys: list[int]) -> dict[int, list[Invoice]]:
+        grouped: dict[int, list[Invoice]] = defaultdict(list)
+        for invoice in Invoice.objects.filter(student_id__in=keys).order_by("-issue_date"):
+            grouped[invoice.student_id].append(invoice)
+        return grouped
+
+    def _load_payments_by_student(self, keys: list[int]) -> dict[int, list[Payment]]:
+        grouped: dict[int, list[Payment]] = defaultdict(list)
+        payments = Payment.objects.filter(invoice__student_id__in=keys).annotate(student_pk=F("invoice__student_id"))
+        for payment in payments.order_by("-payment_date"):
+            grouped[payment.student_pk].append(payment)
+        return grouped
+
+
+@dataclass
+class GraphQLContext(StrawberryDjangoContext):
+    """Strawberry context carrying the request's loaders."""
+
+    loaders: GraphQLLoaders = field(default_factory=GraphQLLoaders)
+
+
+class LoaderGraphQLView(GraphQLView):
+    """GraphQL view that gives every request a fresh set of loaders."""
+
+    def get_context(self, request, response) -> GraphQLContext:
+        return GraphQLContext(request=request, response=response)
+
+
+def get_loaders(info: Any) -> GraphQLLoaders:
+    """Return the loaders for the current request.
+
+    Creates and attaches them when the schema is executed without
+    ``GraphQLContext``, e.g. via ``schema.execute_sync`` in tests.
+    """
+    context = info.context
+    if isinstance(context, dict):
+        return context.setdefault("loaders", GraphQLLoaders())
+    loaders = getattr(context, "loaders", None)
+    if loaders is None:
+        loaders = GraphQLLoaders()
+        context.loaders = loaders
+    return loaders
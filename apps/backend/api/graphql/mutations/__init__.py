@@ -0,0 +1 @@
+"""GraphQL mutation resolvers for the Naga SIS system."""
@@ -18,7 +18,7 @@ class FinanceMutations:
     @strawberry.mutation
     def process_pos_transaction(
         self,
-        info,
+        info: strawberry.Info,
         transaction_input: POSTransactionInput
     ) -> POSTransactionResult:
         """Process a point-of-sale transaction."""
@@ -48,7 +48,7 @@ class FinanceMutations:
     @strawberry.mutation
     def setup_payment_reminders(
         self,
-        info,
+        info: strawberry.Info,
         reminder_input: PaymentReminderInput
     ) -> PaymentReminderResult:
         """Setup automated payment reminders."""
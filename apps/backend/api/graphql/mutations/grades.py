@@ -21,7 +21,7 @@ class GradeMutations:
     @strawberry.mutation
     def update_grade(
         self,
-        info,
+        info: strawberry.Info,
         grade_update: GradeUpdateInput
     ) -> GradeUpdateResult:
         """Update a single grade."""
@@ -68,7 +68,7 @@ class GradeMutations:
     @strawberry.mutation
     def bulk_update_grades(
         self,
-        info,
+        info: strawberry.Info,
         bulk_update: BulkGradeUpdateInput
     ) -> List[GradeUpdateResult]:
         """Bulk update grades for a class."""
@@ -0,0 +1 @@
+"""GraphQL query resolvers for the Naga SIS system."""
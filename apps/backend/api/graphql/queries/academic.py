@@ -21,7 +21,7 @@ class AcademicQueries:
     """Academic-related GraphQL queries."""
 
     @strawberry.field
-    def class_header(self, info, class_id: strawberry.ID) -> Optional[ClassHeaderType]:
+    def class_header(self, info: strawberry.Info, class_id: strawberry.ID) -> Optional[ClassHeaderType]:
         """Get a single class header by ID."""
         try:
             class_header = ClassHeader.objects.select_related(
@@ -47,7 +47,7 @@ class AcademicQueries:
             return None
 
     @strawberry.field
-    def grade_spreadsheet(self, info, class_id: strawberry.ID) -> Optional[GradeSpreadsheetData]:
+    def grade_spreadsheet(self, info: strawberry.Info, class_id: strawberry.ID) -> Optional[GradeSpreadsheetData]:
         """Get grade spreadsheet data for a class."""
         try:
             class_header = get_object_or_404(ClassHeader, unique_id=class_id)
@@ -23,7 +23,7 @@ class AnalyticsQueries:
     @strawberry.field
     def enrollment_trends(
         self,
-        info,
+        info: strawberry.Info,
         months: int = 12,
         program_id: Optional[strawberry.ID] = None
     ) -> ChartData:
@@ -60,7 +60,7 @@ class AnalyticsQueries:
     @strawberry.field
     def custom_report(
         self,
-        info,
+        info: strawberry.Info,
         report_type: str,
         filters: Optional[ReportFiltersInput] = None
     ) -> CustomReportResult:
@@ -126,7 +126,7 @@ class AnalyticsQueries:
     @strawberry.field
     def predictive_insights(
         self,
-        info,
+        info: strawberry.Info,
         model_type: str = "student_success",
         filters: Optional[AnalyticsFiltersInput] = None
     ) -> PredictiveInsight:
@@ -177,7 +177,7 @@ class AnalyticsQueries:
     @strawberry.field
     def grade_distribution(
         self,
-        info,
+        info: strawberry.Info,
         class_id: strawberry.ID
     ) -> Optional[GradeDistribution]:
         """Get grade distribution for a class."""
@@ -19,7 +19,7 @@ class DashboardQueries:
     @strawberry.field
     def dashboard_metrics(
         self,
-        info,
+        info: strawberry.Info,
         date_range_days: int = 30
     ) -> DashboardMetrics:
         """Get comprehensive dashboard metrics."""
@@ -20,7 +20,7 @@ class FinanceQueries:
     @strawberry.field
     def financial_analytics(
         self,
-        info,
+        info: strawberry.Info,
         date_range_days: int = 30,
         include_forecasts: bool = True
     ) -> FinancialMetrics:
@@ -72,7 +72,7 @@ class FinanceQueries:
     @strawberry.field
     def scholarship_matches(
         self,
-        info,
+        info: strawberry.Info,
         student_id: strawberry.ID,
         min_match_score: float = 0.5
     ) -> List[ScholarshipMatchType]:
@@ -3,26 +3,29 @@
 import strawberry
 from typing import List, Optional
 from django.core.cache import cache
-from django.db.models import Q, Prefetch
+from django.db.models import Q
 
-from apps.people.models import StudentProfile, Person
-from apps.enrollment.models import ClassHeaderEnrollment
+from apps.people.models import StudentProfile
 
+from ..dataloaders import get_loaders
 from ..types.student import (
     StudentType,
     StudentConnection,
     StudentSearchFilters,
     PersonType,
     StudentAnalytics,
-    EnrollmentInfo,
-    PaymentInfo,
     TimelineEvent
 )
 from ..types.common import PaginationInput
 
 
 def convert_student_to_graphql(student: StudentProfile) -> StudentType:
-    """Convert Django model to GraphQL type."""
+    """Convert Django model to GraphQL type.
+
+    Only the student row and its person are read here. Enrollments, grades,
+    invoices and payments are resolved lazily through the request's
+    loaders, so converting a page of students issues no extra queries.
+    """
 
     # Convert person
     person = PersonType(
@@ -37,28 +40,13 @@ def convert_student_to_graphql(student: StudentProfile) -> StudentType:
         preferred_gender=student.person.preferred_gender
     )
 
-    # Get enrollments
-    enrollments = []
-    for enrollment in student.enrollments.all()[:10]:  # Limit to recent 10
-        enrollments.append(EnrollmentInfo(
-            unique_id=str(enrollment.unique_id),
-            course_code=enrollment.class_header.course.code,
-            course_name=enrollment.class_header.course.name,
-            term=enrollment.class_header.term.name if enrollment.class_header.term else None,
-            status=enrollment.status,
-            enrolled_date=enrollment.created_at
-        ))
-
-    # Get payments (mock for now)
-    payments = []
-
     # Get timeline (mock for now)
     timeline = []
 
     # Get analytics (simplified)
     analytics = StudentAnalytics(
         success_prediction=0.85,
-        risk_factors=["low_attendance"] if student.status == "at_risk" else [],
+        risk_factors=["low_attendance"] if student.current_status == "at_risk" else [],
         performance_trend="stable",
         attendance_rate=0.87,
         grade_average=3.2,
@@ -67,19 +55,17 @@ def convert_student_to_graphql(student: StudentProfile) -> StudentType:
     )
 
     return StudentType(
-        unique_id=str(student.unique_id),
-        student_id=student.student_id,
+        unique_id=str(student.person.unique_id),
+        student_id=str(student.student_id),
         person=person,
-        program=student.current_program.name if student.current_program else None,
-        level=student.current_level,
-        status=student.status,
+        program=None,
+        level=None,
+        status=student.current_status,
         photo_url=None,  # TODO: Get from photos
         analytics=analytics,
-        enrollments=enrollments,
-        payments=payments,
         timeline=timeline,
-        enrollment_count=len(enrollments),
-        last_activity=student.last_modified
+        last_activity=student.updated_at,
+        student_pk=student.pk
     )
 
 
@@ -88,20 +74,12 @@ class StudentQueries:
     """Student-related GraphQL queries."""
 
     @strawberry.field
-    def student(self, info, student_id: strawberry.ID) -> Optional[StudentType]:
+    def student(self, info: strawberry.Info, student_id: strawberry.ID) -> Optional[StudentType]:
         """Get a single student by ID."""
         try:
-            student = StudentProfile.objects.select_related(
-                'person', 'current_program'
-            ).prefetch_related(
-                Prefetch(
-                    'enrollments',
-                    queryset=ClassHeaderEnrollment.objects.select_related(
-                        'class_header__course', 'class_header__term'
-                    )
-                )
-            ).get(unique_id=student_id)
+            student = StudentProfile.objects.select_related('person').get(person__unique_id=student_id)
 
+            get_loaders(info).prime_students([student])
             return convert_student_to_graphql(student)
         except StudentProfile.DoesNotExist:
             return None
@@ -109,23 +87,14 @@ class StudentQueries:
     @strawberry.field
     def students(
         self,
-        info,
+        info: strawberry.Info,
         filters: Optional[StudentSearchFilters] = None,
         pagination: Optional[PaginationInput] = None
     ) -> StudentConnection:
         """Search and list students with advanced filtering."""
 
-        # Base query
-        queryset = StudentProfile.objects.select_related(
-            'person', 'current_program'
-        ).prefetch_related(
-            Prefetch(
-                'enrollments',
-                queryset=ClassHeaderEnrollment.objects.select_related(
-                    'class_header__course'
-                )
-            )
-        )
+        # Base query; related rows are batched by the request's loaders
+        queryset = StudentProfile.objects.select_related('person')
 
         # Apply filters
         if filters:
@@ -169,6 +138,7 @@ class StudentQueries:
         # In production, implement proper cursor-based pagination
         total_count = queryset.count()
         students = list(queryset[:page_size])
+        get_loaders(info).prime_students(students)
 
         # Convert to GraphQL types
         from ..types.student import StudentEdge, StudentPageInfo
@@ -194,7 +164,7 @@ class StudentQueries:
         )
 
     @strawberry.field
-    def student_analytics(self, info, student_id: strawberry.ID) -> Optional[StudentAnalytics]:
+    def student_analytics(self, info: strawberry.Info, student_id: strawberry.ID) -> Optional[StudentAnalytics]:
         """Get detailed analytics for a specific student."""
         cache_key = f"student_analytics_{student_id}"
         cached = cache.get(cache_key)
@@ -235,7 +205,7 @@ class StudentQueries:
     @strawberry.field
     def student_timeline(
         self,
-        info,
+        info: strawberry.Info,
         student_id: strawberry.ID,
         event_types: Optional[List[str]] = None,
         limit: int = 20
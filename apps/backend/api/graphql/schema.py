@@ -6,6 +6,7 @@ Strawberry GraphQL schema with comprehensive type definitions and resolvers.
 
 import strawberry
 from typing import Optional
+from django.conf import settings
 
 from .queries.student import StudentQueries
 from .queries.academic import AcademicQueries
@@ -18,6 +19,7 @@ from .mutations.grades import GradeMutations
 from .mutations.finance import FinanceMutations
 from .mutations.enhanced_grades import EnhancedGradeMutations
 
+from apps.common.graphql_cost import QueryCostLimiter
 from .subscriptions.real_time import RealTimeSubscriptions
 
 
@@ -71,10 +73,10 @@ schema = strawberry.Schema(
     mutation=Mutation,
     subscription=Subscription,
     extensions=[
-        # Add performance monitoring
-        strawberry.extensions.QueryDepthLimiter(max_depth=10),
-        # Add query complexity analysis
-        # strawberry.extensions.QueryComplexityLimiter(max_complexity=1000),
+        # Reject deeply nested queries during validation
+        strawberry.extensions.QueryDepthLimiter(max_depth=settings.GRAPHQL_MAX_QUERY_DEPTH),
+        # Static cost analysis and per-user cost budgets
+        QueryCostLimiter,
     ]
 )
 
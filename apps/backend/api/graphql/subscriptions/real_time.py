@@ -0,0 +1,167 @@
+"""Real-time GraphQL subscriptions.
+
+Resolvers await channel-layer groups fed by
+:mod:`apps.common.realtime_publishers`; nothing here polls or sleeps.
+"""
+
+import strawberry
+from datetime import datetime
+from typing import AsyncGenerator, List, Optional
+
+from asgiref.sync import sync_to_async
+
+from apps.common.realtime import DASHBOARD_GROUP, grade_entry_group, payment_group, subscribe
+
+from ..types.academic import GradeType
+from ..types.analytics import DashboardMetrics
+from ..types.finance import CurrencyType, PaymentType
+
+CURRENCY_SYMBOLS = {"USD": "$", "KHR": "៛"}
+
+# Dashboard sections that change with each metric of the shared producer
+METRIC_SECTIONS = {
+    "total_students": ["student_metrics"],
+    "active_enrollments": ["student_metrics", "academic_metrics"],
+    "total_classes": ["academic_metrics"],
+    "pending_payments": ["financial_metrics"],
+}
+
+
+@strawberry.type
+class GradeUpdateNotification:
+    """Grade update notification for real-time collaboration."""
+    student_id: strawberry.ID
+    assignment_id: strawberry.ID
+    new_score: float
+    updated_by: str
+    timestamp: datetime
+    conflict: bool = False
+
+
+@strawberry.type
+class DashboardUpdate:
+    """Dashboard metrics update notification."""
+    metrics: DashboardMetrics
+    updated_fields: list[str]
+    timestamp: datetime
+
+
+def _dashboard_update(snapshot: dict, updated_fields: list[str]) -> DashboardUpdate:
+    """Build a dashboard update from a shared metrics snapshot envelope.
+
+    Shared metrics replace the matching values of the dashboard query;
+    sections the producer does not compute keep the query's values.
+    """
+    from ..queries.dashboard import DashboardQueries
+
+    shared = snapshot["metrics"]
+    metrics = DashboardQueries().dashboard_metrics(None, 30)
+    metrics.student_metrics.total_count.value = shared["total_students"]
+    if shared["total_classes"]:
+        metrics.academic_metrics.average_class_size = shared["active_enrollments"] / shared["total_classes"]
+    metrics.financial_metrics.pending_payments.value = shared["pending_payments"]
+    metrics.last_updated = datetime.fromisoformat(shared["last_updated"])
+
+    return DashboardUpdate(
+        metrics=metrics,
+        updated_fields=updated_fields,
+        timestamp=metrics.last_updated
+    )
+
+
+@strawberry.type
+class RealTimeSubscriptions:
+    """Real-time GraphQL subscriptions."""
+
+    @strawberry.subscription
+    async def grade_entry_updates(
+        self,
+        info: strawberry.Info,
+        class_id: strawberry.ID,
+        student_id: Optional[strawberry.ID] = None
+    ) -> AsyncGenerator[GradeUpdateNotification, None]:
+        """Subscribe to grade changes in a class, optionally for a single student."""
+
+        def matches(event: dict) -> bool:
+            return student_id is None or event.get("student_id") == str(student_id)
+
+        async for event in subscribe(grade_entry_group(class_id), predicate=matches):
+            yield GradeUpdateNotification(
+                student_id=event["student_id"],
+                assignment_id=event["class_part_id"],
+                new_score=event["score"] if event.get("score") is not None else 0.0,
+                updated_by=event.get("updated_by", ""),
+                timestamp=datetime.fromisoformat(event["timestamp"]),
+                conflict=event.get("conflict", False)
+            )
+
+    @strawberry.subscription
+    async def dashboard_metrics_updates(
+        self,
+        info: strawberry.Info,
+        fields: Optional[List[str]] = None
+    ) -> AsyncGenerator[DashboardUpdate, None]:
+        """Subscribe to dashboard metrics, optionally only for some metric sections.
+
+        Relays the snapshot and deltas broadcast by the shared producer in
+        ``apps.web_interface.dashboard_metrics``; subscribers never query.
+        """
+
+        from apps.web_interface.dashboard_metrics import (
+            apply_broadcast,
+            ensure_dashboard_producer,
+            get_dashboard_snapshot,
+        )
+
+        wanted = set(fields or [])
+        snapshot = await sync_to_async(get_dashboard_snapshot)()
+        await sync_to_async(ensure_dashboard_producer)()
+
+        sections = sorted({section for keys in METRIC_SECTIONS.values() for section in keys})
+        if not wanted or wanted.intersection(sections):
+            yield _dashboard_update(snapshot, sections)
+
+        async for message in subscribe(DASHBOARD_GROUP):
+            if message["version"] <= snapshot["version"]:
+                continue
+
+            updated = apply_broadcast(snapshot, message)
+            if updated is None:
+                # A delta was missed; catch up from the cached snapshot.
+                updated = await sync_to_async(get_dashboard_snapshot)()
+
+            changed = {
+                key for key, value in updated["metrics"].items() if snapshot["metrics"].get(key) != value
+            }
+            snapshot = updated
+            sections = sorted({section for key in changed for section in METRIC_SECTIONS.get(key, ())})
+            if sections and (not wanted or wanted.intersection(sections)):
+                yield _dashboard_update(snapshot, sections)
+
+    @strawberry.subscription
+    async def payment_notifications(
+        self,
+        info: strawberry.Info,
+        student_id: strawberry.ID
+    ) -> AsyncGenerator[PaymentType, None]:
+        """Subscribe to payment notifications for a student."""
+
+        async for event in subscribe(payment_group(student_id)):
+            currency = event.get("currency", "USD")
+
+            yield PaymentType(
+                unique_id=event["payment_id"],
+                amount=event["amount"],
+                currency=CurrencyType(
+                    code=currency,
+                    name=event.get("currency_name", currency),
+                    symbol=CURRENCY_SYMBOLS.get(currency, currency)
+                ),
+                payment_method=event["payment_method"],
+                status=event["status"],
+                payment_date=(
+                    datetime.fromisoformat(event["payment_date"])
+                    if event.get("payment_date") else datetime.now()
+                ),
+                notes=event.get("notes")
+            )
@@ -0,0 +1 @@
+"""GraphQL type definitions for the Naga SIS system."""
@@ -1,5 +1,6 @@
 """Common GraphQL types and utilities."""
 
+from enum import Enum
 from typing import Generic, List, Optional, TypeVar
 import strawberry
 from datetime import datetime
@@ -66,7 +67,7 @@ class TimeSeriesPoint:
 
 
 @strawberry.enum
-class SortDirection:
+class SortDirection(Enum):
     """Sort direction enumeration."""
     ASC = "asc"
     DESC = "desc"
@@ -0,0 +1,230 @@
+"""Student-related GraphQL types."""
+
+from typing import List, Optional
+import strawberry
+from datetime import datetime, date
+
+from ..dataloaders import get_loaders
+from .common import MetricValue, TimeSeriesPoint
+
+
+@strawberry.type
+class PersonType:
+    """Person information."""
+    unique_id: strawberry.ID
+    full_name: str
+    family_name: str
+    personal_name: str
+    khmer_name: Optional[str] = None
+    school_email: Optional[str] = None
+    personal_email: Optional[str] = None
+    date_of_birth: Optional[date] = None
+    preferred_gender: Optional[str] = None
+
+
+@strawberry.type
+class StudentAnalytics:
+    """Student analytics and predictions."""
+    success_prediction: float
+    risk_factors: List[str]
+    performance_trend: str  # "improving", "declining", "stable"
+    attendance_rate: float
+    grade_average: Optional[float] = None
+    payment_status: str
+    engagement_score: float
+
+
+@strawberry.type
+class PartGradeInfo:
+    """Grade for one class part of an enrollment."""
+    class_part: str
+    score: Optional[float] = None
+    letter_grade: Optional[str] = None
+    status: str
+    entered_at: Optional[datetime] = None
+
+
+@strawberry.type
+class EnrollmentInfo:
+    """Student enrollment information."""
+    unique_id: strawberry.ID
+    course_code: str
+    course_name: str
+    term: Optional[str] = None
+    status: str
+    enrolled_date: datetime
+    grade: Optional[str] = None
+    enrollment_pk: strawberry.Private[int]
+
+    @strawberry.field
+    def grades(self, info: strawberry.Info) -> List[PartGradeInfo]:
+        """Class part grades, batched across all enrollments in the request."""
+        return [
+            PartGradeInfo(
+                class_part=grade.class_part.name,
+                score=float(grade.numeric_score) if grade.numeric_score is not None else None,
+                letter_grade=grade.letter_grade or None,
+                status=grade.grade_status,
+                entered_at=grade.entered_at,
+            )
+            for grade in get_loaders(info).grades_by_enrollment.load(self.enrollment_pk)
+        ]
+
+
+@strawberry.type
+class PaymentInfo:
+    """Student payment information."""
+    unique_id: strawberry.ID
+    amount: str  # Decimal as string for precision
+    date: datetime
+    method: str
+    status: str
+    description: Optional[str] = None
+
+
+@strawberry.type
+class InvoiceInfo:
+    """Student invoice information."""
+    invoice_number: str
+    total_amount: str  # Decimal as string for precision
+    paid_amount: str  # Decimal as string for precision
+    due_date: date
+    status: str
+
+
+@strawberry.type
+class TimelineEvent:
+    """Student timeline event."""
+    event_type: str
+    description: str
+    timestamp: datetime
+    metadata: Optional[str] = None  # JSON string
+
+
+@strawberry.type
+class StudentType:
+    """Student information with analytics."""
+    unique_id: strawberry.ID
+    student_id: str
+    person: PersonType
+    program: Optional[str] = None
+    level: Optional[str] = None
+    status: str
+    photo_url: Optional[str] = None
+
+    # Analytics
+    analytics: Optional[StudentAnalytics] = None
+
+    # Related data
+    timeline: List[TimelineEvent]
+
+    # Metrics
+    last_activity: Optional[datetime] = None
+
+    # Search relevance (when used in search results)
+    match_score: Optional[float] = None
+
+    student_pk: strawberry.Private[int]
+
+    @strawberry.field
+    def enrollments(self, info: strawberry.Info, limit: int = 10) -> List[EnrollmentInfo]:
+        """Most recent class enrollments, batched across all students in the request."""
+        loaders = get_loaders(info)
+        enrollments = loaders.enrollments_by_student.load(self.student_pk)[:limit]
+        class_headers = loaders.class_headers.load_many(enrollment.class_header_id for enrollment in enrollments)
+
+        return [
+            EnrollmentInfo(
+                unique_id=str(enrollment.pk),
+                course_code=class_header.course.code,
+                course_name=class_header.course.title,
+                term=class_header.term.code if class_header.term else None,
+                status=enrollment.status,
+                enrolled_date=enrollment.created_at,
+                grade=enrollment.final_grade or None,
+                enrollment_pk=enrollment.pk,
+            )
+            for enrollment, class_header in zip(enrollments, class_headers, strict=True)
+        ]
+
+    @strawberry.field
+    def enrollment_count(self, info: strawberry.Info) -> int:
+        """Total number of class enrollments."""
+        return len(get_loaders(info).enrollments_by_student.load(self.student_pk))
+
+    @strawberry.field
+    def invoices(self, info: strawberry.Info) -> List[InvoiceInfo]:
+        """Invoices, batched across all students in the request."""
+        return [
+            InvoiceInfo(
+                invoice_number=invoice.invoice_number,
+                total_amount=str(invoice.total_amount),
+                paid_amount=str(invoice.paid_amount),
+                due_date=invoice.due_date,
+                status=invoice.status,
+            )
+            for invoice in get_loaders(info).invoices_by_student.load(self.student_pk)
+        ]
+
+    @strawberry.field
+    def payments(self, info: strawberry.Info) -> List[PaymentInfo]:
+        """Payments, batched across all students in the request."""
+        return [
+            PaymentInfo(
+                unique_id=str(payment.pk),
+                amount=str(payment.amount),
+                date=payment.payment_date,
+                method=payment.payment_method,
+                status=payment.status,
+                description=payment.notes or None,
+            )
+            for payment in get_loaders(info).payments_by_student.load(self.student_pk)
+        ]
+
+
+@strawberry.input
+class StudentSearchFilters:
+    """Search filters for students."""
+    query: Optional[str] = None
+    fuzzy_search: bool = False
+    program_ids: List[strawberry.ID] = strawberry.field(default_factory=list)
+    levels: List[str] = strawberry.field(default_factory=list)
+    statuses: List[str] = strawberry.field(default_factory=list)
+    risk_levels: List[str] = strawberry.field(default_factory=list)
+    has_overdue_payments: Optional[bool] = None
+    min_gpa: Optional[float] = None
+    max_gpa: Optional[float] = None
+
+
+@strawberry.type
+class StudentConnection:
+    """Paginated student results."""
+    edges: List["StudentEdge"]
+    page_info: "StudentPageInfo"
+    total_count: int
+
+
+@strawberry.type
+class StudentEdge:
+    """Student edge for pagination."""
+    node: StudentType
+    cursor: str
+
+
+@strawberry.type
+class StudentPageInfo:
+    """Student pagination info."""
+    has_next_page: bool
+    has_previous_page: bool
+    start_cursor: Optional[str] = None
+    end_cursor: Optional[str] = None
+
+
+@strawberry.type
+class StudentMetrics:
+    """Student-related metrics."""
+    total_count: MetricValue
+    new_this_week: MetricValue
+    at_risk_count: MetricValue
+    success_rate: MetricValue
+    enrollment_trends: List[TimeSeriesPoint]
\ No newline at end of file
@@ -20,7 +20,6 @@ from django.utils import timezone
 from ninja import Router, Schema
 from ninja.responses import Response
 
-from apps.attendance.models import RosterSync
 from apps.attendance.services import AttendanceCodeService, RosterSyncService
 
 # Import business logic from apps
@@ -209,7 +208,7 @@ def start_attendance_session(request, data: AttendanceSessionCreateSchema):
 @router.get("/teacher/class-roster/{class_part_id}", response=ClassRosterResponseSchema, auth=jwt_auth)
 def get_class_roster(request, class_part_id: int):
     """Get current class roster for teacher's mobile app.
-    Uses latest roster sync data.
+    Uses latest roster sync data, syncing first when no sync checked it today.
     """
     # Check teacher authorization using unified auth
     if not check_teacher_access(request.user):
@@ -223,33 +222,23 @@ def get_class_roster(request, class_part_id: int):
         if class_part.teacher != teacher:
             return Response({"error": "Not authorized for this class"}, status=403)
 
-        # Get latest roster sync
+        # Rebuild the roster from the latest checkpoint and deltas
         today = timezone.now().date()
-        roster_sync = (
-            RosterSync.objects.filter(
-                class_part=class_part,
-                sync_date=today,
-                is_successful=True,
-            )
-            .order_by("-sync_timestamp")
-            .first()
-        )
+        roster, roster_sync = RosterSyncService.get_current_roster(class_part)
 
-        if not roster_sync:
-            # Force sync if no recent data
-            RosterSyncService.sync_daily_rosters("MANUAL")
-            roster_sync = RosterSync.objects.filter(
-                class_part=class_part,
-                sync_date=today,
-                is_successful=True,
-            ).first()
+        if not roster_sync or (
+            roster_sync.sync_date != today and not RosterSyncService.checked_on(class_part.id, today)
+        ):
+            # Force sync if this class was never synced or no sync has checked it today
+            RosterSyncService.sync_class_parts([class_part.id], today, "MANUAL")
+            roster, roster_sync = RosterSyncService.get_current_roster(class_part)
 
         if not roster_sync:
             return Response({"error": "Unable to sync roster"}, status=500)
 
         # Format student data
         students = []
-        for student_data in roster_sync.enrollment_snapshot.get("roster", []):
+        for student_data in roster:
             students.append(
                 RosterStudentSchema(
                     student_id=student_data["student_id"],
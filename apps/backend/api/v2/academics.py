@@ -10,6 +10,7 @@ This module provides enhanced academic management endpoints with:
 """
 
 import logging
+from collections import defaultdict
 from datetime import datetime, timedelta
 from typing import List, Optional, Dict, Any
 from uuid import UUID
@@ -27,6 +28,8 @@ from apps.enrollment.models import ClassHeaderEnrollment
 from apps.attendance.models import AttendanceRecord
 from apps.curriculum.models import Course, Prerequisite
 from apps.academic_records.models import Transcript
+from apps.scheduling.overlaps import Overlap, find_overlaps
+from apps.scheduling.room_occupancy import MINUTES_PER_DAY, meeting_intervals
 
 from ..v1.auth import jwt_auth
 from .schemas import (
@@ -211,126 +214,186 @@ def update_grade_spreadsheet(request, class_id: UUID, grades_data: List[GradeEnt
         )
 
 
+CONFLICT_STATUSES = [
+    ClassHeaderEnrollment.EnrollmentStatus.ENROLLED,
+    ClassHeaderEnrollment.EnrollmentStatus.ACTIVE,
+]
+
+
+def _class_part_item(part: ClassPart) -> Dict[str, Any]:
+    class_header = part.class_session.class_header
+    return {
+        "class_id": class_header.id,
+        "class_part_id": part.id,
+        "course": f"{class_header.course.code} - {class_header.course.title}",
+        "section": class_header.section_id,
+        "meeting_days": part.meeting_days,
+        "start_time": part.start_time.strftime("%H:%M"),
+        "end_time": part.end_time.strftime("%H:%M"),
+    }
+
+
+def _overlap_conflict(
+    overlap: Overlap, parts: Dict[int, ClassPart], type: str, subject: str, suggestions: List[str], **extra: Any
+) -> ScheduleConflict:
+    start, end = overlap.start % MINUTES_PER_DAY, overlap.end % MINUTES_PER_DAY
+    return ScheduleConflict(
+        type=type,
+        severity="critical",
+        message=(
+            f"{subject} on {overlap.day} {start // 60:02d}:{start % 60:02d}-{end // 60:02d}:{end % 60:02d} "
+            f"({overlap.minutes} min overlap)"
+        ),
+        affected_items=[
+            {**_class_part_item(parts[overlap.first.part_id]), **extra},
+            {**_class_part_item(parts[overlap.second.part_id]), **extra},
+        ],
+        suggestions=suggestions,
+        day=overlap.day,
+        overlap_minutes=overlap.minutes,
+    )
+
+
 @router.get("/schedule/conflicts/", response=List[ScheduleConflict])
 def detect_schedule_conflicts(
     request,
-    term_id: Optional[UUID] = Query(None),
-    room_id: Optional[UUID] = Query(None),
+    term_id: Optional[int] = Query(None),
+    room_id: Optional[int] = Query(None),
     check_type: str = Query("all")  # "all", "time", "resource", "capacity"
 ) -> List[ScheduleConflict]:
-    """Real-time schedule conflict detection and resolution suggestions."""
+    """Real-time schedule conflict detection and resolution suggestions.
+
+    Class part meetings are swept per day and resource, so partial
+    overlaps are reported as well as identical time slots. Each conflict
+    names the overlapping pair and how many minutes they share. Resources
+    are keyed by term too, so without a ``term_id`` filter classes from
+    different terms that share a weekly slot are not reported.
+    """
 
     conflicts = []
 
-    # Base queryset for class parts in the specified term
     class_parts_qs = ClassPart.objects.select_related(
-        'class_header__course',
-        'class_header__instructor',
-        'time_slot',
+        'class_session__class_header__course',
+        'teacher__person',
         'room'
-    )
+    ).filter(start_time__isnull=False, end_time__isnull=False).exclude(meeting_days="")
 
     if term_id:
-        class_parts_qs = class_parts_qs.filter(class_header__term_id=term_id)
+        class_parts_qs = class_parts_qs.filter(class_session__class_header__term_id=term_id)
 
     if room_id:
         class_parts_qs = class_parts_qs.filter(room_id=room_id)
 
-    class_parts = list(class_parts_qs)
-
-    # Check for time conflicts
-    if check_type in ["all", "time"]:
-        time_conflicts = {}
-        for part in class_parts:
-            if not part.time_slot:
-                continue
-
-            key = (
-                part.time_slot.start_time,
-                part.time_slot.end_time,
-                part.time_slot.day_of_week
-            )
+    parts = {part.id: part for part in class_parts_qs}
 
-            if key not in time_conflicts:
-                time_conflicts[key] = []
-            time_conflicts[key].append(part)
+    def term_of(part) -> int:
+        return part.class_session.class_header.term_id
 
-        # Find conflicts (more than one class at same time)
-        for time_key, parts in time_conflicts.items():
-            if len(parts) > 1:
-                conflicts.append(ScheduleConflict(
-                    type="time_overlap",
-                    severity="critical",
-                    message=f"Time conflict on {parts[0].time_slot.day_of_week} at {parts[0].time_slot.start_time}",
-                    affected_items=[{
-                        "class_id": str(part.class_header.unique_id),
-                        "course": f"{part.class_header.course.code} - {part.class_header.course.name}",
-                        "instructor": part.class_header.instructor.person.full_name if part.class_header.instructor else "TBA"
-                    } for part in parts],
-                    suggestions=[
-                        "Reschedule one of the conflicting classes",
-                        "Use different time slots",
-                        "Consider online delivery for one class"
-                    ]
-                ))
+    intervals = {
+        part_id: meeting_intervals(part.meeting_days, part.start_time, part.end_time, part_id)
+        for part_id, part in parts.items()
+    }
 
-    # Check for room conflicts
+    # Room double-bookings
     if check_type in ["all", "resource"]:
-        room_conflicts = {}
-        for part in class_parts:
-            if not part.room or not part.time_slot:
-                continue
-
-            key = (
-                part.room.unique_id,
-                part.time_slot.start_time,
-                part.time_slot.end_time,
-                part.time_slot.day_of_week
-            )
-
-            if key not in room_conflicts:
-                room_conflicts[key] = []
-            room_conflicts[key].append(part)
-
-        for room_key, parts in room_conflicts.items():
-            if len(parts) > 1:
-                room = parts[0].room
-                conflicts.append(ScheduleConflict(
-                    type="resource_conflict",
-                    severity="critical",
-                    message=f"Room conflict in {room.room_number} ({room.building})",
-                    affected_items=[{
-                        "class_id": str(part.class_header.unique_id),
-                        "course": f"{part.class_header.course.code} - {part.class_header.course.name}",
-                        "room": f"{part.room.room_number} ({part.room.building})"
-                    } for part in parts],
-                    suggestions=[
-                        "Assign different rooms to conflicting classes",
-                        "Stagger class times",
-                        "Use alternative venues"
-                    ]
-                ))
+        room_overlaps = find_overlaps(
+            ((term_of(part), part.room_id), interval)
+            for part_id, part in parts.items()
+            if part.room_id
+            for interval in intervals[part_id]
+        )
+        for overlap in room_overlaps:
+            room = parts[overlap.first.part_id].room
+            conflicts.append(_overlap_conflict(
+                overlap,
+                parts,
+                type="resource_conflict",
+                subject=f"Room {room} is double-booked",
+                suggestions=[
+                    "Assign different rooms to conflicting classes",
+                    "Stagger class times",
+                    "Use alternative venues"
+                ],
+                room=str(room),
+            ))
 
-    # Check for capacity issues
+    if check_type in ["all", "time"]:
+        # Teachers scheduled in two places at once
+        teacher_overlaps = find_overlaps(
+            ((term_of(part), part.teacher_id), interval)
+            for part_id, part in parts.items()
+            if part.teacher_id
+            for interval in intervals[part_id]
+        )
+        for overlap in teacher_overlaps:
+            teacher = parts[overlap.first.part_id].teacher
+            conflicts.append(_overlap_conflict(
+                overlap,
+                parts,
+                type="instructor_conflict",
+                subject=f"Instructor {teacher.person.full_name} is double-booked",
+                suggestions=[
+                    "Assign a different instructor to one of the classes",
+                    "Change the time slot for one of the classes"
+                ],
+                instructor=teacher.person.full_name,
+            ))
+
+        # Students enrolled in classes that meet at the same time
+        header_intervals: Dict[int, List] = defaultdict(list)
+        header_terms: Dict[int, int] = {}
+        for part_id, part in parts.items():
+            header_intervals[part.class_session.class_header_id].extend(intervals[part_id])
+            header_terms[part.class_session.class_header_id] = term_of(part)
+        enrollments = ClassHeaderEnrollment.objects.filter(
+            class_header_id__in=list(header_intervals),
+            status__in=CONFLICT_STATUSES,
+        ).values_list("student_id", "class_header_id")
+        student_overlaps = find_overlaps(
+            ((header_terms[class_header_id], student_id), interval)
+            for student_id, class_header_id in enrollments
+            for interval in header_intervals[class_header_id]
+        )
+        cohorts: Dict[tuple, List[Overlap]] = defaultdict(list)
+        for overlap in student_overlaps:
+            cohorts[(overlap.first, overlap.second)].append(overlap)
+        for cohort in cohorts.values():
+            conflicts.append(_overlap_conflict(
+                cohort[0],
+                parts,
+                type="time_overlap",
+                subject=f"{len(cohort)} enrolled student(s) have overlapping classes",
+                suggestions=[
+                    "Reschedule one of the conflicting classes",
+                    "Move affected students to another section"
+                ],
+                student_count=len(cohort),
+            ))
+
+    # Rooms too small for their enrollment
     if check_type in ["all", "capacity"]:
-        for part in class_parts:
-            if not part.room:
+        enrollment_counts = dict(
+            ClassHeaderEnrollment.objects.filter(
+                class_header_id__in={part.class_session.class_header_id for part in parts.values()},
+                status__in=CONFLICT_STATUSES,
+            )
+            .values("class_header_id")
+            .annotate(count=Count("id"))
+            .values_list("class_header_id", "count")
+        )
+        for part in parts.values():
+            if not part.room or not part.room.capacity:
                 continue
 
-            enrollment_count = ClassHeaderEnrollment.objects.filter(
-                class_header=part.class_header,
-                status='enrolled'
-            ).count()
-
+            enrollment_count = enrollment_counts.get(part.class_session.class_header_id, 0)
             if enrollment_count > part.room.capacity:
                 conflicts.append(ScheduleConflict(
                     type="capacity_exceeded",
                     severity="warning",
                     message=f"Room capacity exceeded: {enrollment_count} students in room for {part.room.capacity}",
                     affected_items=[{
-                        "class_id": str(part.class_header.unique_id),
-                        "course": f"{part.class_header.course.code} - {part.class_header.course.name}",
-                        "room": f"{part.room.room_number} ({part.room.building})",
+                        **_class_part_item(part),
+                        "room": str(part.room),
                         "enrollment": enrollment_count,
                         "capacity": part.room.capacity
                     }],
@@ -676,155 +739,6 @@ def bulk_update_grades(request, class_id: UUID, grade_updates: List[GradeEntry])
     return results
 
 
-@router.get("/schedule/conflicts/", response=List[ScheduleConflict])
-def detect_schedule_conflicts(
-    request,
-    term_id: Optional[UUID] = Query(None),
-    room_id: Optional[UUID] = Query(None),
-    instructor_id: Optional[UUID] = Query(None)
-):
-    """Detect scheduling conflicts for classes, rooms, and instructors."""
-
-    conflicts = []
-
-    # Base query for classes
-    classes_query = ClassHeader.objects.select_related(
-        'course', 'instructor__person', 'term'
-    ).prefetch_related('class_parts__time_slots', 'class_parts__room')
-
-    if term_id:
-        classes_query = classes_query.filter(term__unique_id=term_id)
-
-    if instructor_id:
-        classes_query = classes_query.filter(instructor__unique_id=instructor_id)
-
-    classes = list(classes_query)
-
-    # Group classes by time slots for conflict detection
-    time_slot_groups = {}
-
-    for class_header in classes:
-        for class_part in class_header.class_parts.all():
-            for time_slot in class_part.time_slots.all():
-                # Create a key for time slot grouping
-                key = (
-                    time_slot.day_of_week,
-                    time_slot.start_time,
-                    time_slot.end_time
-                )
-
-                if key not in time_slot_groups:
-                    time_slot_groups[key] = []
-
-                time_slot_groups[key].append({
-                    'class_header': class_header,
-                    'class_part': class_part,
-                    'time_slot': time_slot,
-                    'room': class_part.room
-                })
-
-    # Detect conflicts
-    for time_key, scheduled_items in time_slot_groups.items():
-        if len(scheduled_items) > 1:
-            # Time overlap conflict
-            day, start_time, end_time = time_key
-
-            # Group by room
-            room_conflicts = {}
-            instructor_conflicts = {}
-
-            for item in scheduled_items:
-                room = item['room']
-                instructor = item['class_header'].instructor
-
-                # Room conflicts
-                if room:
-                    if room.unique_id not in room_conflicts:
-                        room_conflicts[room.unique_id] = []
-                    room_conflicts[room.unique_id].append(item)
-
-                # Instructor conflicts
-                if instructor:
-                    if instructor.unique_id not in instructor_conflicts:
-                        instructor_conflicts[instructor.unique_id] = []
-                    instructor_conflicts[instructor.unique_id].append(item)
-
-            # Report room conflicts
-            for room_id, conflicting_items in room_conflicts.items():
-                if len(conflicting_items) > 1:
-                    room_name = conflicting_items[0]['room'].name
-                    affected_classes = [
-                        {
-                            "class_id": str(item['class_header'].unique_id),
-                            "course_code": item['class_header'].course.code,
-                            "course_name": item['class_header'].course.name
-                        }
-                        for item in conflicting_items
-                    ]
-
-                    conflicts.append(ScheduleConflict(
-                        type="room_conflict",
-                        severity="critical",
-                        message=f"Room {room_name} is double-booked on {day} from {start_time} to {end_time}",
-                        affected_items=affected_classes,
-                        suggestions=[
-                            f"Move one class to a different room",
-                            f"Change the time slot for one of the classes",
-                            f"Split the class into multiple sections"
-                        ]
-                    ))
-
-            # Report instructor conflicts
-            for instructor_id, conflicting_items in instructor_conflicts.items():
-                if len(conflicting_items) > 1:
-                    instructor_name = conflicting_items[0]['class_header'].instructor.person.full_name
-                    affected_classes = [
-                        {
-                            "class_id": str(item['class_header'].unique_id),
-                            "course_code": item['class_header'].course.code,
-                            "course_name": item['class_header'].course.name
-                        }
-                        for item in conflicting_items
-                    ]
-
-                    conflicts.append(ScheduleConflict(
-                        type="instructor_conflict",
-                        severity="critical",
-                        message=f"Instructor {instructor_name} is scheduled for multiple classes on {day} from {start_time} to {end_time}",
-                        affected_items=affected_classes,
-                        suggestions=[
-                            f"Assign a different instructor to one of the classes",
-                            f"Change the time slot for one of the classes",
-                            f"Combine the classes if content is similar"
-                        ]
-                    ))
-
-    # Check capacity conflicts
-    for class_header in classes:
-        for class_part in class_header.class_parts.all():
-            if class_part.room and class_part.room.capacity:
-                enrollment_count = class_header.enrollments.filter(status='enrolled').count()
-                if enrollment_count > class_part.room.capacity:
-                    conflicts.append(ScheduleConflict(
-                        type="capacity_exceeded",
-                        severity="warning",
-                        message=f"Class {class_header.course.code} has {enrollment_count} students but room {class_part.room.name} capacity is {class_part.room.capacity}",
-                        affected_items=[{
-                            "class_id": str(class_header.unique_id),
-                            "course_code": class_header.course.code,
-                            "enrollment_count": enrollment_count,
-                            "room_capacity": class_part.room.capacity
-                        }],
-                        suggestions=[
-                            "Move to a larger room",
-                            "Split into multiple sections",
-                            "Limit enrollment"
-                        ]
-                    ))
-
-    return conflicts
-
-
 @router.get("/transcripts/generate/{student_id}/")
 def generate_transcript(
     request,
@@ -10,136 +10,212 @@ This module provides analytics endpoints with:
 
 import logging
 from datetime import datetime, timedelta
+from decimal import Decimal
 from typing import List, Optional, Dict, Any
 from uuid import UUID
 
+from django.shortcuts import get_object_or_404
+from django.utils import timezone
 from ninja import Query, Router
+from ninja.errors import HttpError
+
+from apps.analytics import rollups
+from apps.analytics.models import DailyMetricRollup, TermMetricRollup
+from apps.curriculum.models import Term
 
 from ..v1.auth import jwt_auth
-from .schemas import DashboardMetrics, ChartData, TimeSeriesPoint, MetricValue
+from .schemas import DashboardMetrics, ChartData, TimeSeriesPoint, MetricValue, RollupBucket, TermRollupSummary
 
 logger = logging.getLogger(__name__)
 
 router = Router(auth=jwt_auth, tags=["analytics"])
 
 
+def _metric_value(
+    label: str,
+    value: int | float | Decimal,
+    previous: int | float | Decimal | None = None,
+) -> MetricValue:
+    """Build a metric with trend information relative to ``previous``."""
+    if previous is None:
+        return MetricValue(value=value, label=label)
+
+    if previous:
+        change_percent = round(float((value - previous) / previous) * 100, 1)
+    else:
+        change_percent = 0.0 if not value else 100.0
+    if change_percent > 0:
+        trend = "up"
+    elif change_percent < 0:
+        trend = "down"
+    else:
+        trend = "stable"
+    return MetricValue(
+        value=value,
+        label=label,
+        trend=trend,
+        change_percent=change_percent,
+        previous_value=previous,
+    )
+
+
+def _count(breakdown: dict[str, dict[str, Any]], dimensions: tuple[str, ...] | None = None) -> int:
+    return sum(
+        bucket["count"] for dimension, bucket in breakdown.items() if dimensions is None or dimension in dimensions
+    )
+
+
+def _total(breakdown: dict[str, dict[str, Any]], dimensions: tuple[str, ...] | None = None) -> Decimal:
+    return sum(
+        (bucket["total"] for dimension, bucket in breakdown.items() if dimensions is None or dimension in dimensions),
+        Decimal("0.00"),
+    )
+
+
+def _rollup_buckets(breakdown: dict[str, dict[str, Any]]) -> List[RollupBucket]:
+    return [
+        RollupBucket(dimension=dimension, count=bucket["count"], total=bucket["total"])
+        for dimension, bucket in sorted(breakdown.items())
+    ]
+
+
 @router.get("/dashboard/metrics/", response=DashboardMetrics)
 def get_dashboard_metrics(
     request,
-    date_range: int = Query(30, description="Days to look back")
+    date_range: int = Query(30, ge=1, le=366, description="Days to look back")
 ):
-    """Get comprehensive dashboard metrics."""
+    """Get comprehensive dashboard metrics.
+
+    All values are read from the pre-aggregated rollups in
+    ``apps.analytics``, so the cost does not grow with history size.
+    Windowed metrics are compared with the preceding window of the same
+    length; term metrics are compared with the previous term.
+    """
+    today = timezone.now().date()
+    start, end = rollups.daily_range(date_range, today)
+    previous_start, previous_end = rollups.daily_range(date_range, start - timedelta(days=1))
+
+    current_term = Term.objects.filter(is_active=True).order_by("-start_date").first()
+    previous_term = (
+        Term.objects.filter(start_date__lt=current_term.start_date).order_by("-start_date").first()
+        if current_term
+        else None
+    )
+
+    def term_breakdown(metric: str, term: Term | None) -> dict[str, dict[str, Any]]:
+        return rollups.get_term_breakdown(metric, term.id) if term else {}
+
+    enrollments = term_breakdown(TermMetricRollup.Metric.ENROLLMENT, current_term)
+    previous_enrollments = term_breakdown(TermMetricRollup.Metric.ENROLLMENT, previous_term)
+    grades = term_breakdown(TermMetricRollup.Metric.GRADE_DISTRIBUTION, current_term)
+    previous_grades = term_breakdown(TermMetricRollup.Metric.GRADE_DISTRIBUTION, previous_term)
+    receivables = rollups.get_term_breakdown(TermMetricRollup.Metric.RECEIVABLES, None)
 
-    # Mock dashboard metrics
     student_metrics = {
-        "total_count": MetricValue(
-            value=1247,
-            label="Total Students",
-            trend="up",
-            change_percent=3.2,
-            previous_value=1208
+        "active_enrollments": _metric_value(
+            "Active Enrollments",
+            _count(enrollments, rollups.ACTIVE_ENROLLMENT_STATUSES),
+            _count(previous_enrollments, rollups.ACTIVE_ENROLLMENT_STATUSES) if previous_term else None,
         ),
-        "new_this_week": MetricValue(
-            value=23,
-            label="New This Week",
-            trend="stable",
-            change_percent=0.0,
-            previous_value=23
+        "total_enrollments": _metric_value(
+            "Term Enrollments",
+            _count(enrollments),
+            _count(previous_enrollments) if previous_term else None,
         ),
-        "at_risk_count": MetricValue(
-            value=45,
-            label="At Risk Students",
-            trend="down",
-            change_percent=-12.5,
-            previous_value=52
-        ),
-        "success_rate": MetricValue(
-            value=0.87,
-            label="Success Rate",
-            trend="up",
-            change_percent=2.1,
-            previous_value=0.85
-        )
     }
 
     academic_metrics = {
-        "grades_entered": MetricValue(
-            value=2341,
-            label="Grades Entered",
-            trend="up",
-            change_percent=15.3,
-            previous_value=2031
+        "grades_entered": _metric_value(
+            "Grades Entered",
+            _count(grades),
+            _count(previous_grades) if previous_term else None,
         ),
-        "transcripts_pending": MetricValue(
-            value=12,
-            label="Transcripts Pending",
-            trend="down",
-            change_percent=-25.0,
-            previous_value=16
+        "attendance_rate": _metric_value(
+            "Attendance Rate",
+            round(rollups.attendance_rate(start, end), 4),
+            round(rollups.attendance_rate(previous_start, previous_end), 4),
         ),
-        "attendance_rate": MetricValue(
-            value=0.92,
-            label="Attendance Rate",
-            trend="stable",
-            change_percent=1.1,
-            previous_value=0.91
-        )
     }
 
+    revenue = rollups.sum_daily(DailyMetricRollup.Metric.REVENUE, start, end)
+    previous_revenue = rollups.sum_daily(DailyMetricRollup.Metric.REVENUE, previous_start, previous_end)
     financial_metrics = {
-        "total_revenue": MetricValue(
-            value=125670.50,
-            label="Total Revenue",
-            trend="up",
-            change_percent=8.7,
-            previous_value=115532.25
-        ),
-        "pending_payments": MetricValue(
-            value=23450.00,
-            label="Pending Payments",
-            trend="down",
-            change_percent=-5.2,
-            previous_value=24734.50
-        ),
-        "scholarship_total": MetricValue(
-            value=45200.00,
-            label="Scholarship Awards",
-            trend="up",
-            change_percent=12.3,
-            previous_value=40250.00
-        )
-    }
-
-    system_metrics = {
-        "active_users": MetricValue(
-            value=156,
-            label="Active Users",
-            trend="up",
-            change_percent=6.8,
-            previous_value=146
-        ),
-        "system_health": MetricValue(
-            value=0.98,
-            label="System Health",
-            trend="stable",
-            change_percent=0.0,
-            previous_value=0.98
-        ),
-        "performance_score": MetricValue(
-            value=0.94,
-            label="Performance Score",
-            trend="up",
-            change_percent=1.5,
-            previous_value=0.926
-        )
+        "total_revenue": _metric_value("Total Revenue", revenue["total"], previous_revenue["total"]),
+        "payment_count": _metric_value("Payments Received", revenue["count"], previous_revenue["count"]),
+        "outstanding_receivables": _metric_value("Outstanding Receivables", _total(receivables)),
+        "overdue_receivables": _metric_value("Overdue Receivables", _total(receivables, ("OVERDUE",))),
     }
 
     return DashboardMetrics(
         student_metrics=student_metrics,
         academic_metrics=academic_metrics,
         financial_metrics=financial_metrics,
-        system_metrics=system_metrics,
-        last_updated=datetime.now()
+        system_metrics={},
+        last_updated=timezone.now()
+    )
+
+
+DAILY_ROLLUP_METRICS = {
+    "revenue": DailyMetricRollup.Metric.REVENUE,
+    "attendance": DailyMetricRollup.Metric.ATTENDANCE,
+}
+
+
+@router.get("/rollups/daily/{metric}/", response=ChartData)
+def get_daily_rollup(
+    request,
+    metric: str,
+    days: int = Query(30, ge=1, le=366),
+    dimension: Optional[str] = Query(None, description="Restrict to one payment method or attendance status")
+):
+    """Get a per-day series for a rolled-up metric.
+
+    Revenue points carry the summed amount; attendance points carry the
+    number of records.
+    """
+    if metric not in DAILY_ROLLUP_METRICS:
+        raise HttpError(404, f"Unknown daily metric: {metric}")
+
+    rollup_metric = DAILY_ROLLUP_METRICS[metric]
+    start, end = rollups.daily_range(days, timezone.now().date())
+    daily_totals = rollups.get_daily_totals(rollup_metric, start, end)
+    dimensions = (dimension,) if dimension else None
+
+    data_points = []
+    for offset in range(days):
+        day = start + timedelta(days=offset)
+        breakdown = daily_totals.get(day, {})
+        if rollup_metric == DailyMetricRollup.Metric.REVENUE:
+            value = _total(breakdown, dimensions)
+        else:
+            value = _count(breakdown, dimensions)
+        data_points.append(TimeSeriesPoint(
+            timestamp=datetime.combine(day, datetime.min.time()),
+            value=value,
+            label=day.isoformat()
+        ))
+
+    return ChartData(
+        title=DailyMetricRollup.Metric(rollup_metric).label,
+        type="line",
+        data=data_points,
+        options={"days": days, "dimension": dimension or "all"}
+    )
+
+
+@router.get("/rollups/terms/{term_id}/", response=TermRollupSummary)
+def get_term_rollup(request, term_id: int):
+    """Get enrollment, grade and receivable breakdowns for one term."""
+    term = get_object_or_404(Term, id=term_id)
+
+    return TermRollupSummary(
+        term_id=term.id,
+        term_code=term.code,
+        enrollments=_rollup_buckets(rollups.get_term_breakdown(TermMetricRollup.Metric.ENROLLMENT, term.id)),
+        grade_distribution=_rollup_buckets(
+            rollups.get_term_breakdown(TermMetricRollup.Metric.GRADE_DISTRIBUTION, term.id)
+        ),
+        receivables=_rollup_buckets(rollups.get_term_breakdown(TermMetricRollup.Metric.RECEIVABLES, term.id)),
     )
 
 
@@ -123,6 +123,22 @@ class ChartData(BaseSchema):
     options: Dict[str, Any] = {}
 
 
+class RollupBucket(BaseSchema):
+    """One dimension of a pre-aggregated metric rollup."""
+    dimension: str
+    count: int
+    total: Decimal
+
+
+class TermRollupSummary(BaseSchema):
+    """Pre-aggregated metric breakdowns for a single term."""
+    term_id: int
+    term_code: str
+    enrollments: List[RollupBucket]
+    grade_distribution: List[RollupBucket]
+    receivables: List[RollupBucket]
+
+
 # Student schemas
 class StudentBasicInfo(BaseSchema):
     """Basic student information for lists."""
@@ -254,6 +270,8 @@ class ScheduleConflict(BaseSchema):
     message: str
     affected_items: List[Dict[str, Any]]
     suggestions: List[str] = []
+    day: Optional[str] = None
+    overlap_minutes: Optional[int] = None
 
 
 # Financial schemas
@@ -385,6 +403,8 @@ __all__ = [
     "DashboardMetrics",
     "TimeSeriesPoint",
     "ChartData",
+    "RollupBucket",
+    "TermRollupSummary",
     # Students
     "StudentBasicInfo",
     "StudentSearchResult",
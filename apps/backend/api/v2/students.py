@@ -17,11 +17,12 @@ from uuid import UUID
 from django.core.cache import cache
 from django.core.files.uploadedfile import UploadedFile
 from django.core.paginator import Paginator
-from django.db.models import Q, Count, Avg, Prefetch
+from django.db.models import Count, Avg, Prefetch
 from django.shortcuts import get_object_or_404
 from ninja import File, Query, Router, Form
 from ninja.pagination import paginate
 
+from apps.common.services.student_search import StudentSearchService
 from apps.people.models import Person, StudentProfile, StudentPhoto
 from apps.enrollment.models import ClassHeaderEnrollment, ProgramEnrollment
 from apps.grading.models import Grade
@@ -215,16 +216,7 @@ def advanced_student_search(
 
     # Apply text search with fuzzy matching
     if filters.query:
-        query_terms = filters.query.split()
-        search_q = Q()
-        for term in query_terms:
-            search_q |= (
-                Q(person__first_name__icontains=term) |
-                Q(person__last_name__icontains=term) |
-                Q(student_id__icontains=term) |
-                Q(person__email__icontains=term)
-            )
-        queryset = queryset.filter(search_q)
+        queryset = StudentSearchService.search(queryset, filters.query, fuzzy=True)
 
     # Apply filters
     if filters.program_id:
@@ -249,7 +241,7 @@ def advanced_student_search(
     if sort:
         order_field = f"{'-' if sort.descending else ''}{sort.field}"
         queryset = queryset.order_by(order_field)
-    else:
+    elif not filters.query:
         queryset = queryset.order_by('person__last_name', 'person__first_name')
 
     # Apply pagination
@@ -513,28 +505,8 @@ def advanced_student_search(
 
     # Apply search filters
     if filters.query:
-        search_query = filters.query.strip()
-
-        if filters.fuzzy_search:
-            # Fuzzy search implementation (simplified)
-            # In production, consider using PostgreSQL full-text search or Elasticsearch
-            q_objects = Q()
-            for term in search_query.split():
-                q_objects |= (
-                    Q(person__family_name__icontains=term) |
-                    Q(person__personal_name__icontains=term) |
-                    Q(student_id__icontains=term) |
-                    Q(person__school_email__icontains=term)
-                )
-            queryset = queryset.filter(q_objects)
-        else:
-            # Exact search
-            queryset = queryset.filter(
-                Q(person__family_name__icontains=search_query) |
-                Q(person__personal_name__icontains=search_query) |
-                Q(student_id__icontains=search_query) |
-                Q(person__school_email__icontains=search_query)
-            )
+        # Trigram-indexed search; fuzzy search also matches misspellings
+        queryset = StudentSearchService.search(queryset, filters.query, fuzzy=filters.fuzzy_search)
 
     # Apply status filter
     if filters.status:
@@ -570,7 +542,7 @@ def advanced_student_search(
 
     if order_by:
         queryset = queryset.order_by(*order_by)
-    else:
+    elif not filters.query:
         queryset = queryset.order_by('person__family_name', 'person__personal_name')
 
     # Pagination
@@ -587,16 +559,8 @@ def advanced_student_search(
             if latest_photo:
                 photo_url = latest_photo.image.url
 
-        # Calculate match score (simplified)
-        match_score = 1.0
-        if filters.query and filters.fuzzy_search:
-            # Simple match scoring based on field matches
-            query_lower = filters.query.lower()
-            name_match = query_lower in student.person.full_name.lower()
-            id_match = query_lower in student.student_id.lower()
-            email_match = query_lower in (student.person.school_email or "").lower()
-
-            match_score = (name_match * 0.4 + id_match * 0.4 + email_match * 0.2)
+        # Relevance from the search backend
+        match_score = float(getattr(student, 'search_rank', 1.0))
 
         # Get analytics
         analytics = calculate_student_analytics(student)
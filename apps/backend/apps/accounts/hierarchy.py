@@ -0,0 +1,31 @@
+"""Closure-table helpers for the position and role hierarchies.
+
+``Position.reports_to`` and ``Role.parent_role`` form forests. Their closure
+tables hold one ``(ancestor, descendant, depth)`` row for every node and each
+of its ancestors, including a depth-0 row linking the node to itself, so the
+whole subtree or ancestry of a node is one indexed lookup.
+"""
+
+from collections.abc import Iterator, Mapping
+
+ClosureRow = tuple[int, int, int]
+
+
+def closure_rows(parents: Mapping[int, int | None]) -> Iterator[ClosureRow]:
+    """Yield ``(ancestor, descendant, depth)`` rows for a forest.
+
+    ``parents`` maps every node to its parent, or ``None`` for roots. Parents
+    missing from the mapping end the chain, and a chain that loops back on
+    itself is cut at the repeated node, so damaged data still produces a
+    valid closure.
+    """
+    for node in parents:
+        seen = {node}
+        yield node, node, 0
+        depth = 0
+        parent = parents[node]
+        while parent is not None and parent in parents and parent not in seen:
+            depth += 1
+            seen.add(parent)
+            yield parent, node, depth
+            parent = parents[parent]
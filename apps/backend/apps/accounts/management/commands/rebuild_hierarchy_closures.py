@@ -0,0 +1,37 @@
+"""Management command to rebuild the position and role closure tables.
+
+``PositionClosure`` and ``RoleClosure`` rows are maintained when positions
+and roles are saved or deleted. Use this command to repair them after bulk
+imports or raw updates that bypass those hooks. Cached effective permission
+sets are invalidated afterwards.
+
+Usage:
+    python manage.py rebuild_hierarchy_closures
+    python manage.py rebuild_hierarchy_closures --batch-size 500
+"""
+
+from django.core.management.base import BaseCommand
+
+from apps.accounts.models import PositionClosure, RoleClosure
+from apps.accounts.permission_cache import invalidate_all_permissions
+
+
+class Command(BaseCommand):
+    help = "Rebuild the closure tables of the position and role hierarchies"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of closure rows inserted per query (default: 1000)",
+        )
+
+    def handle(self, *args, **options):
+        """Recompute both closure tables from the parent links."""
+        positions = PositionClosure.rebuild(batch_size=options["batch_size"])
+        roles = RoleClosure.rebuild(batch_size=options["batch_size"])
+        invalidate_all_permissions()
+        self.stdout.write(
+            self.style.SUCCESS(f"Rebuilt {positions} position closure rows and {roles} role closure rows")
+        )
@@ -0,0 +1,92 @@
+# Generated by Django 5.2 on 2025-08-01
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+from apps.accounts.hierarchy import closure_rows
+
+
+def build_closures(apps, schema_editor):
+    for node_name, closure_name, parent_field in (
+        ("Position", "PositionClosure", "reports_to_id"),
+        ("Role", "RoleClosure", "parent_role_id"),
+    ):
+        Node = apps.get_model("accounts", node_name)
+        Closure = apps.get_model("accounts", closure_name)
+        parents = dict(Node.objects.values_list("pk", parent_field))
+        Closure.objects.bulk_create(
+            (
+                Closure(ancestor_id=ancestor_id, descendant_id=descendant_id, depth=depth)
+                for ancestor_id, descendant_id, depth in closure_rows(parents)
+            ),
+            batch_size=1000,
+        )
+
+
+def closure_model(name, node, verbose_name, verbose_name_plural, db_table, constraint_name, index_name):
+    return migrations.CreateModel(
+        name=name,
+        fields=[
+            ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+            (
+                "depth",
+                models.PositiveSmallIntegerField(
+                    help_text="Number of levels between ancestor and descendant (0 for the node itself)",
+                    verbose_name="Depth",
+                ),
+            ),
+            (
+                "ancestor",
+                models.ForeignKey(
+                    on_delete=django.db.models.deletion.CASCADE,
+                    related_name="descendant_links",
+                    to=node,
+                    verbose_name="Ancestor",
+                ),
+            ),
+            (
+                "descendant",
+                models.ForeignKey(
+                    on_delete=django.db.models.deletion.CASCADE,
+                    related_name="ancestor_links",
+                    to=node,
+                    verbose_name="Descendant",
+                ),
+            ),
+        ],
+        options={
+            "verbose_name": verbose_name,
+            "verbose_name_plural": verbose_name_plural,
+            "db_table": db_table,
+            "indexes": [models.Index(fields=["descendant", "depth"], name=index_name)],
+            "constraints": [models.UniqueConstraint(fields=("ancestor", "descendant"), name=constraint_name)],
+        },
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("accounts", "0002_initial"),
+    ]
+
+    operations = [
+        closure_model(
+            "PositionClosure",
+            "accounts.position",
+            "Position Closure",
+            "Position Closures",
+            "accounts_position_closure",
+            "unique_position_closure",
+            "position_closure_desc_depth_idx",
+        ),
+        closure_model(
+            "RoleClosure",
+            "accounts.role",
+            "Role Closure",
+            "Role Closures",
+            "accounts_role_closure",
+            "unique_role_closure",
+            "role_closure_desc_depth_idx",
+        ),
+        migrations.RunPython(build_closures, migrations.RunPython.noop),
+    ]
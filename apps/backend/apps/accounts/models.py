@@ -17,6 +17,7 @@ Models:
 - UserRole: Links users to roles with department context
 - Permission: Custom permissions beyond Django's built-in system
 - RolePermission: Links roles to permissions with context
+- PositionClosure / RoleClosure: Closure tables of the position and role hierarchies
 """
 
 from datetime import date
@@ -26,7 +27,7 @@ from django.conf import settings
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import ValidationError
-from django.db import models
+from django.db import models, transaction
 from django.db.models import (
     BooleanField,
     CharField,
@@ -43,6 +44,8 @@ try:
 except ImportError:
     jsonschema = None
 
+from apps.accounts.hierarchy import closure_rows
+from apps.accounts.permission_cache import invalidate_all_permissions, invalidate_user_permissions
 from apps.common.models import AuditModel
 
 # JSON schema definitions for security validation
@@ -168,6 +171,69 @@ class Department(AuditModel):
             self.code = self.code.upper()
 
 
+class HierarchyClosure(models.Model):
+    """Closure table of a self-referencing hierarchy.
+
+    Concrete subclasses define ``ancestor`` and ``descendant`` foreign keys to
+    the hierarchy model and name its parent field in ``parent_field``. Every
+    node has a depth-0 row to itself plus one row per ancestor, so subtrees
+    and ancestries are single indexed lookups. Rows are maintained by the
+    node model's ``save`` and ``delete``; ``rebuild`` repairs the table after
+    bulk or raw updates.
+    """
+
+    parent_field: ClassVar[str]
+
+    depth: PositiveSmallIntegerField = models.PositiveSmallIntegerField(
+        _("Depth"),
+        help_text=_("Number of levels between ancestor and descendant (0 for the node itself)"),
+    )
+
+    class Meta:
+        abstract = True
+
+    @classmethod
+    def node_model(cls) -> type[models.Model]:
+        return cls._meta.get_field("descendant").related_model
+
+    @classmethod
+    def move_subtree(cls, node_id: int, parent_id: int | None) -> None:
+        """Attach a node and its descendants below a new parent, or make it a root.
+
+        Also inserts the self row of a node that has none yet, which makes
+        this the hook for both new nodes and re-parented ones.
+        """
+        subtree = list(cls.objects.filter(ancestor_id=node_id).values_list("descendant_id", "depth"))
+        if not subtree:
+            cls.objects.create(ancestor_id=node_id, descendant_id=node_id, depth=0)
+            subtree = [(node_id, 0)]
+        subtree_ids = [descendant_id for descendant_id, _depth in subtree]
+
+        cls.objects.filter(descendant_id__in=subtree_ids).exclude(ancestor_id__in=subtree_ids).delete()
+        if parent_id is None:
+            return
+
+        ancestors = list(cls.objects.filter(descendant_id=parent_id).values_list("ancestor_id", "depth"))
+        cls.objects.bulk_create(
+            cls(ancestor_id=ancestor_id, descendant_id=descendant_id, depth=above + below + 1)
+            for ancestor_id, above in ancestors or [(parent_id, 0)]
+            for descendant_id, below in subtree
+        )
+
+    @classmethod
+    def rebuild(cls, batch_size: int = 1000) -> int:
+        """Recompute the whole table from the parent links; return the row count."""
+        parents = dict(cls.node_model().objects.values_list("pk", f"{cls.parent_field}_id"))
+        rows = [
+            cls(ancestor_id=ancestor_id, descendant_id=descendant_id, depth=depth)
+            for ancestor_id, descendant_id, depth in closure_rows(parents)
+        ]
+        with transaction.atomic():
+            cls.objects.all().delete()
+            cls.objects.bulk_create(rows, batch_size=batch_size)
+        return len(rows)
+
+
 class Position(AuditModel):
     """Formal institutional positions with clear authority levels and hierarchy.
 
@@ -265,18 +331,23 @@ class Position(AuditModel):
         Returns:
             Set of Position objects in the reporting hierarchy below this position
         """
-        subordinates: set[Position] = set()
-
-        # Get direct reports
-        direct_reports = self.direct_reports.filter(is_active=True)
-        subordinates.update(direct_reports)
-
-        # Get indirect reports recursively
-        for direct_report in direct_reports:
-            indirect_reports = direct_report.get_all_subordinates()
-            subordinates.update(indirect_reports)
-
-        return subordinates
+        # An inactive position hides its whole subtree, so skip positions with an
+        # inactive position anywhere on the chain below this one.
+        hidden = PositionClosure.objects.filter(
+            descendant=models.OuterRef("pk"),
+            ancestor__is_active=False,
+            ancestor__ancestor_links__ancestor=self,
+            ancestor__ancestor_links__depth__gt=0,
+        )
+        return set(
+            Position.objects.filter(
+                ancestor_links__ancestor=self,
+                ancestor_links__depth__gt=0,
+                is_active=True,
+            )
+            .exclude(models.Exists(hidden))
+            .order_by()
+        )
 
     def can_override_policy(self, policy_type: str) -> bool:
         """Check if this position can override a specific policy type.
@@ -334,9 +405,50 @@ class Position(AuditModel):
                 raise ValidationError({"approval_limits": _("Must be a dictionary of approval limits.")})
 
     def save(self, *args, **kwargs):
-        """Ensure validation runs on save."""
+        """Ensure validation runs on save and keep the closure table in step."""
         self.full_clean()
-        super().save(*args, **kwargs)
+        previous = None if self._state.adding else Position.objects.filter(pk=self.pk).values("reports_to_id").first()
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            if previous is None or previous["reports_to_id"] != self.reports_to_id:
+                PositionClosure.move_subtree(self.pk, self.reports_to_id)
+
+    def delete(self, *args, **kwargs):
+        """Detach direct reports into their own trees before deleting."""
+        with transaction.atomic():
+            for report_id in self.direct_reports.values_list("pk", flat=True):
+                PositionClosure.move_subtree(report_id, None)
+            return super().delete(*args, **kwargs)
+
+
+class PositionClosure(HierarchyClosure):
+    """Reporting-line closure of ``Position.reports_to``."""
+
+    parent_field = "reports_to"
+
+    ancestor: ForeignKey = models.ForeignKey(
+        Position,
+        on_delete=models.CASCADE,
+        related_name="descendant_links",
+        verbose_name=_("Ancestor"),
+    )
+    descendant: ForeignKey = models.ForeignKey(
+        Position,
+        on_delete=models.CASCADE,
+        related_name="ancestor_links",
+        verbose_name=_("Descendant"),
+    )
+
+    class Meta:
+        verbose_name = _("Position Closure")
+        verbose_name_plural = _("Position Closures")
+        db_table = "accounts_position_closure"
+        constraints: ClassVar[list[models.BaseConstraint]] = [
+            models.UniqueConstraint(fields=["ancestor", "descendant"], name="unique_position_closure"),
+        ]
+        indexes: ClassVar[list[models.Index]] = [
+            models.Index(fields=["descendant", "depth"], name="position_closure_desc_depth_idx"),
+        ]
 
 
 class PositionAssignment(AuditModel):
@@ -840,21 +952,11 @@ class Role(AuditModel):
         Returns:
             Set of permission codenames this role has access to
         """
-        permissions: set[str] = set()
-
-        # Get direct permissions
-        direct_permissions = self.role_permissions.values_list(
-            "permission__codename",
-            flat=True,
+        return set(
+            RolePermission.objects.filter(role__descendant_links__descendant=self)
+            .order_by()
+            .values_list("permission__codename", flat=True)
         )
-        permissions.update(direct_permissions)
-
-        # Get inherited permissions from parent roles
-        if self.parent_role:
-            parent_permissions = self.parent_role.get_all_permissions()
-            permissions.update(parent_permissions)
-
-        return permissions
 
     def clean(self) -> None:
         """Validate role data."""
@@ -870,6 +972,60 @@ class Role(AuditModel):
                     )
                 current = current.parent_role
 
+    def save(self, *args, **kwargs):
+        """Keep the closure table in step and drop stale permission caches."""
+        previous = (
+            None
+            if self._state.adding
+            else Role.objects.filter(pk=self.pk).values("parent_role_id", "department_id", "is_active").first()
+        )
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            if previous is None or previous["parent_role_id"] != self.parent_role_id:
+                RoleClosure.move_subtree(self.pk, self.parent_role_id)
+        if previous and (previous["parent_role_id"], previous["department_id"], previous["is_active"]) != (
+            self.parent_role_id,
+            self.department_id,
+            self.is_active,
+        ):
+            invalidate_all_permissions()
+
+    def delete(self, *args, **kwargs):
+        """Delete the role and drop stale permission caches."""
+        result = super().delete(*args, **kwargs)
+        invalidate_all_permissions()
+        return result
+
+
+class RoleClosure(HierarchyClosure):
+    """Inheritance closure of ``Role.parent_role``."""
+
+    parent_field = "parent_role"
+
+    ancestor: ForeignKey = models.ForeignKey(
+        Role,
+        on_delete=models.CASCADE,
+        related_name="descendant_links",
+        verbose_name=_("Ancestor"),
+    )
+    descendant: ForeignKey = models.ForeignKey(
+        Role,
+        on_delete=models.CASCADE,
+        related_name="ancestor_links",
+        verbose_name=_("Descendant"),
+    )
+
+    class Meta:
+        verbose_name = _("Role Closure")
+        verbose_name_plural = _("Role Closures")
+        db_table = "accounts_role_closure"
+        constraints: ClassVar[list[models.BaseConstraint]] = [
+            models.UniqueConstraint(fields=["ancestor", "descendant"], name="unique_role_closure"),
+        ]
+        indexes: ClassVar[list[models.Index]] = [
+            models.Index(fields=["descendant", "depth"], name="role_closure_desc_depth_idx"),
+        ]
+
 
 class UserRole(AuditModel):
     """Links users to roles with department context and status tracking.
@@ -959,6 +1115,17 @@ class UserRole(AuditModel):
                 },
             )
 
+    def save(self, *args, **kwargs):
+        """Save the assignment and drop the user's cached permissions."""
+        super().save(*args, **kwargs)
+        invalidate_user_permissions(self.user_id)
+
+    def delete(self, *args, **kwargs):
+        """Delete the assignment and drop the user's cached permissions."""
+        result = super().delete(*args, **kwargs)
+        invalidate_user_permissions(self.user_id)
+        return result
+
 
 class Permission(AuditModel):
     """Custom permissions beyond Django's built-in permission system.
@@ -1026,6 +1193,17 @@ class Permission(AuditModel):
             # Ensure codename follows Django conventions
             self.codename = self.codename.lower().replace(" ", "_")
 
+    def save(self, *args, **kwargs):
+        """Save the permission and drop stale permission caches."""
+        super().save(*args, **kwargs)
+        invalidate_all_permissions()
+
+    def delete(self, *args, **kwargs):
+        """Delete the permission and drop stale permission caches."""
+        result = super().delete(*args, **kwargs)
+        invalidate_all_permissions()
+        return result
+
 
 class RolePermission(AuditModel):
     """Links roles to permissions with department and object context.
@@ -1123,9 +1301,16 @@ class RolePermission(AuditModel):
         ]
 
     def save(self, *args, **kwargs):
-        """Ensure validation runs on save."""
+        """Ensure validation runs on save and drop stale permission caches."""
         self.full_clean()
         super().save(*args, **kwargs)
+        invalidate_all_permissions()
+
+    def delete(self, *args, **kwargs):
+        """Delete the grant and drop stale permission caches."""
+        result = super().delete(*args, **kwargs)
+        invalidate_all_permissions()
+        return result
 
     def __str__(self) -> str:
         parts = [str(self.role), str(self.permission)]
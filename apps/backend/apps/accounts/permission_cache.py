@@ -0,0 +1,95 @@
+"""Cached effective permission sets for role-based access checks.
+
+A user's effective permissions are the codenames granted, directly or through
+parent roles, to every active role assigned to them. Each grant keeps its
+department scope: the department named by the grant, the assigned role or
+the assignment, whichever are set. A grant whose scopes name different
+departments applies nowhere, and object-level grants are left out because
+they only cover their one object. The set is computed in one query through
+``RoleClosure`` and cached per user.
+
+Cache keys embed a generation number. Changes that can affect many users
+(role hierarchy, role department or activation, permission activation, role
+permission grants) bump the generation, which orphans every cached set at
+once; changes to one user's role assignments only drop that user's entry.
+"""
+
+from django.core.cache import cache
+
+PERMISSION_CACHE_TIMEOUT = 900  # 15 minutes
+PERMISSION_GENERATION_KEY = "accounts:permissions:generation"
+
+Grant = tuple[str, int | None]
+
+
+def _generation() -> int:
+    generation = cache.get(PERMISSION_GENERATION_KEY)
+    if generation is None:
+        cache.add(PERMISSION_GENERATION_KEY, 1, None)
+        generation = cache.get(PERMISSION_GENERATION_KEY, 1)
+    return generation
+
+
+def _user_key(user_id: int) -> str:
+    return f"accounts:permissions:{_generation()}:{user_id}"
+
+
+def get_permission_grants(user_id: int) -> frozenset[Grant]:
+    """``(codename, department_id)`` grants a user holds through active role assignments.
+
+    ``department_id`` is None for grants that apply in every department.
+    """
+    key = _user_key(user_id)
+    grants = cache.get(key)
+    if grants is None:
+        from apps.accounts.models import RolePermission
+
+        rows = (
+            RolePermission.objects.filter(
+                is_active=True,
+                permission__is_active=True,
+                content_type__isnull=True,
+                object_id__isnull=True,
+                role__descendant_links__descendant__is_active=True,
+                role__descendant_links__descendant__user_assignments__user_id=user_id,
+                role__descendant_links__descendant__user_assignments__is_active=True,
+            )
+            .order_by()
+            .values_list(
+                "permission__codename",
+                "department_id",
+                "role__department_id",
+                "role__descendant_links__descendant__department_id",
+                "role__descendant_links__descendant__user_assignments__department_id",
+            )
+        )
+        scoped = set()
+        for codename, *department_ids in rows:
+            departments = {department_id for department_id in department_ids if department_id is not None}
+            if len(departments) <= 1:
+                scoped.add((codename, departments.pop() if departments else None))
+        grants = frozenset(scoped)
+        cache.set(key, grants, PERMISSION_CACHE_TIMEOUT)
+    return grants
+
+
+def grants_permission(grants: frozenset[Grant], codename: str, department_id: int | None = None) -> bool:
+    """Whether the grants include a permission in a department.
+
+    Unscoped grants apply everywhere; department grants only satisfy checks
+    for that department.
+    """
+    return (codename, None) in grants or (department_id is not None and (codename, department_id) in grants)
+
+
+def invalidate_user_permissions(user_id: int) -> None:
+    """Drop one user's cached permission set."""
+    cache.delete(_user_key(user_id))
+
+
+def invalidate_all_permissions() -> None:
+    """Orphan every cached permission set by moving to a new generation."""
+    try:
+        cache.incr(PERMISSION_GENERATION_KEY)
+    except ValueError:
+        cache.set(PERMISSION_GENERATION_KEY, 2, None)
@@ -18,6 +18,7 @@ from django.db.models import QuerySet
 from apps.common.policies.base import PolicyContext, PolicyResult, get_policy_engine
 
 from .models import PositionAssignment, TeachingAssignment
+from .permission_cache import get_permission_grants, grants_permission
 
 if TYPE_CHECKING:
     from apps.accounts.models import Department, UserRole
@@ -409,6 +410,24 @@ class PermissionService:
             return True
 
         # Check Django's built-in permissions first
-        if hasattr(user, "has_perm"):
-            return bool(user.has_perm(permission_codename))
-        return False
+        if hasattr(user, "has_perm") and user.has_perm(permission_codename):
+            return True
+
+        # Then permissions granted through (inherited) role assignments in scope
+        if not getattr(user, "pk", None):
+            return False
+        return grants_permission(get_permission_grants(user.pk), permission_codename, getattr(department, "pk", None))
+
+    @staticmethod
+    def get_effective_permissions(user, department: Optional["Department"] = None) -> frozenset[str]:
+        """Get the cached codenames a user holds through active role assignments.
+
+        Department-scoped grants count only when ``department`` is that
+        department; object-level grants are not included.
+        """
+        if not user or not getattr(user, "pk", None):
+            return frozenset()
+        department_id = getattr(department, "pk", None)
+        return frozenset(
+            codename for codename, scope in get_permission_grants(user.pk) if scope is None or scope == department_id
+        )
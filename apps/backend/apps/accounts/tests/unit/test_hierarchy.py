@@ -0,0 +1,107 @@
+"""
+Tests for building and maintaining position and role closure rows.
+
+Verifies that every node gets a self row and one row per ancestor with the
+right depth, that dangling parents and cycles in damaged data do not break
+the rebuild, that re-parenting moves a whole subtree, and that an inactive
+position hides the positions reporting through it.
+"""
+
+import pytest
+
+from apps.accounts.hierarchy import closure_rows
+from apps.accounts.models import Position, PositionClosure
+
+
+@pytest.mark.unit
+class TestClosureRows:
+    """Test closure rows computed from parent links."""
+
+    def test_chain_and_siblings(self):
+        rows = set(closure_rows({1: None, 2: 1, 3: 2, 4: 1}))
+
+        assert rows == {
+            (1, 1, 0),
+            (2, 2, 0),
+            (1, 2, 1),
+            (3, 3, 0),
+            (2, 3, 1),
+            (1, 3, 2),
+            (4, 4, 0),
+            (1, 4, 1),
+        }
+
+    def test_missing_parent_ends_chain(self):
+        assert set(closure_rows({2: 99})) == {(2, 2, 0)}
+
+    def test_cycle_is_cut(self):
+        rows = set(closure_rows({1: 2, 2: 1}))
+
+        assert rows == {(1, 1, 0), (2, 1, 1), (2, 2, 0), (1, 2, 1)}
+
+
+def closure(model=PositionClosure):
+    return set(model.objects.values_list("ancestor_id", "descendant_id", "depth"))
+
+
+@pytest.mark.django_db
+class TestPositionHierarchy:
+    """Test closure maintenance and subtree queries on positions."""
+
+    def position(self, title, reports_to=None, is_active=True):
+        return Position.objects.create(title=title, reports_to=reports_to, authority_level=1, is_active=is_active)
+
+    def test_new_positions_get_ancestor_rows(self):
+        dean = self.position("Dean")
+        chair = self.position("Chair", reports_to=dean)
+        lecturer = self.position("Lecturer", reports_to=chair)
+
+        assert closure() == set(closure_rows({dean.pk: None, chair.pk: dean.pk, lecturer.pk: chair.pk}))
+
+    def test_move_subtree_reparents_descendants(self):
+        dean = self.position("Dean")
+        director = self.position("Director")
+        chair = self.position("Chair", reports_to=dean)
+        lecturer = self.position("Lecturer", reports_to=chair)
+
+        chair.reports_to = director
+        chair.save()
+
+        assert closure() == set(
+            closure_rows({dean.pk: None, director.pk: None, chair.pk: director.pk, lecturer.pk: chair.pk})
+        )
+        assert dean.get_all_subordinates() == set()
+        assert director.get_all_subordinates() == {chair, lecturer}
+
+    def test_move_subtree_to_root(self):
+        dean = self.position("Dean")
+        chair = self.position("Chair", reports_to=dean)
+        lecturer = self.position("Lecturer", reports_to=chair)
+
+        PositionClosure.move_subtree(chair.pk, None)
+
+        assert closure() == {
+            (dean.pk, dean.pk, 0),
+            (chair.pk, chair.pk, 0),
+            (chair.pk, lecturer.pk, 1),
+            (lecturer.pk, lecturer.pk, 0),
+        }
+
+    def test_rebuild_repairs_rows(self):
+        dean = self.position("Dean")
+        self.position("Chair", reports_to=dean)
+        expected = closure()
+        PositionClosure.objects.exclude(depth=0).delete()
+
+        assert PositionClosure.rebuild() == len(expected)
+        assert closure() == expected
+
+    def test_inactive_position_hides_its_subtree(self):
+        dean = self.position("Dean")
+        chair = self.position("Chair", reports_to=dean, is_active=False)
+        self.position("Lecturer", reports_to=chair)
+        registrar = self.position("Registrar", reports_to=dean)
+        clerk = self.position("Clerk", reports_to=registrar)
+
+        assert dean.get_all_subordinates() == {registrar, clerk}
+        assert {position.title for position in chair.get_all_subordinates()} == {"Lecturer"}
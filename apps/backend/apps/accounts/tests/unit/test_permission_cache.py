@@ -0,0 +1,152 @@
+"""
+Tests for cached role permission checks.
+
+Verifies that permissions granted through roles and parent roles are only
+honoured in their department scope, that object-level grants are never
+widened to the whole model, and that role, assignment and grant changes
+drop stale cached sets.
+"""
+
+import pytest
+from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
+
+from apps.accounts.models import Department, Permission, Role, RolePermission, UserRole
+from apps.accounts.services import PermissionService
+
+
+@pytest.mark.django_db
+class TestRolePermissions:
+    """Test scoped permission checks through the per-user cache."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, settings, user):
+        settings.CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+        cache.clear()
+        self.user = user
+        self.english = Department.objects.create(name="English", code="ENG")
+        self.math = Department.objects.create(name="Mathematics", code="MATH")
+        self.view_grades = Permission.objects.create(name="View grades", codename="view_grades")
+
+    def role(self, name, department=None, parent=None):
+        return Role.objects.create(
+            name=name, role_type=Role.RoleType.TEACHER, department=department, parent_role=parent
+        )
+
+    def grant(self, role, permission=None, **scope):
+        return RolePermission.objects.create(role=role, permission=permission or self.view_grades, **scope)
+
+    def can(self, department=None, codename="view_grades"):
+        return PermissionService.has_permission(self.user, codename, department=department)
+
+    def test_global_grant_applies_everywhere(self):
+        role = self.role("Registrar")
+        self.grant(role)
+        UserRole.objects.create(user=self.user, role=role)
+
+        assert self.can()
+        assert self.can(self.english)
+
+    def test_department_role_grants_only_in_its_department(self):
+        role = self.role("Teacher", department=self.english)
+        self.grant(role)
+        UserRole.objects.create(user=self.user, role=role, department=self.english)
+
+        assert self.can(self.english)
+        assert not self.can(self.math)
+        assert not self.can()
+
+    def test_department_scoped_grant_on_global_role(self):
+        role = self.role("Coordinator")
+        self.grant(role, department=self.math)
+        UserRole.objects.create(user=self.user, role=role)
+
+        assert self.can(self.math)
+        assert not self.can(self.english)
+        assert not self.can()
+
+    def test_inherited_grant_keeps_the_assignment_scope(self):
+        parent = self.role("Staff")
+        self.grant(parent)
+        child = self.role("Teacher", department=self.english, parent=parent)
+        UserRole.objects.create(user=self.user, role=child, department=self.english)
+
+        assert self.can(self.english)
+        assert not self.can(self.math)
+
+    def test_conflicting_scopes_grant_nothing(self):
+        role = self.role("Teacher", department=self.english)
+        self.grant(role, department=self.math)
+        UserRole.objects.create(user=self.user, role=role, department=self.english)
+
+        assert not self.can(self.english)
+        assert not self.can(self.math)
+
+    def test_object_level_grants_are_not_model_wide(self):
+        role = self.role("Advisor")
+        self.grant(role, content_type=ContentType.objects.get_for_model(Department), object_id=self.english.pk)
+        UserRole.objects.create(user=self.user, role=role)
+
+        assert not self.can()
+        assert not self.can(self.english)
+
+    def test_assignment_changes_drop_the_users_cache(self):
+        role = self.role("Registrar")
+        self.grant(role)
+        assignment = UserRole.objects.create(user=self.user, role=role)
+        assert self.can()
+
+        assignment.is_active = False
+        assignment.save()
+        assert not self.can()
+
+        assignment.is_active = True
+        assignment.save()
+        assert self.can()
+
+        assignment.delete()
+        assert not self.can()
+
+    def test_role_changes_drop_cached_sets(self):
+        parent = self.role("Staff")
+        self.grant(parent)
+        child = self.role("Registrar")
+        UserRole.objects.create(user=self.user, role=child)
+        assert not self.can()
+
+        child.parent_role = parent
+        child.save()
+        assert self.can()
+
+        child.is_active = False
+        child.save()
+        assert not self.can()
+
+        child.is_active = True
+        child.department = self.english
+        child.save()
+        assert not self.can()
+        assert self.can(self.english)
+
+    def test_grant_changes_drop_cached_sets(self):
+        role = self.role("Registrar")
+        UserRole.objects.create(user=self.user, role=role)
+        assert not self.can()
+
+        grant = self.grant(role)
+        assert self.can()
+
+        grant.is_active = False
+        grant.save()
+        assert not self.can()
+
+        grant.is_active = True
+        grant.save()
+        self.view_grades.is_active = False
+        self.view_grades.save()
+        assert not self.can()
+
+        self.view_grades.is_active = True
+        self.view_grades.save()
+        grant.delete()
+        assert not self.can()
@@ -0,0 +1,15 @@
+"""Django app configuration for analytics app."""
+
+from django.apps import AppConfig
+
+
+class AnalyticsConfig(AppConfig):
+    """Configuration for the analytics app."""
+
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "apps.analytics"
+    verbose_name = "Analytics"
+
+    def ready(self):
+        """Connect rollup change-event signals."""
+        from apps.analytics import signals  # noqa: F401
@@ -0,0 +1,90 @@
+"""Management command to rebuild dashboard metric rollups.
+
+Rollups are normally maintained incrementally by change-event actors. Use
+this command to backfill them after deployment or bulk imports that bypass
+signals, or to repair drift.
+
+Usage:
+    # Rebuild everything
+    python manage.py rebuild_metric_rollups
+
+    # Rebuild daily rollups for the last 90 days only
+    python manage.py rebuild_metric_rollups --days 90 --skip-terms
+"""
+
+from datetime import date, timedelta
+
+from django.core.management.base import BaseCommand
+from django.db.models import Max, Min
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from apps.analytics import rollups
+
+
+class Command(BaseCommand):
+    help = "Rebuild pre-aggregated dashboard metric rollups"
+
+    def add_arguments(self, parser):
+        """Add command arguments."""
+        parser.add_argument(
+            "--days",
+            type=int,
+            help="Only rebuild daily rollups for this many recent days (default: full history)",
+        )
+        parser.add_argument(
+            "--skip-daily",
+            action="store_true",
+            help="Do not rebuild per-day rollups",
+        )
+        parser.add_argument(
+            "--skip-terms",
+            action="store_true",
+            help="Do not rebuild per-term rollups",
+        )
+
+    def handle(self, *args, **options):
+        """Rebuild the requested rollups bucket by bucket."""
+        if not options["skip_daily"]:
+            start, end = self._daily_bounds(options["days"])
+            days = 0
+            if start and end:
+                current = start
+                while current <= end:
+                    rollups.refresh_daily_revenue(current)
+                    rollups.refresh_daily_attendance(current)
+                    current += timedelta(days=1)
+                    days += 1
+            self.stdout.write(f"Rebuilt daily rollups for {days} days")
+
+        if not options["skip_terms"]:
+            from apps.curriculum.models import Term
+
+            term_ids = list(Term.objects.values_list("id", flat=True))
+            for term_id in term_ids:
+                rollups.refresh_term_enrollments(term_id)
+                rollups.refresh_term_grades(term_id)
+                rollups.refresh_term_receivables(term_id, include_global=False)
+            rollups.refresh_global_receivables()
+            self.stdout.write(f"Rebuilt term rollups for {len(term_ids)} terms")
+
+        self.stdout.write(self.style.SUCCESS("Metric rollups rebuilt"))
+
+    def _daily_bounds(self, days: int | None) -> tuple[date | None, date | None]:
+        """Return the inclusive day range covering payments and attendance."""
+        today = timezone.now().date()
+        if days:
+            return today - timedelta(days=days - 1), today
+
+        from apps.attendance.models import AttendanceSession
+        from apps.finance.models import Payment
+
+        payment_bounds = Payment.objects.aggregate(
+            first=Min(TruncDate("payment_date")), last=Max(TruncDate("payment_date"))
+        )
+        session_bounds = AttendanceSession.objects.aggregate(first=Min("session_date"), last=Max("session_date"))
+        firsts = [d for d in (payment_bounds["first"], session_bounds["first"]) if d]
+        lasts = [d for d in (payment_bounds["last"], session_bounds["last"]) if d]
+        if not firsts:
+            return None, None
+        return min(firsts), max(lasts)
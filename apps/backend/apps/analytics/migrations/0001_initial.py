@@ -0,0 +1,171 @@
+# Generated by Django 5.2 on 2025-08-01
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # 0005 created ML metadata models that were never added to models.py and
+    # depended on a migration that does not exist, so it could not be applied.
+    # Squashing drops it while keeping migrations that depend on it resolvable.
+    replaces = [
+        ("analytics", "0005_add_ai_ml_metadata"),
+        ("analytics", "0006_metric_rollups"),
+    ]
+
+    initial = True
+
+    dependencies = [
+        ("curriculum", "0002_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DailyMetricRollup",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                (
+                    "created_at",
+                    models.DateTimeField(
+                        auto_now_add=True, help_text="Date and time when the record was created", verbose_name="Created at"
+                    ),
+                ),
+                (
+                    "updated_at",
+                    models.DateTimeField(
+                        auto_now=True, help_text="Date and time when the record was last updated", verbose_name="Updated at"
+                    ),
+                ),
+                (
+                    "metric",
+                    models.CharField(
+                        choices=[("REVENUE", "Revenue"), ("ATTENDANCE", "Attendance")],
+                        help_text="Metric this row aggregates",
+                        max_length=20,
+                        verbose_name="Metric",
+                    ),
+                ),
+                ("day", models.DateField(help_text="Calendar day covered by this row", verbose_name="Day")),
+                (
+                    "dimension",
+                    models.CharField(
+                        blank=True,
+                        help_text="Breakdown value, e.g. payment method or attendance status",
+                        max_length=50,
+                        verbose_name="Dimension",
+                    ),
+                ),
+                (
+                    "count",
+                    models.PositiveIntegerField(
+                        default=0, help_text="Number of source records in this bucket", verbose_name="Count"
+                    ),
+                ),
+                (
+                    "total",
+                    models.DecimalField(
+                        decimal_places=2,
+                        default=0,
+                        help_text="Summed amount for monetary metrics",
+                        max_digits=14,
+                        verbose_name="Total",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Daily Metric Rollup",
+                "verbose_name_plural": "Daily Metric Rollups",
+                "ordering": ["metric", "day", "dimension"],
+                "indexes": [models.Index(fields=["metric", "day"], name="analytics_daily_metric_idx")],
+                "constraints": [
+                    models.UniqueConstraint(fields=("metric", "day", "dimension"), name="unique_daily_metric_rollup")
+                ],
+            },
+        ),
+        migrations.CreateModel(
+            name="TermMetricRollup",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                (
+                    "created_at",
+                    models.DateTimeField(
+                        auto_now_add=True, help_text="Date and time when the record was created", verbose_name="Created at"
+                    ),
+                ),
+                (
+                    "updated_at",
+                    models.DateTimeField(
+                        auto_now=True, help_text="Date and time when the record was last updated", verbose_name="Updated at"
+                    ),
+                ),
+                (
+                    "metric",
+                    models.CharField(
+                        choices=[
+                            ("ENROLLMENT", "Enrollment Count"),
+                            ("RECEIVABLES", "Outstanding Receivables"),
+                            ("GRADE_DISTRIBUTION", "Grade Distribution"),
+                        ],
+                        help_text="Metric this row aggregates",
+                        max_length=20,
+                        verbose_name="Metric",
+                    ),
+                ),
+                (
+                    "dimension",
+                    models.CharField(
+                        blank=True,
+                        help_text="Breakdown value, e.g. enrollment status, invoice status or letter grade",
+                        max_length=50,
+                        verbose_name="Dimension",
+                    ),
+                ),
+                (
+                    "count",
+                    models.PositiveIntegerField(
+                        default=0, help_text="Number of source records in this bucket", verbose_name="Count"
+                    ),
+                ),
+                (
+                    "total",
+                    models.DecimalField(
+                        decimal_places=2,
+                        default=0,
+                        help_text="Summed amount for monetary metrics",
+                        max_digits=14,
+                        verbose_name="Total",
+                    ),
+                ),
+                (
+                    "term",
+                    models.ForeignKey(
+                        blank=True,
+                        help_text="Term covered by this row; empty for institution-wide totals",
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="metric_rollups",
+                        to="curriculum.term",
+                        verbose_name="Term",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Term Metric Rollup",
+                "verbose_name_plural": "Term Metric Rollups",
+                "ordering": ["metric", "term", "dimension"],
+                "indexes": [models.Index(fields=["term", "metric"], name="analytics_term_metric_idx")],
+                "constraints": [
+                    models.UniqueConstraint(
+                        condition=models.Q(("term__isnull", False)),
+                        fields=("term", "metric", "dimension"),
+                        name="unique_term_metric_rollup",
+                    ),
+                    models.UniqueConstraint(
+                        condition=models.Q(("term__isnull", True)),
+                        fields=("metric", "dimension"),
+                        name="unique_global_metric_rollup",
+                    ),
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,120 @@
+"""Seed dashboard metric rollups from existing records.
+
+Dashboards read only rollup rows, so without a seed they show zeros until
+``rebuild_metric_rollups`` runs. Each metric is seeded with one grouped query
+over the full history; change events keep the rows current afterwards. The
+queries mirror the refreshers in ``apps.analytics.rollups`` and are copied
+here so this migration keeps working when that module changes.
+"""
+
+from decimal import Decimal
+
+from django.db import migrations
+from django.db.models import Count, F, Sum
+from django.db.models.functions import TruncDate
+
+OPEN_INVOICE_STATUSES = ("SENT", "PARTIALLY_PAID", "OVERDUE")
+
+
+def seed_metric_rollups(apps, schema_editor):
+    DailyMetricRollup = apps.get_model("analytics", "DailyMetricRollup")
+    TermMetricRollup = apps.get_model("analytics", "TermMetricRollup")
+    AttendanceRecord = apps.get_model("attendance", "AttendanceRecord")
+    ClassHeaderEnrollment = apps.get_model("enrollment", "ClassHeaderEnrollment")
+    Invoice = apps.get_model("finance", "Invoice")
+    Payment = apps.get_model("finance", "Payment")
+
+    # payment_date__date and TruncDate both use the current time zone
+    revenue = (
+        Payment.objects.filter(status="COMPLETED", payment_date__isnull=False)
+        .values(bucket=TruncDate("payment_date"), dimension=F("payment_method"))
+        .annotate(count=Count("id"), total=Sum("amount"))
+        .order_by()
+    )
+    attendance = (
+        AttendanceRecord.objects.values(bucket=F("attendance_session__session_date"), dimension=F("status"))
+        .annotate(count=Count("id"))
+        .order_by()
+    )
+    DailyMetricRollup.objects.bulk_create(
+        (
+            DailyMetricRollup(
+                metric=metric,
+                day=row["bucket"],
+                dimension=row["dimension"] or "",
+                count=row["count"],
+                total=row.get("total") or Decimal("0.00"),
+            )
+            for metric, rows in (("REVENUE", revenue), ("ATTENDANCE", attendance))
+            for row in rows
+        ),
+        batch_size=1000,
+    )
+
+    enrollments = (
+        ClassHeaderEnrollment.objects.filter(class_header__term__isnull=False)
+        .values(bucket=F("class_header__term_id"), dimension=F("status"))
+        .annotate(count=Count("id"))
+        .order_by()
+    )
+    grades = (
+        ClassHeaderEnrollment.objects.filter(class_header__term__isnull=False)
+        .exclude(final_grade="")
+        .exclude(final_grade__isnull=True)
+        .values(bucket=F("class_header__term_id"), dimension=F("final_grade"))
+        .annotate(count=Count("id"))
+        .order_by()
+    )
+    receivables = list(
+        Invoice.objects.filter(term__isnull=False, status__in=OPEN_INVOICE_STATUSES)
+        .values(bucket=F("term_id"), dimension=F("status"))
+        .annotate(count=Count("id"), total=Sum(F("total_amount") - F("paid_amount")))
+        .order_by()
+    )
+
+    # Institution-wide receivables are the sum of the per-term rows
+    overall: dict[str, dict] = {}
+    for row in receivables:
+        total = overall.setdefault(
+            row["dimension"], {"bucket": None, "dimension": row["dimension"], "count": 0, "total": Decimal("0.00")}
+        )
+        total["count"] += row["count"]
+        total["total"] += row["total"] or Decimal("0.00")
+
+    TermMetricRollup.objects.bulk_create(
+        (
+            TermMetricRollup(
+                metric=metric,
+                term_id=row["bucket"],
+                dimension=row["dimension"] or "",
+                count=row["count"],
+                total=row.get("total") or Decimal("0.00"),
+            )
+            for metric, rows in (
+                ("ENROLLMENT", enrollments),
+                ("GRADE_DISTRIBUTION", grades),
+                ("RECEIVABLES", [*receivables, *overall.values()]),
+            )
+            for row in rows
+        ),
+        batch_size=1000,
+    )
+
+
+def clear_metric_rollups(apps, schema_editor):
+    apps.get_model("analytics", "DailyMetricRollup").objects.all().delete()
+    apps.get_model("analytics", "TermMetricRollup").objects.all().delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("analytics", "0001_initial"),
+        ("attendance", "0002_initial"),
+        ("enrollment", "0002_initial"),
+        ("finance", "0003_studentbalance"),
+    ]
+
+    operations = [
+        migrations.RunPython(seed_metric_rollups, clear_metric_rollups),
+    ]
@@ -0,0 +1,145 @@
+"""Pre-aggregated metric rollups for dashboards.
+
+Rollup rows are maintained incrementally by the actors in
+``apps.analytics.tasks`` whenever the underlying records change, so
+dashboard endpoints read a bounded number of rows instead of aggregating
+the full history of payments, invoices, enrollments and attendance.
+"""
+
+from typing import ClassVar
+
+from django.db import models
+from django.db.models import CharField, DateField, DecimalField, ForeignKey, PositiveIntegerField
+from django.utils.translation import gettext_lazy as _
+
+from apps.common.models import TimestampedModel
+
+
+class DailyMetricRollup(TimestampedModel):
+    """Per-day aggregate of a metric, split by one dimension.
+
+    Examples: completed payment revenue per payment method, attendance
+    records per attendance status.
+    """
+
+    class Metric(models.TextChoices):
+        """Metrics rolled up per day."""
+
+        REVENUE = "REVENUE", _("Revenue")
+        ATTENDANCE = "ATTENDANCE", _("Attendance")
+
+    metric: CharField = models.CharField(
+        _("Metric"),
+        max_length=20,
+        choices=Metric.choices,
+        help_text=_("Metric this row aggregates"),
+    )
+    day: DateField = models.DateField(
+        _("Day"),
+        help_text=_("Calendar day covered by this row"),
+    )
+    dimension: CharField = models.CharField(
+        _("Dimension"),
+        max_length=50,
+        blank=True,
+        help_text=_("Breakdown value, e.g. payment method or attendance status"),
+    )
+    count: PositiveIntegerField = models.PositiveIntegerField(
+        _("Count"),
+        default=0,
+        help_text=_("Number of source records in this bucket"),
+    )
+    total: DecimalField = models.DecimalField(
+        _("Total"),
+        max_digits=14,
+        decimal_places=2,
+        default=0,
+        help_text=_("Summed amount for monetary metrics"),
+    )
+
+    class Meta:
+        verbose_name = _("Daily Metric Rollup")
+        verbose_name_plural = _("Daily Metric Rollups")
+        ordering = ["metric", "day", "dimension"]
+        constraints: ClassVar[list[models.BaseConstraint]] = [
+            models.UniqueConstraint(fields=["metric", "day", "dimension"], name="unique_daily_metric_rollup"),
+        ]
+        indexes: ClassVar[list[models.Index]] = [
+            models.Index(fields=["metric", "day"], name="analytics_daily_metric_idx"),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.metric} {self.day} {self.dimension or '-'}: {self.count} / {self.total}"
+
+
+class TermMetricRollup(TimestampedModel):
+    """Per-term aggregate of a metric, split by one dimension.
+
+    Rows with no term hold the institution-wide total for metrics such as
+    outstanding receivables, so dashboards never sum across terms.
+    """
+
+    class Metric(models.TextChoices):
+        """Metrics rolled up per term."""
+
+        ENROLLMENT = "ENROLLMENT", _("Enrollment Count")
+        RECEIVABLES = "RECEIVABLES", _("Outstanding Receivables")
+        GRADE_DISTRIBUTION = "GRADE_DISTRIBUTION", _("Grade Distribution")
+
+    term: ForeignKey = models.ForeignKey(
+        "curriculum.Term",
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name="metric_rollups",
+        verbose_name=_("Term"),
+        help_text=_("Term covered by this row; empty for institution-wide totals"),
+    )
+    metric: CharField = models.CharField(
+        _("Metric"),
+        max_length=20,
+        choices=Metric.choices,
+        help_text=_("Metric this row aggregates"),
+    )
+    dimension: CharField = models.CharField(
+        _("Dimension"),
+        max_length=50,
+        blank=True,
+        help_text=_("Breakdown value, e.g. enrollment status, invoice status or letter grade"),
+    )
+    count: PositiveIntegerField = models.PositiveIntegerField(
+        _("Count"),
+        default=0,
+        help_text=_("Number of source records in this bucket"),
+    )
+    total: DecimalField = models.DecimalField(
+        _("Total"),
+        max_digits=14,
+        decimal_places=2,
+        default=0,
+        help_text=_("Summed amount for monetary metrics"),
+    )
+
+    class Meta:
+        verbose_name = _("Term Metric Rollup")
+        verbose_name_plural = _("Term Metric Rollups")
+        ordering = ["metric", "term", "dimension"]
+        constraints: ClassVar[list[models.BaseConstraint]] = [
+            models.UniqueConstraint(
+                fields=["term", "metric", "dimension"],
+                condition=models.Q(term__isnull=False),
+                name="unique_term_metric_rollup",
+            ),
+            models.UniqueConstraint(
+                fields=["metric", "dimension"],
+                condition=models.Q(term__isnull=True),
+                name="unique_global_metric_rollup",
+            ),
+        ]
+        indexes: ClassVar[list[models.Index]] = [
+            models.Index(fields=["term", "metric"], name="analytics_term_metric_idx"),
+        ]
+
+    def __str__(self) -> str:
+        scope = self.term or "ALL"
+        return f"{self.metric} {scope} {self.dimension or '-'}: {self.count} / {self.total}"
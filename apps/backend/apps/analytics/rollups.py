@@ -0,0 +1,241 @@
+"""Incremental maintenance and reads for dashboard metric rollups.
+
+Each rollup bucket covers one (metric, day) or (metric, term) slice. When a
+source record changes, only its bucket is recomputed with a single grouped
+query over that slice, so refresh cost depends on the bucket size and not
+on how much history exists. Reads only touch rollup rows.
+
+Bucket keys are plain strings so they can be passed to Dramatiq actors:
+``"revenue:2024-05-01"``, ``"attendance:2024-05-01"``, ``"enrollment:12"``,
+``"grades:12"`` and ``"receivables:12"``.
+"""
+
+import logging
+from collections.abc import Callable
+from datetime import date, timedelta
+from decimal import Decimal
+from typing import Any
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count, F, Sum
+
+from apps.analytics.models import DailyMetricRollup, TermMetricRollup
+
+logger = logging.getLogger(__name__)
+
+PENDING_CACHE_KEY = "analytics:rollup:pending:{bucket}"
+PENDING_TTL_SECONDS = 300
+
+OPEN_INVOICE_STATUSES = ("SENT", "PARTIALLY_PAID", "OVERDUE")
+ACTIVE_ENROLLMENT_STATUSES = ("ENROLLED", "ACTIVE")
+# Matches AttendanceSession.update_statistics: excused absences count as present.
+ATTENDED_STATUSES = ("PRESENT", "PERMISSION")
+
+
+# --- Bucket refreshers -------------------------------------------------------
+
+
+def _replace_daily(metric: str, day: date, rows: list[dict[str, Any]]) -> int:
+    with transaction.atomic():
+        DailyMetricRollup.objects.filter(metric=metric, day=day).delete()
+        DailyMetricRollup.objects.bulk_create(
+            DailyMetricRollup(
+                metric=metric,
+                day=day,
+                dimension=row["dimension"] or "",
+                count=row["count"],
+                total=row.get("total") or Decimal("0.00"),
+            )
+            for row in rows
+        )
+    return len(rows)
+
+
+def _replace_term(metric: str, term_id: int | None, rows: list[dict[str, Any]]) -> int:
+    with transaction.atomic():
+        TermMetricRollup.objects.filter(metric=metric, term_id=term_id).delete()
+        TermMetricRollup.objects.bulk_create(
+            TermMetricRollup(
+                metric=metric,
+                term_id=term_id,
+                dimension=row["dimension"] or "",
+                count=row["count"],
+                total=row.get("total") or Decimal("0.00"),
+            )
+            for row in rows
+        )
+    return len(rows)
+
+
+def refresh_daily_revenue(day: date) -> int:
+    """Recompute completed payment revenue per payment method for one day."""
+    from apps.finance.models import Payment
+
+    rows = (
+        Payment.objects.filter(payment_date__date=day, status=Payment.PaymentStatus.COMPLETED)
+        .values(dimension=F("payment_method"))
+        .annotate(count=Count("id"), total=Sum("amount"))
+        .order_by()
+    )
+    return _replace_daily(DailyMetricRollup.Metric.REVENUE, day, list(rows))
+
+
+def refresh_daily_attendance(day: date) -> int:
+    """Recompute attendance record counts per status for one day."""
+    from apps.attendance.models import AttendanceRecord
+
+    rows = (
+        AttendanceRecord.objects.filter(attendance_session__session_date=day)
+        .values(dimension=F("status"))
+        .annotate(count=Count("id"))
+        .order_by()
+    )
+    return _replace_daily(DailyMetricRollup.Metric.ATTENDANCE, day, list(rows))
+
+
+def refresh_term_enrollments(term_id: int) -> int:
+    """Recompute class enrollment counts per status for one term."""
+    from apps.enrollment.models import ClassHeaderEnrollment
+
+    rows = (
+        ClassHeaderEnrollment.objects.filter(class_header__term_id=term_id)
+        .values(dimension=F("status"))
+        .annotate(count=Count("id"))
+        .order_by()
+    )
+    return _replace_term(TermMetricRollup.Metric.ENROLLMENT, term_id, list(rows))
+
+
+def refresh_term_grades(term_id: int) -> int:
+    """Recompute the final grade distribution for one term."""
+    from apps.enrollment.models import ClassHeaderEnrollment
+
+    rows = (
+        ClassHeaderEnrollment.objects.filter(class_header__term_id=term_id)
+        .exclude(final_grade="")
+        .exclude(final_grade__isnull=True)
+        .values(dimension=F("final_grade"))
+        .annotate(count=Count("id"))
+        .order_by()
+    )
+    return _replace_term(TermMetricRollup.Metric.GRADE_DISTRIBUTION, term_id, list(rows))
+
+
+def refresh_term_receivables(term_id: int, *, include_global: bool = True) -> int:
+    """Recompute open invoice balances for one term, then the global totals."""
+    from apps.finance.models import Invoice
+
+    rows = (
+        Invoice.objects.filter(term_id=term_id, status__in=OPEN_INVOICE_STATUSES)
+        .values(dimension=F("status"))
+        .annotate(count=Count("id"), total=Sum(F("total_amount") - F("paid_amount")))
+        .order_by()
+    )
+    written = _replace_term(TermMetricRollup.Metric.RECEIVABLES, term_id, list(rows))
+    if include_global:
+        refresh_global_receivables()
+    return written
+
+
+def refresh_global_receivables() -> int:
+    """Sum per-term receivable rows into the institution-wide rows."""
+    rows = (
+        TermMetricRollup.objects.filter(metric=TermMetricRollup.Metric.RECEIVABLES, term__isnull=False)
+        .values("dimension")
+        .annotate(count=Sum("count"), total=Sum("total"))
+        .order_by()
+    )
+    return _replace_term(TermMetricRollup.Metric.RECEIVABLES, None, list(rows))
+
+
+DAILY_REFRESHERS: dict[str, Callable[[date], int]] = {
+    "revenue": refresh_daily_revenue,
+    "attendance": refresh_daily_attendance,
+}
+
+TERM_REFRESHERS: dict[str, Callable[[int], int]] = {
+    "enrollment": refresh_term_enrollments,
+    "grades": refresh_term_grades,
+    "receivables": refresh_term_receivables,
+}
+
+
+def refresh_bucket(bucket: str) -> int:
+    """Recompute a single rollup bucket identified by its key."""
+    kind, _, key = bucket.partition(":")
+    if kind in DAILY_REFRESHERS:
+        return DAILY_REFRESHERS[kind](date.fromisoformat(key))
+    if kind in TERM_REFRESHERS:
+        return TERM_REFRESHERS[kind](int(key))
+    raise ValueError(f"Unknown rollup bucket: {bucket}")
+
+
+def schedule_refresh(kind: str, key: Any) -> None:
+    """Queue a bucket refresh after commit, coalescing bursts on the same bucket."""
+    if key is None:
+        return
+    bucket = f"{kind}:{key.isoformat() if isinstance(key, date) else key}"
+
+    def _enqueue() -> None:
+        if not cache.add(PENDING_CACHE_KEY.format(bucket=bucket), True, PENDING_TTL_SECONDS):
+            return
+        from apps.analytics.tasks import refresh_metric_rollup
+
+        try:
+            refresh_metric_rollup.send(bucket)
+        except Exception:
+            cache.delete(PENDING_CACHE_KEY.format(bucket=bucket))
+            logger.exception("Could not queue rollup refresh for %s", bucket)
+
+    transaction.on_commit(_enqueue)
+
+
+def clear_pending(bucket: str) -> None:
+    """Allow new refreshes of ``bucket`` to be queued."""
+    cache.delete(PENDING_CACHE_KEY.format(bucket=bucket))
+
+
+# --- Reads -------------------------------------------------------------------
+
+
+def get_daily_totals(metric: str, start: date, end: date) -> dict[date, dict[str, dict[str, Any]]]:
+    """Return ``{day: {dimension: {"count", "total"}}}`` for an inclusive range."""
+    result: dict[date, dict[str, dict[str, Any]]] = {}
+    rows = DailyMetricRollup.objects.filter(metric=metric, day__gte=start, day__lte=end).values_list(
+        "day", "dimension", "count", "total"
+    )
+    for day, dimension, count, total in rows:
+        result.setdefault(day, {})[dimension] = {"count": count, "total": total}
+    return result
+
+
+def sum_daily(metric: str, start: date, end: date, dimensions: tuple[str, ...] | None = None) -> dict[str, Any]:
+    """Sum count and total for a metric over an inclusive day range."""
+    queryset = DailyMetricRollup.objects.filter(metric=metric, day__gte=start, day__lte=end)
+    if dimensions is not None:
+        queryset = queryset.filter(dimension__in=dimensions)
+    totals = queryset.aggregate(count=Sum("count"), total=Sum("total"))
+    return {"count": totals["count"] or 0, "total": totals["total"] or Decimal("0.00")}
+
+
+def get_term_breakdown(metric: str, term_id: int | None) -> dict[str, dict[str, Any]]:
+    """Return ``{dimension: {"count", "total"}}`` for a term (``None`` for global)."""
+    rows = TermMetricRollup.objects.filter(metric=metric, term_id=term_id).values_list(
+        "dimension", "count", "total"
+    )
+    return {dimension: {"count": count, "total": total} for dimension, count, total in rows}
+
+
+def attendance_rate(start: date, end: date) -> float:
+    """Share of attendance records counted as attended over a day range."""
+    everything = sum_daily(DailyMetricRollup.Metric.ATTENDANCE, start, end)
+    if not everything["count"]:
+        return 0.0
+    attended = sum_daily(DailyMetricRollup.Metric.ATTENDANCE, start, end, ATTENDED_STATUSES)
+    return attended["count"] / everything["count"]
+
+
+def daily_range(days: int, end: date) -> tuple[date, date]:
+    """Inclusive ``(start, end)`` covering ``days`` days ending at ``end``."""
+    return end - timedelta(days=days - 1), end
@@ -0,0 +1,85 @@
+"""Change-event signals that keep metric rollups current.
+
+Each receiver maps the changed record to the rollup buckets it affects and
+queues their refresh after commit. Refreshes for the same bucket are
+coalesced, so bulk writes trigger one recompute per bucket. When an update
+moves a record to another bucket (a payment's date or an invoice's term),
+the bucket it left is refreshed as well.
+"""
+
+import logging
+from datetime import date, datetime
+from typing import Any
+
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+from django.utils import timezone
+
+from apps.analytics.rollups import schedule_refresh
+from apps.attendance.models import AttendanceRecord, AttendanceSession
+from apps.enrollment.models import ClassHeaderEnrollment
+from apps.finance.models import Invoice, Payment
+from apps.scheduling.models import ClassHeader
+
+logger = logging.getLogger(__name__)
+
+
+def _revenue_day(payment_date: datetime | None) -> date | None:
+    """Local calendar day of a payment, matching ``payment_date__date`` lookups."""
+    return timezone.localdate(payment_date) if payment_date else None
+
+
+@receiver(pre_save, sender=Payment)
+def store_original_payment_day(sender: type[Payment], instance: Payment, **kwargs: Any) -> None:
+    """Remember the stored payment day so a changed date also refreshes the old bucket."""
+    stored = None
+    if instance.pk:
+        stored = sender.objects.filter(pk=instance.pk).values_list("payment_date", flat=True).first()
+    instance._original_revenue_day = _revenue_day(stored)
+
+
+@receiver([post_save, post_delete], sender=Payment)
+def payment_changed(sender: type[Payment], instance: Payment, **kwargs: Any) -> None:
+    """Refresh the revenue bucket for the payment's day, and the day it moved from."""
+    day = _revenue_day(instance.payment_date)
+    schedule_refresh("revenue", day)
+    original_day = getattr(instance, "_original_revenue_day", None)
+    if original_day != day:
+        schedule_refresh("revenue", original_day)
+
+
+@receiver(pre_save, sender=Invoice)
+def store_original_invoice_term(sender: type[Invoice], instance: Invoice, **kwargs: Any) -> None:
+    """Remember the stored term so moving an invoice also refreshes the old term."""
+    stored = None
+    if instance.pk:
+        stored = sender.objects.filter(pk=instance.pk).values_list("term_id", flat=True).first()
+    instance._original_term_id = stored
+
+
+@receiver([post_save, post_delete], sender=Invoice)
+def invoice_changed(sender: type[Invoice], instance: Invoice, **kwargs: Any) -> None:
+    """Refresh the receivables bucket for the invoice's term, and the term it moved from."""
+    schedule_refresh("receivables", instance.term_id)
+    original_term_id = getattr(instance, "_original_term_id", None)
+    if original_term_id != instance.term_id:
+        schedule_refresh("receivables", original_term_id)
+
+
+@receiver([post_save, post_delete], sender=ClassHeaderEnrollment)
+def enrollment_changed(sender: type[ClassHeaderEnrollment], instance: ClassHeaderEnrollment, **kwargs: Any) -> None:
+    """Refresh enrollment counts and grade distribution for the class's term."""
+    term_id = ClassHeader.objects.filter(pk=instance.class_header_id).values_list("term_id", flat=True).first()
+    schedule_refresh("enrollment", term_id)
+    schedule_refresh("grades", term_id)
+
+
+@receiver([post_save, post_delete], sender=AttendanceRecord)
+def attendance_changed(sender: type[AttendanceRecord], instance: AttendanceRecord, **kwargs: Any) -> None:
+    """Refresh the attendance bucket for the session's day."""
+    session_date = (
+        AttendanceSession.objects.filter(pk=instance.attendance_session_id)
+        .values_list("session_date", flat=True)
+        .first()
+    )
+    schedule_refresh("attendance", session_date)
@@ -0,0 +1,28 @@
+"""Dramatiq background tasks for the analytics app.
+
+This module keeps dashboard metric rollups current by recomputing only the
+rollup bucket affected by each change.
+"""
+
+import logging
+
+import dramatiq
+
+from apps.analytics.rollups import clear_pending, refresh_bucket
+
+logger = logging.getLogger(__name__)
+
+
+@dramatiq.actor(queue_name="default", max_retries=3)
+def refresh_metric_rollup(bucket: str):
+    """Recompute one rollup bucket such as ``"revenue:2024-05-01"``.
+
+    The pending marker is cleared before computing, so changes committed
+    while this runs queue a fresh refresh instead of being lost.
+
+    Args:
+        bucket: Bucket key built by ``apps.analytics.rollups.schedule_refresh``
+    """
+    clear_pending(bucket)
+    rows = refresh_bucket(bucket)
+    logger.debug("Refreshed rollup bucket %s (%d rows)", bucket, rows)
@@ -0,0 +1,197 @@
+"""
+Tests for dashboard metric rollups.
+
+Covers how bucket keys queued by change events are dispatched to the
+per-day and per-term refreshers, that change events and payment status
+updates keep the stored aggregates correct when records move between
+buckets, and that the seed migration writes what the refreshers write.
+"""
+
+from datetime import UTC, date, datetime
+from decimal import Decimal
+from importlib import import_module
+
+import pytest
+from django.apps import apps
+
+from apps.analytics import rollups
+from apps.analytics.models import DailyMetricRollup, TermMetricRollup
+from apps.analytics.tasks import refresh_metric_rollup
+from apps.curriculum.models import Term
+from apps.finance.models import Invoice, Payment
+from apps.finance.services import InvoiceService
+from apps.people.models import Person, StudentProfile
+
+
+@pytest.mark.unit
+class TestRefreshBucket:
+    """Test that bucket keys reach the right refresher."""
+
+    def test_daily_bucket_parses_date(self, monkeypatch):
+        calls = []
+        monkeypatch.setitem(rollups.DAILY_REFRESHERS, "revenue", lambda day: calls.append(day) or 2)
+
+        assert rollups.refresh_bucket("revenue:2024-05-01") == 2
+        assert calls == [date(2024, 5, 1)]
+
+    def test_term_bucket_parses_id(self, monkeypatch):
+        calls = []
+        monkeypatch.setitem(rollups.TERM_REFRESHERS, "grades", lambda term_id: calls.append(term_id) or 5)
+
+        assert rollups.refresh_bucket("grades:12") == 5
+        assert calls == [12]
+
+    def test_unknown_bucket_raises(self):
+        with pytest.raises(ValueError):
+            rollups.refresh_bucket("unknown:1")
+
+
+@pytest.mark.django_db
+class TestChangeEventRefresh:
+    """Test that change signals leave the rollups matching the source rows."""
+
+    @pytest.fixture(autouse=True)
+    def _run_refreshes_inline(self, monkeypatch, django_capture_on_commit_callbacks):
+        monkeypatch.setattr(refresh_metric_rollup, "send", refresh_metric_rollup.fn)
+        self.committed = lambda: django_capture_on_commit_callbacks(execute=True)
+
+    @pytest.fixture
+    def invoice(self):
+        person = Person.objects.create(personal_name="Dara", family_name="Sok", date_of_birth="2000-01-01")
+        student = StudentProfile.objects.create(person=person, student_id=10001)
+        self.term = self._term("FALL24")
+        with self.committed():
+            return Invoice.objects.create(
+                student=student,
+                term=self.term,
+                invoice_number="INV-0001",
+                due_date=date(2024, 9, 30),
+                status="SENT",
+                subtotal=Decimal("100.00"),
+                total_amount=Decimal("100.00"),
+            )
+
+    def _term(self, code):
+        return Term.objects.create(
+            code=code, term_type=Term.TermType.BACHELORS, start_date="2024-09-01", end_date="2024-12-15"
+        )
+
+    def _revenue(self, day):
+        return rollups.sum_daily(DailyMetricRollup.Metric.REVENUE, day, day)
+
+    def _pay(self, invoice, user, paid_at):
+        with self.committed():
+            return Payment.objects.create(
+                invoice=invoice,
+                payment_reference="PAY-0001",
+                amount=Decimal("40.00"),
+                payment_date=paid_at,
+                payment_method="CASH",
+                status=Payment.PaymentStatus.COMPLETED,
+                processed_by=user,
+            )
+
+    def test_revenue_uses_local_payment_day(self, invoice, user):
+        # 20:00 UTC is 03:00 the next day in Phnom Penh
+        self._pay(invoice, user, datetime(2024, 5, 1, 20, 0, tzinfo=UTC))
+
+        assert self._revenue(date(2024, 5, 2)) == {"count": 1, "total": Decimal("40.00")}
+        assert self._revenue(date(2024, 5, 1))["count"] == 0
+
+    def test_moving_payment_date_refreshes_old_day(self, invoice, user):
+        payment = self._pay(invoice, user, datetime(2024, 5, 2, 3, 0, tzinfo=UTC))
+
+        payment.payment_date = datetime(2024, 5, 10, 3, 0, tzinfo=UTC)
+        with self.committed():
+            payment.save()
+
+        assert self._revenue(date(2024, 5, 2))["count"] == 0
+        assert self._revenue(date(2024, 5, 10)) == {"count": 1, "total": Decimal("40.00")}
+
+    def test_deleting_payment_refreshes_its_day(self, invoice, user):
+        payment = self._pay(invoice, user, datetime(2024, 5, 2, 3, 0, tzinfo=UTC))
+
+        with self.committed():
+            payment.delete()
+
+        assert self._revenue(date(2024, 5, 2))["count"] == 0
+
+    def test_moving_invoice_term_refreshes_old_term(self, invoice):
+        new_term = self._term("SPRING25")
+        assert rollups.get_term_breakdown(TermMetricRollup.Metric.RECEIVABLES, self.term.id)["SENT"]["count"] == 1
+
+        invoice.term = new_term
+        with self.committed():
+            invoice.save()
+
+        assert rollups.get_term_breakdown(TermMetricRollup.Metric.RECEIVABLES, self.term.id) == {}
+        assert rollups.get_term_breakdown(TermMetricRollup.Metric.RECEIVABLES, new_term.id)["SENT"] == {
+            "count": 1,
+            "total": Decimal("100.00"),
+        }
+
+    def test_payment_status_update_refreshes_receivables(self, invoice):
+        # Payment services change paid amounts with queryset updates, which send no signals
+        Invoice.objects.filter(pk=invoice.pk).update(paid_amount=Decimal("40.00"))
+        invoice.refresh_from_db()
+        with self.committed():
+            InvoiceService.update_invoice_payment_status(invoice)
+
+        assert rollups.get_term_breakdown(TermMetricRollup.Metric.RECEIVABLES, self.term.id) == {
+            "PARTIALLY_PAID": {"count": 1, "total": Decimal("60.00")}
+        }
+
+
+@pytest.mark.django_db
+class TestSeedMigration:
+    """The seed migration must write the rows the refreshers maintain."""
+
+    seed = staticmethod(import_module("apps.analytics.migrations.0002_seed_metric_rollups").seed_metric_rollups)
+
+    def _rows(self):
+        return (
+            sorted(DailyMetricRollup.objects.values_list("metric", "day", "dimension", "count", "total")),
+            sorted(
+                TermMetricRollup.objects.values_list("metric", "term_id", "dimension", "count", "total"),
+                key=lambda row: (row[0], row[1] or 0, row[2]),
+            ),
+        )
+
+    def test_seed_matches_refreshers(self, user):
+        # Change-event refreshes only run on commit, so nothing is rolled up yet
+        term = Term.objects.create(
+            code="FALL24", term_type=Term.TermType.BACHELORS, start_date="2024-09-01", end_date="2024-12-15"
+        )
+        person = Person.objects.create(personal_name="Dara", family_name="Sok", date_of_birth="2000-01-01")
+        student = StudentProfile.objects.create(person=person, student_id=10001)
+        for number, status in [("INV-0001", "SENT"), ("INV-0002", "OVERDUE")]:
+            invoice = Invoice.objects.create(
+                student=student,
+                term=term,
+                invoice_number=number,
+                due_date=date(2024, 9, 30),
+                status=status,
+                subtotal=Decimal("100.00"),
+                total_amount=Decimal("100.00"),
+            )
+        Payment.objects.create(
+            invoice=invoice,
+            payment_reference="PAY-0001",
+            amount=Decimal("40.00"),
+            payment_date=datetime(2024, 5, 1, 20, 0, tzinfo=UTC),
+            payment_method="CASH",
+            status=Payment.PaymentStatus.COMPLETED,
+            processed_by=user,
+        )
+        assert self._rows() == ([], [])
+
+        self.seed(apps, None)
+        seeded = self._rows()
+
+        DailyMetricRollup.objects.all().delete()
+        TermMetricRollup.objects.all().delete()
+        rollups.refresh_daily_revenue(date(2024, 5, 2))
+        rollups.refresh_term_receivables(term.id)
+
+        assert seeded == self._rows()
+        assert seeded[0] == [("REVENUE", date(2024, 5, 2), "CASH", 1, Decimal("40.00"))]
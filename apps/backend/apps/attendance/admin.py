@@ -563,6 +563,7 @@ class RosterSyncAdmin(admin.ModelAdmin):
         "sync_timestamp",
         "student_count",
         "enrollment_snapshot",
+        "roster_hash",
         "roster_changed",
         "changes_summary",
     ]
@@ -593,6 +594,7 @@ class RosterSyncAdmin(admin.ModelAdmin):
             "Change Tracking",
             {
                 "fields": (
+                    "roster_hash",
                     "roster_changed",
                     "changes_summary",
                 ),
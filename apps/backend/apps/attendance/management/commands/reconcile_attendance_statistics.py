@@ -0,0 +1,43 @@
+"""Management command to reconcile attendance session statistics.
+
+Session counters are maintained incrementally by record saves, and the
+``reconcile_session_statistics`` actor repairs recent sessions once a day
+(see ``start_attendance_schedules``). Use this command to repair older
+sessions, or drift right after bulk updates or raw writes that bypass the
+model.
+
+Usage:
+    # Reconcile every session
+    python manage.py reconcile_attendance_statistics
+
+    # Reconcile sessions from the last 30 days only
+    python manage.py reconcile_attendance_statistics --days 30
+"""
+
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from apps.attendance.models import AttendanceSession
+
+
+class Command(BaseCommand):
+    help = "Recount attendance records and repair drifted session statistics"
+
+    def add_arguments(self, parser):
+        """Add command arguments."""
+        parser.add_argument(
+            "--days",
+            type=int,
+            help="Only reconcile sessions held within this many days (default: all sessions)",
+        )
+
+    def handle(self, *args, **options):
+        """Repair drifted statistics in a single update."""
+        queryset = AttendanceSession.objects.all()
+        if options["days"]:
+            queryset = queryset.filter(session_date__gte=timezone.now().date() - timedelta(days=options["days"]))
+
+        corrected = AttendanceSession.reconcile_statistics(queryset)
+        self.stdout.write(self.style.SUCCESS(f"Reconciled session statistics; corrected {corrected} sessions"))
@@ -0,0 +1,27 @@
+"""Management command to start the periodic attendance jobs.
+
+Attendance statistics are reconciled daily and rosters are synced at
+midnight and noon by self-rescheduling Dramatiq actor chains. This command
+starts each chain unless one is already running, so it is safe to run on
+every deploy. The Dramatiq worker start scripts run it before
+starting the worker.
+
+Usage:
+    python manage.py start_attendance_schedules
+"""
+
+from django.core.management.base import BaseCommand
+
+from apps.attendance.tasks import start_schedules
+
+
+class Command(BaseCommand):
+    help = "Start the self-rescheduling attendance jobs that are not already running"
+
+    def handle(self, *args, **options):
+        """Start missing schedules and report which were started."""
+        started = start_schedules()
+        if started:
+            self.stdout.write(self.style.SUCCESS(f"Started schedules: {', '.join(started)}"))
+        else:
+            self.stdout.write("All attendance schedules are already running")
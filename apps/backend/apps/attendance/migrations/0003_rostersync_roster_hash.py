@@ -0,0 +1,54 @@
+# Generated by Django 5.2 on 2025-08-01
+
+import hashlib
+import json
+
+from django.db import migrations, models
+
+
+def roster_hash(roster):
+    """SHA-256 of the roster, independent of entry and key order.
+
+    Copied from ``apps.attendance.rosters`` so this migration keeps hashing
+    the same way when that module changes.
+    """
+    canonical = sorted(roster, key=lambda entry: entry["student_id"])
+    payload = json.dumps(canonical, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def hash_checkpoints(apps, schema_editor):
+    RosterSync = apps.get_model("attendance", "RosterSync")
+    syncs = RosterSync.objects.filter(is_successful=True, enrollment_snapshot__has_key="roster")
+    for sync in syncs.iterator():
+        sync.roster_hash = roster_hash(sync.enrollment_snapshot["roster"])
+        sync.save(update_fields=["roster_hash"])
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("attendance", "0002_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="rostersync",
+            name="roster_hash",
+            field=models.CharField(
+                blank=True,
+                help_text="SHA-256 of the full roster, compared to skip unchanged rosters",
+                max_length=64,
+                verbose_name="Roster Hash",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="rostersync",
+            name="enrollment_snapshot",
+            field=models.JSONField(
+                default=dict,
+                help_text="Full roster checkpoint, or students added and dropped since the previous sync",
+                verbose_name="Enrollment Snapshot",
+            ),
+        ),
+        migrations.RunPython(hash_checkpoints, migrations.RunPython.noop),
+    ]
@@ -22,7 +22,7 @@ from typing import TYPE_CHECKING, ClassVar
 from django.conf import settings
 from django.core.exceptions import ValidationError
 from django.core.validators import MaxValueValidator, MinValueValidator
-from django.db import models
+from django.db import models, transaction
 from django.db.models import (
     BooleanField,
     CharField,
@@ -30,16 +30,22 @@ from django.db.models import (
     DateField,
     DateTimeField,
     DecimalField,
+    F,
     ForeignKey,
+    OuterRef,
     PositiveIntegerField,
     Q,
+    Subquery,
     TimeField,
 )
+from django.db.models.functions import Coalesce
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
 from apps.common.models import AuditModel
 
+from .statistics import apply_record_transition
+
 if TYPE_CHECKING:
     from users.models import User
 
@@ -339,7 +345,11 @@ class AttendanceSession(AuditModel):
         return (self.present_count / self.total_students) * 100
 
     def update_statistics(self) -> None:
-        """Update session statistics using an efficient, single database query."""
+        """Recount session statistics using an efficient, single database query.
+
+        Record saves keep the counters current incrementally; this full
+        recount is for batches and reconciliation.
+        """
         stats = self.attendance_records.aggregate(
             total_students=Count("id"),
             present_count=Count(
@@ -368,6 +378,41 @@ class AttendanceSession(AuditModel):
 
         self.save(update_fields=["total_students", "present_count", "absent_count"])
 
+    @classmethod
+    def reconcile_statistics(cls, queryset: models.QuerySet | None = None) -> int:
+        """Recount statistics and repair sessions whose counters drifted.
+
+        Args:
+            queryset: Sessions to check (defaults to all)
+
+        Returns:
+            Number of sessions whose statistics were corrected
+        """
+
+        def record_count(statuses: list[str] | None = None):
+            records = AttendanceRecord.objects.filter(attendance_session=OuterRef("pk"))
+            if statuses is not None:
+                records = records.filter(status__in=statuses)
+            return Coalesce(
+                Subquery(records.order_by().values("attendance_session").annotate(count=Count("pk")).values("count")),
+                0,
+            )
+
+        actual = {
+            "total_students": record_count(),
+            "present_count": record_count(
+                [AttendanceRecord.AttendanceStatus.PRESENT, AttendanceRecord.AttendanceStatus.PERMISSION]
+            ),
+            "absent_count": record_count(
+                [AttendanceRecord.AttendanceStatus.ABSENT, AttendanceRecord.AttendanceStatus.LATE]
+            ),
+        }
+        queryset = cls.objects.all() if queryset is None else queryset
+        drifted = queryset.annotate(**{f"actual_{field}": value for field, value in actual.items()}).exclude(
+            **{field: F(f"actual_{field}") for field in actual}
+        )
+        return cls.objects.filter(pk__in=drifted.values("pk")).update(**actual)
+
     def assign_substitute(
         self,
         substitute_teacher: "TeacherProfile",
@@ -605,6 +650,32 @@ class AttendanceRecord(AuditModel):
     def __str__(self) -> str:
         return f"{self.student} - {self.attendance_session.session_date} ({self.status})"
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._counted_as = (instance.attendance_session_id, instance.status)
+        return instance
+
+    def save(self, *args, **kwargs) -> None:
+        """Save and move the record between its session's status counters."""
+        counted_as = getattr(self, "_counted_as", None)
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            current = (self.attendance_session_id, self.status)
+            if counted_as != current:
+                apply_record_transition(counted_as, current)
+        self._counted_as = current
+
+    def delete(self, *args, **kwargs):
+        """Delete and remove the record from its session's counters."""
+        counted_as = getattr(self, "_counted_as", None)
+        with transaction.atomic():
+            result = super().delete(*args, **kwargs)
+            if counted_as is not None:
+                apply_record_transition(counted_as, None)
+        self._counted_as = None
+        return result
+
     @property
     def is_present(self) -> bool:
         """Check if student was present (including excused)."""
@@ -824,7 +895,13 @@ class RosterSync(AuditModel):
     enrollment_snapshot: models.JSONField = models.JSONField(
         _("Enrollment Snapshot"),
         default=dict,
-        help_text=_("Frozen enrollment data for this date"),
+        help_text=_("Full roster checkpoint, or students added and dropped since the previous sync"),
+    )
+    roster_hash: models.CharField = models.CharField(
+        _("Roster Hash"),
+        max_length=64,
+        blank=True,
+        help_text=_("SHA-256 of the full roster, compared to skip unchanged rosters"),
     )
 
     # Change tracking
@@ -0,0 +1,83 @@
+"""Content hashes and add/drop deltas for daily roster snapshots.
+
+A roster is a list of student entries keyed by ``student_id``. Each sync
+hashes the roster in a canonical order and compares it with the hash of the
+class part's previous sync; unchanged rosters are not written at all.
+Changed rosters are stored as a delta against the previous roster, with a
+full checkpoint every ``ROSTER_CHECKPOINT_INTERVAL`` changes so that
+rebuilding a roster never replays more than that many deltas.
+
+Snapshot layouts stored in ``RosterSync.enrollment_snapshot``::
+
+    checkpoint: {"roster": [entry, ...]}
+    delta:      {"added": [entry, ...], "dropped": [student_id, ...], "sequence": n}
+
+``added`` holds entries that are new or whose details changed; ``sequence``
+counts the deltas written since the last checkpoint.
+"""
+
+import hashlib
+import json
+from collections.abc import Iterable
+
+ROSTER_CHECKPOINT_INTERVAL = 7
+
+
+def canonical_roster(roster: Iterable[dict]) -> list[dict]:
+    """Roster entries ordered by student ID."""
+    return sorted(roster, key=lambda entry: entry["student_id"])
+
+
+def roster_hash(roster: Iterable[dict]) -> str:
+    """SHA-256 of the roster, independent of entry and key order."""
+    payload = json.dumps(canonical_roster(roster), sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def roster_delta(previous: Iterable[dict], current: Iterable[dict]) -> dict[str, list]:
+    """Entries added or changed and student IDs dropped between two rosters."""
+    before = {entry["student_id"]: entry for entry in previous}
+    after = {entry["student_id"]: entry for entry in current}
+    return {
+        "added": canonical_roster(entry for student_id, entry in after.items() if before.get(student_id) != entry),
+        "dropped": sorted(student_id for student_id in before if student_id not in after),
+    }
+
+
+def apply_roster_delta(roster: Iterable[dict], delta: dict) -> list[dict]:
+    """Apply a delta produced by ``roster_delta`` to a roster."""
+    entries = {entry["student_id"]: entry for entry in roster}
+    for student_id in delta.get("dropped", []):
+        entries.pop(student_id, None)
+    for entry in delta.get("added", []):
+        entries[entry["student_id"]] = entry
+    return canonical_roster(entries.values())
+
+
+def is_checkpoint_snapshot(snapshot: dict) -> bool:
+    """Whether a stored snapshot holds a full roster rather than a delta."""
+    return "roster" in snapshot
+
+
+def rebuild_roster(snapshots: Iterable[dict]) -> list[dict]:
+    """Rebuild a roster from snapshots ordered newest first.
+
+    Deltas are collected until the first checkpoint and then replayed onto
+    it oldest first. Without a checkpoint the deltas are replayed onto an
+    empty roster.
+    """
+    deltas = []
+    roster: list[dict] = []
+    for snapshot in snapshots:
+        if is_checkpoint_snapshot(snapshot):
+            roster = snapshot["roster"]
+            break
+        deltas.append(snapshot)
+    for delta in reversed(deltas):
+        roster = apply_roster_delta(roster, delta)
+    return canonical_roster(roster)
+
+
+def summarize_delta(delta: dict) -> str:
+    """Human-readable summary for ``RosterSync.changes_summary``."""
+    return f"{len(delta['added'])} added or updated, {len(delta['dropped'])} dropped"
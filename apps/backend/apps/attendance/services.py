@@ -10,9 +10,11 @@ This module provides services for:
 
 import secrets
 import string
+from collections import defaultdict
 from datetime import date, datetime, timedelta
 
-from django.db.models import Prefetch
+from django.core.cache import cache
+from django.db.models import OuterRef, Subquery
 from django.utils import timezone
 
 from apps.enrollment.models import ClassHeaderEnrollment
@@ -21,13 +23,43 @@ from apps.scheduling.models import ClassPart, TeacherLeaveRequest
 
 from .constants import AttendanceConstants
 from .models import AttendanceRecord, AttendanceSession, PermissionRequest, RosterSync
+from .rosters import (
+    ROSTER_CHECKPOINT_INTERVAL,
+    canonical_roster,
+    rebuild_roster,
+    roster_delta,
+    roster_hash,
+    summarize_delta,
+)
 
 
 class RosterSyncService:
     """Service for synchronizing class rosters with enrollment data.
     Runs twice daily (midnight and noon) to update mobile apps.
+
+    Only rosters whose content hash differs from the previous sync are
+    written, as add/drop deltas with periodic full checkpoints (see
+    ``apps.attendance.rosters``). Every sync also marks the class parts it
+    checked in the cache for the day, since an unchanged roster leaves the
+    latest row dated on the day it last changed.
     """
 
+    CHUNK_SIZE = 200
+    CHECKED_CACHE_KEY = "attendance:roster:checked:{class_part_id}:{sync_date}"
+    CHECKED_TTL_SECONDS = 24 * 60 * 60
+
+    @classmethod
+    def active_class_part_ids(cls, sync_date: date) -> list[int]:
+        """IDs of class parts meeting on ``sync_date`` in active classes."""
+        return list(
+            ClassPart.objects.filter(
+                class_session__class_header__status="ACTIVE",
+                meeting_days__contains=sync_date.strftime("%a").upper()[:3],
+            )
+            .order_by("id")
+            .values_list("id", flat=True)
+        )
+
     @classmethod
     def sync_daily_rosters(cls, sync_type: str = "MIDNIGHT") -> dict[str, int]:
         """Sync all active class rosters for today.
@@ -39,84 +71,188 @@ class RosterSyncService:
             Dict with sync statistics
         """
         today = timezone.now().date()
-        success_count = 0
-        error_count = 0
+        totals = {"success_count": 0, "error_count": 0, "changed_count": 0, "total_classes": 0}
 
-        # Get all active class parts for today with prefetched enrollments
-        active_class_parts = ClassPart.objects.filter(
-            class_session__class_header__status="ACTIVE",
-            meeting_days__contains=today.strftime("%a").upper()[:3],
-        ).prefetch_related(
-            # Prefetch the enrollments for all class parts at once
-            Prefetch(
-                "class_session__class_header__enrollments",
-                queryset=ClassHeaderEnrollment.objects.filter(status__in=["ENROLLED", "AUDIT"]).select_related(
-                    "student__person"
-                ),
-                to_attr="prefetched_enrollments",
-            )
-        )
+        class_part_ids = cls.active_class_part_ids(today)
+        for start in range(0, len(class_part_ids), cls.CHUNK_SIZE):
+            stats = cls.sync_class_parts(class_part_ids[start : start + cls.CHUNK_SIZE], today, sync_type)
+            for key in totals:
+                totals[key] += stats[key]
+
+        return totals
+
+    @classmethod
+    def sync_class_parts(cls, class_part_ids: list[int], sync_date: date, sync_type: str) -> dict[str, int]:
+        """Sync the rosters of a chunk of class parts.
+
+        Enrollments and the previous sync of every class part are loaded in
+        bulk; a row is only written for class parts whose roster changed.
 
-        for class_part in active_class_parts:
+        Returns:
+            Dict with sync statistics for the chunk
+        """
+        success_count = 0
+        error_count = 0
+        changed_count = 0
+        checked_ids = []
+
+        class_parts = ClassPart.objects.filter(id__in=class_part_ids).select_related("class_session")
+        header_ids = {class_part.class_session.class_header_id for class_part in class_parts}
+        enrollments_by_header = defaultdict(list)
+        for enrollment in ClassHeaderEnrollment.objects.filter(
+            class_header_id__in=header_ids,
+            status__in=["ENROLLED", "AUDIT"],  # Active enrollment statuses
+        ).select_related("student__person"):
+            enrollments_by_header[enrollment.class_header_id].append(enrollment)
+        latest_syncs = cls._latest_syncs(class_part_ids)
+
+        for class_part in class_parts:
             try:
-                cls._sync_class_roster(class_part, today, sync_type)
+                roster_data = cls._roster_entries(enrollments_by_header[class_part.class_session.class_header_id])
+                if cls._sync_class_roster(
+                    class_part, sync_date, sync_type, roster_data, latest_syncs.get(class_part.id)
+                ):
+                    changed_count += 1
                 success_count += 1
+                checked_ids.append(class_part.id)
             except (ValueError, TypeError, AttributeError) as e:
-                # Log error but continue with other classes
-                RosterSync.objects.create(
-                    class_part=class_part,
-                    sync_date=today,
-                    sync_type=sync_type,
-                    student_count=0,
-                    enrollment_snapshot={},
-                    is_successful=False,
-                    error_message=str(e),
-                )
+                # Log error but continue with other classes. A successful row
+                # under the same key may anchor later deltas, so it is kept.
                 error_count += 1
+                sync_key = {"class_part": class_part, "sync_date": sync_date, "sync_type": sync_type}
+                if RosterSync.objects.filter(**sync_key, is_successful=True).exists():
+                    continue
+                RosterSync.objects.update_or_create(
+                    **sync_key,
+                    defaults={
+                        "student_count": 0,
+                        "enrollment_snapshot": {},
+                        "roster_hash": "",
+                        "is_successful": False,
+                        "error_message": str(e),
+                    },
+                )
+
+        cache.set_many(
+            {
+                cls.CHECKED_CACHE_KEY.format(class_part_id=class_part_id, sync_date=sync_date): True
+                for class_part_id in checked_ids
+            },
+            cls.CHECKED_TTL_SECONDS,
+        )
 
         return {
             "success_count": success_count,
             "error_count": error_count,
+            "changed_count": changed_count,
             "total_classes": success_count + error_count,
         }
 
     @classmethod
-    def _sync_class_roster(cls, class_part: ClassPart, sync_date, sync_type: str):
-        """Sync roster for a single class part."""
-        # Use prefetched enrollments if available, otherwise query
-        if hasattr(class_part.class_session.class_header, "prefetched_enrollments"):  # type: ignore[attr-defined]
-            enrollments = class_part.class_session.class_header.prefetched_enrollments  # type: ignore[attr-defined]
-        else:
-            # Fallback for when called without prefetch
-            enrollments = ClassHeaderEnrollment.objects.filter(
-                class_header=class_part.class_session.class_header,  # type: ignore[attr-defined]
-                status__in=["ENROLLED", "AUDIT"],  # Active enrollment statuses
-            ).select_related("student__person")
-
-        # Create enrollment snapshot
-        roster_data = []
-        for enrollment in enrollments:
-            student_data = {
+    def checked_on(cls, class_part_id: int, sync_date: date) -> bool:
+        """Whether a sync has compared the roster of a class part on ``sync_date``."""
+        return bool(cache.get(cls.CHECKED_CACHE_KEY.format(class_part_id=class_part_id, sync_date=sync_date)))
+
+    @classmethod
+    def get_current_roster(cls, class_part: ClassPart) -> tuple[list[dict], RosterSync | None]:
+        """Rebuild the latest synced roster of a class part.
+
+        Returns:
+            The roster entries and the sync that last changed them, or an
+            empty roster and None if the class part was never synced
+        """
+        syncs = list(
+            RosterSync.objects.filter(class_part=class_part, is_successful=True)
+            .order_by("-sync_date", "-sync_timestamp")
+            .only("enrollment_snapshot", "sync_date", "sync_timestamp")[: ROSTER_CHECKPOINT_INTERVAL + 1]
+        )
+        if not syncs:
+            return [], None
+        return rebuild_roster(sync.enrollment_snapshot for sync in syncs), syncs[0]
+
+    @classmethod
+    def _latest_syncs(cls, class_part_ids: list[int]) -> dict[int, RosterSync]:
+        """Latest successful sync per class part, in two queries."""
+        latest_ids = (
+            ClassPart.objects.filter(id__in=class_part_ids)
+            .annotate(
+                latest_sync_id=Subquery(
+                    RosterSync.objects.filter(class_part=OuterRef("pk"), is_successful=True)
+                    .order_by("-sync_date", "-sync_timestamp")
+                    .values("id")[:1]
+                )
+            )
+            .exclude(latest_sync_id__isnull=True)
+            .values_list("latest_sync_id", flat=True)
+        )
+        return {sync.class_part_id: sync for sync in RosterSync.objects.filter(id__in=list(latest_ids))}
+
+    @staticmethod
+    def _roster_entries(enrollments) -> list[dict]:
+        """Roster entries for the mobile app from active enrollments."""
+        return canonical_roster(
+            {
                 "student_id": enrollment.student.student_id,
                 "student_name": enrollment.student.person.display_name,
                 "enrollment_status": enrollment.status,
                 "is_audit": enrollment.is_audit,
                 "late_enrollment": enrollment.late_enrollment,
             }
-            roster_data.append(student_data)
+            for enrollment in enrollments
+        )
+
+    @classmethod
+    def _sync_class_roster(
+        cls,
+        class_part: ClassPart,
+        sync_date,
+        sync_type: str,
+        roster_data: list[dict],
+        previous: RosterSync | None,
+    ) -> bool:
+        """Record the roster of a single class part if it changed.
+
+        Returns:
+            Whether a sync row was written
+        """
+        current_hash = roster_hash(roster_data)
+        if previous is not None and previous.roster_hash == current_hash:
+            return False
+
+        if previous is None:
+            delta = roster_delta([], roster_data)
+            snapshot = {"roster": roster_data}
+        else:
+            delta = roster_delta(cls.get_current_roster(class_part)[0], roster_data)
+            if not delta["added"] and not delta["dropped"]:
+                # Only the stored hash was missing, as on rows written before hashing
+                RosterSync.objects.filter(pk=previous.pk).update(roster_hash=current_hash)
+                return False
+
+            sequence = previous.enrollment_snapshot.get("sequence", 0) + 1
+            # A second sync under the same key overwrites the previous row, so
+            # the changes that row recorded must be folded into a checkpoint
+            same_row = (previous.sync_date, previous.sync_type) == (sync_date, sync_type)
+            if same_row or sequence >= ROSTER_CHECKPOINT_INTERVAL:
+                snapshot = {"roster": roster_data}
+            else:
+                snapshot = {**delta, "sequence": sequence}
 
-        # Save roster sync record
         RosterSync.objects.update_or_create(
             class_part=class_part,
             sync_date=sync_date,
             sync_type=sync_type,
             defaults={
                 "student_count": len(roster_data),
-                "enrollment_snapshot": {"roster": roster_data},
+                "enrollment_snapshot": snapshot,
+                "roster_hash": current_hash,
+                "roster_changed": previous is not None,
+                "changes_summary": summarize_delta(delta) if previous is not None else "",
                 "is_successful": True,
                 "error_message": "",
             },
         )
+        return True
 
 
 class AttendanceCodeService:
@@ -237,19 +373,29 @@ class AttendanceCodeService:
 
     @classmethod
     def _create_default_attendance_records(cls, session: AttendanceSession):
-        """Create default ABSENT records for all enrolled students."""
-        enrollments = ClassHeaderEnrollment.objects.filter(
+        """Create default ABSENT records for all enrolled students.
+
+        Records are inserted with one bulk insert, which sends no per-record
+        signals, and the session statistics are aggregated once afterwards.
+        """
+        student_ids = ClassHeaderEnrollment.objects.filter(
             class_header=session.class_part.class_session.class_header,  # type: ignore[attr-defined]
             status__in=["ENROLLED", "AUDIT"],
+        ).values_list("student_id", flat=True)
+
+        AttendanceRecord.objects.bulk_create(
+            [
+                AttendanceRecord(
+                    attendance_session=session,
+                    student_id=student_id,
+                    status=AttendanceRecord.AttendanceStatus.ABSENT,
+                    data_source=AttendanceRecord.DataSource.AUTO_ABSENT,
+                )
+                for student_id in student_ids
+            ],
+            batch_size=500,
         )
-
-        for enrollment in enrollments:
-            AttendanceRecord.objects.create(
-                attendance_session=session,
-                student=enrollment.student,
-                status=AttendanceRecord.AttendanceStatus.ABSENT,
-                data_source=AttendanceRecord.DataSource.AUTO_ABSENT,
-            )
+        session.update_statistics()
 
     @classmethod
     def validate_student_code_submission(
@@ -1,7 +1,6 @@
 """Attendance app signals for automated workflows.
 
 This module provides signal handlers for:
-- Automatic attendance statistics updates
 - Permission request notifications
 - Roster sync triggers
 - External system integrations
@@ -13,16 +12,6 @@ from django.dispatch import receiver
 from .models import AttendanceRecord, AttendanceSession, PermissionRequest
 
 
-@receiver(post_save, sender=AttendanceRecord)
-def update_session_statistics(sender, instance, created, **kwargs):
-    """Update attendance session statistics when attendance records change.
-
-    This ensures session totals are always accurate in real-time.
-    """
-    if instance.attendance_session:
-        instance.attendance_session.update_statistics()
-
-
 @receiver(post_save, sender=PermissionRequest)
 def handle_permission_request_approval(sender, instance, created, **kwargs):
     """Handle permission request approvals and create attendance records.
@@ -0,0 +1,111 @@
+"""Incremental maintenance of attendance session statistics.
+
+Each record save applies the counter changes implied by its old and new
+status to its session as a single atomic ``UPDATE ... SET count = count + 1``,
+so concurrent check-ins never re-aggregate the session.
+``AttendanceSession.reconcile_statistics`` recounts periodically to repair
+drift from writes that bypass the model.
+
+Batch operations such as recording a whole class at once run inside
+``deferred_session_statistics`` instead: record saves in the block only mark
+their session, and each marked session is aggregated once when the block
+exits successfully.
+"""
+
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.db.models import F
+from django.db.models.functions import Greatest
+
+# Session counter credited by each record status, besides total_students
+STATUS_COUNTERS = {
+    "PRESENT": "present_count",
+    "PERMISSION": "present_count",
+    "ABSENT": "absent_count",
+    "LATE": "absent_count",
+}
+
+_pending_sessions: ContextVar[set[int] | None] = ContextVar("pending_attendance_sessions", default=None)
+
+
+@contextmanager
+def deferred_session_statistics() -> Iterator[set[int]]:
+    """Defer session statistics updates to the end of a batch.
+
+    Yields the set of session ids to refresh. Bulk writes send no signals,
+    so callers add the sessions they touched to it. Nested blocks share the
+    outermost block's set.
+    """
+    pending = _pending_sessions.get()
+    if pending is not None:
+        yield pending
+        return
+
+    pending = set()
+    token = _pending_sessions.set(pending)
+    try:
+        yield pending
+    finally:
+        _pending_sessions.reset(token)
+
+    from .models import AttendanceSession
+
+    for session in AttendanceSession.objects.filter(pk__in=pending):
+        session.update_statistics()
+
+
+def defer_session_update(session_id: int) -> bool:
+    """Mark a session for a deferred update if a batch is in progress.
+
+    Returns:
+        Whether the update was deferred
+    """
+    pending = _pending_sessions.get()
+    if pending is None:
+        return False
+    pending.add(session_id)
+    return True
+
+
+def counter_deltas(
+    old: tuple[int, str] | None,
+    new: tuple[int, str] | None,
+) -> dict[int, dict[str, int]]:
+    """Session counter changes for a record moving between states.
+
+    Args:
+        old: ``(session id, status)`` the record counted toward, or None if new
+        new: ``(session id, status)`` it counts toward now, or None if deleted
+
+    Returns:
+        Non-zero counter deltas keyed by session id
+    """
+    deltas: dict[int, Counter] = {}
+    for state, sign in ((old, -1), (new, 1)):
+        if state is None:
+            continue
+        session_id, status = state
+        fields = deltas.setdefault(session_id, Counter())
+        fields["total_students"] += sign
+        if status in STATUS_COUNTERS:
+            fields[STATUS_COUNTERS[status]] += sign
+    return {
+        session_id: {field: delta for field, delta in fields.items() if delta}
+        for session_id, fields in deltas.items()
+        if any(fields.values())
+    }
+
+
+def apply_record_transition(old: tuple[int, str] | None, new: tuple[int, str] | None) -> None:
+    """Apply a record's status transition to its session counters atomically."""
+    from .models import AttendanceSession
+
+    for session_id, fields in counter_deltas(old, new).items():
+        if defer_session_update(session_id):
+            continue
+        AttendanceSession.objects.filter(pk=session_id).update(
+            **{field: Greatest(F(field) + delta, 0) for field, delta in fields.items()}
+        )
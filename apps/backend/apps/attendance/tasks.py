@@ -0,0 +1,186 @@
+"""Dramatiq background tasks for the attendance app.
+
+Session statistics are maintained incrementally by record saves; this
+module holds the periodic reconciliation that repairs drift from writes
+which bypass the model, such as bulk updates and raw SQL. It runs from a
+self-rescheduling actor chain started by ``start_attendance_schedules``.
+
+Roster syncs run at midnight and noon from a second chain and fan out
+across class parts in chunks, each chunk writing only the rosters that
+changed since the previous sync.
+"""
+
+import logging
+import uuid
+from datetime import date, datetime, timedelta
+
+import dramatiq
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+
+from apps.attendance.models import AttendanceSession
+from apps.attendance.services import RosterSyncService
+
+logger = logging.getLogger(__name__)
+
+RECONCILE_LEADER_KEY = "attendance:schedule:reconcile"
+ROSTER_LEADER_KEY = "attendance:schedule:rosters"
+
+# Local hours at which rosters are synced, with the sync type recorded
+ROSTER_SYNC_TIMES = ((0, "MIDNIGHT"), (12, "NOON"))
+ROSTER_LEASE_SECONDS = 24 * 60 * 60
+
+
+def get_reconcile_interval_seconds() -> int:
+    """Seconds between statistics reconciliations."""
+    return int(getattr(settings, "ATTENDANCE_RECONCILE_INTERVAL_SECONDS", 24 * 60 * 60))
+
+
+def claim_schedule(leader_key: str, chain_id: str, ttl: int) -> bool:
+    """Elect one self-rescheduling chain per schedule; others stop on their next run.
+
+    The lease expires when the leader misses its runs, so a crashed chain is
+    replaced the next time the schedules are started.
+    """
+    cache.add(leader_key, chain_id, ttl)
+    if cache.get(leader_key) != chain_id:
+        return False
+    cache.touch(leader_key, ttl)
+    return True
+
+
+def start_schedules() -> list[str]:
+    """Start every attendance schedule that has no running chain.
+
+    Returns the names of the schedules that were started.
+    """
+    started = []
+    if cache.get(RECONCILE_LEADER_KEY) is None:
+        schedule_session_reconciliation.send()
+        started.append("reconcile_session_statistics")
+    if cache.get(ROSTER_LEADER_KEY) is None:
+        schedule_roster_syncs.send()
+        started.append("sync_daily_rosters")
+    return started
+
+
+def next_roster_sync(now: datetime) -> tuple[datetime, str]:
+    """Return the next local midnight or noon after ``now`` and its sync type."""
+    local = timezone.localtime(now)
+    for hour, sync_type in ROSTER_SYNC_TIMES:
+        slot = local.replace(hour=hour, minute=0, second=0, microsecond=0)
+        if slot > local:
+            return slot, sync_type
+    hour, sync_type = ROSTER_SYNC_TIMES[0]
+    return (local + timedelta(days=1)).replace(hour=hour, minute=0, second=0, microsecond=0), sync_type
+
+
+@dramatiq.actor(queue_name="default", max_retries=0)
+def schedule_session_reconciliation(chain_id: str | None = None):
+    """Queue a statistics reconciliation once per interval.
+
+    The actor reschedules itself with the same ``chain_id``. Only the chain
+    holding the lease keeps running, so starting the schedule on several
+    workers still reconciles once per interval.
+
+    Args:
+        chain_id: Identifier of the self-rescheduling chain (new chain if omitted)
+    """
+    chain_id = chain_id or uuid.uuid4().hex
+    interval = get_reconcile_interval_seconds()
+
+    if not claim_schedule(RECONCILE_LEADER_KEY, chain_id, interval * 2):
+        logger.debug("Reconciliation chain %s is not the leader; stopping", chain_id)
+        return
+
+    try:
+        reconcile_session_statistics.send()
+    except Exception:
+        logger.exception("Failed to queue attendance statistics reconciliation")
+    finally:
+        schedule_session_reconciliation.send_with_options(args=(chain_id,), delay=interval * 1000)
+
+
+@dramatiq.actor(queue_name="default", max_retries=0)
+def schedule_roster_syncs(chain_id: str | None = None, sync_type: str | None = None):
+    """Queue ``sync_daily_rosters`` at every midnight and noon.
+
+    Each run queues the sync it was scheduled for, then reschedules itself
+    for the next slot with the same ``chain_id``. Only the chain holding the
+    lease keeps running. A new chain only schedules its first slot.
+
+    Args:
+        chain_id: Identifier of the self-rescheduling chain (new chain if omitted)
+        sync_type: Sync to queue on this run, or None for a new chain
+    """
+    chain_id = chain_id or uuid.uuid4().hex
+
+    if not claim_schedule(ROSTER_LEADER_KEY, chain_id, ROSTER_LEASE_SECONDS):
+        logger.debug("Roster sync chain %s is not the leader; stopping", chain_id)
+        return
+
+    try:
+        if sync_type:
+            sync_daily_rosters.send(sync_type)
+    except Exception:
+        logger.exception("Failed to queue %s roster sync", sync_type)
+    finally:
+        now = timezone.now()
+        slot, next_sync_type = next_roster_sync(now)
+        delay = int((slot - now).total_seconds() * 1000)
+        schedule_roster_syncs.send_with_options(args=(chain_id, next_sync_type), delay=delay)
+
+
+@dramatiq.actor(queue_name="default", max_retries=3)
+def reconcile_session_statistics(days: int = 7):
+    """Recount statistics for recent sessions and repair drifted counters.
+
+    Queued once per ``ATTENDANCE_RECONCILE_INTERVAL_SECONDS`` by
+    ``schedule_session_reconciliation``.
+
+    Args:
+        days: Reconcile sessions held within this many days
+    """
+    since = timezone.now().date() - timedelta(days=days)
+    corrected = AttendanceSession.reconcile_statistics(AttendanceSession.objects.filter(session_date__gte=since))
+    if corrected:
+        logger.warning("Corrected statistics for %d attendance sessions", corrected)
+
+
+@dramatiq.actor(queue_name="default", max_retries=3)
+def sync_daily_rosters(sync_type: str = "MIDNIGHT"):
+    """Enqueue roster syncs for today's active class parts in chunks.
+
+    Queued at midnight and noon by ``schedule_roster_syncs``.
+
+    Args:
+        sync_type: 'MIDNIGHT', 'NOON' or 'MANUAL'
+    """
+    today = timezone.now().date()
+    class_part_ids = RosterSyncService.active_class_part_ids(today)
+    chunks = range(0, len(class_part_ids), RosterSyncService.CHUNK_SIZE)
+    for start in chunks:
+        sync_roster_chunk.send(
+            class_part_ids[start : start + RosterSyncService.CHUNK_SIZE], today.isoformat(), sync_type
+        )
+    logger.info("Enqueued %s roster sync for %d class parts in %d chunks", sync_type, len(class_part_ids), len(chunks))
+
+
+@dramatiq.actor(queue_name="default", max_retries=3)
+def sync_roster_chunk(class_part_ids: list[int], sync_date: str, sync_type: str):
+    """Sync the rosters of one chunk of class parts.
+
+    Args:
+        class_part_ids: Class parts in this chunk
+        sync_date: ISO date the rosters apply to
+        sync_type: 'MIDNIGHT', 'NOON' or 'MANUAL'
+    """
+    stats = RosterSyncService.sync_class_parts(class_part_ids, date.fromisoformat(sync_date), sync_type)
+    logger.info(
+        "%s roster sync: %d of %d rosters changed, %d errors",
+        sync_type,
+        stats["changed_count"],
+        stats["total_classes"],
+        stats["error_count"],
+    )
@@ -0,0 +1,65 @@
+"""
+Tests for roster hashing and add/drop deltas.
+
+Verifies that hashes ignore entry order, that deltas capture additions,
+detail changes and drops, and that replaying deltas onto a checkpoint
+rebuilds the roster.
+"""
+
+from importlib import import_module
+
+import pytest
+
+from apps.attendance.rosters import apply_roster_delta, rebuild_roster, roster_delta, roster_hash
+
+
+def entry(student_id, status="ENROLLED"):
+    return {"student_id": student_id, "student_name": f"Student {student_id}", "enrollment_status": status}
+
+
+@pytest.mark.unit
+class TestRosterHash:
+    """Test content hashing of rosters."""
+
+    def test_hash_ignores_entry_order(self):
+        assert roster_hash([entry(1), entry(2)]) == roster_hash([entry(2), entry(1)])
+
+    def test_hash_changes_with_details(self):
+        assert roster_hash([entry(1)]) != roster_hash([entry(1, "AUDIT")])
+
+    def test_migration_hash_matches_service_hash(self):
+        migration = import_module("apps.attendance.migrations.0003_rostersync_roster_hash")
+        roster = [entry(2, "AUDIT"), entry(1)]
+
+        assert migration.roster_hash(roster) == roster_hash(roster)
+
+
+@pytest.mark.unit
+class TestRosterDelta:
+    """Test computing and applying deltas."""
+
+    def test_delta_captures_adds_changes_and_drops(self):
+        delta = roster_delta([entry(1), entry(2), entry(3)], [entry(1), entry(2, "AUDIT"), entry(4)])
+
+        assert delta == {"added": [entry(2, "AUDIT"), entry(4)], "dropped": [3]}
+
+    def test_unchanged_roster_has_empty_delta(self):
+        assert roster_delta([entry(1)], [entry(1)]) == {"added": [], "dropped": []}
+
+    def test_apply_round_trips(self):
+        previous = [entry(1), entry(2), entry(3)]
+        current = [entry(4), entry(2, "AUDIT"), entry(1)]
+
+        assert apply_roster_delta(previous, roster_delta(previous, current)) == sorted(
+            current, key=lambda item: item["student_id"]
+        )
+
+    def test_rebuild_replays_deltas_onto_latest_checkpoint(self):
+        snapshots = [
+            {**roster_delta([entry(1), entry(2)], [entry(2)]), "sequence": 2},
+            {**roster_delta([entry(1)], [entry(1), entry(2)]), "sequence": 1},
+            {"roster": [entry(1)]},
+            {"roster": [entry(9)]},
+        ]
+
+        assert rebuild_roster(snapshots) == [entry(2)]
@@ -0,0 +1,98 @@
+"""
+Tests for roster freshness in the teacher roster endpoint.
+
+Verifies that syncs mark the class parts they checked for the day, that a
+roster whose latest sync is from an earlier day and was not checked today
+is synced before it is served, and that a roster checked today is served
+without another sync.
+"""
+
+from datetime import date, time, timedelta
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+from django.core.cache import cache
+from django.utils import timezone
+
+from api.v1.attendance import get_class_roster
+from apps.attendance.models import RosterSync
+from apps.attendance.services import RosterSyncService
+from apps.curriculum.models import Course, Cycle, Division, Term
+from apps.enrollment.models import ClassHeaderEnrollment
+from apps.people.models import Person, StudentProfile, TeacherProfile
+from apps.scheduling.models import ClassHeader, ClassPart, ClassSession
+
+LOCMEM_CACHE = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+
+def person(name):
+    return Person.objects.create(personal_name=name, family_name="Sok", date_of_birth=date(2000, 1, 1))
+
+
+@pytest.mark.django_db
+class TestRosterFreshness:
+    """The roster endpoint must not serve a roster nobody checked today."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, settings, user):
+        settings.CACHES = LOCMEM_CACHE
+        cache.clear()
+        cycle = Cycle.objects.create(division=Division.objects.create(name="Academic"), name="Bachelor")
+        term = Term.objects.create(
+            code="FALL24", term_type=Term.TermType.BACHELORS, start_date="2024-09-01", end_date="2024-12-15"
+        )
+        course = Course.objects.create(code="ENG-101", title="English", short_title="English", cycle=cycle)
+        class_header = ClassHeader.objects.create(course=course, term=term, section_id="A")
+        self.teacher = TeacherProfile.objects.create(person=person("Teacher"))
+        self.class_part = ClassPart.objects.create(
+            class_session=ClassSession.objects.create(class_header=class_header),
+            meeting_days="MON",
+            start_time=time(9, 0),
+            end_time=time(10, 0),
+            teacher=self.teacher,
+        )
+        student = StudentProfile.objects.create(person=person("Dara"), student_id=10001)
+        ClassHeaderEnrollment.objects.create(
+            student=student, class_header=class_header, status="ENROLLED", enrolled_by=user
+        )
+        self.today = timezone.now().date()
+        self.request = SimpleNamespace(
+            user=SimpleNamespace(
+                is_authenticated=True, is_staff=False, person=SimpleNamespace(teacher_profile=self.teacher)
+            )
+        )
+
+    def test_sync_marks_class_parts_checked(self):
+        assert not RosterSyncService.checked_on(self.class_part.id, self.today)
+
+        RosterSyncService.sync_class_parts([self.class_part.id], self.today, "MIDNIGHT")
+
+        assert RosterSyncService.checked_on(self.class_part.id, self.today)
+        assert not RosterSyncService.checked_on(self.class_part.id, self.today + timedelta(days=1))
+
+    def test_stale_roster_is_synced_before_serving(self):
+        # Yesterday's sync saw an empty class; the enrollment arrived since
+        yesterday = self.today - timedelta(days=1)
+        ClassHeaderEnrollment.objects.update(status="DROPPED")
+        RosterSyncService.sync_class_parts([self.class_part.id], yesterday, "MIDNIGHT")
+        ClassHeaderEnrollment.objects.update(status="ENROLLED")
+
+        response = get_class_roster(self.request, self.class_part.id)
+
+        assert [student.student_id for student in response.students] == [10001]
+        assert RosterSync.objects.filter(class_part=self.class_part, sync_date=self.today, sync_type="MANUAL").exists()
+
+    def test_roster_checked_today_is_served_without_sync(self, monkeypatch):
+        yesterday = self.today - timedelta(days=1)
+        RosterSyncService.sync_class_parts([self.class_part.id], yesterday, "MIDNIGHT")
+        # An unchanged roster writes no row today but is marked checked
+        RosterSyncService.sync_class_parts([self.class_part.id], self.today, "MIDNIGHT")
+        assert not RosterSync.objects.filter(sync_date=self.today).exists()
+        sync = Mock()
+        monkeypatch.setattr(RosterSyncService, "sync_class_parts", sync)
+
+        response = get_class_roster(self.request, self.class_part.id)
+
+        sync.assert_not_called()
+        assert [student.student_id for student in response.students] == [10001]
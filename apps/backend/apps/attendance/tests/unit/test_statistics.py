@@ -0,0 +1,70 @@
+"""
+Tests for incremental and batched attendance session statistics.
+
+Verifies the counter deltas applied for record status transitions, that
+record saves inside a batch only mark their session, and that each marked
+session is aggregated exactly once when the batch ends.
+"""
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+from apps.attendance.statistics import counter_deltas, defer_session_update, deferred_session_statistics
+
+
+@pytest.mark.unit
+class TestCounterDeltas:
+    """Test counter changes for record status transitions."""
+
+    def test_new_record(self):
+        assert counter_deltas(None, (1, "PRESENT")) == {1: {"total_students": 1, "present_count": 1}}
+
+    def test_check_in_moves_between_counters(self):
+        assert counter_deltas((1, "ABSENT"), (1, "PRESENT")) == {1: {"absent_count": -1, "present_count": 1}}
+
+    def test_transition_within_a_counter_is_a_no_op(self):
+        assert counter_deltas((1, "ABSENT"), (1, "LATE")) == {}
+        assert counter_deltas((1, "PRESENT"), (1, "PERMISSION")) == {}
+
+    def test_deleted_record(self):
+        assert counter_deltas((1, "LATE"), None) == {1: {"total_students": -1, "absent_count": -1}}
+
+    def test_record_moved_to_another_session(self):
+        assert counter_deltas((1, "PRESENT"), (2, "PRESENT")) == {
+            1: {"total_students": -1, "present_count": -1},
+            2: {"total_students": 1, "present_count": 1},
+        }
+
+
+@pytest.mark.unit
+class TestDeferredSessionStatistics:
+    """Test deferring session statistics to the end of a batch."""
+
+    def test_updates_are_immediate_outside_a_batch(self):
+        assert defer_session_update(1) is False
+
+    @patch("apps.attendance.models.AttendanceSession.objects")
+    def test_each_session_is_aggregated_once(self, session_objects):
+        session = Mock()
+        session_objects.filter.return_value = [session]
+
+        with deferred_session_statistics() as pending:
+            assert defer_session_update(7)
+            assert defer_session_update(7)
+            with deferred_session_statistics() as nested:
+                assert nested is pending
+                nested.add(7)
+
+        session_objects.filter.assert_called_once_with(pk__in={7})
+        session.update_statistics.assert_called_once_with()
+        assert defer_session_update(7) is False
+
+    @patch("apps.attendance.models.AttendanceSession.objects")
+    def test_failed_batch_does_not_aggregate(self, session_objects):
+        with pytest.raises(RuntimeError), deferred_session_statistics():
+            defer_session_update(7)
+            raise RuntimeError
+
+        session_objects.filter.assert_not_called()
+        assert defer_session_update(7) is False
@@ -0,0 +1,120 @@
+"""
+Tests for the self-rescheduling attendance jobs.
+
+Verifies that the reconciliation chain queues a reconciliation and
+reschedules itself once per interval, that the roster chain queues syncs at
+midnight and noon, that a second chain stops, and that starting the
+schedules leaves a running chain alone.
+"""
+
+from datetime import datetime
+from io import StringIO
+from unittest.mock import Mock
+
+import pytest
+from django.core.cache import cache
+from django.core.management import call_command
+from django.utils import timezone
+
+from apps.attendance import tasks
+
+LOCMEM_CACHE = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+
+@pytest.mark.unit
+class TestReconciliationSchedule:
+    """Test the periodic statistics reconciliation chain."""
+
+    @pytest.fixture(autouse=True)
+    def locmem_cache(self, settings, monkeypatch):
+        settings.CACHES = LOCMEM_CACHE
+        settings.ATTENDANCE_RECONCILE_INTERVAL_SECONDS = 3600
+        cache.clear()
+        self.reconcile = Mock()
+        self.reschedule = Mock()
+        monkeypatch.setattr(tasks.reconcile_session_statistics, "send", self.reconcile)
+        monkeypatch.setattr(tasks.schedule_session_reconciliation, "send_with_options", self.reschedule)
+
+    def test_leader_reconciles_and_reschedules(self):
+        tasks.schedule_session_reconciliation.fn("chain-a")
+
+        self.reconcile.assert_called_once_with()
+        self.reschedule.assert_called_once_with(args=("chain-a",), delay=3600 * 1000)
+
+    def test_second_chain_stops(self):
+        tasks.schedule_session_reconciliation.fn("chain-a")
+        tasks.schedule_session_reconciliation.fn("chain-b")
+
+        assert self.reconcile.call_count == 1
+        assert self.reschedule.call_count == 1
+
+    def test_start_leaves_running_chain_alone(self, monkeypatch):
+        send = Mock()
+        monkeypatch.setattr(tasks.schedule_session_reconciliation, "send", send)
+        monkeypatch.setattr(tasks.schedule_roster_syncs, "send", Mock())
+
+        assert tasks.start_schedules() == ["reconcile_session_statistics", "sync_daily_rosters"]
+        tasks.schedule_session_reconciliation.fn("chain-a")
+
+        assert tasks.start_schedules() == ["sync_daily_rosters"]
+        send.assert_called_once_with()
+
+    def test_command_starts_missing_schedules(self, monkeypatch):
+        monkeypatch.setattr(tasks.schedule_session_reconciliation, "send", Mock())
+        monkeypatch.setattr(tasks.schedule_roster_syncs, "send", Mock())
+        stdout = StringIO()
+
+        call_command("start_attendance_schedules", stdout=stdout)
+
+        assert "reconcile_session_statistics" in stdout.getvalue()
+        assert "sync_daily_rosters" in stdout.getvalue()
+
+
+def local(hour, minute=0, day=7):
+    return timezone.make_aware(datetime(2024, 10, day, hour, minute))
+
+
+@pytest.mark.unit
+class TestRosterSchedule:
+    """Test the midnight and noon roster sync chain."""
+
+    @pytest.fixture(autouse=True)
+    def locmem_cache(self, settings, monkeypatch):
+        settings.CACHES = LOCMEM_CACHE
+        cache.clear()
+        self.sync = Mock()
+        self.reschedule = Mock()
+        monkeypatch.setattr(tasks.sync_daily_rosters, "send", self.sync)
+        monkeypatch.setattr(tasks.schedule_roster_syncs, "send_with_options", self.reschedule)
+        monkeypatch.setattr(tasks.timezone, "now", lambda: local(11, 30))
+
+    @pytest.mark.parametrize(
+        ("now", "expected"),
+        [
+            (local(0, 0), (local(12), "NOON")),
+            (local(11, 59), (local(12), "NOON")),
+            (local(12, 0), (local(0, day=8), "MIDNIGHT")),
+            (local(23, 59), (local(0, day=8), "MIDNIGHT")),
+        ],
+    )
+    def test_next_sync_is_following_midnight_or_noon(self, now, expected):
+        assert tasks.next_roster_sync(now) == expected
+
+    def test_new_chain_only_schedules_first_slot(self):
+        tasks.schedule_roster_syncs.fn("chain-a")
+
+        self.sync.assert_not_called()
+        self.reschedule.assert_called_once_with(args=("chain-a", "NOON"), delay=30 * 60 * 1000)
+
+    def test_leader_syncs_and_reschedules(self):
+        tasks.schedule_roster_syncs.fn("chain-a", "MIDNIGHT")
+
+        self.sync.assert_called_once_with("MIDNIGHT")
+        self.reschedule.assert_called_once_with(args=("chain-a", "NOON"), delay=30 * 60 * 1000)
+
+    def test_second_chain_stops(self):
+        tasks.schedule_roster_syncs.fn("chain-a")
+        tasks.schedule_roster_syncs.fn("chain-b", "NOON")
+
+        self.sync.assert_not_called()
+        assert self.reschedule.call_count == 1
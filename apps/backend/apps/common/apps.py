@@ -5,3 +5,9 @@ class CommonConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.common"
     verbose_name = "Common Utilities"
+
+    def ready(self):
+        """Connect the model signals that feed GraphQL subscription groups."""
+        from apps.common.realtime_publishers import connect_subscription_publishers
+
+        connect_subscription_publishers()
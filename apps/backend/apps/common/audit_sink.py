@@ -0,0 +1,161 @@
+"""Buffered, batched writes for audit and activity log entries.
+
+Audit helpers such as ``SystemAuditLog.log_override`` and
+``StudentActivityLog.log_enrollment`` hand their unsaved entries to
+``record_audit_entry``. Outside an ``audit_buffer`` scope the entry is saved
+immediately, as before. Inside a scope (one per request, see
+``AuditBufferMiddleware``, or around a batch job) entries are collected and
+written with one ``bulk_create`` per model when the scope ends.
+
+Delivery follows the caller's transaction:
+
+- an entry recorded inside ``transaction.atomic`` is only released when the
+  outermost transaction commits (``transaction.on_commit``), so entries for
+  work that was rolled back, including rolled-back savepoints, are dropped
+  exactly as the synchronous inserts used to be;
+- released entries are always written, even when the scope exits with an
+  exception, and a failed bulk insert is retried row by row so one bad
+  entry does not discard the rest.
+
+With ``AUDIT_SINK_ASYNC`` enabled, released entries are sent to the
+``write_audit_entries`` Dramatiq actor instead of being written in the
+request; if the message cannot be enqueued they are written synchronously.
+Primary keys of buffered entries are not available to the caller, and
+``auto_now_add`` timestamps record when an entry is written.
+"""
+
+import json
+import logging
+from collections import defaultdict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import TypeVar
+
+from django.apps import apps
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models, transaction
+
+logger = logging.getLogger(__name__)
+
+M = TypeVar("M", bound=models.Model)
+
+AUDIT_SINK_BATCH_SIZE = 500
+
+_current_sink: ContextVar["AuditSink | None"] = ContextVar("audit_sink", default=None)
+
+
+def serialize_entries(entries: list[models.Model]) -> str:
+    """JSON payload of unsaved entries of one model, as concrete field values."""
+    fields = [field for field in entries[0]._meta.concrete_fields if not field.primary_key]
+    return json.dumps(
+        [{field.attname: getattr(entry, field.attname) for field in fields} for entry in entries],
+        cls=DjangoJSONEncoder,
+    )
+
+
+def write_entries(model: type[models.Model], entries: list[models.Model]) -> int:
+    """Insert entries of one model in bulk, falling back to one insert per entry."""
+    try:
+        with transaction.atomic():
+            model._default_manager.bulk_create(entries, batch_size=AUDIT_SINK_BATCH_SIZE)
+        return len(entries)
+    except Exception:
+        logger.exception("Bulk insert of %d %s entries failed; retrying one by one", len(entries), model._meta.label)
+
+    written = 0
+    for entry in entries:
+        try:
+            with transaction.atomic():
+                entry.save()
+            written += 1
+        except Exception:
+            logger.exception("Could not write %s audit entry", model._meta.label)
+    return written
+
+
+class AuditSink:
+    """Collects audit entries and writes them in batches once they are committed."""
+
+    def __init__(self, asynchronous: bool = False) -> None:
+        self.asynchronous = asynchronous
+        self.ready: list[models.Model] = []
+
+    def add(self, entry: models.Model) -> None:
+        """Buffer an entry, releasing it once the current transaction commits."""
+        if transaction.get_connection().in_atomic_block:
+            transaction.on_commit(lambda: self.ready.append(entry))
+        else:
+            self.ready.append(entry)
+
+    def close(self) -> None:
+        """Flush released entries now, or after the enclosing transaction commits."""
+        if transaction.get_connection().in_atomic_block:
+            transaction.on_commit(self.flush, robust=True)
+        else:
+            self.flush()
+
+    def flush(self) -> int:
+        """Write or enqueue all released entries; return how many were handed off."""
+        entries, self.ready = self.ready, []
+        by_model: dict[type[models.Model], list[models.Model]] = defaultdict(list)
+        for entry in entries:
+            by_model[type(entry)].append(entry)
+
+        for model, model_entries in by_model.items():
+            if self.asynchronous and self._enqueue(model, model_entries):
+                continue
+            write_entries(model, model_entries)
+        return len(entries)
+
+    def _enqueue(self, model: type[models.Model], entries: list[models.Model]) -> bool:
+        from apps.common.tasks import write_audit_entries
+
+        try:
+            write_audit_entries.send(model._meta.label, serialize_entries(entries))
+        except Exception:
+            logger.exception("Could not enqueue %d %s entries; writing them now", len(entries), model._meta.label)
+            return False
+        return True
+
+
+@contextmanager
+def audit_buffer(asynchronous: bool | None = None) -> Iterator[AuditSink]:
+    """Buffer audit entries recorded in the block and write them in batches.
+
+    Nested scopes share the outermost sink.
+
+    Args:
+        asynchronous: Hand entries to Dramatiq; defaults to ``AUDIT_SINK_ASYNC``
+    """
+    sink = _current_sink.get()
+    if sink is not None:
+        yield sink
+        return
+
+    if asynchronous is None:
+        asynchronous = getattr(settings, "AUDIT_SINK_ASYNC", False)
+    sink = AuditSink(asynchronous=asynchronous)
+    token = _current_sink.set(sink)
+    try:
+        yield sink
+    finally:
+        _current_sink.reset(token)
+        sink.close()
+
+
+def record_audit_entry(entry: M) -> M:
+    """Save an audit entry now, or buffer it when an ``audit_buffer`` is active."""
+    sink = _current_sink.get()
+    if sink is None:
+        entry.save()
+    else:
+        sink.add(entry)
+    return entry
+
+
+def load_entries(model_label: str, payload: str) -> tuple[type[models.Model], list[models.Model]]:
+    """Rebuild unsaved entries from a ``serialize_entries`` payload."""
+    model = apps.get_model(model_label)
+    return model, [model(**values) for values in json.loads(payload)]
@@ -6,6 +6,7 @@ from .views import (
     CRUDDetailView,
     CRUDListView,
     CRUDUpdateView,
+    ExportDownloadView,
 )
 
 __all__ = [
@@ -20,4 +21,5 @@ __all__ = [
     # Views
     "CRUDListView",
     "CRUDUpdateView",
+    "ExportDownloadView",
 ]
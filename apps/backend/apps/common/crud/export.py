@@ -0,0 +1,224 @@
+"""Streaming CSV and XLSX exports.
+
+CSV exports are streamed row by row from ``QuerySet.iterator`` so neither the
+rows nor the file are held in memory. XLSX files cannot be streamed while
+they are written (they are zip archives), so they are built with openpyxl's
+write-only mode into a temporary file, which is then streamed back; column
+widths are estimated from the first rows instead of a second pass over the
+sheet.
+
+Exports with more than ``EXPORT_BACKGROUND_THRESHOLD`` rows are built by the
+``build_export`` Dramatiq actor instead, which saves the file under
+``EXPORT_ROOT`` and notifies the requesting user with a download link. Views
+opt in by providing ``get_queryset``, ``get_export_header`` and
+``get_export_rows`` (see ``CRUDListMixin``).
+
+Saved exports contain personal data, so they are kept outside the public
+media directory and are only served by ``ExportDownloadView`` to the user who
+requested them, for ``EXPORT_RETENTION_HOURS`` hours. ``python manage.py
+cleanup_exports`` deletes them afterwards.
+"""
+
+from __future__ import annotations
+
+import csv
+import os
+import re
+import tempfile
+import uuid
+from datetime import datetime, timedelta
+from itertools import chain, islice
+from typing import IO, TYPE_CHECKING, Any
+
+from django.conf import settings
+from django.core.files import File
+from django.core.files.storage import FileSystemStorage
+from django.http import FileResponse, StreamingHttpResponse
+from django.urls import reverse
+from django.utils import timezone
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Sequence
+
+try:
+    from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Font, PatternFill
+    from openpyxl.utils import get_column_letter
+
+    HAS_OPENPYXL = True
+except ImportError:
+    HAS_OPENPYXL = False
+
+EXPORT_CHUNK_SIZE = 1000
+WIDTH_SAMPLE_ROWS = 200
+MAX_COLUMN_WIDTH = 50
+XLSX_CONTENT_TYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+
+# <owner id>/<random token>/<filename>
+EXPORT_PATH_RE = re.compile(r"^(?P<owner_id>\d+)/[0-9a-f]{32}/[^/]+$")
+
+
+class Echo:
+    """File-like object whose ``write`` returns the value, for streaming ``csv.writer`` output."""
+
+    def write(self, value: str) -> str:
+        return value
+
+
+def get_background_threshold() -> int:
+    """Row count above which exports are built by a background job."""
+    return getattr(settings, "EXPORT_BACKGROUND_THRESHOLD", 10000)
+
+
+def get_export_retention() -> timedelta:
+    """How long saved exports can be downloaded before they are deleted."""
+    return timedelta(hours=getattr(settings, "EXPORT_RETENTION_HOURS", 24))
+
+
+def get_export_storage() -> FileSystemStorage:
+    """Private storage for background exports; it has no public URL."""
+    return FileSystemStorage(location=getattr(settings, "EXPORT_ROOT", os.path.join(tempfile.gettempdir(), "exports")))
+
+
+def iter_csv(header: Sequence[Any], rows: Iterable[Sequence[Any]]) -> Iterator[str]:
+    """CSV-formatted lines for the header and rows."""
+    writer = csv.writer(Echo())
+    yield writer.writerow(header)
+    for row in rows:
+        yield writer.writerow(row)
+
+
+def csv_response(filename: str, header: Sequence[Any], rows: Iterable[Sequence[Any]]) -> StreamingHttpResponse:
+    """Stream rows to the client as a CSV attachment."""
+    response = StreamingHttpResponse(iter_csv(header, rows), content_type="text/csv")
+    response["Content-Disposition"] = f'attachment; filename="{filename}"'
+    return response
+
+
+def estimate_column_widths(header: Sequence[Any], sample: Sequence[Sequence[Any]]) -> list[int]:
+    """Column widths fitting the header and sample rows, capped at ``MAX_COLUMN_WIDTH``."""
+    widths = [len(str(value)) for value in header]
+    for row in sample:
+        for index, value in enumerate(row[: len(widths)]):
+            if value is not None:
+                widths[index] = max(widths[index], len(str(value)))
+    return [min(width + 2, MAX_COLUMN_WIDTH) for width in widths]
+
+
+def write_xlsx(
+    file: IO[bytes],
+    header: Sequence[Any],
+    rows: Iterable[Sequence[Any]],
+    title: str = "Data Export",
+    header_color: str = "366092",
+    widths: Sequence[int] | None = None,
+) -> None:
+    """Write a single-sheet workbook in openpyxl write-only mode.
+
+    Args:
+        file: Binary file to save the workbook to
+        header: Column titles, styled as a header row
+        rows: Row values; consumed once
+        title: Worksheet title
+        header_color: Header fill as an RGB hex string
+        widths: Column widths; estimated from the first rows when omitted
+    """
+    workbook = Workbook(write_only=True)
+    worksheet = workbook.create_sheet(title)
+
+    rows = iter(rows)
+    if widths is None:
+        # Column dimensions must be set before the first row is written
+        sample = list(islice(rows, WIDTH_SAMPLE_ROWS))
+        rows = chain(sample, rows)
+        widths = estimate_column_widths(header, sample)
+    for index, width in enumerate(widths, 1):
+        worksheet.column_dimensions[get_column_letter(index)].width = width
+
+    header_font = Font(bold=True, color="FFFFFF")
+    header_fill = PatternFill(start_color=header_color, end_color=header_color, fill_type="solid")
+    header_cells = []
+    for value in header:
+        cell = WriteOnlyCell(worksheet, value=value)
+        cell.font = header_font
+        cell.fill = header_fill
+        header_cells.append(cell)
+    worksheet.append(header_cells)
+
+    for row in rows:
+        worksheet.append(list(row))
+
+    workbook.save(file)
+
+
+def xlsx_response(filename: str, header: Sequence[Any], rows: Iterable[Sequence[Any]], **options: Any) -> FileResponse:
+    """Build a workbook in a temporary file and stream it as an XLSX attachment.
+
+    ``options`` are passed to ``write_xlsx``.
+    """
+    file = tempfile.TemporaryFile()
+    write_xlsx(file, header, rows, **options)
+    file.seek(0)
+    return FileResponse(file, as_attachment=True, filename=filename, content_type=XLSX_CONTENT_TYPE)
+
+
+def save_export(
+    format_type: str, filename: str, header: Sequence[Any], rows: Iterable[Sequence[Any]], owner_id: int
+) -> str:
+    """Write an export to the export storage and return its storage path.
+
+    The path starts with the id of the user allowed to download it, followed
+    by a random directory so paths cannot be guessed.
+    """
+    with tempfile.TemporaryFile() as file:
+        if format_type == "xlsx":
+            write_xlsx(file, header, rows)
+        else:
+            file.writelines(line.encode() for line in iter_csv(header, rows))
+        file.seek(0)
+        return get_export_storage().save(f"{owner_id}/{uuid.uuid4().hex}/{filename}", File(file))
+
+
+def export_download_url(path: str) -> str:
+    """URL of ``ExportDownloadView`` for a saved export."""
+    return reverse("web_interface:export-download", kwargs={"path": path})
+
+
+def get_export_owner_id(path: str) -> int | None:
+    """Id of the user a saved export belongs to, or ``None`` if ``path`` is not an export path."""
+    match = EXPORT_PATH_RE.match(path)
+    return int(match.group("owner_id")) if match else None
+
+
+def is_export_expired(path: str, now: datetime | None = None) -> bool:
+    """Whether a saved export is older than the retention period."""
+    now = now or timezone.now()
+    return get_export_storage().get_modified_time(path) < now - get_export_retention()
+
+
+def delete_expired_exports(now: datetime | None = None) -> int:
+    """Delete saved exports older than the retention period and return how many were deleted.
+
+    Directories left empty are removed as well.
+    """
+    storage = get_export_storage()
+    if not os.path.isdir(storage.location):
+        return 0
+
+    deleted = 0
+    owners, _ = storage.listdir("")
+    for owner in owners:
+        tokens, _ = storage.listdir(owner)
+        for token in tokens:
+            directory = f"{owner}/{token}"
+            _, filenames = storage.listdir(directory)
+            for filename in filenames:
+                if is_export_expired(f"{directory}/{filename}", now):
+                    storage.delete(f"{directory}/{filename}")
+                    deleted += 1
+            if storage.listdir(directory) == ([], []):
+                storage.delete(directory)
+        if storage.listdir(owner) == ([], []):
+            storage.delete(owner)
+    return deleted
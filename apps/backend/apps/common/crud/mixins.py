@@ -5,12 +5,12 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Any, Protocol
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from django.db.models import Model, QuerySet
     from django.http import HttpRequest, HttpResponse
 
-import csv
 from datetime import datetime
-from io import BytesIO
 
 from django.contrib import messages
 from django.contrib.auth.mixins import PermissionRequiredMixin
@@ -20,15 +20,8 @@ from django.http import HttpResponse, HttpResponseRedirect
 from django.urls import reverse, reverse_lazy
 from django.views.generic import CreateView
 
-try:
-    import openpyxl
-    from openpyxl.styles import Font, PatternFill
-
-    HAS_OPENPYXL = True
-except ImportError:
-    HAS_OPENPYXL = False
-
 from .config import CRUDConfig, FieldConfig
+from .export import EXPORT_CHUNK_SIZE, HAS_OPENPYXL, csv_response, get_background_threshold, xlsx_response
 from .utils import format_field_value, get_field_value
 
 
@@ -323,118 +316,84 @@ class CRUDListMixin(CRUDConfigMixin, PermissionRequiredMixin):
         """Handle export requests."""
         export_format = self.request.GET.get("format")
         if export_format in ["csv", "xlsx"]:
-            return self.export_data(export_format, context["object_list"])
+            # Export every matching row, not just the current page
+            return self.export_data(export_format, self.object_list)  # type: ignore[attr-defined]
 
         return super().render_to_response(context, **response_kwargs)
 
     def export_data(self, format_type: str, queryset: QuerySet[Any]) -> HttpResponse:
-        """Export data to CSV or XLSX with size limits and memory protection."""
+        """Stream an export, or hand exports too large for a request to a background job."""
         config = self.get_crud_config()
 
-        # Check export size limits to prevent memory exhaustion
-        MAX_EXPORT_SIZE = 10000  # Maximum records per export
-        queryset_count = queryset.count()
-
-        if queryset_count > MAX_EXPORT_SIZE:
-            messages.error(
-                self.request,
-                f"Export size ({queryset_count:,} records) exceeds maximum limit "
-                f"({MAX_EXPORT_SIZE:,} records). Please add filters to reduce the dataset.",
-            )
-            return self.get(self.request)  # type: ignore[attr-defined]
-
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = f"{config.export_filename_prefix}_{timestamp}.{format_type}"
 
+        if format_type == "xlsx" and not HAS_OPENPYXL:
+            messages.error(self.request, f"Export format '{format_type}' not supported")
+            return self._redirect_without_export()
+
+        queryset_count = queryset.count()
+        if queryset_count > get_background_threshold():
+            return self.export_in_background(format_type, filename, queryset_count)
+
         if format_type == "csv":
             return self.export_csv(queryset, filename)
-        elif format_type == "xlsx" and HAS_OPENPYXL:
-            return self.export_xlsx(queryset, filename)
-        else:
-            messages.error(self.request, f"Export format '{format_type}' not supported")
-            return self.get(self.request)  # type: ignore[attr-defined]
+        return self.export_xlsx(queryset, filename)
+
+    def export_in_background(self, format_type: str, filename: str, row_count: int) -> HttpResponse:
+        """Queue a ``build_export`` job for this view and request."""
+        from apps.common.tasks import build_export
+
+        view_path = f"{type(self).__module__}.{type(self).__qualname__}"
+        build_export.send(
+            view_path,
+            getattr(self, "kwargs", {}),
+            self.request.GET.urlencode(),
+            self.request.user.pk,
+            format_type,
+            filename,
+        )
+        messages.info(
+            self.request,
+            f"Exporting {row_count:,} records in the background. "
+            "You will get a notification with a download link when the file is ready.",
+        )
+        return self._redirect_without_export()
 
-    def export_csv(self, queryset: QuerySet[Any], filename: str) -> HttpResponse:
-        """Export to CSV with memory-efficient streaming."""
-        response = HttpResponse(content_type="text/csv")
-        response["Content-Disposition"] = f'attachment; filename="{filename}"'
+    def _redirect_without_export(self) -> HttpResponse:
+        params = self.request.GET.copy()
+        params.pop("format", None)
+        query = params.urlencode()
+        return HttpResponseRedirect(f"{self.request.path}?{query}" if query else self.request.path)
 
-        writer = csv.writer(response)
-        field_configs = [f for f in self.get_field_configs() if f.export]
+    def get_export_header(self) -> list[str]:
+        """Column titles of exported files."""
+        return [str(f.verbose_name) for f in self.get_field_configs() if f.export]
 
-        # Write headers
-        headers = [f.verbose_name for f in field_configs]
-        writer.writerow(headers)
+    def get_export_rows(self, queryset: QuerySet[Any], format_type: str = "csv") -> Iterator[list[Any]]:
+        """Formatted export values, read from the database in chunks.
 
-        # Write data in chunks to prevent memory exhaustion
-        CHUNK_SIZE = 1000
-        for chunk in queryset.iterator(chunk_size=CHUNK_SIZE):
+        ``format_type`` ('csv' or 'xlsx') lets subclasses format values per file type.
+        """
+        field_configs = [f for f in self.get_field_configs() if f.export]
+        for obj in queryset.iterator(chunk_size=EXPORT_CHUNK_SIZE):
             row = []
             for field_config in field_configs:
                 try:
-                    value = get_field_value(chunk, field_config.name)
-                    formatted_value = format_field_value(value, field_config)
-                    row.append(formatted_value)
+                    value = get_field_value(obj, field_config.name)
+                    row.append(format_field_value(value, field_config))
                 except (AttributeError, ValueError, TypeError):
                     # Handle cases where field doesn't exist or can't be formatted
                     row.append("")
-            writer.writerow(row)
+            yield row
 
-        return response
+    def export_csv(self, queryset: QuerySet[Any], filename: str) -> HttpResponse:
+        """Export to CSV, streamed row by row."""
+        return csv_response(filename, self.get_export_header(), self.get_export_rows(queryset))
 
     def export_xlsx(self, queryset: QuerySet[Any], filename: str) -> HttpResponse:
-        """Export to XLSX."""
-        workbook = openpyxl.Workbook()
-        worksheet = workbook.active
-        if worksheet is None:
-            worksheet = workbook.create_sheet("Data Export")
-        worksheet.title = "Data Export"
-
-        field_configs = [f for f in self.get_field_configs() if f.export]
-
-        # Style for headers
-        header_font = Font(bold=True, color="FFFFFF")
-        header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-
-        # Write headers
-        for col, field_config in enumerate(field_configs, 1):
-            cell = worksheet.cell(row=1, column=col, value=field_config.verbose_name)
-            cell.font = header_font
-            cell.fill = header_fill
-
-        # Write data
-        for row_idx, obj in enumerate(queryset, 2):
-            for col_idx, field_config in enumerate(field_configs, 1):
-                value = get_field_value(obj, field_config.name)
-                formatted_value = format_field_value(value, field_config)
-                worksheet.cell(row=row_idx, column=col_idx, value=formatted_value)
-
-        # Auto-adjust column widths
-        for column in worksheet.columns:
-            max_length = 0
-            # Get column letter safely - skip if first cell is a MergedCell
-            first_cell = column[0]
-            if not hasattr(first_cell, "column_letter"):
-                continue
-            column_letter = first_cell.column_letter
-            for cell in column:
-                try:
-                    if len(str(cell.value)) > max_length:
-                        max_length = len(str(cell.value))
-                except (AttributeError, ValueError, TypeError):
-                    pass
-            adjusted_width = min(max_length + 2, 50)
-            worksheet.column_dimensions[column_letter].width = adjusted_width
-
-        # Save to response
-        response = HttpResponse(content_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet")
-        response["Content-Disposition"] = f'attachment; filename="{filename}"'
-
-        virtual_workbook = BytesIO()
-        workbook.save(virtual_workbook)
-        response.write(virtual_workbook.getvalue())
-
-        return response
+        """Export to XLSX, written in write-only mode and streamed from a temporary file."""
+        return xlsx_response(filename, self.get_export_header(), self.get_export_rows(queryset))
 
 
 class CRUDFormMixin(CRUDConfigMixin, PermissionRequiredMixin):
@@ -1,13 +1,19 @@
 """CRUD Framework Views."""
 
+import os
+
+from django.contrib.auth.mixins import LoginRequiredMixin
+from django.http import FileResponse, Http404
 from django.views.generic import (
     CreateView,
     DeleteView,
     DetailView,
     ListView,
     UpdateView,
+    View,
 )
 
+from .export import get_export_owner_id, get_export_storage, is_export_expired
 from .mixins import CRUDDeleteMixin, CRUDDetailMixin, CRUDFormMixin, CRUDListMixin
 
 
@@ -53,3 +59,17 @@ class CRUDDeleteView(CRUDDeleteMixin, DeleteView):
     """Generic CRUD delete view."""
 
     pass
+
+
+class ExportDownloadView(LoginRequiredMixin, View):
+    """Serve a background export to the user who requested it.
+
+    Exports of other users, unknown paths and exports past the retention
+    period are all reported as not found.
+    """
+
+    def get(self, request, path):
+        storage = get_export_storage()
+        if get_export_owner_id(path) != request.user.pk or not storage.exists(path) or is_export_expired(path):
+            raise Http404("Export not found")
+        return FileResponse(storage.open(path), as_attachment=True, filename=os.path.basename(path))
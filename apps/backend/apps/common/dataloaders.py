@@ -0,0 +1,74 @@
+"""Synchronous per-request batch loading.
+
+A ``BatchLoader`` collects keys from many callers and fetches them with a
+single call to its batch function, caching the results for the lifetime
+of the loader. It is meant to live for one request: resolvers for a list
+of parents queue their keys first, then the first ``load`` fetches them
+all at once instead of issuing one query per parent.
+
+Django views and Strawberry's ``GraphQLView`` run synchronously, so this
+does not use ``strawberry.dataloader.DataLoader``, which needs an event
+loop.
+"""
+
+from collections.abc import Callable, Hashable, Iterable
+from typing import Generic, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class BatchLoader(Generic[K, V]):
+    """Load values by key, fetching all pending keys in one batch.
+
+    Args:
+        batch_load_fn: Receives a list of keys and returns a mapping of key
+            to value; keys missing from the mapping get ``default_factory()``
+        default_factory: Builds the value for keys with no rows
+    """
+
+    def __init__(
+        self,
+        batch_load_fn: Callable[[list[K]], dict[K, V]],
+        default_factory: Callable[[], V] = lambda: None,  # type: ignore[assignment,return-value]
+    ):
+        self.batch_load_fn = batch_load_fn
+        self.default_factory = default_factory
+        self.batch_count = 0
+        self._cache: dict[K, V] = {}
+        self._pending: set[K] = set()
+
+    def queue(self, keys: Iterable[K]) -> None:
+        """Mark keys to be fetched with the next batch."""
+        self._pending.update(key for key in keys if key is not None and key not in self._cache)
+
+    def prime(self, key: K, value: V) -> None:
+        """Seed the cache with a value that has already been fetched."""
+        self._cache[key] = value
+        self._pending.discard(key)
+
+    def load(self, key: K) -> V:
+        """Return the value for ``key``, dispatching the pending batch if needed."""
+        if key not in self._cache:
+            self._pending.add(key)
+            self.dispatch()
+        return self._cache[key]
+
+    def load_many(self, keys: Iterable[K]) -> list[V]:
+        """Return values for several keys with at most one batch."""
+        keys = list(keys)
+        self.queue(keys)
+        if self._pending:
+            self.dispatch()
+        return [self._cache[key] for key in keys]
+
+    def dispatch(self) -> None:
+        """Fetch every pending key in a single call to the batch function."""
+        keys = list(self._pending)
+        self._pending.clear()
+        if not keys:
+            return
+        self.batch_count += 1
+        results = self.batch_load_fn(keys)
+        for key in keys:
+            self._cache[key] = results[key] if key in results else self.default_factory()
@@ -0,0 +1,360 @@
+"""Static query cost analysis and per-user cost budgets.
+
+Every operation is costed from its parsed document before any resolver
+runs. A field costs its weight plus the cost of its selections; list
+fields multiply their selections by the page size requested through
+``first``/``last``/``limit`` arguments (directly or inside a
+``pagination`` input), falling back to the argument's default. Selections
+on an interface or union are costed as the most expensive type that can be
+returned.
+
+``QueryCostLimiter`` rejects operations over the per-query maximum and
+charges the rest against a per-user budget that refills every window.
+The computed cost is returned in the response ``extensions`` and, when
+``prometheus_client`` is installed (production only), recorded in
+Prometheus metrics.
+"""
+
+import contextlib
+import functools
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any
+
+from django.conf import settings
+from django.core.cache import cache
+from graphql import (
+    ExecutionResult,
+    FieldNode,
+    FragmentDefinitionNode,
+    FragmentSpreadNode,
+    GraphQLError,
+    GraphQLInputObjectType,
+    GraphQLObjectType,
+    GraphQLSchema,
+    InlineFragmentNode,
+    OperationDefinitionNode,
+    SelectionSetNode,
+    Undefined,
+    get_named_type,
+    get_nullable_type,
+    is_abstract_type,
+    is_list_type,
+    value_from_ast,
+)
+from strawberry.extensions import SchemaExtension
+
+logger = logging.getLogger(__name__)
+
+# Weights for fields that fan out to the database; "Type.field" keys.
+FIELD_COSTS: dict[str, int] = {
+    "Query.students": 10,
+    "Query.student": 5,
+    "StudentType.enrollments": 2,
+    "StudentType.invoices": 2,
+    "StudentType.payments": 2,
+    "EnrollmentInfo.grades": 2,
+}
+OBJECT_FIELD_COST = 1
+SCALAR_FIELD_COST = 0
+
+LIST_SIZE_ARGUMENTS = ("first", "last", "limit")
+DEFAULT_LIST_SIZE = 25
+MAX_LIST_SIZE = 100
+
+BUDGET_CACHE_KEY = "graphql:cost:{user}:{window}"
+
+
+@functools.cache
+def _get_metrics() -> tuple[Any, Any] | None:
+    """Create the cost histogram and rejection counter once, if Prometheus is installed."""
+    try:
+        from prometheus_client import Counter, Histogram
+    except ImportError:
+        return None
+    query_cost = Histogram(
+        "graphql_query_cost",
+        "Static cost of GraphQL operations",
+        ["operation_type"],
+        buckets=(10, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 25000),
+    )
+    query_rejections = Counter(
+        "graphql_query_rejections_total",
+        "GraphQL operations rejected by the cost limiter",
+        ["reason"],
+    )
+    return query_cost, query_rejections
+
+
+def record_cost(operation_type: str, cost: int) -> None:
+    """Observe an operation's cost in Prometheus, when available."""
+    metrics = _get_metrics()
+    if metrics is not None:
+        metrics[0].labels(operation_type=operation_type).observe(cost)
+
+
+def record_rejection(reason: str) -> None:
+    """Count a rejected operation in Prometheus, when available."""
+    metrics = _get_metrics()
+    if metrics is not None:
+        metrics[1].labels(reason=reason).inc()
+
+
+@dataclass
+class QueryCost:
+    """Result of costing one operation."""
+
+    cost: int
+    operation_type: str
+
+
+class CostEstimator:
+    """Compute the static cost of an operation against a schema."""
+
+    def __init__(self, schema: GraphQLSchema, document, variables: dict[str, Any] | None = None):
+        self.schema = schema
+        self.variables = variables or {}
+        self.fragments = {
+            definition.name.value: definition
+            for definition in document.definitions
+            if isinstance(definition, FragmentDefinitionNode)
+        }
+        self.document = document
+
+    def estimate(self, operation_name: str | None = None) -> QueryCost:
+        """Cost the selected operation of the document."""
+        operation = self._get_operation(operation_name)
+        root_type = self.schema.get_root_type(operation.operation)
+        cost = self._selection_set_cost(operation.selection_set, root_type, set())
+        return QueryCost(cost=cost, operation_type=operation.operation.value)
+
+    def _get_operation(self, operation_name: str | None) -> OperationDefinitionNode:
+        operations = [
+            definition for definition in self.document.definitions if isinstance(definition, OperationDefinitionNode)
+        ]
+        if operation_name:
+            for operation in operations:
+                if operation.name and operation.name.value == operation_name:
+                    return operation
+        return operations[0]
+
+    def _selection_set_cost(
+        self,
+        selection_set: SelectionSetNode | None,
+        parent_type: Any,
+        visited_fragments: set[str],
+        page_size: int | None = None,
+    ) -> int:
+        if selection_set is None:
+            return 0
+        if is_abstract_type(parent_type):
+            # Any implementation may be returned, so charge the most expensive one
+            return max(
+                (
+                    self._selection_set_cost(selection_set, possible_type, visited_fragments, page_size)
+                    for possible_type in self.schema.get_possible_types(parent_type)
+                ),
+                default=0,
+            )
+        if not isinstance(parent_type, GraphQLObjectType):
+            return 0
+
+        total = 0
+        for selection in selection_set.selections:
+            if isinstance(selection, FieldNode):
+                total += self._field_cost(selection, parent_type, visited_fragments, page_size)
+            elif isinstance(selection, InlineFragmentNode):
+                if selection.type_condition and not self._applies_to(selection.type_condition, parent_type):
+                    continue
+                total += self._selection_set_cost(selection.selection_set, parent_type, visited_fragments, page_size)
+            elif isinstance(selection, FragmentSpreadNode):
+                name = selection.name.value
+                fragment = self.fragments.get(name)
+                if fragment is None or name in visited_fragments:
+                    continue
+                if not self._applies_to(fragment.type_condition, parent_type):
+                    continue
+                total += self._selection_set_cost(
+                    fragment.selection_set, parent_type, visited_fragments | {name}, page_size
+                )
+        return total
+
+    def _applies_to(self, type_condition, object_type: GraphQLObjectType) -> bool:
+        """Whether a fragment's type condition matches a concrete object type."""
+        condition_type = self.schema.get_type(type_condition.name.value)
+        if condition_type is object_type:
+            return True
+        return is_abstract_type(condition_type) and self.schema.is_sub_type(condition_type, object_type)
+
+    def _field_cost(
+        self,
+        node: FieldNode,
+        parent_type: GraphQLObjectType,
+        visited_fragments: set[str],
+        page_size: int | None,
+    ) -> int:
+        name = node.name.value
+        field = parent_type.fields.get(name)
+        if field is None:  # __typename and other introspection fields
+            return 0
+
+        named_type = get_named_type(field.type)
+        default_weight = OBJECT_FIELD_COST if node.selection_set else SCALAR_FIELD_COST
+        weight = FIELD_COSTS.get(f"{parent_type.name}.{name}", default_weight)
+        is_list = is_list_type(get_nullable_type(field.type))
+
+        if self._has_list_size_argument(field):
+            size = self._list_size(node, field)
+            if not is_list:
+                # Connection types page their edges list with this field's arguments
+                return weight + self._selection_set_cost(node.selection_set, named_type, visited_fragments, size)
+            return weight + size * self._selection_set_cost(node.selection_set, named_type, visited_fragments)
+
+        children = self._selection_set_cost(node.selection_set, named_type, visited_fragments)
+        if is_list:
+            children *= page_size or DEFAULT_LIST_SIZE
+        return weight + children
+
+    def _has_list_size_argument(self, field) -> bool:
+        for name, argument in field.args.items():
+            if name in LIST_SIZE_ARGUMENTS:
+                return True
+            input_type = get_nullable_type(argument.type)
+            if isinstance(input_type, GraphQLInputObjectType) and any(
+                key in input_type.fields for key in LIST_SIZE_ARGUMENTS
+            ):
+                return True
+        return False
+
+    def _list_size(self, node: FieldNode, field) -> int:
+        provided = {argument.name.value: argument.value for argument in node.arguments or ()}
+        size = None
+        for name, argument in field.args.items():
+            value = self._argument_value(argument, provided.get(name))
+            if name in LIST_SIZE_ARGUMENTS and isinstance(value, int):
+                size = value
+            elif isinstance(get_nullable_type(argument.type), GraphQLInputObjectType) and isinstance(value, dict):
+                for key in LIST_SIZE_ARGUMENTS:
+                    if isinstance(value.get(key), int):
+                        size = value[key]
+                        break
+        if size is None:
+            size = DEFAULT_LIST_SIZE
+        return max(1, min(size, MAX_LIST_SIZE))
+
+    def _argument_value(self, argument, value_node) -> Any:
+        if value_node is not None:
+            value = value_from_ast(value_node, argument.type, self.variables)
+            if value is not Undefined:
+                return self._with_input_defaults(argument.type, value)
+        if argument.default_value is not Undefined:
+            return self._with_input_defaults(argument.type, argument.default_value)
+        return None
+
+    def _with_input_defaults(self, type_: Any, value: Any) -> Any:
+        input_type = get_nullable_type(type_)
+        if not isinstance(input_type, GraphQLInputObjectType) or not isinstance(value, dict):
+            return value
+        return {
+            **{
+                name: field.default_value
+                for name, field in input_type.fields.items()
+                if field.default_value is not Undefined
+            },
+            **value,
+        }
+
+
+def get_user_key(context: Any) -> str:
+    """Identify the caller whose budget an operation is charged to."""
+    request = context.get("request") if isinstance(context, dict) else getattr(context, "request", None)
+    user = getattr(request, "user", None)
+    if user is not None and user.is_authenticated:
+        return f"user:{user.pk}"
+    remote_addr = request.META.get("REMOTE_ADDR", "unknown") if request is not None else "unknown"
+    return f"anon:{remote_addr}"
+
+
+def charge_budget(user_key: str, cost: int, budget: int, window_seconds: int) -> tuple[bool, int]:
+    """Charge ``cost`` against the caller's budget for the current window.
+
+    Returns whether the charge was accepted and the remaining budget. The
+    charge is applied atomically first so concurrent requests cannot both
+    spend the last of a budget; a rejected charge is refunded.
+    """
+    window = int(time.time() // window_seconds)
+    key = BUDGET_CACHE_KEY.format(user=user_key, window=window)
+    cache.add(key, 0, window_seconds)
+    try:
+        spent = cache.incr(key, cost)
+    except ValueError:
+        # Key expired between add and incr; start a new window
+        spent = cost if cache.add(key, cost, window_seconds) else cache.incr(key, cost)
+
+    if spent > budget:
+        with contextlib.suppress(ValueError):
+            cache.decr(key, cost)
+        return False, max(budget - (spent - cost), 0)
+    return True, budget - spent
+
+
+class QueryCostLimiter(SchemaExtension):
+    """Reject operations that are too expensive or exceed the caller's budget.
+
+    Limits come from ``GRAPHQL_MAX_QUERY_COST``, ``GRAPHQL_USER_COST_BUDGET``
+    and ``GRAPHQL_COST_BUDGET_WINDOW_SECONDS``.
+    """
+
+    def __init__(self, *, execution_context=None):
+        super().__init__(execution_context=execution_context)
+        self.query_cost: QueryCost | None = None
+        self.remaining: int | None = None
+
+    def on_execute(self):
+        context = self.execution_context
+        self.query_cost = CostEstimator(context.schema._schema, context.graphql_document, context.variables).estimate(
+            context.operation_name
+        )
+        cost = self.query_cost.cost
+        record_cost(self.query_cost.operation_type, cost)
+
+        max_cost = settings.GRAPHQL_MAX_QUERY_COST
+        error = None
+        if cost > max_cost:
+            record_rejection("max_cost")
+            error = GraphQLError(
+                f"Query cost {cost} exceeds the maximum of {max_cost}. Request fewer fields or smaller pages.",
+                extensions={"code": "QUERY_TOO_COMPLEX", "cost": cost, "maximum": max_cost},
+            )
+        else:
+            user_key = get_user_key(context.context)
+            accepted, self.remaining = charge_budget(
+                user_key,
+                cost,
+                settings.GRAPHQL_USER_COST_BUDGET,
+                settings.GRAPHQL_COST_BUDGET_WINDOW_SECONDS,
+            )
+            if not accepted:
+                record_rejection("budget")
+                logger.info("GraphQL cost budget exhausted for %s (cost %d)", user_key, cost)
+                error = GraphQLError(
+                    f"Query cost {cost} exceeds your remaining budget of {self.remaining}. "
+                    f"The budget resets every {settings.GRAPHQL_COST_BUDGET_WINDOW_SECONDS} seconds.",
+                    extensions={"code": "COST_BUDGET_EXCEEDED", "cost": cost, "remaining": self.remaining},
+                )
+
+        if error is not None:
+            context.result = ExecutionResult(data=None, errors=[error])
+        yield
+
+    def get_results(self) -> dict[str, Any]:
+        if self.query_cost is None:
+            return {}
+        return {
+            "cost": {
+                "requested": self.query_cost.cost,
+                "maximum": settings.GRAPHQL_MAX_QUERY_COST,
+                "remaining": self.remaining,
+            }
+        }
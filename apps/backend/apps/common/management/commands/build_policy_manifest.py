@@ -0,0 +1,62 @@
+"""Management command to regenerate the policy registry manifest.
+
+``PolicyRegistry`` resolves policy codes through the precomputed manifest in
+``apps/common/policies/manifest.py`` instead of importing every app's
+``policies`` package. Run this command after adding, renaming or moving a
+policy; ``--check`` fails when the manifest is out of date (for CI).
+
+Usage:
+    python manage.py build_policy_manifest
+    python manage.py build_policy_manifest --check
+"""
+
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.common.policies import manifest
+from apps.common.policies.base import discover_policies
+
+MANIFEST_HEADER = '''"""Precomputed registry manifest mapping policy codes to policy classes.
+
+``PolicyRegistry`` imports a policy's module only when its code is first
+requested, instead of importing every app's ``policies`` package at startup.
+Codes missing from the manifest fall back to full discovery.
+
+Generated by ``python manage.py build_policy_manifest``; do not edit by hand.
+"""
+'''
+
+
+def render_manifest(entries: dict[str, str]) -> str:
+    """Source of ``manifest.py`` for the given policy code to class path mapping."""
+    lines = [MANIFEST_HEADER, "POLICY_MANIFEST: dict[str, str] = {"]
+    lines.extend(f'    "{code}": "{path}",' for code, path in sorted(entries.items()))
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+class Command(BaseCommand):
+    help = "Regenerate the policy registry manifest from the installed apps"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--check",
+            action="store_true",
+            help="Exit with an error instead of writing when the manifest is out of date",
+        )
+
+    def handle(self, *args, **options):
+        """Discover all policies and write or check the manifest."""
+        entries = {
+            code: f"{policy_class.__module__}.{policy_class.__qualname__}"
+            for code, policy_class in discover_policies().items()
+        }
+        if options["check"]:
+            if entries != manifest.POLICY_MANIFEST:
+                raise CommandError("Policy manifest is out of date; run build_policy_manifest")
+            self.stdout.write(self.style.SUCCESS(f"Policy manifest is up to date ({len(entries)} policies)"))
+            return
+
+        Path(manifest.__file__).write_text(render_manifest(entries))
+        self.stdout.write(self.style.SUCCESS(f"Wrote policy manifest with {len(entries)} policies"))
@@ -0,0 +1,22 @@
+"""Management command to delete expired background exports.
+
+Background exports (``apps.common.crud.export``) hold personal data and can
+only be downloaded for ``EXPORT_RETENTION_HOURS`` hours. This command deletes
+the files that are older than that from ``EXPORT_ROOT``. Run it at least daily.
+
+Usage:
+    python manage.py cleanup_exports
+"""
+
+from django.core.management.base import BaseCommand
+
+from apps.common.crud.export import delete_expired_exports
+
+
+class Command(BaseCommand):
+    help = "Delete background exports older than the export retention period"
+
+    def handle(self, *args, **options):
+        """Delete expired exports and report how many were removed."""
+        deleted = delete_expired_exports()
+        self.stdout.write(self.style.SUCCESS(f"Deleted {deleted} expired export(s)"))
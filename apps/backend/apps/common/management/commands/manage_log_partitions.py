@@ -0,0 +1,110 @@
+"""Management command to maintain the monthly activity and audit log partitions.
+
+Creates the partitions for the current month and the next
+``LOG_PARTITION_MONTHS_AHEAD`` months, moving any rows that landed in the
+default partition into them, and retires months older than
+``LOG_PARTITION_RETENTION_MONTHS``. Retired partitions are detached and moved
+to the ``LOG_PARTITION_ARCHIVE_SCHEMA`` schema, or dropped with ``--drop``.
+Run it daily or at least monthly; PostgreSQL only.
+
+Usage:
+    python manage.py manage_log_partitions
+    python manage.py manage_log_partitions --dry-run
+    python manage.py manage_log_partitions --months-ahead 6 --retention-months 36
+    python manage.py manage_log_partitions --table common_studentactivitylog --drop
+"""
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.utils import timezone
+
+from apps.common.partitioning import (
+    PARTITIONED_LOG_TABLES,
+    add_months,
+    create_partition,
+    expired_months,
+    is_partitioned,
+    list_partitions,
+    month_range,
+    retire_partition,
+)
+
+
+class Command(BaseCommand):
+    help = "Create upcoming monthly log partitions and retire expired ones"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--months-ahead",
+            type=int,
+            default=getattr(settings, "LOG_PARTITION_MONTHS_AHEAD", 3),
+            help="Number of future months to create partitions for",
+        )
+        parser.add_argument(
+            "--retention-months",
+            type=int,
+            default=getattr(settings, "LOG_PARTITION_RETENTION_MONTHS", 24),
+            help="Months to keep before the current month; 0 keeps everything",
+        )
+        parser.add_argument(
+            "--archive-schema",
+            default=getattr(settings, "LOG_PARTITION_ARCHIVE_SCHEMA", "log_archive"),
+            help="Schema that retired partitions are moved to",
+        )
+        parser.add_argument(
+            "--drop",
+            action="store_true",
+            help="Drop retired partitions instead of archiving them",
+        )
+        parser.add_argument(
+            "--table",
+            action="append",
+            choices=[spec.table for spec in PARTITIONED_LOG_TABLES],
+            help="Only maintain this table (repeatable)",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Show what would change without changing anything",
+        )
+
+    def handle(self, *args, **options):
+        """Create and retire partitions for each partitioned log table."""
+        if connection.vendor != "postgresql":
+            raise CommandError("Log partitioning requires PostgreSQL")
+
+        today = timezone.now().date()
+        archive_schema = None if options["drop"] else options["archive_schema"]
+        specs = [spec for spec in PARTITIONED_LOG_TABLES if not options["table"] or spec.table in options["table"]]
+
+        for spec in specs:
+            with transaction.atomic(), connection.cursor() as cursor:
+                if not is_partitioned(cursor, spec):
+                    self.stdout.write(self.style.WARNING(f"{spec.table} is not partitioned; skipping"))
+                    continue
+
+                partitions = list_partitions(cursor, spec)
+                missing = [
+                    month
+                    for month in month_range(today, add_months(today, options["months_ahead"]))
+                    if month not in partitions
+                ]
+                expired = expired_months(list(partitions), today, options["retention_months"])
+
+                if options["dry_run"]:
+                    for month in missing:
+                        self.stdout.write(f"Would create {spec.partition_name(month)}")
+                    for month in expired:
+                        self.stdout.write(f"Would retire {partitions[month]}")
+                    continue
+
+                for month in missing:
+                    create_partition(cursor, spec, month)
+                for month in expired:
+                    retire_partition(cursor, spec, month, archive_schema)
+
+            action = "dropped" if archive_schema is None else f"archived to {archive_schema}"
+            self.stdout.write(
+                self.style.SUCCESS(f"{spec.table}: created {len(missing)} partitions, {action} {len(expired)}")
+            )
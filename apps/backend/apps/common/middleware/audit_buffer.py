@@ -0,0 +1,19 @@
+"""Request-scoped audit buffering middleware.
+
+Wraps each request in an ``audit_buffer`` so the audit and activity log
+entries recorded while handling it are written together, with one bulk
+insert per log model, after the request's transaction commits.
+"""
+
+from apps.common.audit_sink import audit_buffer
+
+
+class AuditBufferMiddleware:
+    """Middleware that batches the audit log writes of a request."""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with audit_buffer():
+            return self.get_response(request)
@@ -0,0 +1,19 @@
+"""Request-scoped policy memoization middleware.
+
+Wraps each request in a ``policy_evaluation_scope`` so that policies
+evaluated repeatedly with the same inputs while handling one request are
+evaluated, and logged, only once.
+"""
+
+from apps.common.policies.memo import policy_evaluation_scope
+
+
+class PolicyEvaluationScopeMiddleware:
+    """Middleware that memoizes policy evaluations for the duration of a request."""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with policy_evaluation_scope():
+            return self.get_response(request)
@@ -66,6 +66,7 @@ CLEAN ARCHITECTURE BENEFITS:
 """
 
 import uuid
+from datetime import timedelta
 from typing import TYPE_CHECKING, Any, ClassVar
 
 from django.conf import settings
@@ -79,6 +80,7 @@ from django.utils import timezone
 from django.utils.text import slugify
 from django.utils.translation import gettext_lazy as _
 
+from .audit_sink import record_audit_entry
 from .constants import Buildings, get_building_display_name
 
 
@@ -759,7 +761,7 @@ class SystemAuditLog(TimestampedModel):
             # Extract user agent
             log_data["user_agent"] = request.headers.get("user-agent", "")
 
-        return cls.objects.create(**log_data)
+        return record_audit_entry(cls(**log_data))
 
 
 class StudentActivityLogManager(models.Manager):
@@ -930,6 +932,10 @@ class StudentActivityLog(TimestampedModel):
     # through the indexed string fields which are more stable anyway since they
     # don't break when records are deleted.
 
+    # Recent windows tried, newest first, by searches without a start date;
+    # the table is partitioned by month on PostgreSQL (apps.common.partitioning)
+    SEARCH_WINDOW_DAYS: ClassVar[tuple[int, ...]] = (31, 92, 366)
+
     class Meta:
         verbose_name = _("Student Audit Log")
         verbose_name_plural = _("Student Audit Logs")
@@ -999,7 +1005,7 @@ class StudentActivityLog(TimestampedModel):
         class_code = class_header.course.code if class_header else ""
         class_section = class_header.section_id if class_header else ""
 
-        return cls.objects.create(
+        entry = cls(
             student_number=student_number,
             student_name=student_name or "",
             activity_type=activity_type,
@@ -1012,6 +1018,7 @@ class StudentActivityLog(TimestampedModel):
             performed_by=performed_by,
             is_system_generated=is_system_generated,
         )
+        return record_audit_entry(entry)
 
     @classmethod
     def search_student_activities(
@@ -1035,6 +1042,11 @@ class StudentActivityLog(TimestampedModel):
             date_to: Filter by date range end
             limit: Maximum number of results
 
+        Without ``date_from``, the most recent windows (see
+        ``SEARCH_WINDOW_DAYS``) are tried first so that, on partitioned
+        storage, searches usually only scan the latest months; the full range
+        is searched only when a window holds fewer than ``limit`` matches.
+
         Returns:
             QuerySet of matching StudentAuditLog entries
         """
@@ -1053,8 +1065,14 @@ class StudentActivityLog(TimestampedModel):
             filters["created_at__lte"] = date_to
 
         # Unpack the dictionary of active filters directly into the filter method
-        queryset = cls.objects.filter(**filters)
-        return queryset.order_by("-created_at")[:limit]
+        queryset = cls.objects.filter(**filters).order_by("-created_at")
+        if not date_from and limit > 0:
+            newest = date_to or timezone.now()
+            for days in cls.SEARCH_WINDOW_DAYS:
+                window = queryset.filter(created_at__gte=newest - timedelta(days=days))
+                if window[limit - 1 : limit].exists():
+                    return window[:limit]
+        return queryset[:limit]
 
     @classmethod
     def log_status_change(cls, student, old_status: str, new_status: str, user, notes: str = ""):
@@ -1062,7 +1080,7 @@ class StudentActivityLog(TimestampedModel):
         student_number = str(student.student_id) if hasattr(student, "student_id") else str(student)
         student_name = student.person.full_name if hasattr(student, "person") else ""
 
-        return cls.objects.create(
+        entry = cls(
             student_number=student_number,
             student_name=student_name,
             activity_type=cls.ActivityType.STUDENT_STATUS_CHANGE,
@@ -1075,6 +1093,7 @@ class StudentActivityLog(TimestampedModel):
             performed_by=user,
             visibility=cls.VisibilityLevel.STUDENT_VISIBLE,
         )
+        return record_audit_entry(entry)
 
     @classmethod
     def log_enrollment(cls, student, class_header, term, user, action: str = "enrolled"):
@@ -1088,7 +1107,7 @@ class StudentActivityLog(TimestampedModel):
         student_number = str(student.student_id) if hasattr(student, "student_id") else str(student)
         student_name = student.person.full_name if hasattr(student, "person") else ""
 
-        return cls.objects.create(
+        entry = cls(
             student_number=student_number,
             student_name=student_name,
             activity_type=activity_type,
@@ -1099,6 +1118,7 @@ class StudentActivityLog(TimestampedModel):
             performed_by=user,
             visibility=cls.VisibilityLevel.STUDENT_VISIBLE,
         )
+        return record_audit_entry(entry)
 
     @classmethod
     def log_grade_change(
@@ -1114,7 +1134,7 @@ class StudentActivityLog(TimestampedModel):
         student_number = str(student.student_id) if hasattr(student, "student_id") else str(student)
         student_name = student.person.full_name if hasattr(student, "person") else ""
 
-        return cls.objects.create(
+        entry = cls(
             student_number=student_number,
             student_name=student_name,
             activity_type=cls.ActivityType.GRADE_CHANGE,
@@ -1128,6 +1148,7 @@ class StudentActivityLog(TimestampedModel):
             performed_by=user,
             visibility=cls.VisibilityLevel.STUDENT_VISIBLE,
         )
+        return record_audit_entry(entry)
 
     @classmethod
     def log_override(cls, student, override_type: str, reason: str, user, **context):
@@ -1145,7 +1166,7 @@ class StudentActivityLog(TimestampedModel):
 
         activity_type = activity_type_map.get(override_type, cls.ActivityType.MANAGEMENT_OVERRIDE)
 
-        return cls.objects.create(
+        entry = cls(
             student_number=student_number,
             student_name=student_name,
             activity_type=activity_type,
@@ -1158,6 +1179,7 @@ class StudentActivityLog(TimestampedModel):
             performed_by=user,
             visibility=cls.VisibilityLevel.STAFF_ONLY,
         )
+        return record_audit_entry(entry)
 
 
 class RoomManager(SoftDeleteManager["Room"]):
@@ -1691,7 +1713,7 @@ class ActivityLog(UserAuditModel):
                 }
             )
 
-        return cls.objects.create(**activity_data)
+        return record_audit_entry(cls(**activity_data))
 
 
 class NotificationTemplate(UserAuditModel):
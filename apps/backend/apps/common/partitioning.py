@@ -0,0 +1,225 @@
+"""Monthly range partitioning of the activity and audit log tables.
+
+On PostgreSQL the log tables below are declaratively partitioned by UTC month on
+their creation timestamp, so queries filtered by date only scan the matching
+months and old months can be detached instead of deleted row by row. Each
+table has one partition per month, named ``<table>_pYYYYMM``, and a
+``<table>_default`` partition that catches rows outside every monthly range
+so writes never fail when future partitions have not been created yet.
+
+The primary key of a partitioned table must include the partition column, so
+the database key is ``(id, <column>)``; Django keeps treating ``id`` alone as
+the primary key, which stays unique because it is generated by the identity
+sequence.
+
+``python manage.py manage_log_partitions`` creates upcoming partitions and
+retires partitions older than the retention period, either by moving them to
+an archive schema or by dropping them. Other database vendors keep plain
+tables and every function here is PostgreSQL-only.
+"""
+
+import re
+from dataclasses import dataclass
+from datetime import date, datetime
+
+PARTITION_SUFFIX_RE = re.compile(r"_p(\d{4})(\d{2})$")
+
+
+@dataclass(frozen=True)
+class PartitionedTable:
+    """A log table partitioned by month on a timestamp column."""
+
+    table: str
+    column: str
+
+    def partition_name(self, month: date) -> str:
+        return f"{self.table}_p{month:%Y%m}"
+
+    @property
+    def default_partition(self) -> str:
+        return f"{self.table}_default"
+
+
+PARTITIONED_LOG_TABLES = (
+    PartitionedTable("common_studentactivitylog", "created_at"),
+    PartitionedTable("common_activitylog", "created_at"),
+    PartitionedTable("people_personeventlog", "timestamp"),
+    PartitionedTable("people_studentauditlog", "timestamp"),
+)
+
+
+def month_start(value: date | datetime) -> date:
+    """First day of the month containing ``value``."""
+    return date(value.year, value.month, 1)
+
+
+def add_months(value: date | datetime, months: int) -> date:
+    """First day of the month ``months`` after the one containing ``value``."""
+    index = value.year * 12 + value.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def month_range(first: date, last: date) -> list[date]:
+    """First days of every month from ``first`` through ``last``, inclusive."""
+    months = []
+    month = month_start(first)
+    while month <= last:
+        months.append(month)
+        month = add_months(month, 1)
+    return months
+
+
+def partition_month(spec: PartitionedTable, name: str) -> date | None:
+    """Month covered by a partition of ``spec``, or ``None`` if the name is not a monthly partition."""
+    match = PARTITION_SUFFIX_RE.search(name)
+    if not name.startswith(spec.table) or match is None or len(name) != len(spec.table) + 8:
+        return None
+    return date(int(match.group(1)), int(match.group(2)), 1)
+
+
+def expired_months(months: list[date], today: date, retention_months: int) -> list[date]:
+    """Months that lie entirely before the retention window ending in ``today``'s month.
+
+    The current month and the ``retention_months`` before it are kept; a
+    retention of zero or less keeps everything.
+    """
+    if retention_months <= 0:
+        return []
+    cutoff = add_months(today, -retention_months)
+    return sorted(month for month in months if month < cutoff)
+
+
+def _bound(month: date) -> str:
+    return f"'{month.isoformat()} 00:00:00+00'"
+
+
+def create_partition_sql(spec: PartitionedTable, month: date) -> str:
+    """DDL attaching an empty partition for ``month``."""
+    return (
+        f'CREATE TABLE IF NOT EXISTS "{spec.partition_name(month)}" PARTITION OF "{spec.table}" '
+        f"FOR VALUES FROM ({_bound(month)}) TO ({_bound(add_months(month, 1))})"
+    )
+
+
+def move_from_default_sql(spec: PartitionedTable, month: date) -> list[str]:
+    """Statements that create ``month``'s partition when the default partition may hold its rows.
+
+    PostgreSQL refuses to attach a range that rows in the default partition
+    fall into, so those rows are moved into a standalone table first and the
+    table is attached afterwards.
+    """
+    name = spec.partition_name(month)
+    start, end = _bound(month), _bound(add_months(month, 1))
+    return [
+        f'CREATE TABLE "{name}" (LIKE "{spec.table}" INCLUDING DEFAULTS INCLUDING CONSTRAINTS)',
+        f'WITH moved AS (DELETE FROM "{spec.default_partition}" '
+        f'WHERE "{spec.column}" >= {start} AND "{spec.column}" < {end} RETURNING *) '
+        f'INSERT INTO "{name}" SELECT * FROM moved',
+        f'ALTER TABLE "{spec.table}" ATTACH PARTITION "{name}" FOR VALUES FROM ({start}) TO ({end})',
+    ]
+
+
+def is_partitioned(cursor, spec: PartitionedTable) -> bool:
+    cursor.execute("SELECT relkind FROM pg_class WHERE oid = to_regclass(%s)", [spec.table])
+    row = cursor.fetchone()
+    return row is not None and row[0] == "p"
+
+
+def list_partitions(cursor, spec: PartitionedTable) -> dict[date, str]:
+    """Monthly partitions currently attached to ``spec``'s table, by month."""
+    cursor.execute(
+        "SELECT child.relname FROM pg_inherits "
+        "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+        "WHERE pg_inherits.inhparent = to_regclass(%s)",
+        [spec.table],
+    )
+    partitions = {}
+    for (name,) in cursor.fetchall():
+        month = partition_month(spec, name)
+        if month is not None:
+            partitions[month] = name
+    return partitions
+
+
+def default_partition_has_rows(cursor, spec: PartitionedTable, month: date) -> bool:
+    start, end = _bound(month), _bound(add_months(month, 1))
+    cursor.execute(
+        f'SELECT EXISTS (SELECT 1 FROM "{spec.default_partition}" '
+        f'WHERE "{spec.column}" >= {start} AND "{spec.column}" < {end})'
+    )
+    return cursor.fetchone()[0]
+
+
+def create_partition(cursor, spec: PartitionedTable, month: date) -> str:
+    """Create and attach the partition for ``month``, moving any rows the default partition holds for it."""
+    if default_partition_has_rows(cursor, spec, month):
+        for statement in move_from_default_sql(spec, month):
+            cursor.execute(statement)
+    else:
+        cursor.execute(create_partition_sql(spec, month))
+    return spec.partition_name(month)
+
+
+def retire_partition(cursor, spec: PartitionedTable, month: date, archive_schema: str | None) -> str:
+    """Detach ``month``'s partition and move it to ``archive_schema``, or drop it when no schema is given."""
+    name = spec.partition_name(month)
+    cursor.execute(f'ALTER TABLE "{spec.table}" DETACH PARTITION "{name}"')
+    if archive_schema:
+        cursor.execute(f'CREATE SCHEMA IF NOT EXISTS "{archive_schema}"')
+        cursor.execute(f'ALTER TABLE "{name}" SET SCHEMA "{archive_schema}"')
+    else:
+        cursor.execute(f'DROP TABLE "{name}"')
+    return name
+
+
+def convert_to_partitioned(cursor, spec: PartitionedTable, today: date, months_ahead: int) -> None:
+    """Rebuild a plain log table as a monthly partitioned table, keeping its rows.
+
+    The existing indexes and foreign keys are recreated on the partitioned
+    table and the identity sequence continues after the highest copied id.
+    Tables that are already partitioned are left alone.
+    """
+    if is_partitioned(cursor, spec):
+        return
+
+    table, column = spec.table, spec.column
+    legacy = f"{table}_unpartitioned"
+    cursor.execute(
+        "SELECT pg_get_indexdef(indexrelid) FROM pg_index WHERE indrelid = to_regclass(%s) AND NOT indisunique",
+        [table],
+    )
+    index_definitions = [row[0] for row in cursor.fetchall()]
+    cursor.execute(
+        "SELECT conname, pg_get_constraintdef(oid) FROM pg_constraint "
+        "WHERE conrelid = to_regclass(%s) AND contype = 'f'",
+        [table],
+    )
+    foreign_keys = cursor.fetchall()
+
+    cursor.execute(f'ALTER TABLE "{table}" RENAME TO "{legacy}"')
+    cursor.execute(
+        f'CREATE TABLE "{table}" (LIKE "{legacy}" INCLUDING DEFAULTS INCLUDING IDENTITY '
+        f"INCLUDING CONSTRAINTS INCLUDING STORAGE INCLUDING COMMENTS) "
+        f'PARTITION BY RANGE ("{column}")'
+    )
+
+    cursor.execute(f'SELECT min("{column}"), max("{column}") FROM "{legacy}"')
+    oldest, newest = cursor.fetchone()
+    first = month_start(oldest) if oldest else month_start(today)
+    last = max(add_months(today, months_ahead), month_start(newest) if newest else first)
+    for month in month_range(first, last):
+        cursor.execute(create_partition_sql(spec, month))
+    cursor.execute(f'CREATE TABLE "{spec.default_partition}" PARTITION OF "{table}" DEFAULT')
+
+    cursor.execute(f'INSERT INTO "{table}" SELECT * FROM "{legacy}"')
+    cursor.execute(f'DROP TABLE "{legacy}"')
+    cursor.execute(
+        f"SELECT setval(pg_get_serial_sequence(%s, 'id'), COALESCE(max(id), 0) + 1, false) FROM \"{table}\"",
+        [table],
+    )
+
+    cursor.execute(f'ALTER TABLE "{table}" ADD CONSTRAINT "{table}_pkey" PRIMARY KEY (id, "{column}")')
+    for definition in index_definitions:
+        cursor.execute(definition)
+    for name, definition in foreign_keys:
+        cursor.execute(f'ALTER TABLE "{table}" ADD CONSTRAINT "{name}" {definition}')
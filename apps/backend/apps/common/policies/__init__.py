@@ -10,6 +10,7 @@ Key components:
 - PolicyEngine: Orchestrates policy evaluation
 - PolicyContext: Standardized context for policy decisions
 - PolicyResult/PolicyViolation: Structured policy outcomes
+- policy_evaluation_scope: Request/batch-scoped memoization of evaluations
 
 Usage:
     from apps.common.policies import PolicyEngine, PolicyContext
@@ -22,6 +23,7 @@ Usage:
 from .base import Policy, PolicyContext, PolicyEngine, PolicyResult, PolicyViolation
 from .decorators import policy_check, requires_policy
 from .exceptions import PolicyError, PolicyNotFoundError
+from .memo import policy_evaluation_scope
 
 __all__ = [
     "Policy",
@@ -32,5 +34,6 @@ __all__ = [
     "PolicyResult",
     "PolicyViolation",
     "policy_check",
+    "policy_evaluation_scope",
     "requires_policy",
 ]
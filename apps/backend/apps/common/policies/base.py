@@ -5,16 +5,26 @@ as code, ensuring all business rules are discoverable, testable, and auditable.
 """
 
 import logging
+import random
 from abc import ABC, abstractmethod
+from collections.abc import Callable, Mapping
 from dataclasses import dataclass, field
 from datetime import date
 from enum import Enum
 from functools import lru_cache
 from typing import Any
 
+from django.utils.module_loading import import_string
+
+from .manifest import POLICY_MANIFEST
+from .memo import memoized
+
 # Configure policy decision logging
 policy_logger = logging.getLogger("naga.policies")
 
+# Share of ALLOW evaluations that are logged when no setting is configured
+DEFAULT_LOG_SAMPLE_RATE = 1.0
+
 
 class PolicyResult(Enum):
     """Standardized policy evaluation results."""
@@ -174,12 +184,53 @@ class Policy(ABC):
         )
 
 
+def should_log_evaluation(
+    result: PolicyResult,
+    sample_rate: float,
+    rand: Callable[[], float] = random.random,
+) -> bool:
+    """Decide whether an evaluation is logged.
+
+    Denials and override requirements are always logged; allowed results are
+    logged for a ``sample_rate`` share of evaluations.
+    """
+    return result != PolicyResult.ALLOW or rand() < sample_rate
+
+
+def discover_policies() -> dict[str, type[Policy]]:
+    """Import every app's ``policies`` package and collect its policy classes by code."""
+    from django.apps import apps
+
+    discovered: dict[str, type[Policy]] = {}
+    for app_config in apps.get_app_configs():
+        try:
+            policies_module = __import__(f"{app_config.name}.policies", fromlist=[""])
+        except ImportError:
+            # App doesn't have policies module - that's fine
+            continue
+        # Look for Policy subclasses and register them
+        for attr_name in dir(policies_module):
+            attr = getattr(policies_module, attr_name)
+            if isinstance(attr, type) and issubclass(attr, Policy) and attr != Policy:
+                try:
+                    discovered[attr().policy_code] = attr
+                except Exception as e:
+                    policy_logger.warning(f"Could not register policy {attr_name}: {e}")
+    return discovered
+
+
 class PolicyRegistry:
-    """Registry for discovering and managing policies."""
+    """Registry for discovering and managing policies.
+
+    Policies listed in the manifest are imported lazily, the first time their
+    code is requested. A code missing from the manifest triggers one full
+    discovery pass over all apps.
+    """
 
-    def __init__(self) -> None:
+    def __init__(self, manifest: Mapping[str, str] | None = None) -> None:
         self._policies: dict[str, Policy] = {}
-        self._auto_discover()
+        self._manifest = dict(POLICY_MANIFEST if manifest is None else manifest)
+        self._discovered = False
 
     def register(self, policy: Policy) -> None:
         """Register a policy instance."""
@@ -187,36 +238,45 @@ class PolicyRegistry:
 
     def get(self, policy_code: str) -> Policy | None:
         """Get a policy by code."""
+        if policy_code not in self._policies:
+            if policy_code in self._manifest:
+                self._load(policy_code)
+            elif not self._discovered:
+                policy_logger.warning(
+                    "Policy %s is not in the registry manifest; discovering all policies", policy_code
+                )
+                self._auto_discover()
         return self._policies.get(policy_code)
 
     def list_all(self) -> list[Policy]:
         """Get all registered policies."""
+        self._load_manifest()
         return list(self._policies.values())
 
     def get_by_domain(self, domain: str) -> list[Policy]:
         """Get all policies for a specific domain (e.g., 'TEACH', 'ENROLL')."""
+        self._load_manifest()
         return [policy for policy in self._policies.values() if policy.policy_code.startswith(domain)]
 
+    def _load_manifest(self) -> None:
+        """Import every manifest policy that has not been loaded yet."""
+        for policy_code in self._manifest:
+            if policy_code not in self._policies:
+                self._load(policy_code)
+
+    def _load(self, policy_code: str) -> None:
+        """Import and register one policy listed in the manifest."""
+        try:
+            self.register(import_string(self._manifest[policy_code])())
+        except Exception as e:
+            policy_logger.warning(f"Could not register policy {policy_code}: {e}")
+
     def _auto_discover(self) -> None:
         """Auto-discover policies from registered apps."""
-        # Import policies from each app's policies module
-        from django.apps import apps
-
-        for app_config in apps.get_app_configs():
-            try:
-                policies_module = __import__(f"{app_config.name}.policies", fromlist=[""])
-                # Look for Policy subclasses and register them
-                for attr_name in dir(policies_module):
-                    attr = getattr(policies_module, attr_name)
-                    if isinstance(attr, type) and issubclass(attr, Policy) and attr != Policy:
-                        try:
-                            policy_instance = attr()
-                            self.register(policy_instance)
-                        except Exception as e:
-                            policy_logger.warning(f"Could not register policy {attr_name}: {e}")
-            except ImportError:
-                # App doesn't have policies module - that's fine
-                continue
+        self._discovered = True
+        for policy_code, policy_class in discover_policies().items():
+            if policy_code not in self._policies:
+                self.register(policy_class())
 
 
 class PolicyEngine:
@@ -227,11 +287,17 @@ class PolicyEngine:
     """
 
     def __init__(self):
+        from django.conf import settings
+
         self.registry = PolicyRegistry()
+        self.log_sample_rate = getattr(settings, "POLICY_EVALUATION_LOG_SAMPLE_RATE", DEFAULT_LOG_SAMPLE_RATE)
 
     def evaluate_policy(self, policy_code: str, context: PolicyContext, **kwargs) -> PolicyResult:
         """Evaluate a specific policy.
 
+        Inside a ``policy_evaluation_scope`` results are memoized, and only the
+        first evaluation of each input combination is logged.
+
         Args:
             policy_code: Unique policy identifier
             context: Policy evaluation context
@@ -261,12 +327,13 @@ class PolicyEngine:
             msg = f"Missing required parameters for {policy_code}: {missing_params}"
             raise ValueError(msg)
 
-        # Evaluate policy
-        result = policy.evaluate(context, **kwargs)
-
-        # Log evaluation
-        policy.log_evaluation(context, result, **kwargs)
+        return memoized(policy, "evaluate", context, kwargs, lambda: self._evaluate(policy, context, **kwargs))
 
+    def _evaluate(self, policy: Policy, context: PolicyContext, **kwargs) -> PolicyResult:
+        """Evaluate a policy and log a sample of the outcomes."""
+        result = policy.evaluate(context, **kwargs)
+        if policy_logger.isEnabledFor(logging.INFO) and should_log_evaluation(result, self.log_sample_rate):
+            policy.log_evaluation(context, result, **kwargs)
         return result
 
     def get_policy_violations(self, policy_code: str, context: PolicyContext, **kwargs) -> list[PolicyViolation]:
@@ -290,7 +357,7 @@ class PolicyEngine:
             msg = f"Policy not found: {policy_code}"
             raise PolicyNotFoundError(msg)
 
-        return policy.get_violations(context, **kwargs)
+        return list(memoized(policy, "violations", context, kwargs, lambda: policy.get_violations(context, **kwargs)))
 
     def evaluate_multiple(self, policy_codes: list[str], context: PolicyContext, **kwargs) -> dict[str, PolicyResult]:
         """Evaluate multiple policies and return results.
@@ -0,0 +1,14 @@
+"""Precomputed registry manifest mapping policy codes to policy classes.
+
+``PolicyRegistry`` imports a policy's module only when its code is first
+requested, instead of importing every app's ``policies`` package at startup.
+Codes missing from the manifest fall back to full discovery.
+
+Generated by ``python manage.py build_policy_manifest``; do not edit by hand.
+"""
+
+POLICY_MANIFEST: dict[str, str] = {
+    "AUTH_OVERRIDE_001": "apps.accounts.policies.authority_policies.OverrideAuthorityPolicy",
+    "ENRL_CAPACITY_001": "apps.enrollment.policies.enrollment_policies.EnrollmentCapacityPolicy",
+    "TEACH_QUAL_001": "apps.accounts.policies.teaching_policies.TeachingQualificationPolicy",
+}
@@ -0,0 +1,100 @@
+"""Request- and batch-scoped memoization of policy evaluations.
+
+Enrollment and authority checks evaluate the same policy with the same inputs
+many times within one request or bulk operation. Inside a
+``policy_evaluation_scope`` the engine remembers each result under the policy
+code, the policy version and a fingerprint of the context and parameters, so
+repeated evaluations are answered from memory.
+
+Fingerprints identify model instances by their primary key, so a scope
+assumes the records it evaluates against do not change underneath it; values
+that change (such as seat counts) must be passed in as parameters. Inputs that
+cannot be fingerprinted are evaluated without memoization.
+
+Outside a scope nothing is memoized.
+"""
+
+from collections.abc import Callable, Hashable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import fields, is_dataclass
+from datetime import date, datetime, time
+from decimal import Decimal
+from enum import Enum
+from typing import Any, TypeVar
+
+from django.db import models
+
+T = TypeVar("T")
+
+_memo: ContextVar[dict[Hashable, Any] | None] = ContextVar("policy_evaluation_memo", default=None)
+
+SCALAR_TYPES = (str, int, float, bool, Decimal, date, datetime, time, Enum)
+
+
+class NotFingerprintable(TypeError):
+    """Raised for inputs that have no stable, hashable fingerprint."""
+
+
+def fingerprint(value: Any) -> Hashable:
+    """Hashable fingerprint of a policy input.
+
+    Scalars are used as they are, saved model instances become their label and
+    primary key, and containers and dataclasses are fingerprinted recursively.
+    """
+    if value is None or isinstance(value, SCALAR_TYPES):
+        return value
+    if isinstance(value, models.Model):
+        if value.pk is None:
+            msg = f"Unsaved {value._meta.label} instance"
+            raise NotFingerprintable(msg)
+        return (value._meta.label, value.pk)
+    if isinstance(value, dict):
+        return tuple(sorted(((str(key), fingerprint(item)) for key, item in value.items()), key=lambda kv: kv[0]))
+    if isinstance(value, list | tuple):
+        return tuple(fingerprint(item) for item in value)
+    if isinstance(value, set | frozenset):
+        return frozenset(fingerprint(item) for item in value)
+    if is_dataclass(value) and not isinstance(value, type):
+        return (type(value).__qualname__, *(fingerprint(getattr(value, f.name)) for f in fields(value)))
+    msg = f"Cannot fingerprint {type(value).__qualname__}"
+    raise NotFingerprintable(msg)
+
+
+def evaluation_key(policy: Any, operation: str, context: Any, kwargs: dict[str, Any]) -> Hashable | None:
+    """Memo key of one policy call, or ``None`` if its inputs cannot be fingerprinted."""
+    try:
+        return (policy.policy_code, policy.policy_version, operation, fingerprint(context), fingerprint(kwargs))
+    except NotFingerprintable:
+        return None
+
+
+@contextmanager
+def policy_evaluation_scope() -> Iterator[None]:
+    """Memoize policy evaluations until the block exits.
+
+    Nested scopes share the outermost scope's memo.
+    """
+    if _memo.get() is not None:
+        yield
+        return
+    token = _memo.set({})
+    try:
+        yield
+    finally:
+        _memo.reset(token)
+
+
+def memoized(policy: Any, operation: str, context: Any, kwargs: dict[str, Any], compute: Callable[[], T]) -> T:
+    """Return the memoized result of a policy call, computing it on a miss.
+
+    Returns ``compute()`` directly when no scope is active or the inputs
+    cannot be fingerprinted.
+    """
+    memo = _memo.get()
+    key = None if memo is None else evaluation_key(policy, operation, context, kwargs)
+    if key is None:
+        return compute()
+    if key not in memo:
+        memo[key] = compute()
+    return memo[key]
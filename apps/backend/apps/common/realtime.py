@@ -0,0 +1,158 @@
+"""Channel-layer event delivery for real-time features.
+
+Publishers (model signals and services) push small JSON-serializable events
+to channel-layer groups once their transaction commits. Subscription
+resolvers await those groups instead of polling, so an idle subscriber is a
+single suspended task that costs no CPU.
+
+Each subscriber owns a private channel, a bounded buffer and an optional
+predicate. When a client reads slower than events arrive, the oldest
+buffered events are dropped so memory per connection stays bounded.
+"""
+
+import asyncio
+import contextlib
+import logging
+from collections.abc import AsyncIterator, Callable, Iterable
+from typing import Any
+
+from asgiref.sync import async_to_sync
+from channels.layers import get_channel_layer
+from django.db import transaction
+
+logger = logging.getLogger(__name__)
+
+EVENT_MESSAGE_TYPE = "graphql.event"
+DEFAULT_MAX_PENDING = 100
+
+DASHBOARD_GROUP = "gql.dashboard"
+
+EventPredicate = Callable[[dict[str, Any]], bool]
+
+
+def grade_entry_group(class_id: Any) -> str:
+    """Group receiving grade changes for one class header."""
+    return f"gql.grades.{class_id}"
+
+
+def payment_group(student_id: Any) -> str:
+    """Group receiving payment changes for one student."""
+    return f"gql.payments.{student_id}"
+
+
+def publish(group: str, event: dict[str, Any]) -> None:
+    """Publish an event to a subscription group after the current transaction commits.
+
+    Safe to call from synchronous code (signals, services). Events published
+    inside a transaction that rolls back are never delivered.
+    """
+    channel_layer = get_channel_layer()
+    if channel_layer is None:
+        return
+
+    message = {"type": EVENT_MESSAGE_TYPE, "event": event}
+
+    def _send() -> None:
+        try:
+            async_to_sync(channel_layer.group_send)(group, message)
+        except Exception:
+            logger.exception("Failed to publish subscription event to %s", group)
+
+    transaction.on_commit(_send)
+
+
+async def apublish(group: str, event: dict[str, Any]) -> None:
+    """Publish an event from async code; delivery is immediate."""
+    channel_layer = get_channel_layer()
+    if channel_layer is None:
+        return
+    await channel_layer.group_send(group, {"type": EVENT_MESSAGE_TYPE, "event": event})
+
+
+class ChannelSubscription:
+    """Async iterator over events sent to one or more channel-layer groups.
+
+    Use as an async context manager so the private channel leaves its groups
+    when the client disconnects::
+
+        async with ChannelSubscription([payment_group(student_id)]) as events:
+            async for event in events:
+                ...
+    """
+
+    def __init__(
+        self,
+        groups: Iterable[str],
+        *,
+        predicate: EventPredicate | None = None,
+        max_pending: int = DEFAULT_MAX_PENDING,
+        channel_layer=None,
+    ):
+        self.groups = list(groups)
+        self.predicate = predicate
+        self.max_pending = max(1, max_pending)
+        self.channel_layer = channel_layer or get_channel_layer()
+        self.channel_name: str | None = None
+        self.dropped = 0
+        self._queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue(maxsize=self.max_pending)
+        self._pump_task: asyncio.Task | None = None
+
+    async def __aenter__(self) -> "ChannelSubscription":
+        if self.channel_layer is None:
+            raise RuntimeError("No channel layer configured for GraphQL subscriptions")
+
+        self.channel_name = await self.channel_layer.new_channel()
+        for group in self.groups:
+            await self.channel_layer.group_add(group, self.channel_name)
+        self._pump_task = asyncio.create_task(self._pump())
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        if self._pump_task is not None:
+            self._pump_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._pump_task
+        for group in self.groups:
+            with contextlib.suppress(Exception):
+                await self.channel_layer.group_discard(group, self.channel_name)
+        if self.dropped:
+            logger.debug("Subscription %s dropped %d events under backpressure", self.channel_name, self.dropped)
+
+    def __aiter__(self) -> "ChannelSubscription":
+        return self
+
+    async def __anext__(self) -> dict[str, Any]:
+        return await self._queue.get()
+
+    async def _pump(self) -> None:
+        """Move events from the channel layer into the bounded local buffer."""
+        while True:
+            message = await self.channel_layer.receive(self.channel_name)
+            if message.get("type") != EVENT_MESSAGE_TYPE:
+                continue
+
+            event = message.get("event") or {}
+            if self.predicate is not None:
+                try:
+                    if not self.predicate(event):
+                        continue
+                except Exception:
+                    logger.exception("Subscription predicate failed; dropping event")
+                    continue
+
+            if self._queue.full():
+                # Drop the oldest event so the newest state always gets through.
+                self._queue.get_nowait()
+                self.dropped += 1
+            self._queue.put_nowait(event)
+
+
+async def subscribe(
+    *groups: str,
+    predicate: EventPredicate | None = None,
+    max_pending: int = DEFAULT_MAX_PENDING,
+) -> AsyncIterator[dict[str, Any]]:
+    """Yield events published to ``groups`` until the consumer stops iterating."""
+    async with ChannelSubscription(groups, predicate=predicate, max_pending=max_pending) as subscription:
+        async for event in subscription:
+            yield event
@@ -0,0 +1,106 @@
+"""Publish model changes to GraphQL subscription groups.
+
+Signal receivers here translate saved grades and payments into compact
+events for :mod:`apps.common.realtime`. They are connected in
+``CommonConfig.ready`` so every process that saves these models publishes,
+including Dramatiq workers and management commands, not only processes that
+import the GraphQL schema. Services that change state without saving these
+models can call the ``publish_*`` helpers directly.
+
+Dashboard subscriptions are fed by the shared metrics producer in
+``apps.web_interface.dashboard_metrics`` rather than by model signals.
+"""
+
+import logging
+from typing import Any
+
+from django.db import transaction
+from django.db.models.signals import post_save
+from django.utils import timezone
+
+from apps.common.realtime import grade_entry_group, payment_group, publish
+
+logger = logging.getLogger(__name__)
+
+
+def publish_grade_event(grade, *, conflict: bool = False) -> None:
+    """Publish a class part grade change to its class header's group."""
+    enrollment = grade.enrollment
+    publish(
+        grade_entry_group(enrollment.class_header_id),
+        {
+            "student_id": str(enrollment.student_id),
+            "class_part_id": str(grade.class_part_id),
+            "score": float(grade.numeric_score) if grade.numeric_score is not None else None,
+            "letter_grade": grade.letter_grade,
+            "updated_by": str(grade.entered_by_id or ""),
+            "timestamp": timezone.now().isoformat(),
+            "conflict": conflict,
+        },
+    )
+
+
+def _payment_student_id(payment):
+    """Return the paying student's id, reusing the invoice when it is already loaded."""
+    if type(payment).invoice.is_cached(payment):
+        return payment.invoice.student_id
+
+    from apps.finance.models import Invoice
+
+    return Invoice.objects.filter(pk=payment.invoice_id).values_list("student_id", flat=True).first()
+
+
+def publish_payment_event(payment) -> None:
+    """Publish a payment change to the paying student's group."""
+    publish(
+        payment_group(_payment_student_id(payment)),
+        {
+            "payment_id": str(payment.pk),
+            "amount": str(payment.amount),
+            "currency": payment.currency,
+            "currency_name": str(payment.get_currency_display()),
+            "payment_method": payment.payment_method,
+            "status": payment.status,
+            "payment_date": payment.payment_date.isoformat() if payment.payment_date else None,
+            "notes": payment.notes or None,
+        },
+    )
+
+
+def _on_grade_saved(sender, instance, **kwargs: Any) -> None:
+    try:
+        publish_grade_event(instance)
+    except Exception:
+        logger.exception("Failed to publish grade event for ClassPartGrade %s", instance.pk)
+
+
+def _on_payment_saved(sender, instance, **kwargs: Any) -> None:
+    def _publish() -> None:
+        try:
+            publish_payment_event(instance)
+        except Exception:
+            logger.exception("Failed to publish payment event for Payment %s", instance.pk)
+
+    # Build and send the event after commit so saving a payment never waits on it
+    transaction.on_commit(_publish)
+
+
+def connect_subscription_publishers() -> None:
+    """Connect model signals that feed GraphQL subscriptions.
+
+    Idempotent: receivers use fixed ``dispatch_uid`` values.
+    """
+    from apps.finance.models import Payment
+    from apps.grading.models import ClassPartGrade
+
+    post_save.connect(_on_grade_saved, sender=ClassPartGrade, dispatch_uid="graphql_publish_grade")
+    post_save.connect(_on_payment_saved, sender=Payment, dispatch_uid="graphql_publish_payment")
+
+
+def disconnect_subscription_publishers() -> None:
+    """Disconnect subscription publishers, e.g. for bulk imports or tests."""
+    from apps.finance.models import Payment
+    from apps.grading.models import ClassPartGrade
+
+    post_save.disconnect(sender=ClassPartGrade, dispatch_uid="graphql_publish_grade")
+    post_save.disconnect(sender=Payment, dispatch_uid="graphql_publish_payment")
@@ -3,13 +3,54 @@ Centralized student search service for consistent search logic across the applic
 
 This module provides optimized search functionality for StudentProfile objects,
 eliminating duplicated search code and providing consistent performance optimization.
+
+Text search matches against ``Person.search_text``, a normalized copy of the
+names and emails maintained on save. On PostgreSQL the column carries a
+``pg_trgm`` GIN index, so substring matches are index scans and results are
+ranked by trigram word similarity; on other databases (SQLite in tests) the
+same lookups run unindexed with a simple prefix-based rank. Queries that look
+like a student ID take a fast path over the unique ``student_id`` index.
 """
 
 from typing import Any
 
-from django.db.models import Q, QuerySet
+from django.contrib.postgres.search import TrigramWordSimilarity
+from django.db import connections
+from django.db.models import Case, Exists, FloatField, OuterRef, Q, QuerySet, Value, When
+
+from apps.common.utils.search_text import normalize_search_text
+from apps.people.models import PhoneNumber, StudentProfile
+
+STUDENT_ID_WIDTH = 5
+STUDENT_ID_MAX_DIGITS = 10
+
+
+def student_id_prefix_ranges(prefix: str) -> list[tuple[int, int]]:
+    """Half-open ``student_id`` ranges whose formatted IDs start with ``prefix``.
 
-from apps.people.models import StudentProfile
+    IDs are displayed zero-padded to ``STUDENT_ID_WIDTH`` digits, so a digit
+    prefix covers one integer range per possible ID width.
+    """
+    ranges = []
+    for width in range(max(len(prefix), STUDENT_ID_WIDTH), STUDENT_ID_MAX_DIGITS + 1):
+        scale = 10 ** (width - len(prefix))
+        low = max(int(prefix) * scale, 10 ** (width - 1) if width > STUDENT_ID_WIDTH else 0)
+        high = min((int(prefix) + 1) * scale, 10**width)
+        if low < high:
+            ranges.append((low, high))
+    return ranges
+
+
+def student_id_prefix_q(prefix: str) -> Q:
+    """Match students whose formatted ID starts with ``prefix``.
+
+    Range lookups use the ``student_id`` index, unlike ``startswith`` on an
+    integer column.
+    """
+    match = Q(pk__in=[])
+    for low, high in student_id_prefix_ranges(prefix):
+        match |= Q(student_id__gte=low, student_id__lt=high)
+    return match
 
 
 class StudentSearchService:
@@ -20,6 +61,74 @@ class StudentSearchService:
     code duplication across different views and endpoints.
     """
 
+    MIN_QUERY_LENGTH = 2
+    FUZZY_SIMILARITY_THRESHOLD = 0.4
+
+    @classmethod
+    def search(
+        cls,
+        queryset: QuerySet[StudentProfile],
+        search_term: str,
+        fuzzy: bool = False,
+        also_match: Q | None = None,
+    ) -> QuerySet[StudentProfile]:
+        """
+        Filter students matching a search term, ranked by relevance.
+
+        Digit-only terms match formatted student ID prefixes. Other terms
+        require every word to appear in the person's search text; with
+        ``fuzzy`` on PostgreSQL, close trigram matches are included as well.
+
+        Args:
+            queryset: StudentProfile queryset to filter
+            search_term: Raw search input
+            fuzzy: Whether to also match misspellings (PostgreSQL only)
+            also_match: Extra condition OR'd into the match, e.g. phone numbers
+
+        Returns:
+            Filtered queryset annotated with ``search_rank`` and ordered by it
+        """
+        search_term = search_term.strip()
+        if not search_term:
+            return queryset
+
+        extra = also_match if also_match is not None else Q(pk__in=[])
+
+        if search_term.isdigit():
+            return (
+                queryset.filter(student_id_prefix_q(search_term) | extra)
+                .annotate(
+                    search_rank=Case(
+                        When(student_id=int(search_term), then=Value(1.0)),
+                        default=Value(0.5),
+                        output_field=FloatField(),
+                    )
+                )
+                .order_by("-search_rank", "student_id")
+            )
+
+        normalized = normalize_search_text(search_term)
+        matches = Q()
+        for word in normalized.split():
+            matches &= Q(person__search_text__contains=word)
+
+        if connections[queryset.db].vendor == "postgresql":
+            if fuzzy:
+                matches |= Q(person__search_text__trigram_word_similar=normalized)
+            rank = TrigramWordSimilarity(Value(normalized), "person__search_text")
+        else:
+            rank = Case(
+                When(person__search_text__startswith=normalized, then=Value(1.0)),
+                default=Value(0.5),
+                output_field=FloatField(),
+            )
+
+        return (
+            queryset.filter(matches | extra)
+            .annotate(search_rank=rank)
+            .order_by("-search_rank", "person__family_name", "person__personal_name")
+        )
+
     @classmethod
     def get_optimized_search_queryset(
         cls, query_params: dict[str, Any], for_list_view: bool = False, limit: int | None = None
@@ -39,15 +148,7 @@ class StudentSearchService:
         queryset = StudentProfile.objects.filter(is_deleted=False).select_related("person")
 
         # Apply search filters
-        search_query = query_params.get("search", "").strip()
-        if search_query:
-            queryset = queryset.filter(
-                Q(student_id__startswith=search_query)  # Optimized: search by ID prefix
-                | Q(person__full_name__icontains=search_query)
-                | Q(person__khmer_name__icontains=search_query)
-                | Q(person__school_email__icontains=search_query)
-                | Q(person__personal_email__icontains=search_query)
-            )
+        queryset = cls.search(queryset, query_params.get("search", ""))
 
         # Status filter
         status = query_params.get("status", "").strip()
@@ -75,42 +176,22 @@ class StudentSearchService:
             search_term: Search term to match against student fields
             limit: Maximum number of results to return
             active_only: Whether to filter by active status only
-            include_phone: Whether to include phone number in search (if available)
+            include_phone: Whether to also match the person's phone numbers
 
         Returns:
             QuerySet of matching StudentProfile objects
         """
-        if not search_term or len(search_term.strip()) < 2:
+        if not search_term or len(search_term.strip()) < cls.MIN_QUERY_LENGTH:
             return StudentProfile.objects.none()
 
-        search_term = search_term.strip()
-
-        # Base queryset
-        queryset = StudentProfile.objects.filter(is_deleted=False)
-
-        # Build search filters
-        search_filters = Q(
-            Q(student_id__startswith=search_term)  # Optimized: search by ID prefix
-            | Q(person__full_name__icontains=search_term)
-            | Q(person__khmer_name__icontains=search_term)
-            | Q(person__school_email__icontains=search_term)
-            | Q(person__personal_email__icontains=search_term)
-        )
-
-        # Add phone search if requested and available
-        # Note: Person model may not have phone field - this is defensive coding
+        # Phone numbers live on a related model rather than in the search text
+        phone_match = None
         if include_phone:
-            try:
-                # Check if person model has phone field
-                from apps.people.models import Person
-
-                if hasattr(Person, "phone"):
-                    search_filters |= Q(person__phone__icontains=search_term)
-            except Exception:
-                # Silently ignore if phone field doesn't exist
-                pass
+            phone_match = Q(
+                Exists(PhoneNumber.objects.filter(person=OuterRef("person"), number__contains=search_term.strip()))
+            )
 
-        queryset = queryset.filter(search_filters)
+        queryset = cls.search(StudentProfile.objects.filter(is_deleted=False), search_term, also_match=phone_match)
 
         # Filter by active status if requested
         if active_only:
@@ -137,6 +218,12 @@ class StudentSearchService:
         if not id_prefix:
             return StudentProfile.objects.none()
 
-        return StudentProfile.objects.filter(is_deleted=False, student_id__startswith=id_prefix).select_related(
-            "person"
-        )[:limit]
+        if not id_prefix.isdigit():
+            return StudentProfile.objects.none()
+
+        return (
+            StudentProfile.objects.filter(is_deleted=False)
+            .filter(student_id_prefix_q(id_prefix))
+            .select_related("person")
+            .order_by("student_id")[:limit]
+        )
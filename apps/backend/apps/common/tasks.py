@@ -0,0 +1,85 @@
+"""Dramatiq background tasks for the common app.
+
+Audit entries buffered by ``apps.common.audit_sink`` are written here when
+the sink runs in asynchronous mode (``AUDIT_SINK_ASYNC``), and exports too
+large to stream within a request are built here (``apps.common.crud.export``).
+"""
+
+import logging
+
+import dramatiq
+from django.contrib.auth import get_user_model
+from django.http import HttpRequest, QueryDict
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+from apps.common.audit_sink import load_entries, write_entries
+from apps.common.crud.export import export_download_url, get_export_retention, save_export
+
+logger = logging.getLogger(__name__)
+
+
+@dramatiq.actor(queue_name="default", max_retries=3)
+def write_audit_entries(model_label: str, payload: str):
+    """Bulk-insert a batch of committed audit entries.
+
+    Args:
+        model_label: Label of the log model (e.g. 'common.StudentActivityLog')
+        payload: JSON list of field values produced by ``serialize_entries``
+    """
+    model, entries = load_entries(model_label, payload)
+    written = write_entries(model, entries)
+    if written < len(entries):
+        logger.error("Wrote %d of %d %s audit entries", written, len(entries), model_label)
+
+
+@dramatiq.actor(queue_name="default", max_retries=0, time_limit=60 * 60 * 1000)
+def build_export(view_path: str, view_kwargs: dict, query_string: str, user_id: int, format_type: str, filename: str):
+    """Build a large list export and notify the user with a download link.
+
+    The link is only valid for the user and expires with the export after
+    ``EXPORT_RETENTION_HOURS``.
+
+    The view is set up with a GET request carrying the original query string
+    and user, so it selects exactly the rows the user asked to export.
+
+    Args:
+        view_path: Dotted path of the list view class
+        view_kwargs: URL keyword arguments of the original request
+        query_string: Filters, search and sort parameters of the original request
+        user_id: Requesting user, who receives the notification
+        format_type: 'csv' or 'xlsx'
+        filename: Name of the exported file
+    """
+    from apps.common.models import Notification
+
+    user = get_user_model().objects.get(pk=user_id)
+    request = HttpRequest()
+    request.method = "GET"
+    request.GET = QueryDict(query_string)
+    request.user = user
+
+    view = import_string(view_path)()
+    view.setup(request, **view_kwargs)
+    rows = view.get_export_rows(view.get_queryset(), format_type)
+    try:
+        path = save_export(format_type, filename, view.get_export_header(), rows, owner_id=user.pk)
+    except Exception:
+        logger.exception("Export %s for user %s failed", filename, user_id)
+        Notification.create_notification(
+            user,
+            title="Export failed",
+            message=f"{filename} could not be generated. Please try again or narrow the filters.",
+            notification_type=Notification.NotificationType.ERROR,
+        )
+        raise
+
+    Notification.create_notification(
+        user,
+        title="Export ready",
+        message=f"{filename} is ready to download.",
+        notification_type=Notification.NotificationType.SUCCESS,
+        action_url=export_download_url(path),
+        action_text="Download",
+        expires_at=timezone.now() + get_export_retention(),
+    )
@@ -0,0 +1,134 @@
+"""
+PostgreSQL integration tests for monthly log partitioning.
+
+Verifies that converting a log table keeps its rows and ids, that ORM inserts
+still receive ids afterwards, that a new partition takes over the rows the
+default partition held for its month, and that retired partitions are moved to
+the archive schema or dropped. Run against PostgreSQL by setting
+``TEST_DATABASE_URL``; on other databases these tests are skipped.
+"""
+
+from datetime import UTC, datetime
+
+import pytest
+from django.db import connection
+from django.utils import timezone
+
+from apps.common.models import StudentActivityLog
+from apps.common.partitioning import (
+    PartitionedTable,
+    add_months,
+    convert_to_partitioned,
+    create_partition,
+    is_partitioned,
+    list_partitions,
+    month_range,
+    retire_partition,
+)
+
+SPEC = PartitionedTable("common_studentactivitylog", "created_at")
+ARCHIVE_SCHEMA = "test_log_archive"
+
+pytestmark = [
+    pytest.mark.integration,
+    pytest.mark.skipif(connection.vendor != "postgresql", reason="Log partitioning requires PostgreSQL"),
+]
+
+
+def mid_month(month):
+    return datetime(month.year, month.month, 15, 12, tzinfo=UTC)
+
+
+def row_count(cursor, table, schema="public"):
+    cursor.execute(f'SELECT count(*) FROM "{schema}"."{table}"')
+    return cursor.fetchone()[0]
+
+
+@pytest.mark.django_db
+class TestLogPartitioning:
+    """Each test runs in a rolled-back transaction, so the DDL is undone afterwards."""
+
+    @pytest.fixture(autouse=True)
+    def _setup(self, user):
+        self.performer = user
+        self.today = timezone.now().date()
+
+    def _log(self, created_at, student_number="S100"):
+        entry = StudentActivityLog.objects.create(
+            student_number=student_number,
+            student_name="Test Student",
+            activity_type=StudentActivityLog.ActivityType.CLASS_ENROLLMENT,
+            description="Enrolled",
+            performed_by=self.performer,
+        )
+        StudentActivityLog.objects.filter(pk=entry.pk).update(created_at=created_at)
+        return entry.pk
+
+    def test_conversion_keeps_existing_rows(self):
+        oldest = add_months(self.today, -3)
+        ids = [self._log(mid_month(oldest)), self._log(mid_month(self.today))]
+
+        with connection.cursor() as cursor:
+            assert not is_partitioned(cursor, SPEC)
+            convert_to_partitioned(cursor, SPEC, self.today, months_ahead=2)
+
+            assert is_partitioned(cursor, SPEC)
+            assert sorted(list_partitions(cursor, SPEC)) == month_range(oldest, add_months(self.today, 2))
+            assert row_count(cursor, SPEC.partition_name(oldest)) == 1
+            assert row_count(cursor, SPEC.default_partition) == 0
+
+        assert sorted(StudentActivityLog.objects.values_list("pk", flat=True)) == sorted(ids)
+        assert StudentActivityLog.objects.get(pk=ids[0]).created_at == mid_month(oldest)
+
+    def test_orm_inserts_get_ids_after_conversion(self):
+        existing = self._log(mid_month(self.today))
+        with connection.cursor() as cursor:
+            convert_to_partitioned(cursor, SPEC, self.today, months_ahead=1)
+
+        created = StudentActivityLog.objects.create(
+            student_number="S200",
+            student_name="New Student",
+            activity_type=StudentActivityLog.ActivityType.CLASS_ENROLLMENT,
+            description="Enrolled",
+            performed_by=self.performer,
+        )
+
+        assert created.pk is not None
+        assert created.pk > existing
+        assert StudentActivityLog.objects.get(pk=created.pk).student_number == "S200"
+
+    def test_new_partition_moves_rows_out_of_default(self):
+        with connection.cursor() as cursor:
+            convert_to_partitioned(cursor, SPEC, self.today, months_ahead=0)
+        future = add_months(self.today, 3)
+        moved = self._log(mid_month(future))
+
+        with connection.cursor() as cursor:
+            assert row_count(cursor, SPEC.default_partition) == 1
+            name = create_partition(cursor, SPEC, future)
+
+            assert list_partitions(cursor, SPEC)[future] == name
+            assert row_count(cursor, SPEC.default_partition) == 0
+            assert row_count(cursor, name) == 1
+
+        assert StudentActivityLog.objects.filter(pk=moved).exists()
+
+    def test_retired_partitions_are_archived_or_dropped(self):
+        archived, dropped = add_months(self.today, -14), add_months(self.today, -13)
+        archived_id = self._log(mid_month(archived))
+        dropped_id = self._log(mid_month(dropped))
+        kept_id = self._log(mid_month(self.today))
+
+        with connection.cursor() as cursor:
+            convert_to_partitioned(cursor, SPEC, self.today, months_ahead=0)
+            archived_name = retire_partition(cursor, SPEC, archived, ARCHIVE_SCHEMA)
+            dropped_name = retire_partition(cursor, SPEC, dropped, None)
+
+            assert archived not in list_partitions(cursor, SPEC)
+            assert dropped not in list_partitions(cursor, SPEC)
+            assert row_count(cursor, archived_name, schema=ARCHIVE_SCHEMA) == 1
+            cursor.execute("SELECT to_regclass(%s)", [dropped_name])
+            assert cursor.fetchone()[0] is None
+
+        assert list(StudentActivityLog.objects.values_list("pk", flat=True)) == [kept_id]
+        assert not StudentActivityLog.objects.filter(pk__in=[archived_id, dropped_id]).exists()
@@ -0,0 +1,98 @@
+"""
+Tests for the per-request batch loader.
+
+Verifies that keys from many callers are fetched in one batch, that
+results are cached, and that resolving a nested page stays within a fixed
+number of batches regardless of page size.
+"""
+
+from collections import defaultdict
+
+import pytest
+
+from apps.common.dataloaders import BatchLoader
+
+
+class RecordingBatch:
+    """Batch function that records every call."""
+
+    def __init__(self, rows: dict):
+        self.rows = rows
+        self.calls: list[list] = []
+
+    def __call__(self, keys):
+        self.calls.append(sorted(keys))
+        return {key: self.rows[key] for key in keys if key in self.rows}
+
+
+@pytest.mark.unit
+class TestBatchLoader:
+    """Test batching and caching behaviour."""
+
+    def test_queued_keys_are_fetched_in_one_batch(self):
+        batch = RecordingBatch({1: "a", 2: "b", 3: "c"})
+        loader = BatchLoader(batch)
+
+        loader.queue([1, 2, 3])
+
+        assert loader.load(1) == "a"
+        assert loader.load(2) == "b"
+        assert loader.load(3) == "c"
+        assert batch.calls == [[1, 2, 3]]
+
+    def test_results_are_cached(self):
+        batch = RecordingBatch({1: "a"})
+        loader = BatchLoader(batch)
+
+        loader.load(1)
+        loader.load(1)
+        loader.load_many([1])
+
+        assert batch.calls == [[1]]
+
+    def test_missing_keys_use_default_factory(self):
+        loader = BatchLoader(RecordingBatch({}), list)
+
+        assert loader.load(7) == []
+
+    def test_primed_values_skip_the_batch(self):
+        batch = RecordingBatch({2: "b"})
+        loader = BatchLoader(batch)
+
+        loader.prime(1, "primed")
+        loader.queue([1, 2])
+
+        assert loader.load_many([1, 2]) == ["primed", "b"]
+        assert batch.calls == [[2]]
+
+
+@pytest.mark.unit
+class TestNestedPageBudget:
+    """Resolving children for a page of parents costs one batch per relation."""
+
+    @pytest.mark.parametrize("page_size", [1, 10, 50])
+    def test_batch_count_is_independent_of_page_size(self, page_size):
+        children = {parent: [parent * 10 + i for i in range(3)] for parent in range(page_size)}
+        grandchildren: dict[int, list[str]] = defaultdict(list)
+        for child_ids in children.values():
+            for child in child_ids:
+                grandchildren[child] = [f"grade-{child}"]
+
+        grandchild_loader = BatchLoader(RecordingBatch(grandchildren), list)
+
+        def load_children(keys):
+            result = {key: children[key] for key in keys}
+            for child_ids in result.values():
+                grandchild_loader.queue(child_ids)
+            return result
+
+        child_loader = BatchLoader(load_children, list)
+        child_loader.queue(children)
+
+        resolved = [
+            [grandchild_loader.load(child) for child in child_loader.load(parent)] for parent in range(page_size)
+        ]
+
+        assert len(resolved) == page_size
+        assert child_loader.batch_count == 1
+        assert grandchild_loader.batch_count == 1
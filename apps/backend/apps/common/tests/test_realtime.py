@@ -0,0 +1,242 @@
+"""Tests for channel-layer event delivery used by GraphQL subscriptions.
+
+Covers event delivery, per-connection filtering, backpressure, the idle
+cost of large numbers of subscribers, that publishers are connected at app
+startup rather than on schema import and send after commit, and that
+dashboard subscriptions relay the shared metrics broadcast.
+"""
+
+import asyncio
+import time
+from decimal import Decimal
+
+import pytest
+from channels.layers import InMemoryChannelLayer, get_channel_layer
+from django.core.cache import cache
+from django.db.models.signals import post_save
+
+from api.graphql.subscriptions.real_time import RealTimeSubscriptions
+from apps.common import realtime_publishers
+from apps.common.realtime import DASHBOARD_GROUP, EVENT_MESSAGE_TYPE, ChannelSubscription, payment_group
+from apps.common.realtime_publishers import connect_subscription_publishers
+from apps.finance.models import Invoice, Payment
+from apps.grading.models import ClassPartGrade
+from apps.web_interface import dashboard_metrics
+
+
+def _message(**event):
+    return {"type": EVENT_MESSAGE_TYPE, "event": event}
+
+
+@pytest.mark.unit
+class TestChannelSubscription:
+    """Test ChannelSubscription delivery semantics."""
+
+    def test_delivers_group_events(self):
+        layer = InMemoryChannelLayer()
+
+        async def scenario():
+            async with ChannelSubscription(["gql.test"], channel_layer=layer) as events:
+                await layer.group_send("gql.test", _message(value=1))
+                return await asyncio.wait_for(events.__anext__(), timeout=1)
+
+        assert asyncio.run(scenario()) == {"value": 1}
+
+    def test_predicate_filters_events(self):
+        layer = InMemoryChannelLayer()
+
+        async def scenario():
+            subscription = ChannelSubscription(
+                ["gql.test"], channel_layer=layer, predicate=lambda event: event["student_id"] == "42"
+            )
+            async with subscription as events:
+                await layer.group_send("gql.test", _message(student_id="7"))
+                await layer.group_send("gql.test", _message(student_id="42"))
+                return await asyncio.wait_for(events.__anext__(), timeout=1)
+
+        assert asyncio.run(scenario()) == {"student_id": "42"}
+
+    def test_backpressure_drops_oldest_events(self):
+        layer = InMemoryChannelLayer()
+
+        async def scenario():
+            async with ChannelSubscription(["gql.test"], channel_layer=layer, max_pending=2) as events:
+                for value in range(5):
+                    await layer.group_send("gql.test", _message(value=value))
+                await asyncio.sleep(0.05)
+                received = [await events.__anext__(), await events.__anext__()]
+                return received, events.dropped
+
+        received, dropped = asyncio.run(scenario())
+        assert received == [{"value": 3}, {"value": 4}]
+        assert dropped == 3
+
+    def test_leaves_groups_on_exit(self):
+        layer = InMemoryChannelLayer()
+
+        async def scenario():
+            async with ChannelSubscription(["gql.a", "gql.b"], channel_layer=layer):
+                pass
+
+        asyncio.run(scenario())
+        assert not layer.groups.get("gql.a")
+        assert not layer.groups.get("gql.b")
+
+
+@pytest.mark.unit
+class TestPublisherWiring:
+    """Publishers must be connected in every process, not only where the schema is imported."""
+
+    @pytest.mark.parametrize(
+        ("sender", "dispatch_uid"),
+        [
+            (ClassPartGrade, "graphql_publish_grade"),
+            (Payment, "graphql_publish_payment"),
+        ],
+    )
+    def test_connected_by_app_config(self, sender, dispatch_uid):
+        try:
+            assert post_save.disconnect(sender=sender, dispatch_uid=dispatch_uid)
+        finally:
+            connect_subscription_publishers()
+
+
+@pytest.mark.django_db
+class TestPaymentPublisher:
+    """Payment events are built and sent once the saving transaction commits."""
+
+    def test_sent_after_commit_without_queries(
+        self, monkeypatch, django_assert_num_queries, django_capture_on_commit_callbacks
+    ):
+        sent = []
+        monkeypatch.setattr(realtime_publishers, "publish", lambda group, event: sent.append((group, event)))
+        payment = Payment(
+            pk=5,
+            invoice=Invoice(pk=3, student_id=42),
+            amount=Decimal("25.00"),
+            payment_method=Payment.PaymentMethod.CASH,
+            status=Payment.PaymentStatus.COMPLETED,
+        )
+
+        with django_capture_on_commit_callbacks(execute=True) as callbacks:
+            with django_assert_num_queries(0):
+                realtime_publishers._on_payment_saved(Payment, payment)
+            assert sent == []
+
+        assert len(callbacks) == 1
+        assert [group for group, _event in sent] == [payment_group(42)]
+        assert sent[0][1]["payment_id"] == "5"
+
+
+@pytest.mark.unit
+class TestDashboardSubscription:
+    """Dashboard subscriptions relay the shared producer's snapshot and deltas."""
+
+    SNAPSHOT = {
+        "version": 3,
+        "metrics": {
+            "total_students": 100,
+            "total_classes": 20,
+            "active_enrollments": 300,
+            "pending_payments": 1500.0,
+            "last_updated": "2024-01-01T00:00:00",
+        },
+    }
+
+    @pytest.fixture(autouse=True)
+    def shared_snapshot(self, settings, monkeypatch):
+        settings.CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+        cache.clear()
+        cache.set(dashboard_metrics.SNAPSHOT_CACHE_KEY, self.SNAPSHOT)
+        monkeypatch.setattr(dashboard_metrics, "ensure_dashboard_producer", lambda: None)
+
+        def no_queries(*args, **kwargs):
+            raise AssertionError("dashboard subscribers must not compute metrics")
+
+        monkeypatch.setattr(dashboard_metrics, "compute_dashboard_metrics", no_queries)
+
+    def _receive(self, fields, *messages, cached=None):
+        async def scenario():
+            updates = RealTimeSubscriptions().dashboard_metrics_updates(None, fields)
+            received = [await updates.__anext__()]
+            if cached is not None:
+                cache.set(dashboard_metrics.SNAPSHOT_CACHE_KEY, cached)
+            # Let the subscription join its group before the producer broadcasts.
+            pending = asyncio.ensure_future(updates.__anext__())
+            await asyncio.sleep(0.05)
+            layer = get_channel_layer()
+            for message in messages:
+                await layer.group_send(DASHBOARD_GROUP, {"type": EVENT_MESSAGE_TYPE, "event": message})
+            received.append(await asyncio.wait_for(pending, timeout=1))
+            await updates.aclose()
+            return received
+
+        return asyncio.run(scenario())
+
+    def test_relays_snapshot_then_deltas(self):
+        initial, update = self._receive(
+            None,
+            {
+                "type": "metrics.delta",
+                "version": 4,
+                "base_version": 3,
+                "changes": {"pending_payments": 1200.0, "last_updated": "2024-01-01T00:01:00"},
+            },
+        )
+
+        assert initial.metrics.student_metrics.total_count.value == 100
+        assert initial.metrics.academic_metrics.average_class_size == 15
+        assert update.updated_fields == ["financial_metrics"]
+        assert update.metrics.financial_metrics.pending_payments.value == 1200.0
+        assert update.metrics.student_metrics.total_count.value == 100
+
+    def test_filters_sections_and_resyncs_after_missed_delta(self):
+        payments_only = {
+            "type": "metrics.delta",
+            "version": 4,
+            "base_version": 3,
+            "changes": {"pending_payments": 1200.0},
+        }
+        # Version 5 never reaches the subscriber; the cache already holds version 6.
+        latest = {**self.SNAPSHOT["metrics"], "total_students": 101, "pending_payments": 1200.0}
+
+        _initial, update = self._receive(
+            ["student_metrics"],
+            payments_only,
+            {"type": "metrics.delta", "version": 6, "base_version": 5, "changes": {"total_students": 101}},
+            cached={"version": 6, "metrics": latest},
+        )
+
+        assert update.updated_fields == ["student_metrics"]
+        assert update.metrics.student_metrics.total_count.value == 101
+        assert update.metrics.financial_metrics.pending_payments.value == 1200.0
+
+
+@pytest.mark.performance
+@pytest.mark.slow
+def test_idle_subscribers_use_no_cpu():
+    """Thousands of idle subscribers must not consume CPU while waiting."""
+    layer = InMemoryChannelLayer(capacity=10)
+    subscriber_count = 2000
+
+    async def scenario():
+        subscriptions = [ChannelSubscription(["gql.idle"], channel_layer=layer) for _ in range(subscriber_count)]
+        for subscription in subscriptions:
+            await subscription.__aenter__()
+        # Let every receiver task reach its first await before measuring.
+        await asyncio.sleep(0.2)
+
+        cpu_before = time.process_time()
+        await asyncio.sleep(1.0)
+        idle_cpu = time.process_time() - cpu_before
+
+        await layer.group_send("gql.idle", _message(value="wake"))
+        first = await asyncio.wait_for(subscriptions[-1].__anext__(), timeout=5)
+
+        for subscription in subscriptions:
+            await subscription.__aexit__(None, None, None)
+        return idle_cpu, first
+
+    idle_cpu, first = asyncio.run(scenario())
+    assert first == {"value": "wake"}
+    assert idle_cpu < 0.1
@@ -0,0 +1,112 @@
+"""
+Tests for buffered audit log writes.
+
+Verifies that entries are saved immediately outside a buffer, collected and
+written per model once the transaction commits, dropped with rolled-back
+savepoints, handed to the worker in asynchronous mode with a synchronous
+fallback, and serialized losslessly for the worker.
+"""
+
+import pytest
+from django.db import transaction
+
+from apps.common import audit_sink
+from apps.common.audit_sink import audit_buffer, load_entries, record_audit_entry, serialize_entries
+from apps.common.models import ActivityLog, StudentActivityLog
+
+
+class FakeEntry:
+    """Stand-in for an unsaved log entry."""
+
+    def __init__(self):
+        self.saved = False
+
+    def save(self):
+        self.saved = True
+
+
+@pytest.fixture
+def written(monkeypatch):
+    calls = []
+    monkeypatch.setattr(audit_sink, "write_entries", lambda model, entries: calls.append((model, entries)))
+    return calls
+
+
+def activity(number):
+    return StudentActivityLog(
+        student_number=number,
+        student_name="Sok Dara",
+        activity_type=StudentActivityLog.ActivityType.CLASS_ENROLLMENT,
+        description="Enrolled",
+        performed_by_id=1,
+        activity_details={"section": "A"},
+    )
+
+
+@pytest.mark.unit
+class TestAuditBuffer:
+    """Test buffering and flushing of audit entries."""
+
+    def test_saves_immediately_without_buffer(self):
+        entry = record_audit_entry(FakeEntry())
+
+        assert entry.saved
+
+    def test_buffers_and_writes_per_model_on_commit(self, written, django_capture_on_commit_callbacks):
+        with django_capture_on_commit_callbacks(execute=True):
+            with audit_buffer(asynchronous=False):
+                entries = [record_audit_entry(activity("1")), record_audit_entry(activity("2"))]
+                other = record_audit_entry(ActivityLog(activity_type=ActivityLog.ActivityType.SYSTEM, description="x"))
+                with audit_buffer():
+                    nested = record_audit_entry(activity("3"))
+            assert written == []
+
+        assert written == [(StudentActivityLog, [*entries, nested]), (ActivityLog, [other])]
+
+    def test_drops_entries_of_rolled_back_savepoints(self, written, django_capture_on_commit_callbacks):
+        with django_capture_on_commit_callbacks(execute=True), audit_buffer(asynchronous=False):
+            kept = record_audit_entry(activity("1"))
+            with pytest.raises(RuntimeError), transaction.atomic():
+                record_audit_entry(activity("2"))
+                raise RuntimeError
+
+        assert written == [(StudentActivityLog, [kept])]
+
+    def test_writes_committed_entries_when_block_fails(self, written, django_capture_on_commit_callbacks):
+        with django_capture_on_commit_callbacks(execute=True):
+            with pytest.raises(RuntimeError), audit_buffer(asynchronous=False):
+                entry = record_audit_entry(activity("1"))
+                raise RuntimeError
+
+        assert written == [(StudentActivityLog, [entry])]
+
+    def test_async_mode_falls_back_to_synchronous_write(
+        self, monkeypatch, written, django_capture_on_commit_callbacks
+    ):
+        enqueued = []
+        monkeypatch.setattr(
+            audit_sink.AuditSink, "_enqueue", lambda self, model, entries: enqueued.append(model) or True
+        )
+
+        with django_capture_on_commit_callbacks(execute=True), audit_buffer(asynchronous=True):
+            record_audit_entry(activity("1"))
+        assert (enqueued, written) == ([StudentActivityLog], [])
+
+        monkeypatch.setattr(audit_sink.AuditSink, "_enqueue", lambda self, model, entries: False)
+        with django_capture_on_commit_callbacks(execute=True), audit_buffer(asynchronous=True):
+            entry = record_audit_entry(activity("2"))
+        assert written == [(StudentActivityLog, [entry])]
+
+
+@pytest.mark.unit
+class TestSerialization:
+    """Test payloads handed to the audit worker."""
+
+    def test_round_trip(self):
+        model, entries = load_entries("common.StudentActivityLog", serialize_entries([activity("1"), activity("2")]))
+
+        assert model is StudentActivityLog
+        assert [entry.student_number for entry in entries] == ["1", "2"]
+        assert entries[0].activity_details == {"section": "A"}
+        assert entries[0].performed_by_id == 1
+        assert entries[0].pk is None
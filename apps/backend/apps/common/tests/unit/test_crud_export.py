@@ -0,0 +1,276 @@
+"""
+Tests for streaming CSV and write-only XLSX exports.
+
+Verifies that CSV responses stream row by row, that workbooks are written in
+write-only mode with a styled header and sampled column widths, that large
+exports are routed to the ``build_export`` job, and that background exports
+are saved privately under an unguessable path, only downloaded by their owner
+and deleted once expired.
+"""
+
+import os
+from datetime import timedelta
+from io import BytesIO, StringIO
+from unittest.mock import Mock
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import AnonymousUser
+from django.core.management import call_command
+from django.http import FileResponse, Http404, HttpResponseRedirect, StreamingHttpResponse
+from django.test import RequestFactory
+from django.urls import include, path, resolve
+from django.utils import timezone
+from openpyxl import load_workbook
+
+from apps.common import tasks
+from apps.common.crud.config import CRUDConfig, FieldConfig
+from apps.common.crud.export import (
+    MAX_COLUMN_WIDTH,
+    csv_response,
+    delete_expired_exports,
+    estimate_column_widths,
+    export_download_url,
+    get_export_owner_id,
+    get_export_storage,
+    iter_csv,
+    save_export,
+    write_xlsx,
+    xlsx_response,
+)
+from apps.common.crud.views import CRUDListView, ExportDownloadView
+from apps.common.models import Notification
+
+HEADER = ["Student ID", "Name"]
+
+# Download links are resolved against the web interface routes only
+urlpatterns = [path("", include("apps.web_interface.urls", namespace="web_interface"))]
+
+
+def rows():
+    yield [10001, "Sok Dara"]
+    yield [10002, "Chan Sophea"]
+
+
+class UserExportView(CRUDListView):
+    model = get_user_model()
+    crud_config = CRUDConfig(
+        fields=[FieldConfig(name="email", verbose_name="Email", searchable=True)],
+        default_sort_field="email",
+        export_filename_prefix="users",
+    )
+
+
+@pytest.fixture
+def export_root(settings, tmp_path):
+    settings.EXPORT_ROOT = str(tmp_path / "exports")
+    settings.EXPORT_RETENTION_HOURS = 24
+    return settings.EXPORT_ROOT
+
+
+def age_export(path, hours):
+    """Set the modification time of a saved export ``hours`` into the past."""
+    timestamp = (timezone.now() - timedelta(hours=hours)).timestamp()
+    os.utime(get_export_storage().path(path), (timestamp, timestamp))
+
+
+@pytest.mark.unit
+class TestCsvExport:
+    def test_lines_are_produced_lazily(self):
+        lines = iter_csv(HEADER, rows())
+        assert next(lines) == "Student ID,Name\r\n"
+        assert list(lines) == ["10001,Sok Dara\r\n", "10002,Chan Sophea\r\n"]
+
+    def test_response_streams_attachment(self):
+        response = csv_response("students.csv", HEADER, rows())
+
+        assert isinstance(response, StreamingHttpResponse)
+        assert response["Content-Disposition"] == 'attachment; filename="students.csv"'
+        assert b"".join(response.streaming_content).decode().splitlines()[1] == "10001,Sok Dara"
+
+
+@pytest.mark.unit
+class TestXlsxExport:
+    def test_column_widths_fit_sample_and_are_capped(self):
+        widths = estimate_column_widths(["ID", "Notes"], [[7, "x" * 80], [12345, None]])
+        assert widths == [7, MAX_COLUMN_WIDTH]
+
+    def test_workbook_round_trips(self):
+        file = BytesIO()
+        write_xlsx(file, HEADER, rows(), title="Students")
+
+        worksheet = load_workbook(file)["Students"]
+        assert [[cell.value for cell in row] for row in worksheet.iter_rows()] == [
+            HEADER,
+            [10001, "Sok Dara"],
+            [10002, "Chan Sophea"],
+        ]
+        assert worksheet["A1"].font.bold
+        assert worksheet.column_dimensions["B"].width == len("Chan Sophea") + 2
+
+    def test_explicit_widths_are_used(self):
+        file = BytesIO()
+        write_xlsx(file, HEADER, rows(), widths=[12, 25])
+
+        assert load_workbook(file).active.column_dimensions["B"].width == 25
+
+    def test_response_streams_workbook_file(self):
+        response = xlsx_response("students.xlsx", HEADER, rows())
+
+        assert isinstance(response, FileResponse)
+        assert "students.xlsx" in response["Content-Disposition"]
+        workbook = load_workbook(BytesIO(b"".join(response.streaming_content)))
+        assert workbook.active.max_row == 3
+
+
+@pytest.mark.unit
+class TestBackgroundExport:
+    def test_saved_export_uses_owner_and_random_directory(self, export_root):
+        first = save_export("csv", "students.csv", HEADER, rows(), owner_id=7)
+        second = save_export("csv", "students.csv", HEADER, rows(), owner_id=7)
+
+        assert first != second
+        assert first.startswith("7/") and first.endswith("/students.csv")
+        assert get_export_owner_id(first) == 7
+        assert get_export_storage().path(first).startswith(export_root)
+        with get_export_storage().open(first) as file:
+            assert file.read().decode().startswith("Student ID,Name")
+
+    def test_owner_is_only_read_from_export_paths(self):
+        assert get_export_owner_id("7/" + "a" * 32 + "/students.csv") == 7
+        assert get_export_owner_id("7/../8/" + "a" * 32 + "/students.csv") is None
+        assert get_export_owner_id("7/not-a-token/students.csv") is None
+        assert get_export_owner_id("exports/" + "a" * 32 + "/students.csv") is None
+
+    def test_cleanup_deletes_only_expired_exports(self, export_root):
+        expired = save_export("csv", "old.csv", HEADER, rows(), owner_id=7)
+        other_owner = save_export("csv", "old.csv", HEADER, rows(), owner_id=8)
+        recent = save_export("csv", "new.csv", HEADER, rows(), owner_id=7)
+        age_export(expired, 25)
+        age_export(other_owner, 25)
+        age_export(recent, 1)
+
+        assert delete_expired_exports() == 2
+
+        storage = get_export_storage()
+        assert storage.exists(recent)
+        assert not storage.exists(expired) and not storage.exists(os.path.dirname(expired))
+        assert storage.listdir("") == (["7"], [])
+
+    def test_cleanup_command_reports_deleted_exports(self, export_root):
+        age_export(save_export("csv", "old.csv", HEADER, rows(), owner_id=7), 48)
+        output = StringIO()
+
+        call_command("cleanup_exports", stdout=output)
+
+        assert "Deleted 1 expired export(s)" in output.getvalue()
+
+    def test_cleanup_without_exports_directory(self, export_root):
+        assert delete_expired_exports() == 0
+
+
+@pytest.mark.django_db
+class TestExportRouting:
+    def _export(self, admin_user, query="format=csv"):
+        request = RequestFactory().get("/users/", data=dict(pair.split("=") for pair in query.split("&")))
+        request.user = admin_user
+        request._messages = Mock()
+        return UserExportView.as_view()(request)
+
+    def test_small_exports_are_streamed(self, settings, admin_user, monkeypatch):
+        settings.EXPORT_BACKGROUND_THRESHOLD = 10
+        send = Mock()
+        monkeypatch.setattr(tasks.build_export, "send", send)
+
+        response = self._export(admin_user)
+
+        assert isinstance(response, StreamingHttpResponse)
+        assert b"".join(response.streaming_content).decode().splitlines() == ["Email", "admin@example.com"]
+        send.assert_not_called()
+
+    def test_large_exports_are_built_in_background(self, settings, admin_user, monkeypatch):
+        settings.EXPORT_BACKGROUND_THRESHOLD = 0
+        send = Mock()
+        monkeypatch.setattr(tasks.build_export, "send", send)
+
+        response = self._export(admin_user, "format=xlsx&search=admin")
+
+        assert isinstance(response, HttpResponseRedirect)
+        assert response.url == "/users/?search=admin"
+        view_path, view_kwargs, query_string, user_id, format_type, filename = send.call_args.args
+        assert view_path == f"{__name__}.UserExportView"
+        assert (view_kwargs, user_id, format_type) == ({}, admin_user.pk, "xlsx")
+        assert query_string == "format=xlsx&search=admin"
+        assert filename.startswith("users_") and filename.endswith(".xlsx")
+
+
+@pytest.mark.django_db
+@pytest.mark.urls(__name__)
+class TestBuildExport:
+    def test_export_is_saved_for_the_user_and_notified(self, export_root, admin_user, create_user):
+        create_user(email="sok@example.com")
+        create_user(email="chan@example.com")
+
+        tasks.build_export.fn(f"{__name__}.UserExportView", {}, "search=sok", admin_user.pk, "csv", "users.csv")
+
+        notification = Notification.objects.get(user=admin_user)
+        match = resolve(notification.action_url)
+        path = match.kwargs["path"]
+        assert match.view_name == "web_interface:export-download"
+        assert get_export_owner_id(path) == admin_user.pk
+        assert notification.expires_at > timezone.now() + timedelta(hours=23)
+        with get_export_storage().open(path) as file:
+            assert file.read().decode().splitlines() == ["Email", "sok@example.com"]
+
+    def test_failed_export_notifies_the_user(self, export_root, admin_user, monkeypatch):
+        monkeypatch.setattr(tasks, "save_export", Mock(side_effect=OSError("disk full")))
+
+        with pytest.raises(OSError):
+            tasks.build_export.fn(f"{__name__}.UserExportView", {}, "", admin_user.pk, "csv", "users.csv")
+
+        notification = Notification.objects.get(user=admin_user)
+        assert notification.title == "Export failed"
+        assert notification.notification_type == Notification.NotificationType.ERROR
+
+
+@pytest.mark.django_db
+@pytest.mark.urls(__name__)
+class TestExportDownloadView:
+    @pytest.fixture(autouse=True)
+    def _export(self, export_root, user):
+        self.path = save_export("csv", "students.csv", HEADER, rows(), owner_id=user.pk)
+
+    def _download(self, user, path=None):
+        path = path or self.path
+        request = RequestFactory().get(export_download_url(path))
+        request.user = user
+        return ExportDownloadView.as_view()(request, path=path)
+
+    def test_owner_downloads_export(self, user):
+        response = self._download(user)
+
+        assert isinstance(response, FileResponse)
+        assert 'filename="students.csv"' in response["Content-Disposition"]
+        assert b"".join(response.streaming_content).decode().startswith("Student ID,Name")
+
+    def test_other_users_cannot_download(self, admin_user):
+        with pytest.raises(Http404):
+            self._download(admin_user)
+
+    def test_anonymous_users_are_sent_to_login(self, settings):
+        settings.LOGIN_URL = "/login/"
+
+        response = self._download(AnonymousUser())
+
+        assert response.status_code == 302
+        assert response.url.startswith("/login/?next=")
+
+    def test_expired_exports_are_not_served(self, user):
+        age_export(self.path, 25)
+
+        with pytest.raises(Http404):
+            self._download(user)
+
+    def test_paths_outside_the_export_layout_are_rejected(self, user):
+        with pytest.raises(Http404):
+            self._download(user, f"{user.pk}/../{self.path}")
@@ -0,0 +1,97 @@
+"""
+Tests for monthly log partition planning and date-windowed activity search.
+
+Verifies month arithmetic, partition naming and retention cutoffs, the DDL
+generated for new partitions, and that activity searches without a start
+date return the same results whether or not a recent window satisfies them.
+"""
+
+from datetime import date, timedelta
+
+import pytest
+from django.utils import timezone
+
+from apps.common.models import StudentActivityLog
+from apps.common.partitioning import (
+    PartitionedTable,
+    add_months,
+    create_partition_sql,
+    expired_months,
+    month_range,
+    move_from_default_sql,
+    partition_month,
+)
+
+SPEC = PartitionedTable("common_studentactivitylog", "created_at")
+
+
+@pytest.mark.unit
+class TestPartitionPlanning:
+    def test_add_months_crosses_year_boundaries(self):
+        assert add_months(date(2025, 11, 15), 3) == date(2026, 2, 1)
+        assert add_months(date(2025, 1, 31), -1) == date(2024, 12, 1)
+
+    def test_month_range_is_inclusive(self):
+        assert month_range(date(2025, 11, 20), date(2026, 1, 1)) == [
+            date(2025, 11, 1),
+            date(2025, 12, 1),
+            date(2026, 1, 1),
+        ]
+
+    def test_partition_names_round_trip(self):
+        name = SPEC.partition_name(date(2025, 3, 1))
+        assert name == "common_studentactivitylog_p202503"
+        assert partition_month(SPEC, name) == date(2025, 3, 1)
+        assert partition_month(SPEC, SPEC.default_partition) is None
+        assert partition_month(SPEC, "common_activitylog_p202503") is None
+
+    def test_expired_months_keep_retention_window(self):
+        months = month_range(date(2024, 1, 1), date(2025, 6, 1))
+        expired = expired_months(months, date(2025, 6, 15), retention_months=12)
+        assert expired == month_range(date(2024, 1, 1), date(2024, 5, 1))
+        assert expired_months(months, date(2025, 6, 15), retention_months=0) == []
+
+    def test_partition_ddl_uses_utc_month_bounds(self):
+        sql = create_partition_sql(SPEC, date(2025, 12, 1))
+        assert 'PARTITION OF "common_studentactivitylog"' in sql
+        assert "FROM ('2025-12-01 00:00:00+00') TO ('2026-01-01 00:00:00+00')" in sql
+
+    def test_rows_in_default_partition_are_moved_before_attach(self):
+        create, move, attach = move_from_default_sql(SPEC, date(2025, 12, 1))
+        assert create.startswith('CREATE TABLE "common_studentactivitylog_p202512"')
+        assert 'DELETE FROM "common_studentactivitylog_default"' in move
+        assert attach.startswith('ALTER TABLE "common_studentactivitylog" ATTACH PARTITION')
+
+
+@pytest.mark.unit
+class TestWindowedSearch:
+    @pytest.fixture(autouse=True)
+    def _performer(self, user):
+        self.performer = user
+
+    def _log(self, student_number, days_ago):
+        entry = StudentActivityLog.objects.create(
+            student_number=student_number,
+            student_name="Test Student",
+            activity_type=StudentActivityLog.ActivityType.CLASS_ENROLLMENT,
+            description="Enrolled",
+            performed_by=self.performer,
+        )
+        StudentActivityLog.objects.filter(pk=entry.pk).update(created_at=timezone.now() - timedelta(days=days_ago))
+        return entry
+
+    def test_recent_window_answers_full_searches(self):
+        recent = [self._log("S100", days) for days in (1, 2, 3)]
+        self._log("S100", 400)
+
+        results = list(StudentActivityLog.search_student_activities(student_number="S100", limit=3))
+
+        assert results == recent
+
+    def test_sparse_results_fall_back_to_full_range(self):
+        newest = self._log("S200", 10)
+        oldest = self._log("S200", 800)
+
+        results = list(StudentActivityLog.search_student_activities(student_number="S200", limit=5))
+
+        assert results == [newest, oldest]
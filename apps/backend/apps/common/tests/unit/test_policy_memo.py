@@ -0,0 +1,164 @@
+"""
+Tests for memoized policy evaluation and lazy policy registration.
+
+Verifies that inputs are fingerprinted stably, that evaluations are memoized
+only inside a scope and per policy version, that allowed results are logged
+by sample while denials always are, and that the registry resolves policies
+through its manifest.
+"""
+
+from datetime import date
+
+import pytest
+
+from apps.common.policies.base import (
+    Policy,
+    PolicyContext,
+    PolicyEngine,
+    PolicyRegistry,
+    PolicyResult,
+    should_log_evaluation,
+)
+from apps.common.policies.memo import NotFingerprintable, fingerprint, memoized, policy_evaluation_scope
+from apps.people.models import Person
+
+
+class CountingPolicy(Policy):
+    """Policy that allows everything and counts its evaluations."""
+
+    policy_code = "TEST_COUNT_001"
+    policy_name = "Counting policy"
+    policy_description = "Counts evaluations"
+
+    def __init__(self):
+        self.evaluations = 0
+
+    def evaluate(self, context, **kwargs):
+        self.evaluations += 1
+        return PolicyResult.ALLOW
+
+    def get_violations(self, context, **kwargs):
+        return []
+
+
+class RevisedCountingPolicy(CountingPolicy):
+    """Same policy code at a newer version."""
+
+    @property
+    def policy_version(self):
+        return "2.0"
+
+
+class OtherDomainPolicy(CountingPolicy):
+    """Policy in a different domain."""
+
+    policy_code = "OTHER_001"
+
+
+def context():
+    return PolicyContext(effective_date=date(2025, 1, 6))
+
+
+@pytest.mark.unit
+class TestFingerprint:
+    """Test hashable fingerprints of policy inputs."""
+
+    def test_dict_order_does_not_matter(self):
+        assert fingerprint({"a": 1, "b": [2, 3]}) == fingerprint({"b": [2, 3], "a": 1})
+
+    def test_saved_models_use_label_and_pk(self):
+        assert fingerprint(Person(pk=7)) == ("people.Person", 7)
+
+    def test_unsaved_models_and_arbitrary_objects_are_rejected(self):
+        with pytest.raises(NotFingerprintable):
+            fingerprint(Person())
+        with pytest.raises(NotFingerprintable):
+            fingerprint(object())
+
+    def test_context_dataclass(self):
+        assert fingerprint(context()) == fingerprint(context())
+        assert fingerprint(context()) != fingerprint(PolicyContext(effective_date=date(2025, 1, 7)))
+
+
+@pytest.mark.unit
+class TestMemoized:
+    """Test scope-bound memoization."""
+
+    def test_no_memoization_outside_scope(self):
+        policy = CountingPolicy()
+        for _ in range(2):
+            memoized(policy, "evaluate", context(), {}, lambda: policy.evaluate(context()))
+
+        assert policy.evaluations == 2
+
+    def test_memoized_within_nested_scopes(self):
+        policy = CountingPolicy()
+        with policy_evaluation_scope():
+            memoized(policy, "evaluate", context(), {"n": 1}, lambda: policy.evaluate(context()))
+            with policy_evaluation_scope():
+                memoized(policy, "evaluate", context(), {"n": 1}, lambda: policy.evaluate(context()))
+            memoized(policy, "evaluate", context(), {"n": 2}, lambda: policy.evaluate(context()))
+
+        assert policy.evaluations == 2
+
+    def test_policy_version_is_part_of_the_key(self):
+        old, new = CountingPolicy(), RevisedCountingPolicy()
+        with policy_evaluation_scope():
+            memoized(old, "evaluate", context(), {}, lambda: old.evaluate(context()))
+            memoized(new, "evaluate", context(), {}, lambda: new.evaluate(context()))
+
+        assert (old.evaluations, new.evaluations) == (1, 1)
+
+    def test_unfingerprintable_inputs_are_not_memoized(self):
+        policy = CountingPolicy()
+        with policy_evaluation_scope():
+            for _ in range(2):
+                memoized(policy, "evaluate", context(), {"x": object()}, lambda: policy.evaluate(context()))
+
+        assert policy.evaluations == 2
+
+
+@pytest.mark.unit
+class TestEvaluationLogging:
+    """Test sampled evaluation logging."""
+
+    def test_denials_always_logged(self):
+        assert should_log_evaluation(PolicyResult.DENY, 0.0)
+        assert should_log_evaluation(PolicyResult.REQUIRE_OVERRIDE, 0.0)
+
+    def test_allowed_results_sampled(self):
+        assert should_log_evaluation(PolicyResult.ALLOW, 0.1, rand=lambda: 0.05)
+        assert not should_log_evaluation(PolicyResult.ALLOW, 0.1, rand=lambda: 0.5)
+
+
+@pytest.mark.unit
+class TestRegistryAndEngine:
+    """Test manifest-based registration and memoized engine evaluation."""
+
+    manifest = {
+        CountingPolicy.policy_code: f"{__name__}.CountingPolicy",
+        OtherDomainPolicy.policy_code: f"{__name__}.OtherDomainPolicy",
+    }
+
+    def test_registry_loads_policies_from_manifest(self):
+        registry = PolicyRegistry(manifest=self.manifest)
+
+        assert isinstance(registry.get(CountingPolicy.policy_code), CountingPolicy)
+        assert [policy.policy_code for policy in registry.list_all()] == list(self.manifest)
+
+    def test_get_by_domain_loads_the_manifest_first(self):
+        registry = PolicyRegistry(manifest=self.manifest)
+
+        assert [policy.policy_code for policy in registry.get_by_domain("TEST")] == [CountingPolicy.policy_code]
+        assert [policy.policy_code for policy in registry.get_by_domain("OTHER")] == [OtherDomainPolicy.policy_code]
+
+    def test_engine_memoizes_within_scope(self):
+        engine = PolicyEngine()
+        engine.registry = PolicyRegistry(manifest=self.manifest)
+        policy = engine.registry.get(CountingPolicy.policy_code)
+
+        with policy_evaluation_scope():
+            results = [engine.evaluate_policy(CountingPolicy.policy_code, context(), value=1) for _ in range(3)]
+
+        assert results == [PolicyResult.ALLOW] * 3
+        assert policy.evaluations == 1
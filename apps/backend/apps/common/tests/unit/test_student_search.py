@@ -0,0 +1,37 @@
+"""
+Tests for student search normalization and ID fast paths.
+
+Verifies that search text is case- and accent-insensitive without damaging
+Khmer script, and that formatted student ID prefixes map to index ranges.
+"""
+
+import pytest
+
+from apps.common.services.student_search import student_id_prefix_ranges
+from apps.common.utils.search_text import normalize_search_text
+
+
+@pytest.mark.unit
+class TestNormalizeSearchText:
+    """Test search text normalization."""
+
+    def test_case_accents_and_whitespace(self):
+        assert normalize_search_text("  SÓPHAL ", None, "Chan@Example.com") == "sophal chan@example.com"
+
+    def test_khmer_marks_are_kept(self):
+        assert normalize_search_text("សុខ ចាន់") == "សុខ ចាន់"
+
+
+@pytest.mark.unit
+class TestStudentIdPrefixRanges:
+    """Test mapping formatted ID prefixes to integer ranges."""
+
+    def test_short_prefix_covers_each_width(self):
+        assert student_id_prefix_ranges("123")[:2] == [(12300, 12400), (123000, 124000)]
+
+    def test_zero_padded_prefix(self):
+        assert student_id_prefix_ranges("001") == [(100, 200)]
+        assert student_id_prefix_ranges("0") == [(0, 10000)]
+
+    def test_full_id_includes_exact_match(self):
+        assert student_id_prefix_ranges("12345")[0] == (12345, 12346)
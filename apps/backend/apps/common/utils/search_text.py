@@ -0,0 +1,26 @@
+"""Normalized text for indexed people search.
+
+Search text is case-folded, has accents stripped from Latin letters and
+whitespace collapsed, so that ``contains`` lookups against it can use a
+plain trigram index instead of case-insensitive scans. Combining marks on
+non-Latin scripts are kept: Khmer vowel signs and subscripts are
+combining characters, and removing them would change the word.
+"""
+
+import unicodedata
+
+
+def normalize_search_text(*values: str | None) -> str:
+    """Normalize and join values for storage in or matching against search text.
+
+    Examples:
+        >>> normalize_search_text("Sóphal", None, "  CHAN  ")
+        'sophal chan'
+    """
+    text = unicodedata.normalize("NFKD", " ".join(value for value in values if value)).casefold()
+    chars: list[str] = []
+    for char in text:
+        if unicodedata.combining(char) and chars and chars[-1].isascii():
+            continue
+        chars.append(char)
+    return " ".join("".join(chars).split())
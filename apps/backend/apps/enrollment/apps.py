@@ -6,3 +6,7 @@ class EnrollmentConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.enrollment"
     verbose_name = _("Enrollment")
+
+    def ready(self):
+        """Connect eligibility change-event signals."""
+        from apps.enrollment import signals  # noqa: F401
@@ -0,0 +1,170 @@
+"""Compiled prerequisite graph and completed-course bitsets.
+
+The curriculum's active prerequisite relationships are compiled once into
+a DAG in which every course owns one bit. Each course carries the mask of
+its direct prerequisites, so a student with completed-course bitset
+``completed`` satisfies a course's prerequisites exactly when
+``requires & ~completed == 0``. Evaluating every course for a student is a
+single pass of integer operations over one query's worth of grades.
+
+The compiled graph is cached and invalidated when the catalog changes.
+When a student's completed courses change, only the courses returned by
+``PrerequisiteGraph.affected_by`` need to be re-evaluated.
+"""
+
+import logging
+from collections import defaultdict, deque
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+
+from django.core.cache import cache
+from django.db.models import Q
+from django.utils import timezone
+
+from .constants import ENROLLMENT_STATUS_COMPLETED, GRADE_POINTS, MIN_PREREQUISITE_GRADE
+
+logger = logging.getLogger(__name__)
+
+PREREQUISITE_GRAPH_CACHE_KEY = "enrollment:prerequisite_graph"
+PREREQUISITE_GRAPH_CACHE_TIMEOUT = 24 * 60 * 60
+
+
+def is_passing_grade(grade: str | None) -> bool:
+    """Whether a final grade meets ``MIN_PREREQUISITE_GRADE``."""
+    if not grade:
+        return False
+    grade = grade.strip().upper()
+    return grade in GRADE_POINTS and GRADE_POINTS[grade] >= MIN_PREREQUISITE_GRADE
+
+
+@dataclass
+class PrerequisiteGraph:
+    """Prerequisite DAG with one bit per course."""
+
+    course_ids: list[int]
+    codes: dict[int, str]
+    requires: dict[int, int] = field(default_factory=dict)
+    dependents: dict[int, frozenset[int]] = field(default_factory=dict)
+    order: list[int] = field(default_factory=list)
+    cyclic: frozenset[int] = frozenset()
+
+    def __post_init__(self):
+        self.bits = {course_id: bit for bit, course_id in enumerate(self.course_ids)}
+
+    @classmethod
+    def compile(cls, courses: Iterable[tuple[int, str]], edges: Iterable[tuple[int, int]]) -> "PrerequisiteGraph":
+        """Build the graph from ``(id, code)`` courses and ``(course, prerequisite)`` edges."""
+        codes = dict(courses)
+        graph = cls(course_ids=sorted(codes), codes=codes)
+
+        prerequisites: dict[int, set[int]] = defaultdict(set)
+        dependents: dict[int, set[int]] = defaultdict(set)
+        for course_id, prerequisite_id in edges:
+            if course_id in graph.bits and prerequisite_id in graph.bits:
+                prerequisites[course_id].add(prerequisite_id)
+                dependents[prerequisite_id].add(course_id)
+
+        graph.requires = {course_id: graph.mask(ids) for course_id, ids in prerequisites.items()}
+        graph.dependents = {course_id: frozenset(ids) for course_id, ids in dependents.items()}
+
+        # Kahn's algorithm; courses left over sit on a prerequisite cycle
+        in_degree = {course_id: len(prerequisites.get(course_id, ())) for course_id in graph.course_ids}
+        ready = deque(course_id for course_id, degree in in_degree.items() if degree == 0)
+        while ready:
+            course_id = ready.popleft()
+            graph.order.append(course_id)
+            for dependent in dependents.get(course_id, ()):
+                in_degree[dependent] -= 1
+                if in_degree[dependent] == 0:
+                    ready.append(dependent)
+        graph.cyclic = frozenset(course_id for course_id, degree in in_degree.items() if degree > 0)
+        if graph.cyclic:
+            logger.warning(
+                "Prerequisite cycle involving %s; these courses can never be satisfied",
+                ", ".join(sorted(codes[course_id] for course_id in graph.cyclic)),
+            )
+        return graph
+
+    def mask(self, course_ids: Iterable[int]) -> int:
+        """Bitset of the given courses; unknown courses are ignored."""
+        bitset = 0
+        for course_id in course_ids:
+            bit = self.bits.get(course_id)
+            if bit is not None:
+                bitset |= 1 << bit
+        return bitset
+
+    def prerequisites_of(self, course_id: int) -> list[int]:
+        """Direct prerequisites of a course."""
+        return self._courses(self.requires.get(course_id, 0))
+
+    def missing(self, course_id: int, completed: int) -> list[int]:
+        """Direct prerequisites of a course absent from ``completed``."""
+        return self._courses(self.requires.get(course_id, 0) & ~completed)
+
+    def satisfied(self, completed: int) -> set[int]:
+        """All courses whose prerequisites are met by ``completed``, in one pass."""
+        return {course_id for course_id in self.course_ids if not self.requires.get(course_id, 0) & ~completed}
+
+    def affected_by(self, course_ids: Iterable[int]) -> set[int]:
+        """Courses whose eligibility can change when completion of ``course_ids`` changes.
+
+        That is the courses themselves (repeat prevention) and the courses
+        that list them as direct prerequisites.
+        """
+        affected = set()
+        for course_id in course_ids:
+            affected.add(course_id)
+            affected |= self.dependents.get(course_id, frozenset())
+        return affected
+
+    def _courses(self, bitset: int) -> list[int]:
+        courses = []
+        while bitset:
+            low = bitset & -bitset
+            courses.append(self.course_ids[low.bit_length() - 1])
+            bitset ^= low
+        return courses
+
+
+def build_prerequisite_graph() -> PrerequisiteGraph:
+    """Compile the graph from the catalog's currently effective prerequisites."""
+    from apps.curriculum.models import Course, CoursePrerequisite
+
+    today = timezone.now().date()
+    edges = (
+        CoursePrerequisite.objects.filter(is_active=True, start_date__lte=today)
+        .filter(Q(end_date__isnull=True) | Q(end_date__gte=today))
+        .values_list("course_id", "prerequisite_id")
+    )
+    return PrerequisiteGraph.compile(Course.objects.values_list("id", "code"), edges)
+
+
+def get_prerequisite_graph() -> PrerequisiteGraph:
+    """Return the cached compiled graph, compiling it if needed."""
+    graph = cache.get(PREREQUISITE_GRAPH_CACHE_KEY)
+    if graph is None:
+        graph = build_prerequisite_graph()
+        cache.set(PREREQUISITE_GRAPH_CACHE_KEY, graph, PREREQUISITE_GRAPH_CACHE_TIMEOUT)
+    return graph
+
+
+def invalidate_prerequisite_graph() -> None:
+    """Drop the compiled graph after a catalog change."""
+    cache.delete(PREREQUISITE_GRAPH_CACHE_KEY)
+
+
+def load_completed_courses(student_ids: Iterable[int]) -> dict[int, dict[int, str]]:
+    """Passing final grades per student and course, in one query."""
+    from .models import ClassHeaderEnrollment
+
+    completed: dict[int, dict[int, str]] = defaultdict(dict)
+    rows = ClassHeaderEnrollment.objects.filter(
+        student_id__in=list(student_ids),
+        status=ENROLLMENT_STATUS_COMPLETED,
+        final_grade__isnull=False,
+    ).values_list("student_id", "class_header__course_id", "final_grade")
+    for student_id, course_id, grade in rows:
+        if is_passing_grade(grade) and course_id not in completed[student_id]:
+            completed[student_id][course_id] = grade
+    return completed
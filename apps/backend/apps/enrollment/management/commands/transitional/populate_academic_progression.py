@@ -3,19 +3,24 @@
 This command processes student enrollment history to create comprehensive
 academic journey records with progression milestones. It handles unreliable
 legacy data by using confidence scoring and flagging uncertain records for review.
+
+Students are processed in batches: each batch is loaded with grouped queries
+and written with bulk inserts. Pass --checkpoint to make a long run resumable,
+or --enqueue to spread the batches across background worker processes.
 """
 
 import csv
+import json
 from decimal import Decimal
 from pathlib import Path
 
-from django.db import transaction
-from django.db.models import Count, Prefetch
+from django.db.models import Count
 
 from apps.common.management.base_migration import BaseMigrationCommand
 from apps.enrollment.models import ClassHeaderEnrollment
 from apps.enrollment.models_progression import AcademicJourney
 from apps.enrollment.progression_builder import ProgressionBuilder
+from apps.enrollment.tasks import build_journey_chunk
 from apps.people.models import StudentProfile
 
 
@@ -37,6 +42,7 @@ class Command(BaseMigrationCommand):
             "skipped_no_enrollments": 0,
         }
         self.low_confidence_records = []
+        self.journey_samples = []
 
     def get_rejection_categories(self) -> list[str]:
         """Return possible rejection categories for this migration."""
@@ -69,6 +75,16 @@ class Command(BaseMigrationCommand):
         parser.add_argument(
             "--clear-existing", action="store_true", help="Clear existing journey records before populating"
         )
+        parser.add_argument(
+            "--checkpoint",
+            type=str,
+            help="File recording the last completed batch; an interrupted run resumes after it",
+        )
+        parser.add_argument(
+            "--enqueue",
+            action="store_true",
+            help="Send batches to background workers instead of building them in this process",
+        )
 
     def execute_migration(self, *args, **options):
         """Execute the academic journey population."""
@@ -79,6 +95,8 @@ class Command(BaseMigrationCommand):
         export_file = options.get("export_low_confidence")
         student_ids = options.get("student_ids")
         clear_existing = options.get("clear_existing", False)
+        checkpoint = Path(options["checkpoint"]) if options.get("checkpoint") else None
+        enqueue = options.get("enqueue", False)
 
         if dry_run:
             self.stdout.write(self.style.WARNING("🔍 DRY RUN MODE - No database changes"))
@@ -89,10 +107,16 @@ class Command(BaseMigrationCommand):
         # Clear existing if requested
         if clear_existing and not dry_run:
             self.clear_existing_records()
+            if checkpoint:
+                checkpoint.unlink(missing_ok=True)
+
+        # Resume after the last completed batch
+        if checkpoint and not student_ids:
+            start_student = max(start_student, self.read_checkpoint(checkpoint) + 1)
 
         # Get students to process
-        students = self.get_students_to_process(start_student, student_ids)
-        self.stats["total_students"] = students.count()
+        ids = list(self.get_students_to_process(start_student, student_ids).values_list("id", flat=True))
+        self.stats["total_students"] = len(ids)
 
         # Record input statistics
         self.record_input_stats(
@@ -100,6 +124,7 @@ class Command(BaseMigrationCommand):
             batch_size=batch_size,
             confidence_threshold=confidence_threshold,
             dry_run=dry_run,
+            resumed_from_student=start_student,
         )
 
         # Process students in batches
@@ -107,9 +132,16 @@ class Command(BaseMigrationCommand):
 
         for batch_start in range(0, self.stats["total_students"], batch_size):
             batch_end = min(batch_start + batch_size, self.stats["total_students"])
-            batch = students[batch_start:batch_end]
+            batch = ids[batch_start:batch_end]
 
-            self.process_batch(batch, dry_run, confidence_threshold)
+            if dry_run:
+                self.preview_batch(batch)
+            elif enqueue:
+                build_journey_chunk.send(batch)
+            else:
+                self.process_batch(batch, confidence_threshold)
+                if checkpoint:
+                    self.write_checkpoint(checkpoint, batch[-1])
 
             # Progress update
             self.stdout.write(
@@ -117,6 +149,9 @@ class Command(BaseMigrationCommand):
                 f"({batch_end * 100 / self.stats['total_students']:.1f}%)"
             )
 
+        if enqueue and not dry_run:
+            self.stdout.write(self.style.SUCCESS("📨 Batches sent to background workers"))
+
         # Export low confidence records if requested
         if export_file and self.low_confidence_records:
             self.export_low_confidence_records(export_file)
@@ -145,110 +180,125 @@ class Command(BaseMigrationCommand):
             # Start from specific ID
             queryset = queryset.filter(id__gte=start_student)
 
-        # Prefetch related data for performance
-        queryset = queryset.prefetch_related(
-            Prefetch(
-                "class_header_enrollments",
-                queryset=ClassHeaderEnrollment.objects.select_related(
-                    "class_header__course", "class_header__term"
-                ).order_by("class_header__term__start_date"),
-            )
-        )
-
         return queryset
 
+    def read_checkpoint(self, checkpoint: Path) -> int:
+        """Return the last student id of the last completed batch, or -1."""
+        if not checkpoint.exists():
+            return -1
+        last_student = json.loads(checkpoint.read_text())["last_student_id"]
+        self.stdout.write(f"⏯️  Resuming after student {last_student}")
+        return last_student
+
+    def write_checkpoint(self, checkpoint: Path, last_student_id: int):
+        """Record a completed batch so an interrupted run can resume after it."""
+        checkpoint.parent.mkdir(parents=True, exist_ok=True)
+        temporary = checkpoint.with_suffix(".tmp")
+        temporary.write_text(json.dumps({"last_student_id": last_student_id}))
+        temporary.replace(checkpoint)
+
     def clear_existing_records(self):
         """Clear existing journey records."""
         count = AcademicJourney.objects.all().delete()[0]
         self.stdout.write(self.style.SUCCESS(f"🗑️  Cleared {count} existing journey records"))
 
-    @transaction.atomic
-    def process_batch(self, students, dry_run: bool, confidence_threshold: float):
-        """Process a batch of students."""
-        for student in students:
-            try:
-                # Skip if no enrollments
-                if not student.class_header_enrollments.exists():
-                    self.stats["skipped_no_enrollments"] += 1
-                    self.record_rejection(
-                        category="no_enrollments",
-                        record_id=str(student.id),
-                        reason="No class enrollments found",
-                        raw_data={"student_id": student.id},
-                    )
-                    continue
-
-                # Skip if journeys already exist (unless cleared)
-                if student.academic_journeys.exists():
-                    self.record_rejection(
-                        category="duplicate_journey",
-                        record_id=str(student.id),
-                        reason="Journey records already exist",
-                        raw_data={"student_id": student.id},
-                    )
-                    continue
-
-                # Build journey
-                if not dry_run:
-                    journeys = self.progression_builder.build_student_journey(student.id)
-                    self.stats["journeys_created"] += len(journeys)
-
-                    # Process each journey record
-                    for journey in journeys:
-                        # Categorize by confidence
-                        if journey.confidence_score >= Decimal("0.8"):
-                            self.stats["high_confidence"] += 1
-                        elif journey.confidence_score >= Decimal("0.6"):
-                            self.stats["medium_confidence"] += 1
-                        else:
-                            self.stats["low_confidence"] += 1
-
-                        # Track low confidence for export
-                        if journey.confidence_score < Decimal(str(confidence_threshold)):
-                            self.low_confidence_records.append(
-                                {
-                                    "student_id": student.id,
-                                    "student_name": student.person.full_name,
-                                    "confidence_score": float(journey.confidence_score),
-                                    "data_issues": ", ".join(journey.data_issues),
-                                    "program_type": journey.program_type,
-                                    "program": journey.program.name if journey.program else journey.program_type,
-                                    "transition_status": journey.transition_status,
-                                    "start_date": str(journey.start_date),
-                                    "stop_date": str(journey.stop_date) if journey.stop_date else "Active",
-                                }
-                            )
-
-                    # Record success for the student (once)
-                    if journeys:
-                        avg_confidence = sum(j.confidence_score for j in journeys) / len(journeys)
-                        self.record_success(
-                            "journey_created",
-                            len(journeys),
-                            {
-                                "student_id": student.id,
-                                "num_journeys": len(journeys),
-                                "avg_confidence": float(avg_confidence),
-                            },
-                        )
-                else:
-                    # Dry run - just validate
-                    enrollments = list(student.class_header_enrollments.all())
-                    self.stdout.write(f"  Would process student {student.id} with {len(enrollments)} enrollments")
+    def preview_batch(self, student_ids: list[int]):
+        """Dry run - report what a batch would process."""
+        counts = dict(
+            ClassHeaderEnrollment.objects.filter(student_id__in=student_ids)
+            .order_by()
+            .values("student_id")
+            .annotate(count=Count("id"))
+            .values_list("student_id", "count")
+        )
+        for student_id in student_ids:
+            self.stdout.write(f"  Would process student {student_id} with {counts.get(student_id, 0)} enrollments")
+
+    def process_batch(self, student_ids: list[int], confidence_threshold: float):
+        """Process a batch of students with bulk reads and writes.
+
+        If the batch fails as a whole, its students are retried one at a
+        time so a single bad record does not reject the entire batch.
+        """
+        # Skip if journeys already exist (unless cleared)
+        existing = set(AcademicJourney.objects.filter(student_id__in=student_ids).values_list("student_id", flat=True))
+        for student_id in sorted(existing):
+            self.record_rejection(
+                category="duplicate_journey",
+                record_id=str(student_id),
+                reason="Journey records already exist",
+                raw_data={"student_id": student_id},
+            )
+        pending = [student_id for student_id in student_ids if student_id not in existing]
+
+        try:
+            journeys_by_student = self.progression_builder.build_journeys_batch(pending, skip_existing=False)
+        except Exception as e:
+            self.stdout.write(self.style.WARNING(f"⚠️  Batch failed ({e}); retrying students individually"))
+            journeys_by_student = self.process_students_individually(pending)
 
+        for student_id, journeys in journeys_by_student.items():
+            self.record_journeys(student_id, journeys, confidence_threshold)
+
+    def process_students_individually(self, student_ids: list[int]) -> dict[int, list[AcademicJourney]]:
+        """Build journeys one student at a time, recording failures."""
+        journeys_by_student = {}
+        for student_id in student_ids:
+            try:
+                journeys_by_student[student_id] = self.progression_builder.build_student_journey(student_id)
             except Exception as e:
                 self.stats["errors"] += 1
-                category = self._categorize_error(e, student.id)
+                category = self._categorize_error(e, student_id)
                 self.record_rejection(
                     category=category,
-                    record_id=str(student.id),
+                    record_id=str(student_id),
                     reason=str(e),
-                    error_details=f"Error processing student {student.id}: {e}",
-                    raw_data={"student_id": student.id},
+                    error_details=f"Error processing student {student_id}: {e}",
+                    raw_data={"student_id": student_id},
+                )
+        return journeys_by_student
+
+    def record_journeys(self, student_id: int, journeys: list[AcademicJourney], confidence_threshold: float):
+        """Update statistics and the audit report for a student's new journeys."""
+        self.stats["journeys_created"] += len(journeys)
+
+        # Process each journey record
+        for journey in journeys:
+            # Categorize by confidence
+            if journey.confidence_score >= Decimal("0.8"):
+                self.stats["high_confidence"] += 1
+            elif journey.confidence_score >= Decimal("0.6"):
+                self.stats["medium_confidence"] += 1
+            else:
+                self.stats["low_confidence"] += 1
+
+            # Track low confidence for export
+            if journey.confidence_score < Decimal(str(confidence_threshold)):
+                self.low_confidence_records.append(
+                    {
+                        "student_id": student_id,
+                        "student_name": journey.student.person.full_name,
+                        "confidence_score": float(journey.confidence_score),
+                        "data_issues": ", ".join(journey.data_issues),
+                        "program_type": journey.program_type,
+                        "program": journey.program.name if journey.program else journey.program_type,
+                        "transition_status": journey.transition_status,
+                        "start_date": str(journey.start_date),
+                        "stop_date": str(journey.stop_date) if journey.stop_date else "Active",
+                    }
                 )
 
-                # Continue with next student
-                continue
+        # Record success for the student (once)
+        if journeys:
+            avg_confidence = sum(j.confidence_score for j in journeys) / len(journeys)
+            self.record_success("journey_created", len(journeys))
+            self.journey_samples.append(
+                {
+                    "student_id": student_id,
+                    "num_journeys": len(journeys),
+                    "avg_confidence": float(avg_confidence),
+                }
+            )
 
     def _categorize_error(self, error: Exception, student_id: int) -> str:
         """Categorize an error for rejection tracking."""
@@ -328,6 +378,7 @@ class Command(BaseMigrationCommand):
         self.record_success("medium_confidence_journeys", self.stats["medium_confidence"])
         self.record_success("low_confidence_journeys", self.stats["low_confidence"])
         self.record_success("students_skipped_no_enrollments", self.stats["skipped_no_enrollments"])
+        self.record_sample_data("journeys_created", self.journey_samples[:10])
 
         # Calculate percentages
         if self.stats["journeys_created"] > 0:
@@ -29,7 +29,7 @@ from typing import ClassVar
 from django.conf import settings
 from django.core.exceptions import ValidationError
 from django.core.validators import MaxValueValidator, MinValueValidator
-from django.db import models
+from django.db import models, transaction
 from django.db.models import (
     BooleanField,
     CharField,
@@ -48,6 +48,7 @@ from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
 from apps.common.models import AuditModel, UserAuditModel
+from apps.scheduling.constants import SEAT_HOLDING_ENROLLMENT_STATUSES
 
 
 class ProgramEnrollment(UserAuditModel):
@@ -889,6 +890,51 @@ class ClassHeaderEnrollment(UserAuditModel):
     def __str__(self) -> str:
         return f"{self.student} → Class #{self.class_header_id} ({self.get_status_display()})"
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_seat = instance._seat
+        return instance
+
+    @property
+    def _seat(self) -> int | None:
+        """Class header whose seat this enrollment holds, if any."""
+        if self.is_deleted or self.status not in SEAT_HOLDING_ENROLLMENT_STATUSES:
+            return None
+        return self.class_header_id
+
+    def save(self, *args, **kwargs) -> None:
+        """Save and keep ``ClassHeader.enrolled_count`` in step with seat changes.
+
+        A caller that already took the seat with ``ClassHeader.reserve_seat``
+        sets ``_seat_reserved`` so the seat is not counted twice.
+        """
+        from apps.scheduling.models import ClassHeader
+
+        previous = getattr(self, "_loaded_seat", None)
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            current = self._seat
+            if previous != current:
+                if previous is not None:
+                    ClassHeader.adjust_enrolled_count(previous, -1)
+                if current is not None and not getattr(self, "_seat_reserved", False):
+                    ClassHeader.adjust_enrolled_count(current, 1)
+        self._loaded_seat = current
+        self._seat_reserved = False
+
+    def delete(self, *args, **kwargs):
+        """Delete and release the seat this enrollment held."""
+        from apps.scheduling.models import ClassHeader
+
+        previous = getattr(self, "_loaded_seat", None)
+        with transaction.atomic():
+            result = super().delete(*args, **kwargs)
+            if previous is not None:
+                ClassHeader.adjust_enrolled_count(previous, -1)
+        self._loaded_seat = None
+        return result
+
     @property
     def is_active(self) -> bool:
         """Check if enrollment is currently active."""
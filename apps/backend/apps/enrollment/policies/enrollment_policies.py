@@ -14,6 +14,7 @@ from apps.common.policies.base import (
     PolicySeverity,
     PolicyViolation,
 )
+from apps.common.policies.memo import memoized
 from apps.enrollment.models import ClassHeaderEnrollment
 
 
@@ -58,6 +59,8 @@ class EnrollmentCapacityPolicy(Policy):
             **kwargs: Must include:
                 - class_header: ClassHeader instance to check capacity for
                 - student: StudentProfile instance (for context/logging)
+                May include:
+                - capacity_info: Capacity already computed by the caller
 
         Returns:
             PolicyResult indicating whether enrollment is allowed
@@ -69,7 +72,7 @@ class EnrollmentCapacityPolicy(Policy):
             return PolicyResult.DENY
 
         # Get current enrollment counts
-        capacity_info = self._calculate_capacity_info(class_header)
+        capacity_info = kwargs.get("capacity_info") or self._calculate_capacity_info(class_header)
 
         # Check if class has available capacity
         if capacity_info["can_enroll"]:
@@ -98,7 +101,7 @@ class EnrollmentCapacityPolicy(Policy):
             ]
 
         violations = []
-        capacity_info = self._calculate_capacity_info(class_header)
+        capacity_info = kwargs.get("capacity_info") or self._calculate_capacity_info(class_header)
 
         if not capacity_info["can_enroll"]:
             violation = PolicyViolation(
@@ -154,11 +157,14 @@ class EnrollmentCapacityPolicy(Policy):
         if not context.user:
             return False
 
-        authority_service = AuthorityService(context.user, context.effective_date)
+        def has_authority() -> bool:
+            authority_service = AuthorityService(context.user, context.effective_date)
+            return authority_service.has_authority_level(required_level=2, department=context.department)
 
         # Check if user has authority level 2 or higher (lower numbers = higher authority)
-        # Department Chair is level 2, can override capacity
-        return authority_service.has_authority_level(required_level=2, department=context.department)
+        # Department Chair is level 2, can override capacity. The answer depends on the
+        # context alone, so it is shared across classes within a policy evaluation scope.
+        return memoized(self, "override_authority", context, {}, has_authority)
 
     def get_policy_metadata(self) -> dict[str, Any]:
         """Return metadata for policy discovery and audit purposes."""
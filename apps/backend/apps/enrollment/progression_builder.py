@@ -11,9 +11,10 @@ import logging
 from collections import defaultdict
 from datetime import date
 from decimal import Decimal
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from django.db import transaction
+from django.utils import timezone
 
 from apps.curriculum.models import Major, Term
 from apps.enrollment.models import ClassHeaderEnrollment, ProgramEnrollment
@@ -24,8 +25,40 @@ from apps.enrollment.models_progression import (
 )
 from apps.people.models import StudentProfile
 
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
 logger = logging.getLogger(__name__)
 
+BULK_BATCH_SIZE = 1000
+
+# AcademicProgression fields written when rebuilding an existing summary
+PROGRESSION_SUMMARY_FIELDS = [
+    "entry_program",
+    "entry_date",
+    "entry_term",
+    "language_start_date",
+    "language_end_date",
+    "language_terms",
+    "language_final_level",
+    "language_completion_status",
+    "ba_start_date",
+    "ba_major",
+    "ba_terms",
+    "ba_completion_date",
+    "ba_completion_status",
+    "ma_start_date",
+    "ma_program",
+    "ma_terms",
+    "ma_completion_date",
+    "ma_completion_status",
+    "total_terms",
+    "time_to_ba_days",
+    "time_to_ma_days",
+    "current_status",
+    "last_updated",
+]
+
 
 class ProgressionBuilder:
     """Service for building academic progression from enrollment data."""
@@ -205,9 +238,108 @@ class ProgressionBuilder:
             logger.warning(f"No program periods detected for student {student_id}")
             return []
 
-        journeys = []
+        # Create an AcademicJourney record for each program period, then its milestones
+        journeys = self._plan_journeys(student, program_periods)
+        AcademicJourney.objects.bulk_create(journeys)
+        ProgramMilestone.objects.bulk_create(self._plan_milestones(journeys, program_periods))
+
+        # Create denormalized progression view
+        if journeys:
+            self._create_academic_progression_from_journeys(student, journeys, program_periods)
+
+        logger.info(f"Created {len(journeys)} journey records for student {student_id}")
+        return journeys
+
+    def build_journeys_batch(
+        self, student_ids: Sequence[int], skip_existing: bool = True
+    ) -> dict[int, list[AcademicJourney]]:
+        """Build academic journeys for a chunk of students at once.
+
+        Students, enrollments (with their grades) and existing progression
+        summaries are loaded with one grouped query each, program periods
+        are detected in memory, and all journey, milestone and progression
+        rows are written with bulk operations in a single transaction. A
+        chunk therefore either completes or leaves no rows behind, which
+        makes re-running it safe.
+
+        Args:
+            student_ids: StudentProfile primary keys in the chunk
+            skip_existing: Leave students that already have journeys untouched
+
+        Returns:
+            Journeys created, keyed by student id. Students without
+            enrollments or detectable program periods are omitted.
+        """
+        student_ids = list(student_ids)
+        if skip_existing:
+            existing = set(
+                AcademicJourney.objects.filter(student_id__in=student_ids).values_list("student_id", flat=True)
+            )
+            student_ids = [student_id for student_id in student_ids if student_id not in existing]
+        if not student_ids:
+            return {}
+
+        students = StudentProfile.objects.select_related("person").in_bulk(student_ids)
+        enrollments_by_student: dict[int, list[ClassHeaderEnrollment]] = defaultdict(list)
+        enrollments = (
+            ClassHeaderEnrollment.objects.filter(student_id__in=student_ids)
+            .select_related("class_header__course", "class_header__term")
+            .order_by("student_id", "class_header__term__start_date")
+        )
+        for enrollment in enrollments:
+            enrollments_by_student[enrollment.student_id].append(enrollment)
+        progressions = AcademicProgression.objects.in_bulk(student_ids)
+
+        journeys_by_student: dict[int, list[AcademicJourney]] = {}
+        periods_by_student: dict[int, list[dict[str, Any]]] = {}
+        for student_id in student_ids:
+            student = students.get(student_id)
+            if student is None or not enrollments_by_student.get(student_id):
+                continue
+            program_periods = self._detect_program_periods(enrollments_by_student[student_id])
+            if not program_periods:
+                logger.warning(f"No program periods detected for student {student_id}")
+                continue
+            journeys_by_student[student_id] = self._plan_journeys(student, program_periods)
+            periods_by_student[student_id] = program_periods
+
+        new_progressions = []
+        updated_progressions = []
+        milestones = []
+        for student_id, journeys in journeys_by_student.items():
+            periods = periods_by_student[student_id]
+            milestones.extend(self._plan_milestones(journeys, periods))
+
+            progression = progressions.get(student_id)
+            if progression is None:
+                progression = self._new_progression(students[student_id])
+                new_progressions.append(progression)
+            else:
+                progression.last_updated = timezone.now()
+                updated_progressions.append(progression)
+            self._apply_journeys_to_progression(progression, journeys, periods)
+
+        with transaction.atomic():
+            AcademicJourney.objects.bulk_create(
+                [journey for journeys in journeys_by_student.values() for journey in journeys],
+                batch_size=BULK_BATCH_SIZE,
+            )
+            ProgramMilestone.objects.bulk_create(milestones, batch_size=BULK_BATCH_SIZE)
+            AcademicProgression.objects.bulk_create(new_progressions, batch_size=BULK_BATCH_SIZE)
+            AcademicProgression.objects.bulk_update(
+                updated_progressions, PROGRESSION_SUMMARY_FIELDS, batch_size=BULK_BATCH_SIZE
+            )
+
+        logger.info(
+            "Created %d journey records for %d students",
+            sum(len(journeys) for journeys in journeys_by_student.values()),
+            len(journeys_by_student),
+        )
+        return journeys_by_student
 
-        # Create an AcademicJourney record for each program period
+    def _plan_journeys(self, student: StudentProfile, program_periods: list[dict]) -> list[AcademicJourney]:
+        """Build unsaved AcademicJourney records, one per program period."""
+        journeys = []
         for i, period in enumerate(program_periods):
             # Determine transition status
             if i == len(program_periods) - 1:
@@ -228,35 +360,34 @@ class ProgressionBuilder:
             if period["program_type"] in ["BA", "MA"]:
                 program_major = period.get("major")
 
-            # Create journey record for this program period
-            journey = AcademicJourney.objects.create(
-                student=student,
-                program_type=self._map_program_type(period["program_type"]),
-                program=program_major,
-                start_date=period["start_date"],
-                stop_date=period["end_date"] if transition_status != AcademicJourney.TransitionStatus.ACTIVE else None,
-                start_term=period["start_term"],
-                term_code=period["start_term_code"],
-                duration_in_terms=period["term_count"],
-                transition_status=transition_status,
-                data_source=AcademicJourney.DataSource.LEGACY,
-                confidence_score=Decimal(str(period.get("confidence", 0.8))),
-                requires_review=period.get("confidence", 0.8) < 0.7,
-                notes=f"Program: {period['program_name']}, Terms: {period['term_count']}",
+            journeys.append(
+                AcademicJourney(
+                    student=student,
+                    program_type=self._map_program_type(period["program_type"]),
+                    program=program_major,
+                    start_date=period["start_date"],
+                    stop_date=(
+                        period["end_date"] if transition_status != AcademicJourney.TransitionStatus.ACTIVE else None
+                    ),
+                    start_term=period["start_term"],
+                    term_code=period["start_term_code"],
+                    duration_in_terms=period["term_count"],
+                    transition_status=transition_status,
+                    data_source=AcademicJourney.DataSource.LEGACY,
+                    confidence_score=Decimal(str(period.get("confidence", 0.8))),
+                    requires_review=period.get("confidence", 0.8) < 0.7,
+                    notes=f"Program: {period['program_name']}, Terms: {period['term_count']}",
+                )
             )
-
-            journeys.append(journey)
-
-            # Create milestones for this journey
-            self._create_period_milestones(journey, period, transition_status)
-
-        # Create denormalized progression view
-        if journeys:
-            self._create_academic_progression_from_journeys(student, journeys, program_periods)
-
-        logger.info(f"Created {len(journeys)} journey records for student {student_id}")
         return journeys
 
+    def _plan_milestones(self, journeys: list[AcademicJourney], program_periods: list[dict]) -> list[ProgramMilestone]:
+        """Build unsaved milestones for journeys planned by ``_plan_journeys``."""
+        milestones = []
+        for journey, period in zip(journeys, program_periods, strict=True):
+            milestones.extend(self._plan_period_milestones(journey, period, journey.transition_status))
+        return milestones
+
     def _detect_academic_phases(self, enrollments: list[ClassHeaderEnrollment]) -> list[dict[str, Any]]:
         """Detect distinct academic phases from enrollments."""
         phases = []
@@ -572,7 +703,9 @@ class ProgressionBuilder:
         # Find best major
         best_major_id = max(major_scores.keys(), key=lambda k: major_scores[k])
         best_score = major_scores[best_major_id]
-        best_major = Major.objects.get(id=best_major_id)
+        best_major = next(
+            result["major"] for result in results if result.get("major") and result["major"].id == best_major_id
+        )
 
         # Find which strategies detected this major
         detection_methods = []
@@ -972,18 +1105,26 @@ class ProgressionBuilder:
 
     def _create_period_milestones(self, journey: AcademicJourney, period: dict, transition_status: str):
         """Create milestone records for a program period."""
+        ProgramMilestone.objects.bulk_create(self._plan_period_milestones(journey, period, transition_status))
+
+    def _plan_period_milestones(
+        self, journey: AcademicJourney, period: dict, transition_status: str
+    ) -> list[ProgramMilestone]:
+        """Build unsaved milestone records for a program period."""
         # Program start milestone
-        ProgramMilestone.objects.create(
-            journey=journey,
-            milestone_type=ProgramMilestone.MilestoneType.PROGRAM_START,
-            milestone_date=period["start_date"],
-            academic_term=period["start_term"],
-            program=period.get("major"),
-            level=period.get("language_level", ""),
-            confidence_score=Decimal(str(period.get("confidence", 0.8))),
-            is_inferred=True,
-            inference_method="enrollment_analysis",
-        )
+        milestones = [
+            ProgramMilestone(
+                journey=journey,
+                milestone_type=ProgramMilestone.MilestoneType.PROGRAM_START,
+                milestone_date=period["start_date"],
+                academic_term=period["start_term"],
+                program=period.get("major"),
+                level=period.get("language_level") or "",
+                confidence_score=Decimal(str(period.get("confidence", 0.8))),
+                is_inferred=True,
+                inference_method="enrollment_analysis",
+            )
+        ]
 
         # If graduated, add graduation milestone
         if transition_status == AcademicJourney.TransitionStatus.GRADUATED:
@@ -993,42 +1134,56 @@ class ProgressionBuilder:
                 else ProgramMilestone.MilestoneType.DEGREE_EARNED
             )
 
-            ProgramMilestone.objects.create(
-                journey=journey,
-                milestone_type=milestone_type,
-                milestone_date=period["end_date"],
-                program=period.get("major"),
-                level=period.get("language_level", ""),
-                confidence_score=Decimal(str(period.get("confidence", 0.8))),
-                is_inferred=True,
-                inference_method="credit_analysis",
+            milestones.append(
+                ProgramMilestone(
+                    journey=journey,
+                    milestone_type=milestone_type,
+                    milestone_date=period["end_date"],
+                    program=period.get("major"),
+                    level=period.get("language_level") or "",
+                    confidence_score=Decimal(str(period.get("confidence", 0.8))),
+                    is_inferred=True,
+                    inference_method="credit_analysis",
+                )
             )
 
         # If changed program, add change milestone
         elif transition_status == AcademicJourney.TransitionStatus.CHANGED_PROGRAM:
-            ProgramMilestone.objects.create(
-                journey=journey,
-                milestone_type=ProgramMilestone.MilestoneType.MAJOR_CHANGE,
-                milestone_date=period["end_date"],
-                from_program=period.get("major"),
-                confidence_score=Decimal(str(period.get("confidence", 0.8))),
-                is_inferred=True,
-                inference_method="program_detection",
+            milestones.append(
+                ProgramMilestone(
+                    journey=journey,
+                    milestone_type=ProgramMilestone.MilestoneType.MAJOR_CHANGE,
+                    milestone_date=period["end_date"],
+                    from_program=period.get("major"),
+                    confidence_score=Decimal(str(period.get("confidence", 0.8))),
+                    is_inferred=True,
+                    inference_method="program_detection",
+                )
             )
 
+        return milestones
+
     def _create_academic_progression_from_journeys(
         self, student: StudentProfile, journeys: list[AcademicJourney], periods: list[dict]
     ):
         """Create denormalized progression record from multiple journey records."""
-        # Get or create progression record
-        progression, _created = AcademicProgression.objects.get_or_create(
+        progression = AcademicProgression.objects.filter(student=student).first() or self._new_progression(student)
+        self._apply_journeys_to_progression(progression, journeys, periods)
+        progression.save()
+        return progression
+
+    def _new_progression(self, student: StudentProfile) -> AcademicProgression:
+        """Build an unsaved progression summary for a student."""
+        return AcademicProgression(
             student=student,
-            defaults={
-                "student_name": student.person.full_name if student.person else "",
-                "student_id_number": student.student_id,
-            },
+            student_name=student.person.full_name if student.person else "",
+            student_id_number=student.student_id,
         )
 
+    def _apply_journeys_to_progression(
+        self, progression: AcademicProgression, journeys: list[AcademicJourney], periods: list[dict]
+    ) -> None:
+        """Update a progression summary in memory from a student's journeys."""
         # Determine entry program from first journey
         if journeys:
             first_journey = journeys[0]
@@ -1103,6 +1258,3 @@ class ProgressionBuilder:
                 progression.current_status = "GRADUATED"
             else:
                 progression.current_status = "INACTIVE"
-
-        progression.save()
-        return progression
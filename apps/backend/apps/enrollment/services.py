@@ -17,15 +17,17 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from django.db.models import QuerySet
 
-    from apps.curriculum.models import CoursePrerequisite
     from users.models import User
 
 from dataclasses import dataclass
-from datetime import date, datetime, timedelta
+from datetime import date, timedelta
 from decimal import Decimal
 from enum import Enum
+from functools import cache
 from typing import Any, cast
 
 from django.contrib.auth import get_user_model
@@ -36,22 +38,22 @@ from django.utils import timezone
 
 from apps.academic.models import StudentDegreeProgress
 from apps.common.policies.base import PolicyContext, PolicyResult
-from apps.curriculum.models import Course, CoursePrerequisite, Division, Major, Term
+from apps.common.policies.memo import memoized
+from apps.curriculum.models import Course, Division, Major, Term
 from apps.people.models import StudentProfile
 from apps.scheduling.models import ClassHeader, ClassPart
+from apps.scheduling.time_bitmap import bitmaps_overlap
 
 from .constants import (
-    ENROLLMENT_STATUS_COMPLETED,
     ENROLLMENT_STATUS_ENROLLED,
-    GRADE_POINTS,
     HIGH_GPA_THRESHOLD,
     MAX_COURSES_PER_TERM,
     MAX_CREDITS_PER_TERM,
-    MIN_PREREQUISITE_GRADE,
     PROGRAM_STATUS_ACTIVE,
     SCHEDULE_BUFFER_MINUTES,
     SYSTEM_USER_EMAIL,
 )
+from .eligibility import PrerequisiteGraph, get_prerequisite_graph, is_passing_grade, load_completed_courses
 from .models import (
     ClassHeaderEnrollment,
     ClassPartEnrollment,
@@ -129,6 +131,24 @@ class EligibilityResult:
     current_gpa: Decimal | None = None
 
 
+@dataclass
+class StudentEligibilitySnapshot:
+    """Per-student facts that course eligibility depends on.
+
+    Loaded once with a fixed number of queries, then used to evaluate any
+    number of courses in memory.
+    """
+
+    graph: PrerequisiteGraph
+    completed: dict[int, str]
+    completed_mask: int
+    previous_completions: dict[int, dict[str, Any]]
+    program: Major | None
+    major_course_ids: frozenset[int]
+    has_bachelors: bool
+    current_gpa: Decimal | None
+
+
 class EnrollmentService:
     """Core service for student enrollment operations."""
 
@@ -159,8 +179,8 @@ class EnrollmentService:
 
         try:
             with transaction.atomic():
-                # Lock class header to prevent concurrent enrollment race conditions
-                locked_class_header = ClassHeader.objects.select_for_update().get(id=class_header.id)  # type: ignore[attr-defined]
+                # No class header lock: seats are taken with a conditional update below
+                locked_class_header = ClassHeader.objects.select_related("term", "course").get(id=class_header.id)  # type: ignore[attr-defined]
 
                 # Lock student to prevent duplicate enrollments
                 locked_student = StudentProfile.objects.select_for_update().get(id=student.id)  # type: ignore[attr-defined]
@@ -262,8 +282,17 @@ class EnrollmentService:
                             details={"capacity_info": capacity_check},
                         )
 
-                # 8. Create enrollment record (always ENROLLED if we reach this point)
-                enrollment = ClassHeaderEnrollment.objects.create(
+                # 8. Take the seat; this fails if concurrent enrollments filled the class
+                seat_reserved = capacity_check["available_spots"] > 0 and locked_class_header.reserve_seat()
+                if not seat_reserved and not override_capacity and not capacity_check.get("override_required"):
+                    return EnrollmentResult(
+                        status=EnrollmentStatus.CAPACITY_FULL,
+                        message="Class is at capacity. No spots available.",
+                        details={"capacity_info": capacity_check},
+                    )
+
+                # 9. Create enrollment record (always ENROLLED if we reach this point)
+                enrollment = ClassHeaderEnrollment(
                     student=student,
                     class_header=locked_class_header,
                     enrollment_date=timezone.now().date(),
@@ -271,9 +300,8 @@ class EnrollmentService:
                     enrolled_by=enrolled_by,
                     notes=notes,
                 )
-
-                # 9. Update course eligibility cache
-                PrerequisiteService.update_student_eligibility_cache(student)
+                enrollment._seat_reserved = seat_reserved
+                enrollment.save(force_insert=True)
 
                 return EnrollmentResult(
                     status=EnrollmentStatus.SUCCESS,
@@ -399,8 +427,8 @@ class EnrollmentService:
         """
         try:
             with transaction.atomic():
-                # Lock class header to prevent concurrent enrollment race conditions
-                locked_class_header = ClassHeader.objects.select_for_update().get(id=class_header.id)  # type: ignore[attr-defined]
+                # No class header lock: seats are taken with a conditional update below
+                locked_class_header = ClassHeader.objects.select_related("term", "course").get(id=class_header.id)  # type: ignore[attr-defined]
 
                 # Lock student to prevent duplicate enrollments
                 locked_student = StudentProfile.objects.select_for_update().get(id=student.id)  # type: ignore[attr-defined]
@@ -467,7 +495,7 @@ class EnrollmentService:
                     )
 
                 # 7. Check capacity with simplified logic (no waitlist)
-                capacity_check = CapacityService.check_enrollment_capacity(
+                capacity_check = CapacityService.check_enrollment_capacity_atomic(
                     class_header=locked_class_header,
                     user=enrolled_by,
                     student=student,
@@ -498,12 +526,21 @@ class EnrollmentService:
                     # Document repeat override when enrollment succeeds
                     notes = f"{notes}\nREPEAT OVERRIDE: {override_reason}".strip()
 
-                # 8. Create enrollment record with override information (always ENROLLED if we reach this point)
+                # 8. Take the seat; this fails if concurrent enrollments filled the class
+                seat_reserved = capacity_check["available_spots"] > 0 and locked_class_header.reserve_seat()
+                if not seat_reserved and not override_capacity and not capacity_check.get("override_required"):
+                    return EnrollmentResult(
+                        status=EnrollmentStatus.CAPACITY_FULL,
+                        message="Class is at capacity. No spots available.",
+                        details={"capacity_info": capacity_check},
+                    )
+
+                # 9. Create enrollment record with override information (always ENROLLED if we reach this point)
                 override_notes = f"REPEAT OVERRIDE: {override_reason}"
                 if notes:
                     override_notes += f"\nAdditional notes: {notes}"
 
-                enrollment = ClassHeaderEnrollment.objects.create(
+                enrollment = ClassHeaderEnrollment(
                     student=student,
                     class_header=locked_class_header,
                     enrollment_date=timezone.now().date(),
@@ -514,9 +551,8 @@ class EnrollmentService:
                     override_type="REPEAT_PREVENTION_RULE",
                     override_reason=override_reason,
                 )
-
-                # 9. Update course eligibility cache
-                PrerequisiteService.update_student_eligibility_cache(student)
+                enrollment._seat_reserved = seat_reserved
+                enrollment.save(force_insert=True)
 
                 return EnrollmentResult(
                     status=EnrollmentStatus.SUCCESS,
@@ -537,7 +573,12 @@ class EnrollmentService:
 
 
 class CapacityService:
-    """Service for managing class capacity."""
+    """Service for managing class capacity.
+
+    Capacity is read from the ``ClassHeader.enrolled_count`` seat counter
+    rather than counted, and seats are taken with a conditional update via
+    ``ClassHeader.reserve_seat``.
+    """
 
     @staticmethod
     def check_enrollment_capacity_atomic(
@@ -546,13 +587,14 @@ class CapacityService:
         student: StudentProfile | None = None,
         department: Any | None = None,
     ) -> dict[str, Any]:
-        """Check enrollment capacity with proper atomic locking for race condition prevention.
+        """Check enrollment capacity against the current seat counter.
 
-        This method should only be called within a transaction with locked objects
-        to ensure consistency during concurrent enrollment operations.
+        Re-reads the counter by primary key so the result reflects seats
+        taken by concurrent transactions. The seat itself must still be
+        taken with ``ClassHeader.reserve_seat``, which cannot oversell.
 
         Args:
-            class_header: LOCKED ClassHeader instance (must be locked with select_for_update)
+            class_header: ClassHeader instance to check
             user: User context for policy evaluation (optional)
             student: Student context for policy evaluation (optional)
             department: Department context for override authority (optional)
@@ -560,72 +602,12 @@ class CapacityService:
         Returns:
             Dictionary with capacity information and policy results
         """
-        # Count current enrollments using the locked class_header
-        # This query will respect the transaction locks
-        enrolled_count = ClassHeaderEnrollment.objects.filter(
-            class_header=class_header,
-            status__in=["ENROLLED", "ACTIVE"],
-        ).count()
-
-        max_enrollment = class_header.max_enrollment or 0
-        available_spots = max(0, max_enrollment - enrolled_count)
-
-        # Base capacity information
-        capacity_info: dict[str, Any] = {
-            "can_enroll": available_spots > 0,
-            "enrolled_count": enrolled_count,
-            "max_enrollment": max_enrollment,
-            "available_spots": available_spots,
-            "is_full": enrolled_count >= max_enrollment,
-        }
-
-        # Enhanced policy evaluation when user context is provided
-        if user is not None:
-            try:
-                from apps.enrollment.policies.enrollment_policies import (
-                    EnrollmentCapacityPolicy,
-                )
-
-                # Create policy context
-                context = PolicyContext(
-                    user=user,
-                    department=department or getattr(class_header.course, "department", None),
-                    effective_date=date.today(),
-                )
-
-                # Evaluate policy
-                policy = EnrollmentCapacityPolicy()
-                policy_result = policy.evaluate(context, class_header=class_header, student=student)
-
-                # Get detailed violations if any
-                violations = policy.get_violations(context, class_header=class_header, student=student)
-
-                # Add policy information to capacity info
-                capacity_info.update(
-                    {
-                        "policy_result": policy_result,
-                        "policy_allows_enrollment": policy_result == PolicyResult.ALLOW,
-                        "policy_requires_override": policy_result == PolicyResult.REQUIRE_OVERRIDE,
-                        "policy_violations": violations,
-                        "can_override": policy_result == PolicyResult.REQUIRE_OVERRIDE,
-                    },
-                )
-
-                # Override can_enroll based on policy when policy context is available
-                if policy_result == PolicyResult.ALLOW:
-                    capacity_info["can_enroll"] = True
-                elif policy_result == PolicyResult.REQUIRE_OVERRIDE:
-                    # Allow enrollment but flag that override is required
-                    capacity_info["can_enroll"] = True
-                    capacity_info["override_required"] = True
-                else:  # PolicyResult.DENY
-                    capacity_info["can_enroll"] = False
-
-            except ImportError:
-                # Policy not available, fall back to legacy logic
-                pass
-
-        return capacity_info
+        counter = (
+            ClassHeader.objects.filter(pk=class_header.pk).values_list("enrolled_count", "max_enrollment").first()
+        )
+        if counter is not None:
+            class_header.enrolled_count, class_header.max_enrollment = counter
+        return CapacityService.check_enrollment_capacity(class_header, user, student, department)
 
     @staticmethod
     def check_enrollment_capacity(
@@ -645,12 +627,7 @@ class CapacityService:
         Returns:
             Dictionary with capacity information and policy results
         """
-        # Count current enrollments
-        enrolled_count = ClassHeaderEnrollment.objects.filter(
-            class_header=class_header,
-            status__in=["ENROLLED", "ACTIVE"],
-        ).count()
-
+        enrolled_count = class_header.enrolled_count
         max_enrollment = class_header.max_enrollment or 0
         available_spots = max(0, max_enrollment - enrolled_count)
 
@@ -665,24 +642,31 @@ class CapacityService:
 
         # Enhanced policy evaluation when user context is provided
         if user is not None:
-            try:
-                from apps.enrollment.policies.enrollment_policies import (
-                    EnrollmentCapacityPolicy,
-                )
-
+            policy = _capacity_policy()
+            if policy is not None:
                 # Create policy context
                 context = PolicyContext(
                     user=user,
                     department=department or getattr(class_header.course, "department", None),
                     effective_date=date.today(),
                 )
+                base_info = dict(capacity_info)
+
+                policy_kwargs = {"class_header": class_header, "student": student, "capacity_info": base_info}
 
-                # Evaluate policy
-                policy = EnrollmentCapacityPolicy()
-                policy_result = policy.evaluate(context, class_header=class_header, student=student)
+                # Evaluate policy against the counter-based capacity
+                policy_result = memoized(
+                    policy, "evaluate", context, policy_kwargs, lambda: policy.evaluate(context, **policy_kwargs)
+                )
 
                 # Get detailed violations if any
-                violations = policy.get_violations(context, class_header=class_header, student=student)
+                violations = memoized(
+                    policy,
+                    "violations",
+                    context,
+                    policy_kwargs,
+                    lambda: policy.get_violations(context, **policy_kwargs),
+                )
 
                 # Add policy information to capacity info
                 capacity_info.update(
@@ -705,13 +689,20 @@ class CapacityService:
                 else:  # PolicyResult.DENY
                     capacity_info["can_enroll"] = False
 
-            except ImportError:
-                # Policy not available, fall back to legacy logic
-                pass
-
         return capacity_info
 
 
+@cache
+def _capacity_policy():
+    """Return the shared, stateless capacity policy, or None if unavailable."""
+    try:
+        from apps.enrollment.policies.enrollment_policies import EnrollmentCapacityPolicy
+    except ImportError:
+        # Policy not available, fall back to legacy logic
+        return None
+    return EnrollmentCapacityPolicy()
+
+
 class PrerequisiteService:
     """Service for managing course prerequisites and academic eligibility."""
 
@@ -720,6 +711,7 @@ class PrerequisiteService:
         student: StudentProfile,
         course: Course,
         term: Term,
+        snapshot: StudentEligibilitySnapshot | None = None,
     ) -> EligibilityResult:
         """Check if student is eligible to enroll in a course.
 
@@ -727,14 +719,11 @@ class PrerequisiteService:
             student: Student to check
             course: Course to check eligibility for
             term: Term for enrollment
+            snapshot: Preloaded student facts; loaded when not given
 
         Returns:
             EligibilityResult with eligibility details
         """
-        requirements_met = []
-        requirements_missing = []
-        warnings: list[str] = []
-
         # Check if eligibility is cached
         cached_eligibility = StudentCourseEligibility.objects.filter(
             student=student,
@@ -767,12 +756,88 @@ class PrerequisiteService:
                 )
 
         # Calculate fresh eligibility
+        if snapshot is None:
+            snapshot = PrerequisiteService.load_eligibility_snapshot(student)
+        result = PrerequisiteService._evaluate_eligibility(student, course, snapshot)
+
+        _eligibility_obj, _created = StudentCourseEligibility.objects.update_or_create(
+            student=student,
+            course=course,
+            term=term,
+            defaults={
+                "is_eligible": result.eligible,
+                "calculation_notes": PrerequisiteService._calculation_notes(result),
+                "last_calculated": timezone.now(),
+            },
+        )
+
+        return result
+
+    @staticmethod
+    def load_eligibility_snapshot(
+        student: StudentProfile,
+        graph: PrerequisiteGraph | None = None,
+    ) -> StudentEligibilitySnapshot:
+        """Load every per-student fact eligibility depends on, independent of course.
+
+        Args:
+            student: Student to load
+            graph: Compiled prerequisite graph; the cached graph when not given
+
+        Returns:
+            StudentEligibilitySnapshot for evaluating any number of courses
+        """
+        from apps.academic.models import CanonicalRequirement
+
+        graph = graph or get_prerequisite_graph()
+        completed = load_completed_courses([student.pk]).get(student.pk, {})
+
+        current_program: ProgramEnrollment | None = (
+            ProgramEnrollment.objects.filter(student=student, status=PROGRAM_STATUS_ACTIVE)
+            .select_related("program")
+            .order_by("-start_date", "-created_at")
+            .first()
+        )
+        program = cast("Major", current_program.program) if current_program else None
+        major_course_ids: frozenset[int] = frozenset()
+        if program is not None:
+            major_course_ids = frozenset(
+                CanonicalRequirement.objects.filter(major=program, is_active=True).values_list(
+                    "required_course_id",
+                    flat=True,
+                ),
+            )
+
+        return StudentEligibilitySnapshot(
+            graph=graph,
+            completed=completed,
+            completed_mask=graph.mask(completed),
+            previous_completions=PrerequisiteService._load_previous_completions(student),
+            program=program,
+            major_course_ids=major_course_ids,
+            has_bachelors=ProgramEnrollment.objects.filter(
+                student=student,
+                program__degree_type="BACHELORS",
+                status="GRADUATED",
+            ).exists(),
+            current_gpa=PrerequisiteService._calculate_student_gpa(student),
+        )
+
+    @staticmethod
+    def _evaluate_eligibility(
+        student: StudentProfile,
+        course: Course,
+        snapshot: StudentEligibilitySnapshot,
+    ) -> EligibilityResult:
+        """Evaluate eligibility for one course from preloaded student facts."""
+        requirements_met = []
+        requirements_missing = []
+        warnings: list[str] = []
         eligible = True
         gpa_requirement = None
-        current_gpa = None
 
-        # 1. Check course prerequisites using CoursePrerequisite model
-        prerequisite_check = PrerequisiteService._check_prerequisites(student, course)
+        # 1. Check course prerequisites against the compiled prerequisite graph
+        prerequisite_check = PrerequisiteService._check_prerequisites(student, course, snapshot)
         if prerequisite_check["all_met"]:
             requirements_met.extend(prerequisite_check["met_requirements"])
         else:
@@ -785,13 +850,7 @@ class PrerequisiteService:
         # 2. Check academic level requirements
         if course.cycle == "MA" and student.current_status == "ACTIVE":
             # Check if student has bachelor's degree
-            ba_program = ProgramEnrollment.objects.filter(
-                student=student,
-                program__degree_type="BACHELORS",
-                status="GRADUATED",
-            ).exists()
-
-            if ba_program:
+            if snapshot.has_bachelors:
                 requirements_met.append("Bachelor's degree requirement met")
             else:
                 requirements_missing.append(
@@ -802,15 +861,15 @@ class PrerequisiteService:
         # 3. Check GPA requirements (if any)
         # Note: Course model doesn't have minimum_grade field currently
         # This functionality could be added in the future if needed
-        current_gpa = PrerequisiteService._calculate_student_gpa(student)
+        current_gpa = snapshot.current_gpa
         if current_gpa is not None:
             requirements_met.append(f"Current GPA: {current_gpa:.2f}")
         else:
             requirements_met.append("No GPA calculated yet")
 
         # 4. Check for previous course completion (repeat prevention)
-        previous_completion = PrerequisiteService._check_previous_course_completion(student, course)
-        if previous_completion["has_passed"]:
+        previous_completion = snapshot.previous_completions.get(course.id)
+        if previous_completion:
             requirements_missing.append(
                 f"Student already completed {course.code} with grade "
                 f"{previous_completion['grade']} on {previous_completion['completion_date']}. "
@@ -821,7 +880,7 @@ class PrerequisiteService:
             requirements_met.append("No previous completion found - eligible to enroll")
 
         # 5. Check major requirements (students can only take courses in their major)
-        major_check = PrerequisiteService._check_major_requirements(student, course)
+        major_check = PrerequisiteService._check_major_requirements(student, course, snapshot)
         if major_check["eligible"]:
             requirements_met.append(major_check["message"])
         else:
@@ -849,26 +908,6 @@ class PrerequisiteService:
         else:
             requirements_met.append("No enrollment limits specified")
 
-        # Cache the result with calculation notes
-        calculation_notes = []
-        if requirements_met:
-            calculation_notes.append(f"Requirements met: {'; '.join(requirements_met)}")
-        if requirements_missing:
-            calculation_notes.append(f"Requirements missing: {'; '.join(requirements_missing)}")
-        if warnings:
-            calculation_notes.append(f"Warnings: {'; '.join(warnings)}")
-
-        _eligibility_obj, _created = StudentCourseEligibility.objects.update_or_create(
-            student=student,
-            course=course,
-            term=term,
-            defaults={
-                "is_eligible": eligible,
-                "calculation_notes": "\n".join(calculation_notes),
-                "last_calculated": timezone.now(),
-            },
-        )
-
         return EligibilityResult(
             eligible=eligible,
             requirements_met=requirements_met,
@@ -878,6 +917,18 @@ class PrerequisiteService:
             current_gpa=current_gpa,
         )
 
+    @staticmethod
+    def _calculation_notes(result: EligibilityResult) -> str:
+        """Serialize an eligibility result for the eligibility cache."""
+        calculation_notes = []
+        if result.requirements_met:
+            calculation_notes.append(f"Requirements met: {'; '.join(result.requirements_met)}")
+        if result.requirements_missing:
+            calculation_notes.append(f"Requirements missing: {'; '.join(result.requirements_missing)}")
+        if result.warnings:
+            calculation_notes.append(f"Warnings: {'; '.join(result.warnings)}")
+        return "\n".join(calculation_notes)
+
     @staticmethod
     def _check_previous_course_completion(student: StudentProfile, course: Course) -> dict[str, Any]:
         """Check if student has previously completed this course with a passing grade.
@@ -896,68 +947,83 @@ class PrerequisiteService:
             - completion_date: date - Date course was completed (if any)
             - enrollment_id: int - ID of the completion enrollment (if any)
         """
-        # Define passing grades (D and above - per user clarification)
-        # Note: No "D-" grade exists, just "D" which is passing
-        passing_grades = ["D", "D+", "C-", "C", "C+", "B-", "B", "B+", "A-", "A", "A+"]
+        completion = PrerequisiteService._load_previous_completions(student, [course.id]).get(course.id)
+        if completion:
+            return completion
 
-        # Check for completed enrollments with passing grades
-        completed_enrollment = (
-            ClassHeaderEnrollment.objects.filter(
-                student=student,
-                class_header__course=course,
-                status__in=["COMPLETED", "PASSED"],
-                final_grade__in=passing_grades,
-            )
-            .select_related("class_header")
-            .first()
-        )
+        return {
+            "has_passed": False,
+            "grade": None,
+            "completion_date": None,
+            "enrollment_id": None,
+        }
 
-        if completed_enrollment:
-            return {
-                "has_passed": True,
-                "grade": completed_enrollment.final_grade,
-                "completion_date": completed_enrollment.completion_date or completed_enrollment.enrollment_date,
-                "enrollment_id": completed_enrollment.id,
-                "class_header": str(completed_enrollment.class_header),
-            }
+    @staticmethod
+    def _load_previous_completions(
+        student: StudentProfile,
+        course_ids: Iterable[int] | None = None,
+    ) -> dict[int, dict[str, Any]]:
+        """Load passing completions per course for repeat prevention.
 
-        # Also check StudentDegreeProgress for transfer credits or other fulfillment methods
-        # Look for any fulfillment where the canonical requirement's course matches this course
+        Completed enrollments with a passing grade take precedence over
+        transfer or exam credit recorded in StudentDegreeProgress.
 
-        from apps.academic.models import CanonicalRequirement
+        Args:
+            student: Student to check
+            course_ids: Restrict to these courses; all courses when not given
 
-        # Find canonical requirements for this course
-        canonical_reqs = CanonicalRequirement.objects.filter(required_course=course, is_active=True).values_list(
-            "id",
-            flat=True,
-        )
+        Returns:
+            Completion details (see ``_check_previous_course_completion``) keyed by course id
+        """
+        # Define passing grades (D and above - per user clarification)
+        # Note: No "D-" grade exists, just "D" which is passing
+        passing_grades = ["D", "D+", "C-", "C", "C+", "B-", "B", "B+", "A-", "A", "A+"]
 
-        # Check if student has fulfilled any of these requirements through non-enrollment means
-        fulfillment = StudentDegreeProgress.objects.filter(
+        completed_enrollments = ClassHeaderEnrollment.objects.filter(
             student=student,
-            canonical_requirement_id__in=canonical_reqs,
+            status__in=["COMPLETED", "PASSED"],
+            final_grade__in=passing_grades,
+        ).select_related("class_header__course", "class_header__term")
+        fulfillments = StudentDegreeProgress.objects.filter(
+            student=student,
+            canonical_requirement__is_active=True,
             is_active=True,
             fulfillment_method__in=[
                 StudentDegreeProgress.FulfillmentMethod.TRANSFER_CREDIT,
                 StudentDegreeProgress.FulfillmentMethod.EXAM_CREDIT,
             ],
-        ).first()
-
-        if fulfillment:
-            return {
+        ).annotate(course_id=F("canonical_requirement__required_course_id"))
+        if course_ids is not None:
+            course_ids = list(course_ids)
+            completed_enrollments = completed_enrollments.filter(class_header__course_id__in=course_ids)
+            fulfillments = fulfillments.filter(canonical_requirement__required_course_id__in=course_ids)
+
+        completions: dict[int, dict[str, Any]] = {}
+        for fulfillment in fulfillments:
+            completions.setdefault(
+                fulfillment.course_id,
+                {
+                    "has_passed": True,
+                    "grade": fulfillment.grade or "TRANSFER/CREDIT",
+                    "completion_date": fulfillment.fulfillment_date,
+                    "enrollment_id": None,
+                    "fulfillment_source": fulfillment.fulfillment_method,
+                },
+            )
+        seen_courses: set[int] = set()
+        for enrollment in completed_enrollments:
+            course_id = enrollment.class_header.course_id
+            if course_id in seen_courses:
+                continue
+            seen_courses.add(course_id)
+            completions[course_id] = {
                 "has_passed": True,
-                "grade": fulfillment.grade or "TRANSFER/CREDIT",
-                "completion_date": fulfillment.fulfillment_date,
-                "enrollment_id": None,
-                "fulfillment_source": fulfillment.fulfillment_method,
+                "grade": enrollment.final_grade,
+                "completion_date": enrollment.completion_date or enrollment.enrollment_date,
+                "enrollment_id": enrollment.id,
+                "class_header": str(enrollment.class_header),
             }
-
-        return {
-            "has_passed": False,
-            "grade": None,
-            "completion_date": None,
-            "enrollment_id": None,
-        }
+        return completions
 
     @staticmethod
     def _check_course_eligibility_without_repeat_check(
@@ -1032,32 +1098,82 @@ class PrerequisiteService:
         )
 
     @staticmethod
-    def update_student_eligibility_cache(student: StudentProfile):
-        """Update all cached eligibility for a student."""
-        # Get active terms
-        active_terms = Term.objects.filter(is_active=True)
+    def update_student_eligibility_cache(
+        student: StudentProfile,
+        course_ids: Iterable[int] | None = None,
+    ) -> int:
+        """Recompute cached eligibility for a student in one pass.
 
-        # Update eligibility for all courses in active terms
-        for term in active_terms:
-            courses = Course.objects.filter(is_active=True)
-            for course in courses:
-                PrerequisiteService.check_course_eligibility(student, course, term)
+        Student facts are loaded once and every course is evaluated in
+        memory; the results are written for all active terms with a single
+        upsert. Pass ``course_ids`` to refresh only the courses affected by
+        a change (see ``PrerequisiteGraph.affected_by``).
+
+        Args:
+            student: Student to refresh
+            course_ids: Restrict the refresh to these courses
+
+        Returns:
+            Number of eligibility rows written
+        """
+        active_terms = list(Term.objects.filter(is_active=True))
+        courses = Course.objects.filter(is_active=True)
+        if course_ids is not None:
+            courses = courses.filter(id__in=list(course_ids))
+        if not active_terms:
+            return 0
+
+        snapshot = PrerequisiteService.load_eligibility_snapshot(student)
+        now = timezone.now()
+        rows = []
+        for course in courses:
+            result = PrerequisiteService._evaluate_eligibility(student, course, snapshot)
+            notes = PrerequisiteService._calculation_notes(result)
+            rows.extend(
+                StudentCourseEligibility(
+                    student=student,
+                    course=course,
+                    term=term,
+                    is_eligible=result.eligible,
+                    calculation_notes=notes,
+                    last_calculated=now,
+                )
+                for term in active_terms
+            )
+
+        StudentCourseEligibility.objects.bulk_create(
+            rows,
+            batch_size=1000,
+            update_conflicts=True,
+            unique_fields=["student", "course", "term"],
+            update_fields=["is_eligible", "calculation_notes", "last_calculated"],
+        )
+        return len(rows)
 
     @staticmethod
-    def _check_prerequisites(student: StudentProfile, course: Course) -> dict[str, Any]:
+    def _check_prerequisites(
+        student: StudentProfile,
+        course: Course,
+        snapshot: StudentEligibilitySnapshot | None = None,
+    ) -> dict[str, Any]:
         """Check if student has met all prerequisites for a course.
 
         Args:
             student: Student to check
             course: Course to check prerequisites for
+            snapshot: Preloaded student facts; completed courses are loaded when not given
 
         Returns:
             Dictionary with prerequisite check results
         """
+        if snapshot is not None:
+            graph, completed = snapshot.graph, snapshot.completed
+        else:
+            graph = get_prerequisite_graph()
+            completed = load_completed_courses([student.pk]).get(student.pk, {})
 
-        prerequisites = CoursePrerequisite.objects.filter(course=course).select_related("prerequisite")
-
-        if not prerequisites.exists():
+        prerequisite_ids = graph.prerequisites_of(course.id)
+        if not prerequisite_ids:
             return {
                 "all_met": True,
                 "met_requirements": ["No prerequisites required"],
@@ -1067,30 +1183,13 @@ class PrerequisiteService:
         met_requirements: list[str] = []
         missing_requirements: list[str] = []
 
-        for prereq in prerequisites:
-            # Check if student has completed the prerequisite course with D+ or better
-            completed_enrollments = ClassHeaderEnrollment.objects.filter(
-                student=student,
-                class_header__course=cast("Course", prereq.prerequisite),
-                status__in=[ENROLLMENT_STATUS_COMPLETED],
-            ).exclude(final_grade__isnull=True)
-
-            # Check if any enrollment has passing grade (D+ or better)
-            has_passed = False
-            best_grade = None
-            for enrollment in completed_enrollments:
-                if enrollment.final_grade and PrerequisiteService._is_passing_grade(enrollment.final_grade):
-                    has_passed = True
-                    best_grade = enrollment.final_grade
-                    break
-
-            if has_passed:
-                met_requirements.append(
-                    f"Prerequisite {cast('Course', prereq.prerequisite).code} completed with grade {best_grade}"
-                )
+        for prerequisite_id in prerequisite_ids:
+            code = graph.codes[prerequisite_id]
+            if prerequisite_id in completed:
+                met_requirements.append(f"Prerequisite {code} completed with grade {completed[prerequisite_id]}")
             else:
                 missing_requirements.append(
-                    f"Prerequisite {cast('Course', prereq.prerequisite).code} not completed with passing grade",
+                    f"Prerequisite {code} not completed with passing grade",
                 )
 
         return {
@@ -1100,43 +1199,33 @@ class PrerequisiteService:
         }
 
     @staticmethod
-    def _check_major_requirements(student: StudentProfile, course: Course) -> dict[str, Any]:
+    def _check_major_requirements(
+        student: StudentProfile,
+        course: Course,
+        snapshot: StudentEligibilitySnapshot | None = None,
+    ) -> dict[str, Any]:
         """Check if student can take this course based on their current major.
 
         Args:
             student: Student to check
             course: Course to check
+            snapshot: Preloaded student facts; loaded when not given
 
         Returns:
             Dictionary with major requirement check results
         """
+        if snapshot is None:
+            snapshot = PrerequisiteService.load_eligibility_snapshot(student)
 
-        # Get student's most recent active program enrollment
-        current_program: ProgramEnrollment | None = (
-            ProgramEnrollment.objects.filter(student=student, status=PROGRAM_STATUS_ACTIVE)
-            .order_by("-start_date", "-created_at")
-            .first()
-        )
-
-        if not current_program:
+        program = snapshot.program
+        if program is None:
             return {
                 "eligible": False,
                 "message": "Student is not enrolled in any active program",
             }
 
-        # Check if course belongs to student's major
-        # This assumes courses are linked to majors through requirements or similar
-        # We'll check if the course is available in the student's major requirements
-        from apps.academic.models import CanonicalRequirement
-
-        program = cast("Major", current_program.program)
-
-        major_courses = CanonicalRequirement.objects.filter(major=program, is_active=True).values_list(
-            "required_course_id",
-            flat=True,
-        )
-
-        if course.id in major_courses:  # type: ignore[attr-defined]
+        # Check if course belongs to student's major through its canonical requirements
+        if course.id in snapshot.major_course_ids:  # type: ignore[attr-defined]
             return {
                 "eligible": True,
                 "message": f"Course is available for {program.name} major",
@@ -1212,15 +1301,7 @@ class PrerequisiteService:
         Returns:
             Boolean indicating if grade is passing
         """
-        if not grade:
-            return False
-
-        grade = grade.strip().upper()
-
-        if grade in GRADE_POINTS:
-            return GRADE_POINTS[grade] >= MIN_PREREQUISITE_GRADE
-
-        return False
+        return is_passing_grade(grade)
 
 
 class ScheduleService:
@@ -1240,43 +1321,127 @@ class ScheduleService:
         Returns:
             List of conflicts found
         """
-        conflicts = []
+        return ScheduleService.check_bulk_schedule_conflicts(student, [new_class])[new_class.pk]
 
-        # Get student's current enrollments in the same term
-        current_enrollments = ClassHeaderEnrollment.objects.filter(
-            student=student,
-            class_header__term=new_class.term,
-            status__in=["ENROLLED", "ACTIVE"],
-        ).select_related("class_header")
+    @staticmethod
+    def check_bulk_schedule_conflicts(
+        student: StudentProfile,
+        candidate_classes: Iterable[ClassHeader],
+    ) -> dict[int, list[dict[str, Any]]]:
+        """Check many candidate classes against a student's schedule at once.
 
-        # Get class parts for the new class
-        new_class_parts = ClassPart.objects.filter(class_session__class_header=new_class)
+        Loads the parts of the student's current enrollments and of all
+        candidates in two queries. Each candidate is first tested with a
+        single AND against the union of the student's busy slots; only
+        candidates that hit are compared part by part to report details.
 
-        for enrollment in current_enrollments:
-            existing_parts = ClassPart.objects.filter(
-                class_session__class_header=cast("ClassHeader", enrollment.class_header),
-            )
+        Args:
+            student: Student to check
+            candidate_classes: Classes the student wants to register for
 
-            # Check for time conflicts between class parts
-            for new_part in new_class_parts:
-                for existing_part in existing_parts:
-                    if ScheduleService._parts_conflict(new_part, existing_part):
+        Returns:
+            Conflicts found, keyed by candidate class header id
+        """
+        candidates = list(candidate_classes)
+        conflicts = ScheduleService.check_cohort_schedule_conflicts((student, candidate) for candidate in candidates)
+        return {candidate.pk: conflicts[(student.pk, candidate.pk)] for candidate in candidates}
+
+    @staticmethod
+    def check_cohort_schedule_conflicts(
+        requests: Iterable[tuple[StudentProfile, ClassHeader]],
+    ) -> dict[tuple[int, int], list[dict[str, Any]]]:
+        """Check many (student, candidate class) requests against current schedules.
+
+        The current enrollments of every student involved, and the parts of
+        all enrolled and candidate classes, are loaded in three queries
+        regardless of how many requests there are. Parts of a class shared
+        by a cohort are loaded once. Each request is first tested with a
+        single AND of the candidate's slots against the union of the
+        student's busy slots; only requests that hit are compared part by
+        part to report details.
+
+        Args:
+            requests: ``(student, candidate_class)`` pairs
+
+        Returns:
+            Conflicts found, keyed by ``(student id, class header id)``
+        """
+        pairs = list(requests)
+        results: dict[tuple[int, int], list[dict[str, Any]]] = {
+            (student.pk, candidate.pk): [] for student, candidate in pairs
+        }
+        if not pairs:
+            return results
+
+        student_ids = {student.pk for student, _candidate in pairs}
+        term_ids = {candidate.term_id for _student, candidate in pairs}
+        enrolled_headers: dict[int, set[int]] = {}
+        for student_id, header_id in ClassHeaderEnrollment.objects.filter(
+            student_id__in=student_ids,
+            status__in=["ENROLLED", "ACTIVE"],
+            class_header__term_id__in=term_ids,
+        ).values_list("student_id", "class_header_id"):
+            enrolled_headers.setdefault(student_id, set()).add(header_id)
+
+        existing_header_ids = set().union(*enrolled_headers.values())
+        parts_by_header: dict[int, list[tuple[ClassPart, int]]] = {}
+        for part in ClassPart.objects.filter(class_session__class_header_id__in=existing_header_ids).select_related(
+            "class_session__class_header__course", "class_session__class_header__term"
+        ):
+            parts_by_header.setdefault(part.class_session.class_header_id, []).append((part, part.weekly_bitmap))
+
+        # Busy parts and slot union per (student, term)
+        busy: dict[tuple[int, int], list[tuple[ClassPart, int]]] = {}
+        busy_mask: dict[tuple[int, int], int] = {}
+        for student_id, header_ids in enrolled_headers.items():
+            for header_id in header_ids:
+                for part, bitmap in parts_by_header.get(header_id, []):
+                    key = (student_id, part.class_session.class_header.term_id)
+                    busy.setdefault(key, []).append((part, bitmap))
+                    busy_mask[key] = busy_mask.get(key, 0) | bitmap
+
+        candidate_parts: dict[int, list[tuple[ClassPart, int]]] = {}
+        candidate_masks: dict[int, int] = {}
+        for part in ClassPart.objects.filter(
+            class_session__class_header_id__in={candidate.pk for _student, candidate in pairs}
+        ).select_related("class_session__class_header__course", "class_session__class_header__term"):
+            header_id = part.class_session.class_header_id
+            bitmap = part.weekly_bitmap
+            candidate_parts.setdefault(header_id, []).append((part, bitmap))
+            candidate_masks[header_id] = candidate_masks.get(header_id, 0) | bitmap
+
+        for student, candidate in pairs:
+            key = (student.pk, candidate.term_id)
+            if not bitmaps_overlap(
+                candidate_masks.get(candidate.pk, 0), busy_mask.get(key, 0), SCHEDULE_BUFFER_MINUTES
+            ):
+                continue
+
+            conflicts = results[(student.pk, candidate.pk)]
+            if conflicts:
+                # The same request was listed twice; it was already checked
+                continue
+            for new_part, new_bitmap in candidate_parts[candidate.pk]:
+                for existing_part, existing_bitmap in busy[key]:
+                    if bitmaps_overlap(new_bitmap, existing_bitmap, SCHEDULE_BUFFER_MINUTES):
                         conflicts.append(
                             {
-                                "conflicting_class": enrollment.class_header,
+                                "conflicting_class": existing_part.class_session.class_header,
                                 "new_class_part": new_part,
                                 "existing_class_part": existing_part,
                                 "conflict_type": "time_overlap",
                             },
                         )
 
-        return conflicts
+        return results
 
     @staticmethod
     def _parts_conflict(part1: ClassPart, part2: ClassPart) -> bool:
         """Check if two class parts have schedule conflicts.
 
-        Checks for overlapping meeting days and times between two class parts.
+        Compares the parts' weekly slot bitmaps, keeping
+        ``SCHEDULE_BUFFER_MINUTES`` free around each part. Parts without a
+        complete schedule never conflict.
 
         Args:
             part1: First class part
@@ -1285,66 +1450,7 @@ class ScheduleService:
         Returns:
             Boolean indicating if there's a time conflict
         """
-        # If either part doesn't have complete schedule info, assume no conflict
-        if not all(
-            [
-                part1.meeting_days,
-                part1.start_time,
-                part1.end_time,
-                part2.meeting_days,
-                part2.start_time,
-                part2.end_time,
-            ],
-        ):
-            return False
-
-        # Parse meeting days for both parts
-        days1 = {day.strip().upper() for day in part1.meeting_days.split(",") if day.strip()}
-        days2 = {day.strip().upper() for day in part2.meeting_days.split(",") if day.strip()}
-
-        # Check if they have any common meeting days
-        common_days = days1.intersection(days2)
-        if not common_days:
-            return False  # No common days, no conflict
-
-        # Check for time overlap on common days
-        start1 = part1.start_time
-        end1 = part1.end_time
-        start2 = part2.start_time
-        end2 = part2.end_time
-
-        # Handle None values first
-        if not all([start1, end1, start2, end2]):
-            return False  # Can't overlap if any time is None
-
-        # Add buffer time if configured
-        if SCHEDULE_BUFFER_MINUTES > 0:
-            buffer = timedelta(minutes=SCHEDULE_BUFFER_MINUTES)
-            today = timezone.now().date()
-
-            # Convert times to datetime, apply buffer, then back to time
-            if start1 is not None:
-                start1_dt = datetime.combine(today, start1)
-                start1 = (start1_dt - buffer).time()
-            if start2 is not None:
-                start2_dt = datetime.combine(today, start2)
-                start2 = (start2_dt - buffer).time()
-            if end1 is not None:
-                end1_dt = datetime.combine(today, end1)
-                end1 = (end1_dt + buffer).time()
-            if end2 is not None:
-                end2_dt = datetime.combine(today, end2)
-                end2 = (end2_dt + buffer).time()
-
-        # Check for time overlap: two time periods overlap if one starts before the other ends
-        # and the other starts before the first one ends
-        # Final None check after buffer processing
-        if not all([start1, end1, start2, end2]):
-            return False  # Can't overlap if any time is None after processing
-
-        # Type narrowing assertion for MyPy
-        assert start1 is not None and end1 is not None and start2 is not None and end2 is not None
-        return not (end1 <= start2 or end2 <= start1)
+        return bitmaps_overlap(part1.weekly_bitmap, part2.weekly_bitmap, SCHEDULE_BUFFER_MINUTES)
 
 
 class EnrollmentReportService:
@@ -1665,12 +1771,55 @@ class EnrollmentValidationService:
         valid_enrollments = []
         invalid_enrollments = []
 
+        for verdict in cls.get_bulk_enrollment_verdicts(student_course_pairs, term):
+            if verdict["errors"]:
+                invalid_enrollments.append(verdict)
+            else:
+                del verdict["errors"]
+                valid_enrollments.append(verdict)
+
+        return valid_enrollments, invalid_enrollments
+
+    @classmethod
+    def get_bulk_enrollment_verdicts(
+        cls,
+        student_course_pairs: list[tuple],
+        term,
+    ) -> list[dict[str, Any]]:
+        """Validate enrollment requests as a batch and return one verdict per pair.
+
+        Sections for every requested course are loaded in one query and
+        schedule conflicts for all pairs are checked together with
+        ``ScheduleService.check_cohort_schedule_conflicts``, so the number of
+        queries does not grow with the number of pairs. The rules are the
+        same as validating each pair on its own.
+
+        Args:
+            student_course_pairs: List of (student, course) tuples
+            term: Term for enrollments
+
+        Returns:
+            Verdicts in request order, each with ``student``, ``course``,
+            ``class_header`` (when one is scheduled) and a list of ``errors``
+            that is empty when the pair is valid
+
+        Raises:
+            ClassHeader.MultipleObjectsReturned: If a course has more than one
+                class in the term
+        """
+        headers_by_course: dict[int, list[ClassHeader]] = {}
+        for header in ClassHeader.objects.filter(
+            course__in={course.pk for _student, course in student_course_pairs},
+            term=term,
+        ):
+            headers_by_course.setdefault(header.course_id, []).append(header)
+
+        verdicts: list[dict[str, Any]] = []
+        schedulable = []
         for student, course in student_course_pairs:
-            # Find class header for the course in the term
-            try:
-                class_header = ClassHeader.objects.get(course=course, term=term)
-            except ClassHeader.DoesNotExist:
-                invalid_enrollments.append(
+            headers = headers_by_course.get(course.pk, [])
+            if not headers:
+                verdicts.append(
                     {
                         "student": student,
                         "course": course,
@@ -1680,35 +1829,20 @@ class EnrollmentValidationService:
                     },
                 )
                 continue
-
-            # Validate enrollment using existing service
-            conflicts = ScheduleService.check_schedule_conflicts(student, class_header)
-            validation_errors = []
-
-            if conflicts:
-                validation_errors.extend(
-                    [f"Schedule conflict: {conflict}" for conflict in conflicts],
+            if len(headers) > 1:
+                raise ClassHeader.MultipleObjectsReturned(
+                    f"get() returned more than one ClassHeader -- it returned {len(headers)}!",
                 )
+            verdicts.append({"student": student, "course": course, "class_header": headers[0], "errors": []})
+            schedulable.append((student, headers[0]))
 
-            if validation_errors:
-                invalid_enrollments.append(
-                    {
-                        "student": student,
-                        "course": course,
-                        "class_header": class_header,
-                        "errors": validation_errors,
-                    },
-                )
-            else:
-                valid_enrollments.append(
-                    {
-                        "student": student,
-                        "course": course,
-                        "class_header": class_header,
-                    },
-                )
+        conflicts = ScheduleService.check_cohort_schedule_conflicts(schedulable)
+        for verdict in verdicts:
+            if "class_header" in verdict:
+                pair_conflicts = conflicts[(verdict["student"].pk, verdict["class_header"].pk)]
+                verdict["errors"].extend(f"Schedule conflict: {conflict}" for conflict in pair_conflicts)
 
-        return valid_enrollments, invalid_enrollments
+        return verdicts
 
     @classmethod
     def validate_enrollment_limits(
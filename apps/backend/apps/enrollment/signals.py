@@ -0,0 +1,63 @@
+"""Change-event signals that keep cached course eligibility current.
+
+Eligibility is recomputed only when its inputs change: a graded
+enrollment refreshes the student's affected courses, and a catalog change
+recompiles the prerequisite graph and refreshes the changed course for the
+students who have it cached.
+"""
+
+import logging
+from typing import Any
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.curriculum.models import Course, CoursePrerequisite
+from apps.enrollment.eligibility import invalidate_prerequisite_graph
+from apps.enrollment.models import ClassHeaderEnrollment
+from apps.scheduling.models import ClassHeader
+
+logger = logging.getLogger(__name__)
+
+GRADE_FIELDS = frozenset({"status", "final_grade"})
+
+
+def _send_after_commit(actor_name: str, *args: Any) -> None:
+    def _enqueue() -> None:
+        from apps.enrollment import tasks
+
+        try:
+            getattr(tasks, actor_name).send(*args)
+        except Exception:
+            logger.exception("Could not queue %s%r", actor_name, args)
+
+    transaction.on_commit(_enqueue)
+
+
+@receiver([post_save, post_delete], sender=ClassHeaderEnrollment)
+def graded_enrollment_changed(
+    sender: type[ClassHeaderEnrollment], instance: ClassHeaderEnrollment, **kwargs: Any
+) -> None:
+    """Refresh eligibility for courses that depend on a graded enrollment."""
+    update_fields = kwargs.get("update_fields")
+    if update_fields is not None and not GRADE_FIELDS & set(update_fields):
+        return
+    if instance.status != ClassHeaderEnrollment.EnrollmentStatus.COMPLETED and not instance.final_grade:
+        return
+    course_id = ClassHeader.objects.filter(pk=instance.class_header_id).values_list("course_id", flat=True).first()
+    if course_id is not None:
+        _send_after_commit("refresh_student_eligibility", instance.student_id, [course_id])
+
+
+@receiver([post_save, post_delete], sender=CoursePrerequisite)
+def prerequisite_changed(sender: type[CoursePrerequisite], instance: CoursePrerequisite, **kwargs: Any) -> None:
+    """Recompile the prerequisite graph and refresh the dependent course."""
+    transaction.on_commit(invalidate_prerequisite_graph)
+    _send_after_commit("refresh_course_eligibility", instance.course_id)
+
+
+@receiver([post_save, post_delete], sender=Course)
+def course_changed(sender: type[Course], instance: Course, **kwargs: Any) -> None:
+    """Recompile the prerequisite graph when the catalog changes."""
+    transaction.on_commit(invalidate_prerequisite_graph)
@@ -0,0 +1,71 @@
+"""Dramatiq background tasks for the enrollment app.
+
+This module keeps cached course eligibility current by re-evaluating only
+the courses affected by a grade or catalog change, and builds academic
+journeys for chunks of students so a full rebuild can be spread across
+worker processes.
+"""
+
+import logging
+
+import dramatiq
+
+from apps.enrollment.eligibility import get_prerequisite_graph
+from apps.enrollment.models import StudentCourseEligibility
+from apps.enrollment.progression_builder import ProgressionBuilder
+from apps.enrollment.services import PrerequisiteService
+from apps.people.models import StudentProfile
+
+logger = logging.getLogger(__name__)
+
+
+@dramatiq.actor(queue_name="default", max_retries=3)
+def refresh_student_eligibility(student_id: int, changed_course_ids: list[int]):
+    """Re-evaluate a student's eligibility after their completed courses change.
+
+    Args:
+        student_id: Student whose grades changed
+        changed_course_ids: Courses whose completion changed
+    """
+    student = StudentProfile.objects.filter(pk=student_id).first()
+    if student is None:
+        return
+    affected = get_prerequisite_graph().affected_by(changed_course_ids)
+    rows = PrerequisiteService.update_student_eligibility_cache(student, affected)
+    logger.debug("Refreshed %d eligibility rows for student %s", rows, student_id)
+
+
+@dramatiq.actor(queue_name="default", max_retries=3)
+def refresh_course_eligibility(course_id: int):
+    """Re-evaluate a course for every student with cached eligibility for it.
+
+    Args:
+        course_id: Course whose prerequisites changed
+    """
+    student_ids = (
+        StudentCourseEligibility.objects.filter(course_id=course_id).values_list("student_id", flat=True).distinct()
+    )
+    refreshed = 0
+    for student in StudentProfile.objects.filter(pk__in=student_ids).iterator(chunk_size=500):
+        PrerequisiteService.update_student_eligibility_cache(student, [course_id])
+        refreshed += 1
+    logger.info("Refreshed eligibility for course %s for %d students", course_id, refreshed)
+
+
+@dramatiq.actor(queue_name="default", max_retries=3)
+def build_journey_chunk(student_ids: list[int]):
+    """Build academic journeys for one chunk of students.
+
+    Chunks are written atomically and skip students that already have
+    journeys, so a retried or re-enqueued chunk resumes where it stopped.
+
+    Args:
+        student_ids: StudentProfile primary keys in the chunk
+    """
+    journeys = ProgressionBuilder().build_journeys_batch(student_ids)
+    logger.info(
+        "Built %d journeys for %d of %d students",
+        sum(len(student_journeys) for student_journeys in journeys.values()),
+        len(journeys),
+        len(student_ids),
+    )
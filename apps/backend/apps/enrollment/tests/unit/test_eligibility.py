@@ -0,0 +1,69 @@
+"""
+Tests for the compiled prerequisite graph.
+
+Verifies bit assignment, prerequisite evaluation against completed-course
+bitsets, incremental invalidation sets and cycle detection.
+"""
+
+import pytest
+
+from apps.enrollment.eligibility import PrerequisiteGraph, is_passing_grade
+
+COURSES = [(1, "ENG-101"), (2, "ENG-102"), (3, "ENG-201"), (4, "MATH-101"), (5, "ENG-301")]
+EDGES = [(2, 1), (3, 2), (3, 4), (5, 3)]
+
+
+@pytest.fixture
+def graph():
+    return PrerequisiteGraph.compile(COURSES, EDGES)
+
+
+@pytest.mark.unit
+class TestPrerequisiteGraph:
+    """Test evaluating prerequisites from bitsets."""
+
+    def test_missing_prerequisites(self, graph):
+        completed = graph.mask([1, 2])
+
+        assert graph.missing(3, completed) == [4]
+        assert graph.missing(2, completed) == []
+        assert sorted(graph.prerequisites_of(3)) == [2, 4]
+
+    def test_satisfied_evaluates_all_courses_in_one_pass(self, graph):
+        assert graph.satisfied(0) == {1, 4}
+        assert graph.satisfied(graph.mask([1, 2, 4])) == {1, 2, 3, 4}
+
+    def test_affected_by_includes_course_and_direct_dependents(self, graph):
+        assert graph.affected_by([2]) == {2, 3}
+        assert graph.affected_by([5]) == {5}
+
+    def test_topological_order(self, graph):
+        position = {course_id: index for index, course_id in enumerate(graph.order)}
+
+        for course_id, prerequisite_id in EDGES:
+            assert position[prerequisite_id] < position[course_id]
+        assert graph.cyclic == frozenset()
+
+    def test_cycles_are_reported(self):
+        graph = PrerequisiteGraph.compile(COURSES, [*EDGES, (1, 3)])
+
+        assert graph.cyclic == {1, 2, 3, 5}
+
+    def test_edges_to_unknown_courses_are_ignored(self):
+        graph = PrerequisiteGraph.compile(COURSES, [(2, 99)])
+
+        assert graph.prerequisites_of(2) == []
+        assert graph.mask([99]) == 0
+
+
+@pytest.mark.unit
+class TestIsPassingGrade:
+    """Test the prerequisite passing threshold."""
+
+    @pytest.mark.parametrize("grade", ["A", "b+", " C "])
+    def test_passing(self, grade):
+        assert is_passing_grade(grade)
+
+    @pytest.mark.parametrize("grade", ["F", "D", "", None, "XYZ"])
+    def test_failing(self, grade):
+        assert not is_passing_grade(grade)
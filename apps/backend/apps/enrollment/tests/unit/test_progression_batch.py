@@ -0,0 +1,144 @@
+"""
+Tests for batched academic journey building.
+
+Verifies that ``ProgressionBuilder.build_journeys_batch`` writes the same
+journeys as building each student on its own, that
+``populate_academic_progression`` resumes after its checkpoint and falls back
+to per-student builds when a batch fails, and that the ``build_journey_chunk``
+job skips students that already have journeys.
+"""
+
+import json
+from datetime import date
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+
+from apps.curriculum.models import Course, Cycle, Division, Term
+from apps.enrollment.management.commands.transitional.populate_academic_progression import Command
+from apps.enrollment.models import ClassHeaderEnrollment
+from apps.enrollment.models_progression import AcademicJourney, AcademicProgression, ProgramMilestone
+from apps.enrollment.progression_builder import ProgressionBuilder
+from apps.enrollment.tasks import build_journey_chunk
+from apps.people.models import Person, StudentProfile
+from apps.scheduling.models import ClassHeader
+
+# Two language terms followed by two bachelor terms
+HISTORY = [
+    ("2020-1", date(2020, 1, 6), date(2020, 3, 20), ["IEAP-101"]),
+    ("2020-2", date(2020, 4, 6), date(2020, 6, 19), ["IEAP-201"]),
+    ("2021-1", date(2021, 1, 4), date(2021, 5, 14), ["IR-480", "POL-405"]),
+    ("2021-2", date(2021, 6, 7), date(2021, 10, 15), ["LAW-301", "ECON-455"]),
+]
+
+JOURNEY_FIELDS = ["program_type", "start_date", "stop_date", "term_code", "duration_in_terms", "transition_status"]
+
+
+def journey_rows(student):
+    return list(AcademicJourney.objects.filter(student=student).order_by("start_date").values(*JOURNEY_FIELDS))
+
+
+@pytest.mark.django_db
+class TestBatchedJourneys:
+    """Batch builds must write what per-student builds write."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, user):
+        self.user = user
+        cycle = Cycle.objects.create(division=Division.objects.create(name="Academic"), name="Bachelor")
+        self.headers = []
+        for code, start, end, courses in HISTORY:
+            term = Term.objects.create(code=code, term_type=Term.TermType.BACHELORS, start_date=start, end_date=end)
+            for course_code in courses:
+                course, _ = Course.objects.get_or_create(
+                    code=course_code, defaults={"title": course_code, "short_title": course_code, "cycle": cycle}
+                )
+                self.headers.append(ClassHeader.objects.create(course=course, term=term, section_id="A"))
+        self.students = [self._student(10001 + index) for index in range(4)]
+
+    def _student(self, student_id):
+        person = Person.objects.create(
+            personal_name=f"Student{student_id}", family_name="Sok", date_of_birth=date(2000, 1, 1)
+        )
+        student = StudentProfile.objects.create(person=person, student_id=student_id)
+        for header in self.headers:
+            ClassHeaderEnrollment.objects.create(
+                student=student, class_header=header, status="COMPLETED", enrolled_by=self.user
+            )
+        return student
+
+    def _populate(self, monkeypatch, tmp_path, **options):
+        # The command writes its audit report relative to the working directory
+        monkeypatch.chdir(tmp_path)
+        command = Command()
+        call_command(command, stdout=StringIO(), **options)
+        return command
+
+    def test_batch_matches_per_student_build(self):
+        reference, *batch = self.students
+        ProgressionBuilder().build_student_journey(reference.pk)
+
+        journeys = ProgressionBuilder().build_journeys_batch([student.pk for student in batch])
+
+        assert sorted(journeys) == [student.pk for student in batch]
+        expected = journey_rows(reference)
+        assert len(expected) == 2
+        for student in batch:
+            assert journey_rows(student) == expected
+        assert ProgramMilestone.objects.filter(journey__student=batch[0]).count() == (
+            ProgramMilestone.objects.filter(journey__student=reference).count()
+        )
+        assert AcademicProgression.objects.filter(student__in=batch).count() == len(batch)
+
+    def test_batch_queries_do_not_grow_with_students(self, django_assert_max_num_queries):
+        builder = ProgressionBuilder()
+
+        # existing journeys, students, enrollments, progressions, then bulk writes in a savepoint
+        with django_assert_max_num_queries(9):
+            builder.build_journeys_batch([student.pk for student in self.students])
+
+        assert AcademicJourney.objects.count() == 2 * len(self.students)
+
+    def test_command_resumes_after_checkpoint(self, monkeypatch, tmp_path):
+        checkpoint = tmp_path / "progress.json"
+        checkpoint.write_text(json.dumps({"last_student_id": self.students[1].pk}))
+
+        self._populate(monkeypatch, tmp_path, batch_size=1, checkpoint=str(checkpoint))
+
+        built = set(AcademicJourney.objects.values_list("student_id", flat=True))
+        assert built == {self.students[2].pk, self.students[3].pk}
+        assert json.loads(checkpoint.read_text()) == {"last_student_id": self.students[3].pk}
+
+    def test_failed_batch_falls_back_to_each_student(self, monkeypatch, tmp_path):
+        broken = self.students[1].pk
+        build_student_journey = ProgressionBuilder.build_student_journey
+
+        def fail_batch(builder, student_ids, skip_existing=True):
+            raise RuntimeError("bulk insert failed")
+
+        def fail_one(builder, student_id):
+            if student_id == broken:
+                raise ValueError("invalid enrollment data")
+            return build_student_journey(builder, student_id)
+
+        monkeypatch.setattr(ProgressionBuilder, "build_journeys_batch", fail_batch)
+        monkeypatch.setattr(ProgressionBuilder, "build_student_journey", fail_one)
+
+        command = self._populate(monkeypatch, tmp_path, batch_size=4)
+
+        built = set(AcademicJourney.objects.values_list("student_id", flat=True))
+        assert built == {student.pk for student in self.students} - {broken}
+        assert command.stats["errors"] == 1
+        assert command.stats["journeys_created"] == 2 * 3
+
+    def test_chunk_job_skips_students_with_journeys(self):
+        done, *pending = self.students[:3]
+        ProgressionBuilder().build_student_journey(done.pk)
+        existing = set(AcademicJourney.objects.filter(student=done).values_list("pk", flat=True))
+
+        build_journey_chunk.fn([student.pk for student in self.students[:3]])
+
+        assert set(AcademicJourney.objects.filter(student=done).values_list("pk", flat=True)) == existing
+        for student in pending:
+            assert journey_rows(student) == journey_rows(done)
@@ -0,0 +1,147 @@
+"""
+Tests for batched schedule conflict checks and bulk enrollment verdicts.
+
+Verifies that ``ScheduleService.check_cohort_schedule_conflicts`` and
+``EnrollmentValidationService.get_bulk_enrollment_verdicts`` report exactly
+what checking each student on their own reports: only same-term ENROLLED or
+ACTIVE classes block a candidate, and other statuses and terms never do.
+"""
+
+from datetime import time
+
+import pytest
+
+from apps.curriculum.models import Course, Cycle, Division, Term
+from apps.enrollment.models import ClassHeaderEnrollment
+from apps.enrollment.services import EnrollmentValidationService, ScheduleService
+from apps.people.models import Person, StudentProfile
+from apps.scheduling.models import ClassHeader, ClassPart, ClassSession
+
+MON_9 = ("MON", time(9, 0), time(10, 0))
+MON_930 = ("MON,WED", time(9, 30), time(10, 30))
+TUE_9 = ("TUE", time(9, 0), time(10, 0))
+
+
+def per_student_conflicts(student, candidate):
+    """Reference check: compare the candidate with each current enrollment on its own."""
+    found = []
+    for enrollment in ClassHeaderEnrollment.objects.filter(
+        student=student, status__in=["ENROLLED", "ACTIVE"], class_header__term_id=candidate.term_id
+    ):
+        for existing in ClassPart.objects.filter(class_session__class_header=enrollment.class_header):
+            for new in ClassPart.objects.filter(class_session__class_header=candidate):
+                if ScheduleService._parts_conflict(new, existing):
+                    found.append((new.pk, existing.pk))
+    return sorted(found)
+
+
+def conflict_pairs(conflicts):
+    return sorted((conflict["new_class_part"].pk, conflict["existing_class_part"].pk) for conflict in conflicts)
+
+
+@pytest.mark.django_db
+class TestBatchedScheduleChecks:
+    """Batched checks must agree with per-student checks."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, user):
+        self.user = user
+        self.term = self._term("FALL24")
+        self.other_term = self._term("SPRING25")
+        self.cycle = Cycle.objects.create(division=Division.objects.create(name="Academic"), name="Bachelor")
+
+        self.enrolled_class = self._class("ENG-101", self.term, MON_9)
+        self.other_term_class = self._class("ENG-102", self.other_term, MON_9)
+        self.overlapping = self._class("MATH-101", self.term, MON_930)
+        self.free = self._class("SCI-101", self.term, TUE_9)
+
+        self.students = {}
+        for number, (status, header) in enumerate(
+            [
+                ("ENROLLED", self.enrolled_class),
+                ("ACTIVE", self.enrolled_class),
+                ("DROPPED", self.enrolled_class),
+                ("WITHDRAWN", self.enrolled_class),
+                ("COMPLETED", self.enrolled_class),
+                ("ENROLLED", self.other_term_class),
+                (None, None),
+            ]
+        ):
+            student = self._student(number)
+            if header is not None:
+                ClassHeaderEnrollment.objects.create(
+                    student=student, class_header=header, status=status, enrolled_by=user
+                )
+            self.students[f"{status}:{header.course.code if header else '-'}"] = student
+
+    def _term(self, code):
+        return Term.objects.create(
+            code=code, term_type=Term.TermType.BACHELORS, start_date="2024-09-01", end_date="2024-12-15"
+        )
+
+    def _class(self, code, term, pattern):
+        course = Course.objects.create(code=code, title=code, short_title=code, cycle=self.cycle)
+        header = ClassHeader.objects.create(course=course, term=term, section_id="A")
+        session = ClassSession.objects.create(class_header=header)
+        days, start, end = pattern
+        ClassPart.objects.create(class_session=session, meeting_days=days, start_time=start, end_time=end)
+        return header
+
+    def _student(self, number):
+        person = Person.objects.create(
+            personal_name=f"Student{number}", family_name="Test", date_of_birth="2000-01-01"
+        )
+        return StudentProfile.objects.create(person=person, student_id=40000 + number)
+
+    def test_cohort_conflicts_match_per_student_checks(self):
+        requests = [
+            (student, candidate) for student in self.students.values() for candidate in (self.overlapping, self.free)
+        ]
+
+        conflicts = ScheduleService.check_cohort_schedule_conflicts(requests)
+
+        for student, candidate in requests:
+            assert conflict_pairs(conflicts[(student.pk, candidate.pk)]) == per_student_conflicts(student, candidate)
+
+    def test_only_same_term_enrolled_or_active_classes_conflict(self):
+        requests = [(student, self.overlapping) for student in self.students.values()]
+
+        conflicts = ScheduleService.check_cohort_schedule_conflicts(requests)
+
+        blocked = {key for key, student in self.students.items() if conflicts[(student.pk, self.overlapping.pk)]}
+        assert blocked == {"ENROLLED:ENG-101", "ACTIVE:ENG-101"}
+
+    def test_duplicate_requests_are_reported_once(self):
+        student = self.students["ENROLLED:ENG-101"]
+
+        conflicts = ScheduleService.check_cohort_schedule_conflicts([(student, self.overlapping)] * 2)
+
+        assert len(conflicts[(student.pk, self.overlapping.pk)]) == 1
+
+    def test_bulk_verdicts_match_single_pair_verdicts(self, django_assert_max_num_queries):
+        pairs = [
+            (student, course)
+            for student in self.students.values()
+            for course in (self.overlapping.course, self.free.course)
+        ]
+
+        with django_assert_max_num_queries(4):
+            verdicts = EnrollmentValidationService.get_bulk_enrollment_verdicts(pairs, self.term)
+
+        assert [(verdict["student"], verdict["course"]) for verdict in verdicts] == pairs
+        for verdict, (student, course) in zip(verdicts, pairs, strict=True):
+            header = ClassHeader.objects.get(course=course, term=self.term)
+            single = ScheduleService.check_schedule_conflicts(student, header)
+            assert verdict["class_header"] == header
+            assert len(verdict["errors"]) == len(single)
+            assert bool(verdict["errors"]) == bool(per_student_conflicts(student, header))
+
+    def test_unscheduled_course_gets_an_error(self):
+        student = self.students["ENROLLED:ENG-101"]
+
+        [verdict] = EnrollmentValidationService.get_bulk_enrollment_verdicts(
+            [(student, self.other_term_class.course)], self.term
+        )
+
+        assert "class_header" not in verdict
+        assert verdict["errors"] == [f"No class scheduled for ENG-102 in {self.term.code}"]
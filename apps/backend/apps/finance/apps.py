@@ -22,6 +22,10 @@ class FinanceConfig(AppConfig):
     verbose_name = "Financial Management"
 
     def ready(self):
-        """Import signals when app is ready."""
+        """Import signals and connect the balance summary receivers."""
         with contextlib.suppress(ImportError):
             pass
+
+        from .models.balances import connect_balance_refresh
+
+        connect_balance_refresh()
@@ -10,719 +10,46 @@ that validates the entire SIS financial system by:
 
 This is the integration test the user requested - comparing the entire SIS
 against historical payment data and flagging any clerk errors or system discrepancies.
+
+Rows are reconciled by ``ComprehensiveReconciliationService.process_csv_batch``,
+which resolves students, terms and enrollments for the whole run up front.
 """
 
 import csv
 import logging
-import re
-from dataclasses import dataclass
 from datetime import datetime
 from decimal import Decimal
 from pathlib import Path
-from typing import Any
 
 from django.core.management.base import BaseCommand, CommandError
-from django.db.models import Q
 from django.utils import timezone
 
-from apps.curriculum.models import Term
-from apps.enrollment.models import ClassHeaderEnrollment
-from apps.finance.models import (
-    ReconciliationBatch,
-    ReconciliationStatus,
+from apps.finance.models import ReconciliationBatch, ReconciliationStatus
+from apps.finance.services.comprehensive_reconciliation_service import (
+    ComprehensiveReconciliationService,
+    CSVPaymentData,
 )
-from apps.finance.models.discounts import DiscountRule
-from apps.finance.services.separated_pricing_service import SeparatedPricingService
-from apps.people.models import StudentProfile
-from apps.scholarships.models import Scholarship
 
 logger = logging.getLogger(__name__)
 
+NULL_VALUES = ("NULL", "", None)
 
-@dataclass
-class CSVPaymentData:
-    """Structure for CSV payment data from all_receipt_headers_250730.csv."""
-
-    student_id: str
-    term_code: str
-    amount: Decimal
-    net_amount: Decimal
-    net_discount: Decimal
-    notes: str
-    payment_type: str
-    payment_date: str
-    receipt_number: str
-
-
-@dataclass
-class SISCalculation:
-    """SIS-calculated pricing and discounts."""
-
-    base_price: Decimal
-    pricing_method: str
-    scholarship_discount: Decimal
-    scholarship_percentage: Decimal
-    scholarship_source: str
-    discount_amount: Decimal
-    discount_percentage: Decimal
-    discount_type: str
-    expected_net_amount: Decimal
-    calculation_details: dict[str, Any]
-
-
-@dataclass
-class ClerkEntry:
-    """Clerk's recorded values from payment notes."""
-
-    recorded_discount_percentage: Decimal | None
-    recorded_discount_amount: Decimal
-    recorded_net_amount: Decimal
-    scholarship_mentioned: bool
-    discount_type_mentioned: str
-    notes_text: str
-    parsed_details: dict[str, Any]
-
-
-@dataclass
-class ReconciliationDiscrepancy:
-    """Identified discrepancy between SIS calculation and clerk entry."""
-
-    discrepancy_type: str
-    sis_value: Decimal
-    clerk_value: Decimal
-    variance_amount: Decimal
-    variance_percentage: Decimal
-    severity: str  # LOW, MEDIUM, HIGH, CRITICAL
-    description: str
-    requires_correction: bool
-
-
-class SISIntegrationTestService:
-    """Service for comprehensive SIS integration testing via reconciliation."""
-
-    def __init__(self, user=None):
-        self.pricing_service = SeparatedPricingService()
-        self.discount_rules_cache = {}
-        self.user = user
-        self._load_discount_rules()
-
-    def _load_discount_rules(self):
-        """Load and cache all active discount rules for pattern matching."""
-        rules = DiscountRule.objects.filter(is_active=True)
-        for rule in rules:
-            self.discount_rules_cache[rule.pattern_text.lower()] = rule
-        logger.info(f"📋 Loaded {len(self.discount_rules_cache)} discount rules")
-
-    def process_payment_integration_test(
-        self, csv_data: CSVPaymentData, batch: ReconciliationBatch = None
-    ) -> tuple[ReconciliationStatus, list[ReconciliationDiscrepancy]]:
-        """
-        Process payment through comprehensive SIS integration test.
-
-        This method performs a complete integration test by comparing
-        SIS calculated values to clerk's recorded values and flagging differences.
-        """
-        logger.debug(f"🔍 Testing payment {csv_data.receipt_number}")
-
-        try:
-            # Step 1: Find student and term
-            student, term = self._find_student_and_term(csv_data)
-            if not student or not term:
-                return (
-                    self._create_error_status(
-                        csv_data,
-                        batch,
-                        "MISSING_STUDENT_OR_TERM",
-                        f"Could not find student {csv_data.student_id} or term {csv_data.term_code}",
-                    ),
-                    [],
-                )
-
-            # Step 2: Find enrollments for the term
-            enrollments = self._find_student_enrollments(student, term)
-            if not enrollments:
-                return (
-                    self._create_error_status(
-                        csv_data, batch, "NO_ENROLLMENTS", f"No enrollments found for student {student} in term {term}"
-                    ),
-                    [],
-                )
-
-            # Step 3: Calculate SIS pricing using actual pricing service
-            sis_calculation = self._calculate_sis_pricing(student, term, enrollments)
-
-            # Step 4: Parse clerk's notes and extract recorded values
-            clerk_entry = self._parse_clerk_notes(csv_data)
-
-            # Step 5: Verify scholarships against scholarship table
-            scholarship_discrepancies = self._verify_scholarships(student, term, sis_calculation, clerk_entry)
-
-            # Step 6: Verify discounts against discount rules table
-            discount_discrepancies = self._verify_discounts(term, sis_calculation, clerk_entry)
-
-            # Step 7: Compare all calculated values to clerk entries
-            calculation_discrepancies = self._compare_calculations(sis_calculation, clerk_entry, csv_data)
-
-            all_discrepancies = scholarship_discrepancies + discount_discrepancies + calculation_discrepancies
-
-            # Step 8: Create reconciliation status with results
-            status = self._create_reconciliation_status(
-                csv_data, batch, student, term, enrollments, sis_calculation, clerk_entry, all_discrepancies
-            )
-
-            return status, all_discrepancies
-
-        except Exception as e:
-            logger.error(f"❌ Error in integration test: {e}")
-            return self._create_error_status(csv_data, batch, "PROCESSING_ERROR", str(e)), []
-
-    def _find_student_and_term(self, csv_data: CSVPaymentData) -> tuple[StudentProfile | None, Term | None]:
-        """Find student and term from CSV data."""
-        try:
-            # In this CSV, student_id is actually the student name
-            student = None
-
-            # Skip empty student names
-            if not csv_data.student_id or csv_data.student_id.strip() == "":
-                return None, None
-
-            # Try exact name match first
-            student = (
-                StudentProfile.objects.filter(person__full_name__iexact=csv_data.student_id.strip())
-                .select_related("person")
-                .first()
-            )
-
-            if not student:
-                # Try partial name match
-                students = StudentProfile.objects.filter(
-                    person__full_name__icontains=csv_data.student_id.strip()
-                ).select_related("person")
-                student = students.first()
-
-            # Find term by code
-            term = Term.objects.filter(code=csv_data.term_code).first()
-
-            return student, term
-
-        except Exception as e:
-            logger.debug(f"Could not find student/term for {csv_data.student_id}/{csv_data.term_code}: {e}")
-            return None, None
-
-    def _find_student_enrollments(self, student: StudentProfile, term: Term) -> list[ClassHeaderEnrollment]:
-        """Find student's enrollments for the term."""
-        return list(
-            ClassHeaderEnrollment.objects.filter(
-                student=student, class_header__term=term, status__in=["ENROLLED", "COMPLETED", "PASSED", "FAILED"]
-            ).select_related("class_header__course", "class_header")
-        )
 
-    def _calculate_sis_pricing(
-        self, student: StudentProfile, term: Term, enrollments: list[ClassHeaderEnrollment]
-    ) -> SISCalculation:
-        """
-        Calculate pricing using actual SeparatedPricingService.
+def parse_amount(value: str | None) -> Decimal:
+    """Decimal amount from a legacy CSV value, treating NULL as zero."""
+    value = (value or "").strip()
+    return Decimal("0") if value in NULL_VALUES else Decimal(value)
 
-        This is the core integration test - using the real SIS pricing system.
-        """
-        logger.debug(f"💰 Calculating SIS pricing for {len(enrollments)} enrollments")
 
+def parse_payment_date(value: str) -> datetime | None:
+    """Aware payment datetime from a legacy ``PmtDate`` value."""
+    value = (value or "").strip()
+    for date_format in ("%Y-%m-%d %H:%M:%S", "%Y-%m-%d"):
         try:
-            # Calculate base price using actual SIS pricing service
-            total_base_price = Decimal("0")
-            pricing_details = []
-
-            from typing import Any
-
-            for enrollment in enrollments:
-                try:
-                    ch: Any = enrollment.class_header
-                    course_price, pricing_description = self.pricing_service.calculate_course_price(
-                        course=getattr(ch, "course", None),
-                        student=student,
-                        term=term,
-                        class_header=ch,
-                    )
-                    total_base_price += course_price
-                    pricing_details.append(
-                        {
-                            "course": getattr(getattr(ch, "course", None), "code", ""),
-                            "price": course_price,
-                            "method": pricing_description,
-                        }
-                    )
-                    logger.debug(
-                        f"  📚 {getattr(getattr(ch, 'course', None), 'code', '')}: ${course_price} ({pricing_description})"
-                    )
-                except Exception as e:
-                    ch: Any = enrollment.class_header
-                    logger.warning(f"Could not price course {getattr(getattr(ch, 'course', None), 'code', '')}: {e}")
-                    # Use fallback pricing
-                    fallback_price = Decimal("500.00")
-                    total_base_price += fallback_price
-                    pricing_details.append(
-                        {
-                            "course": getattr(getattr(ch, "course", None), "code", ""),
-                            "price": fallback_price,
-                            "method": "FALLBACK_PRICING",
-                        }
-                    )
-
-            # Calculate scholarship discounts using actual scholarship records
-            scholarship_discount, scholarship_percentage, scholarship_source = self._calculate_scholarship_discount(
-                student, term, total_base_price
-            )
-
-            # Calculate other discounts (Early Bird, etc.)
-            other_discount, discount_type = self._calculate_other_discounts(student, term, total_base_price)
-
-            # Calculate final expected amount
-            total_discount = scholarship_discount + other_discount
-            expected_net_amount = total_base_price - total_discount
-
-            return SISCalculation(
-                base_price=total_base_price,
-                pricing_method="SIS_INTEGRATED_PRICING",
-                scholarship_discount=scholarship_discount,
-                scholarship_percentage=scholarship_percentage,
-                scholarship_source=scholarship_source,
-                discount_amount=other_discount,
-                discount_percentage=(
-                    (other_discount / total_base_price * 100) if total_base_price > 0 else Decimal("0")
-                ),
-                discount_type=discount_type,
-                expected_net_amount=expected_net_amount,
-                calculation_details={
-                    "course_pricing": pricing_details,
-                    "total_base_price": total_base_price,
-                    "scholarship_discount": scholarship_discount,
-                    "other_discounts": other_discount,
-                    "final_amount": expected_net_amount,
-                },
-            )
-
-        except Exception as e:
-            logger.error(f"SIS pricing calculation failed: {e}")
-            # Return zero calculation with error details
-            return SISCalculation(
-                base_price=Decimal("0"),
-                pricing_method="ERROR",
-                scholarship_discount=Decimal("0"),
-                scholarship_percentage=Decimal("0"),
-                scholarship_source="ERROR",
-                discount_amount=Decimal("0"),
-                discount_percentage=Decimal("0"),
-                discount_type="ERROR",
-                expected_net_amount=Decimal("0"),
-                calculation_details={"error": str(e)},
-            )
-
-    def _calculate_scholarship_discount(
-        self, student: StudentProfile, term: Term, base_amount: Decimal
-    ) -> tuple[Decimal, Decimal, str]:
-        """
-        Calculate scholarship discount using actual Scholarship table lookups.
-
-        This verifies against the actual scholarship records in the SIS.
-        """
-        logger.debug(f"🎓 Looking up scholarships for student {student} in term {term}")
-
-        # Find active scholarships for this student and term
-        active_scholarships = Scholarship.objects.filter(
-            student=student,
-            status__in=[Scholarship.AwardStatus.APPROVED, Scholarship.AwardStatus.ACTIVE],
-            start_date__lte=term.end_date,
-        ).filter(Q(end_date__isnull=True) | Q(end_date__gte=term.start_date))
-
-        if not active_scholarships.exists():
-            logger.debug(f"No active scholarships found for student {student}")
-            return Decimal("0"), Decimal("0"), "No Scholarship"
-
-        # Calculate total scholarship discount
-        total_discount = Decimal("0")
-        total_percentage = Decimal("0")
-        scholarship_sources = []
-
-        for scholarship in active_scholarships:
-            if scholarship.award_percentage:
-                # Percentage-based scholarship
-                discount = base_amount * (scholarship.award_percentage / 100)
-                total_discount += discount
-                total_percentage += scholarship.award_percentage
-                scholarship_sources.append(f"{scholarship.name} ({scholarship.award_percentage}%)")
-                logger.debug(f"✅ Applied {scholarship.award_percentage}% scholarship: ${discount}")
-
-            elif scholarship.award_amount:
-                # Fixed amount scholarship
-                discount = min(scholarship.award_amount, base_amount)
-                total_discount += discount
-                percentage = (discount / base_amount * 100) if base_amount > 0 else Decimal("0")
-                total_percentage += percentage
-                scholarship_sources.append(f"{scholarship.name} (${scholarship.award_amount})")
-                logger.debug(f"✅ Applied fixed scholarship: ${discount}")
-
-        scholarship_source = "; ".join(scholarship_sources) if scholarship_sources else "No Scholarship"
-
-        return total_discount, total_percentage, scholarship_source
-
-    def _calculate_other_discounts(
-        self, student: StudentProfile, term: Term, base_amount: Decimal
-    ) -> tuple[Decimal, str]:
-        """
-        Calculate other discounts (Early Bird, etc.) using DiscountRule table.
-
-        This matches against actual discount rules in the SIS.
-        """
-        # For now, return zero - this would be enhanced with actual discount rule logic
-        # In a full implementation, this would check for Early Bird qualification based on
-        # enrollment date, payment date, etc.
-        return Decimal("0"), "No Additional Discounts"
-
-    def _parse_clerk_notes(self, csv_data: CSVPaymentData) -> ClerkEntry:
-        """
-        Parse clerk's notes to extract recorded discount information.
-
-        This extracts what the clerk recorded vs what SIS calculates.
-        """
-        notes = csv_data.notes.lower()
-        parsed_details = {}
-
-        # Look for percentage patterns
-        percentage_match = re.search(r"(\d+(?:\.\d+)?)\s*%", notes)
-        recorded_percentage = Decimal(percentage_match.group(1)) if percentage_match else None
-
-        # Check for scholarship mentions
-        scholarship_keywords = ["scholarship", "sponsor", "grant", "aid", "funded"]
-        scholarship_mentioned = any(keyword in notes for keyword in scholarship_keywords)
-
-        # Check for discount type mentions
-        discount_type = "Unknown"
-        if "early bird" in notes:
-            discount_type = "Early Bird"
-        elif "cash" in notes and ("plan" in notes or "payment" in notes):
-            discount_type = "Cash Payment Plan"
-        elif "staff" in notes:
-            discount_type = "Staff Discount"
-        elif "weekend" in notes:
-            discount_type = "Weekend Class"
-        elif scholarship_mentioned:
-            discount_type = "Scholarship"
-
-        return ClerkEntry(
-            recorded_discount_percentage=recorded_percentage,
-            recorded_discount_amount=csv_data.net_discount,
-            recorded_net_amount=csv_data.net_amount,
-            scholarship_mentioned=scholarship_mentioned,
-            discount_type_mentioned=discount_type,
-            notes_text=csv_data.notes,
-            parsed_details=parsed_details,
-        )
-
-    def _verify_scholarships(
-        self, student: StudentProfile, term: Term, sis_calculation: SISCalculation, clerk_entry: ClerkEntry
-    ) -> list[ReconciliationDiscrepancy]:
-        """
-        Verify scholarships against scholarship table and flag differences.
-
-        This is the key integration test for scholarship verification.
-        """
-        discrepancies = []
-
-        # Check if clerk mentioned scholarship but SIS found none
-        if clerk_entry.scholarship_mentioned and sis_calculation.scholarship_percentage == 0:
-            discrepancies.append(
-                ReconciliationDiscrepancy(
-                    discrepancy_type="MISSING_SCHOLARSHIP_RECORD",
-                    sis_value=Decimal("0"),
-                    clerk_value=clerk_entry.recorded_discount_percentage or Decimal("0"),
-                    variance_amount=clerk_entry.recorded_discount_amount,
-                    variance_percentage=Decimal("100"),
-                    severity="HIGH",
-                    description=f"🚨 Clerk mentioned scholarship but no active scholarship found in SIS for student {student}",
-                    requires_correction=True,
-                )
-            )
-
-        # Check if SIS found scholarship but clerk didn't mention it
-        elif not clerk_entry.scholarship_mentioned and sis_calculation.scholarship_percentage > 0:
-            discrepancies.append(
-                ReconciliationDiscrepancy(
-                    discrepancy_type="UNREPORTED_SCHOLARSHIP",
-                    sis_value=sis_calculation.scholarship_percentage,
-                    clerk_value=Decimal("0"),
-                    variance_amount=sis_calculation.scholarship_discount,
-                    variance_percentage=Decimal("100"),
-                    severity="MEDIUM",
-                    description=f"⚠️ SIS shows {sis_calculation.scholarship_percentage}% scholarship but clerk notes do not mention it",
-                    requires_correction=True,
-                )
-            )
-
-        # Check if both mention scholarship but percentages differ
-        elif (
-            clerk_entry.scholarship_mentioned
-            and clerk_entry.recorded_discount_percentage
-            and sis_calculation.scholarship_percentage > 0
-        ):
-            percentage_variance = abs(
-                sis_calculation.scholarship_percentage - clerk_entry.recorded_discount_percentage
-            )
-
-            if percentage_variance > Decimal("0.1"):  # More than 0.1% difference
-                severity = "HIGH" if percentage_variance > 5 else "MEDIUM"
-                discrepancies.append(
-                    ReconciliationDiscrepancy(
-                        discrepancy_type="SCHOLARSHIP_PERCENTAGE_MISMATCH",
-                        sis_value=sis_calculation.scholarship_percentage,
-                        clerk_value=clerk_entry.recorded_discount_percentage,
-                        variance_amount=sis_calculation.scholarship_discount
-                        - (sis_calculation.base_price * clerk_entry.recorded_discount_percentage / 100),
-                        variance_percentage=percentage_variance,
-                        severity=severity,
-                        description=f"📊 CLERK ERROR: Scholarship percentage mismatch - SIS calculated {sis_calculation.scholarship_percentage}% but clerk recorded {clerk_entry.recorded_discount_percentage}%",
-                        requires_correction=True,
-                    )
-                )
-
-        return discrepancies
-
-    def _verify_discounts(
-        self, term: Term, sis_calculation: SISCalculation, clerk_entry: ClerkEntry
-    ) -> list[ReconciliationDiscrepancy]:
-        """
-        Verify discounts against DiscountRule table and flag differences.
-
-        This matches clerk's notes against actual discount rules.
-        """
-        discrepancies = []
-
-        # Check if clerk mentioned Early Bird discount
-        if "early bird" in clerk_entry.notes_text.lower():
-            # Look up Early Bird discount rule
-            early_bird_rule = None
-            for pattern, rule in self.discount_rules_cache.items():
-                if "early bird" in pattern and rule.rule_type == DiscountRule.RuleType.EARLY_BIRD:
-                    early_bird_rule = rule
-                    break
-
-            if early_bird_rule:
-                expected_percentage = early_bird_rule.discount_percentage
-                if clerk_entry.recorded_discount_percentage and abs(
-                    expected_percentage - clerk_entry.recorded_discount_percentage
-                ) > Decimal("0.1"):
-                    discrepancies.append(
-                        ReconciliationDiscrepancy(
-                            discrepancy_type="EARLY_BIRD_PERCENTAGE_MISMATCH",
-                            sis_value=expected_percentage,
-                            clerk_value=clerk_entry.recorded_discount_percentage,
-                            variance_amount=abs(expected_percentage - clerk_entry.recorded_discount_percentage)
-                            / 100
-                            * sis_calculation.base_price,
-                            variance_percentage=abs(expected_percentage - clerk_entry.recorded_discount_percentage),
-                            severity="MEDIUM",
-                            description=f"📋 CLERK ERROR: Early Bird discount mismatch - Rule specifies {expected_percentage}% but clerk recorded {clerk_entry.recorded_discount_percentage}%",
-                            requires_correction=True,
-                        )
-                    )
-            else:
-                discrepancies.append(
-                    ReconciliationDiscrepancy(
-                        discrepancy_type="MISSING_DISCOUNT_RULE",
-                        sis_value=Decimal("0"),
-                        clerk_value=clerk_entry.recorded_discount_percentage or Decimal("0"),
-                        variance_amount=clerk_entry.recorded_discount_amount,
-                        variance_percentage=Decimal("100"),
-                        severity="HIGH",
-                        description="🚨 Clerk mentioned Early Bird discount but no matching rule found in DiscountRule table",
-                        requires_correction=True,
-                    )
-                )
-
-        return discrepancies
-
-    def _compare_calculations(
-        self, sis_calculation: SISCalculation, clerk_entry: ClerkEntry, csv_data: CSVPaymentData
-    ) -> list[ReconciliationDiscrepancy]:
-        """
-        Compare final calculated amounts to clerk's recorded amounts.
-
-        This is the final integration test - comparing SIS totals to actual records.
-        """
-        discrepancies = []
-
-        # Compare net amounts
-        net_amount_variance = abs(sis_calculation.expected_net_amount - clerk_entry.recorded_net_amount)
-        if net_amount_variance > Decimal("1.00"):  # More than $1 difference
-            variance_percentage = (
-                (net_amount_variance / sis_calculation.expected_net_amount * 100)
-                if sis_calculation.expected_net_amount > 0
-                else Decimal("100")
-            )
-            severity = "HIGH" if net_amount_variance > Decimal("50.00") else "MEDIUM"
-
-            discrepancies.append(
-                ReconciliationDiscrepancy(
-                    discrepancy_type="NET_AMOUNT_MISMATCH",
-                    sis_value=sis_calculation.expected_net_amount,
-                    clerk_value=clerk_entry.recorded_net_amount,
-                    variance_amount=net_amount_variance,
-                    variance_percentage=variance_percentage,
-                    severity=severity,
-                    description=f"💰 CALCULATION ERROR: SIS calculated ${sis_calculation.expected_net_amount} but clerk recorded ${clerk_entry.recorded_net_amount}",
-                    requires_correction=True,
-                )
-            )
-
-        return discrepancies
-
-    def _create_reconciliation_status(
-        self,
-        csv_data: CSVPaymentData,
-        batch: ReconciliationBatch,
-        student: StudentProfile,
-        term: Term,
-        enrollments: list[ClassHeaderEnrollment],
-        sis_calculation: SISCalculation,
-        clerk_entry: ClerkEntry,
-        discrepancies: list[ReconciliationDiscrepancy],
-    ) -> ReconciliationStatus:
-        """Create comprehensive reconciliation status with all analysis results."""
-
-        # Determine overall status based on discrepancies
-        if not discrepancies:
-            status = ReconciliationStatus.Status.FULLY_RECONCILED
-            confidence_level = ReconciliationStatus.ConfidenceLevel.HIGH
-            confidence_score = Decimal("95")
-        elif any(d.severity in ["HIGH", "CRITICAL"] for d in discrepancies):
-            status = ReconciliationStatus.Status.EXCEPTION_ERROR
-            confidence_level = ReconciliationStatus.ConfidenceLevel.NONE
-            confidence_score = Decimal("20")
-        elif any(d.severity == "MEDIUM" for d in discrepancies):
-            status = ReconciliationStatus.Status.PENDING_REVIEW
-            confidence_level = ReconciliationStatus.ConfidenceLevel.LOW
-            confidence_score = Decimal("60")
-        else:
-            status = ReconciliationStatus.Status.AUTO_ALLOCATED
-            confidence_level = ReconciliationStatus.ConfidenceLevel.MEDIUM
-            confidence_score = Decimal("80")
-
-        # Create reconciliation status
-        reconciliation_status = ReconciliationStatus(
-            # payment=payment,  # Would link to actual Payment object in full implementation
-            status=status,
-            confidence_level=confidence_level,
-            confidence_score=confidence_score,
-            pricing_method_applied=ReconciliationStatus.PricingMethod.SCHOLARSHIP_VERIFICATION,
-            variance_amount=sum(d.variance_amount for d in discrepancies),
-            reconciliation_batch=batch,
-            reconciled_date=timezone.now(),
-            notes=self._generate_reconciliation_notes(sis_calculation, clerk_entry, discrepancies),
-            created_by=self.user,
-            updated_by=self.user,
-            error_details={
-                "sis_calculation": {
-                    "base_price": float(sis_calculation.base_price),
-                    "scholarship_discount": float(sis_calculation.scholarship_discount),
-                    "scholarship_percentage": float(sis_calculation.scholarship_percentage),
-                    "scholarship_source": sis_calculation.scholarship_source,
-                    "expected_net_amount": float(sis_calculation.expected_net_amount),
-                    "pricing_method": sis_calculation.pricing_method,
-                },
-                "clerk_entry": {
-                    "recorded_net_amount": float(clerk_entry.recorded_net_amount),
-                    "recorded_discount_amount": float(clerk_entry.recorded_discount_amount),
-                    "recorded_discount_percentage": (
-                        float(clerk_entry.recorded_discount_percentage)
-                        if clerk_entry.recorded_discount_percentage
-                        else None
-                    ),
-                    "scholarship_mentioned": clerk_entry.scholarship_mentioned,
-                    "discount_type_mentioned": clerk_entry.discount_type_mentioned,
-                },
-                "discrepancies": [
-                    {
-                        "type": d.discrepancy_type,
-                        "sis_value": float(d.sis_value),
-                        "clerk_value": float(d.clerk_value),
-                        "variance_amount": float(d.variance_amount),
-                        "variance_percentage": float(d.variance_percentage),
-                        "severity": d.severity,
-                        "description": d.description,
-                        "requires_correction": d.requires_correction,
-                    }
-                    for d in discrepancies
-                ],
-                "payment_data": {
-                    "receipt_number": csv_data.receipt_number,
-                    "student_id": csv_data.student_id,
-                    "term_code": csv_data.term_code,
-                    "amount": float(csv_data.amount),
-                    "notes": csv_data.notes,
-                },
-            },
-        )
-
-        logger.debug(f"✅ Created reconciliation status: {status} with {len(discrepancies)} discrepancies")
-        return reconciliation_status
-
-    def _generate_reconciliation_notes(
-        self, sis_calculation: SISCalculation, clerk_entry: ClerkEntry, discrepancies: list[ReconciliationDiscrepancy]
-    ) -> str:
-        """Generate comprehensive notes describing the reconciliation analysis."""
-
-        notes = []
-        notes.append("=== SIS INTEGRATION TEST RECONCILIATION ===")
-        notes.append(f"SIS Calculated: ${sis_calculation.expected_net_amount} (base: ${sis_calculation.base_price})")
-        notes.append(f"Clerk Recorded: ${clerk_entry.recorded_net_amount}")
-
-        if sis_calculation.scholarship_percentage > 0:
-            notes.append(
-                f"SIS Scholarships: {sis_calculation.scholarship_percentage}% = ${sis_calculation.scholarship_discount}"
-            )
-            notes.append(f"Source: {sis_calculation.scholarship_source}")
-
-        if clerk_entry.scholarship_mentioned:
-            notes.append(f"Clerk Mentioned: {clerk_entry.discount_type_mentioned}")
-            if clerk_entry.recorded_discount_percentage:
-                notes.append(f"Clerk Percentage: {clerk_entry.recorded_discount_percentage}%")
-
-        if discrepancies:
-            notes.append(f"\n🚨 {len(discrepancies)} DISCREPANCIES FOUND:")
-            for i, disc in enumerate(discrepancies, 1):
-                notes.append(f"{i}. {disc.discrepancy_type} ({disc.severity})")
-                notes.append(f"   {disc.description}")
-                notes.append(f"   SIS: {disc.sis_value}, Clerk: {disc.clerk_value}")
-        else:
-            notes.append("\n✅ NO DISCREPANCIES - SIS calculations match clerk records")
-
-        return "\n".join(notes)
-
-    def _create_error_status(
-        self, csv_data: CSVPaymentData, batch: ReconciliationBatch, error_type: str, error_message: str
-    ) -> ReconciliationStatus:
-        """Create error status for failed reconciliation attempts."""
-
-        return ReconciliationStatus(
-            status=ReconciliationStatus.Status.EXCEPTION_ERROR,
-            confidence_level=ReconciliationStatus.ConfidenceLevel.NONE,
-            confidence_score=Decimal("0"),
-            reconciliation_batch=batch,
-            error_category=error_type,
-            created_by=self.user,
-            updated_by=self.user,
-            error_details={
-                "error_type": error_type,
-                "error_message": error_message,
-                "csv_data": {
-                    "receipt_number": csv_data.receipt_number,
-                    "student_id": csv_data.student_id,
-                    "term_code": csv_data.term_code,
-                    "amount": float(csv_data.amount),
-                    "notes": csv_data.notes,
-                },
-            },
-            notes=f"Integration test failed: {error_type} - {error_message}",
-        )
+            return timezone.make_aware(datetime.strptime(value.split(".")[0], date_format))
+        except ValueError:
+            continue
+    return None
 
 
 class Command(BaseCommand):
@@ -779,78 +106,17 @@ class Command(BaseCommand):
             updated_by=system_user,
         )
 
-        # Initialize service and counters
-        service = SISIntegrationTestService(user=system_user)
-        processed_count = 0
-        discrepancy_count = 0
-        error_count = 0
-        discrepancies_by_type = {}
+        service = ComprehensiveReconciliationService(user=system_user)
 
         try:
-            with open(csv_path, encoding="utf-8") as csvfile:
-                reader = csv.DictReader(csvfile)
-
-                for row in reader:
-                    if processed_count >= limit:
-                        break
-
-                    try:
-                        # Skip rows with NULL or empty critical values
-                        if (
-                            row.get("Amount") in ["NULL", "", None]
-                            or row.get("name") in ["NULL", "", None]
-                            or row.get("TermID") in ["NULL", "", None]
-                        ):
-                            continue
-
-                        # Parse CSV row with actual column names from CSV
-                        amount_str = row.get("Amount", "0").strip()
-                        net_amount_str = row.get("NetAmount", "0").strip()
-                        net_discount_str = row.get("NetDiscount", "0").strip()
-
-                        # Handle NULL values
-                        if amount_str == "NULL" or not amount_str:
-                            continue
-
-                        csv_data = CSVPaymentData(
-                            student_id=row.get("name", ""),  # Use 'name' field as student identifier
-                            term_code=row.get("TermID", ""),  # Use 'TermID' field
-                            amount=Decimal(amount_str) if amount_str != "NULL" else Decimal("0"),
-                            net_amount=Decimal(net_amount_str) if net_amount_str != "NULL" else Decimal("0"),
-                            net_discount=Decimal(net_discount_str) if net_discount_str != "NULL" else Decimal("0"),
-                            notes=row.get("Notes", ""),
-                            payment_type=row.get("PmtType", ""),
-                            payment_date=row.get("PmtDate", ""),  # Use 'PmtDate' field
-                            receipt_number=row.get("ReceiptNo", str(processed_count)),
-                        )
-
-                        # Process through integration test
-                        status, discrepancies = service.process_payment_integration_test(csv_data, batch)
-
-                        processed_count += 1
-
-                        if discrepancies:
-                            discrepancy_count += 1
-                            for disc in discrepancies:
-                                disc_type = disc.discrepancy_type
-                                discrepancies_by_type[disc_type] = discrepancies_by_type.get(disc_type, 0) + 1
-
-                                # Show critical discrepancies immediately
-                                if disc.severity in ["HIGH", "CRITICAL"]:
-                                    self.stdout.write(self.style.ERROR(f"🚨 {disc.severity}: {disc.description}"))
-
-                        if status.status == ReconciliationStatus.Status.EXCEPTION_ERROR:
-                            error_count += 1
-
-                        if processed_count % 50 == 0:
-                            self.stdout.write(f"📊 Processed {processed_count} payments...")
-
-                    except Exception as e:
-                        self.stdout.write(self.style.ERROR(f"❌ Error processing payment: {e}"))
-                        error_count += 1
+            rows = self._read_rows(csv_path, limit)
+            self.stdout.write(f"📊 Reconciling {len(rows)} payments...")
+            counts = service.process_csv_batch(rows, batch)
 
             # Update batch with results
-            successful_count = max(0, processed_count - error_count)  # Ensure non-negative
+            processed_count = len(rows)
+            successful_count = counts["successful"]
+            error_count = counts["failed"]
             batch.total_payments = processed_count
             batch.processed_payments = processed_count
             batch.successful_matches = successful_count
@@ -861,9 +127,10 @@ class Command(BaseCommand):
                 else ReconciliationBatch.BatchStatus.PARTIAL
             )
             batch.completed_at = timezone.now()
+            status_counts = service.create_batch_summary(batch).get("status_breakdown", {}).get("counts", {})
             batch.results_summary = {
-                "discrepancy_count": discrepancy_count,
-                "discrepancies_by_type": discrepancies_by_type,
+                **batch.results_summary,
+                "status_counts": status_counts,
                 "error_count": error_count,
                 "success_rate": (successful_count / processed_count * 100) if processed_count > 0 else 0,
             }
@@ -872,14 +139,20 @@ class Command(BaseCommand):
             # Show final results
             self.stdout.write(self.style.SUCCESS("\n🎉 SIS Integration Test Complete!"))
             self.stdout.write(f"📊 Total Processed: {processed_count}")
-            self.stdout.write(f"✅ Successful: {processed_count - error_count}")
+            self.stdout.write(f"✅ Successful: {successful_count}")
             self.stdout.write(f"❌ Errors: {error_count}")
-            self.stdout.write(f"⚠️ Payments with Discrepancies: {discrepancy_count}")
 
-            if discrepancies_by_type:
-                self.stdout.write("\n🔍 Discrepancy Breakdown:")
-                for disc_type, count in sorted(discrepancies_by_type.items(), key=lambda x: x[1], reverse=True):
-                    self.stdout.write(f"  • {disc_type}: {count}")
+            if any(status_counts.values()):
+                self.stdout.write("\n🔍 Reconciliation Status Breakdown:")
+                for status, count in sorted(status_counts.items(), key=lambda x: x[1], reverse=True):
+                    if count:
+                        self.stdout.write(f"  • {ReconciliationStatus.Status(status).label}: {count}")
+
+            match_methods = batch.results_summary.get("student_match_methods", {})
+            if match_methods:
+                self.stdout.write("\n🧭 Student Match Methods:")
+                for method, count in sorted(match_methods.items(), key=lambda x: x[1], reverse=True):
+                    self.stdout.write(f"  • {method}: {count}")
 
             self.stdout.write(f"\n📝 Batch ID: {batch.batch_id}")
             self.stdout.write("Use Django admin to review detailed reconciliation results.")
@@ -889,3 +162,46 @@ class Command(BaseCommand):
             batch.error_log = str(e)
             batch.save()
             raise CommandError(f"Integration test failed: {e}") from e
+
+    def _read_rows(self, csv_path: Path, limit: int) -> list[CSVPaymentData]:
+        """Parse up to ``limit`` usable payment rows from the receipt CSV."""
+        rows: list[CSVPaymentData] = []
+        with open(csv_path, encoding="utf-8") as csvfile:
+            for row in csv.DictReader(csvfile):
+                if len(rows) >= limit:
+                    break
+
+                # Skip rows with NULL or empty critical values
+                if any(row.get(column) in NULL_VALUES for column in ("Amount", "name", "TermID")):
+                    continue
+
+                payment_date = parse_payment_date(row.get("PmtDate", ""))
+                if payment_date is None:
+                    self.stdout.write(self.style.ERROR(f"❌ Invalid payment date: {row.get('PmtDate')}"))
+                    continue
+
+                try:
+                    amount = parse_amount(row["Amount"])
+                    net_amount = parse_amount(row.get("NetAmount"))
+                    net_discount = parse_amount(row.get("NetDiscount"))
+                except ArithmeticError as e:
+                    self.stdout.write(self.style.ERROR(f"❌ Invalid amount in receipt {row.get('ReceiptNo')}: {e}"))
+                    continue
+
+                # The 'name' column identifies the student, by ID or by name
+                rows.append(
+                    CSVPaymentData(
+                        student_id=row["name"],
+                        student_name=row["name"],
+                        term_code=row["TermID"],
+                        term_id=row["TermID"],
+                        amount=amount,
+                        net_amount=net_amount,
+                        net_discount=net_discount,
+                        notes=row.get("Notes", ""),
+                        payment_type=row.get("PmtType", ""),
+                        payment_date=payment_date,
+                        receipt_number=row.get("ReceiptNo", str(len(rows))),
+                    )
+                )
+        return rows
@@ -9,7 +9,6 @@ import logging
 from datetime import date, datetime
 
 from django.core.management.base import BaseCommand, CommandError
-from django.db import transaction
 from django.utils import timezone
 
 from apps.finance.models import (
@@ -285,33 +284,34 @@ class Command(BaseCommand):
         successful_count = 0
         failed_count = 0
 
-        # Process in batches
-        for offset in range(0, batch.total_payments, batch_size):
-            batch_payments = payments_qs[offset : offset + batch_size]
+        # Page by primary key so reconciled payments dropping out of the
+        # queryset do not shift later pages
+        payment_ids = list(payments_qs.values_list("id", flat=True))
+
+        for offset in range(0, len(payment_ids), batch_size):
+            chunk_ids = payment_ids[offset : offset + batch_size]
+            batch_payments = list(payments_qs.filter(id__in=chunk_ids))
 
             self.stdout.write(f"🔄 Processing batch {offset // batch_size + 1} ({len(batch_payments)} payments)...")
 
-            with transaction.atomic():
-                for payment in batch_payments:
-                    try:
-                        status = service.reconcile_payment(payment, batch)
-                        processed_count += 1
-
-                        if status.status in [
-                            ReconciliationStatus.Status.FULLY_RECONCILED,
-                            ReconciliationStatus.Status.AUTO_ALLOCATED,
-                        ]:
-                            successful_count += 1
-                        else:
-                            failed_count += 1
-
-                        # Log progress every 10 payments
-                        if processed_count % 10 == 0:
-                            self.stdout.write(f"  📊 Processed {processed_count} payments...")
-
-                    except Exception as e:
-                        failed_count += 1
-                        logger.error(f"Error processing payment {payment.payment_reference}: {e}")
+            try:
+                statuses = service.reconcile_batch(batch_payments, batch)
+            except Exception as e:
+                failed_count += len(batch_payments)
+                logger.error(f"Error processing payment batch starting at {offset}: {e}")
+                continue
+
+            processed_count += len(statuses)
+            for status in statuses:
+                if status.status in [
+                    ReconciliationStatus.Status.FULLY_RECONCILED,
+                    ReconciliationStatus.Status.AUTO_ALLOCATED,
+                ]:
+                    successful_count += 1
+                else:
+                    failed_count += 1
+
+            self.stdout.write(f"  📊 Processed {processed_count} payments...")
 
             # Update batch statistics
             batch.processed_payments = processed_count
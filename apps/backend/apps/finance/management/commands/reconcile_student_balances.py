@@ -0,0 +1,24 @@
+"""Management command to reconcile denormalized student balances.
+
+``StudentBalance`` rows are recomputed whenever a student's invoices or
+payments change. Use this command to create missing rows and repair drift
+after bulk imports or raw updates that bypass those hooks.
+
+Usage:
+    python manage.py reconcile_student_balances
+"""
+
+from django.core.management.base import BaseCommand
+
+from apps.finance.models import StudentBalance
+
+
+class Command(BaseCommand):
+    help = "Recompute student balance summaries that drifted from their invoices"
+
+    def handle(self, *args, **options):
+        """Create missing summaries and refresh drifted ones."""
+        created, corrected = StudentBalance.reconcile()
+        self.stdout.write(
+            self.style.SUCCESS(f"Reconciled student balances; created {created} and corrected {corrected} summaries")
+        )
@@ -0,0 +1,112 @@
+# Generated by Django 5.2 on 2025-08-01
+
+from decimal import Decimal
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count, F, Min, Sum
+
+OPEN_INVOICE_STATUSES = ("SENT", "PARTIALLY_PAID", "OVERDUE")
+
+
+def backfill_balances(apps, schema_editor):
+    Invoice = apps.get_model("finance", "Invoice")
+    StudentBalance = apps.get_model("finance", "StudentBalance")
+    rows = (
+        Invoice.objects.filter(status__in=OPEN_INVOICE_STATUSES, total_amount__gt=F("paid_amount"))
+        .order_by()
+        .values("student_id")
+        .annotate(balance=Sum(F("total_amount") - F("paid_amount")), oldest=Min("issue_date"), count=Count("id"))
+    )
+    StudentBalance.objects.bulk_create(
+        [
+            StudentBalance(
+                student_id=row["student_id"],
+                balance=row["balance"],
+                oldest_open_invoice_date=row["oldest"],
+                open_invoice_count=row["count"],
+            )
+            for row in rows.iterator()
+        ],
+        batch_size=2000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("finance", "0002_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="StudentBalance",
+            fields=[
+                (
+                    "created_at",
+                    models.DateTimeField(
+                        auto_now_add=True,
+                        help_text="Date and time when the record was created",
+                        verbose_name="Created at",
+                    ),
+                ),
+                (
+                    "updated_at",
+                    models.DateTimeField(
+                        auto_now=True,
+                        help_text="Date and time when the record was last updated",
+                        verbose_name="Updated at",
+                    ),
+                ),
+                (
+                    "student",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="balance_summary",
+                        serialize=False,
+                        to="people.studentprofile",
+                        verbose_name="Student",
+                    ),
+                ),
+                (
+                    "balance",
+                    models.DecimalField(
+                        decimal_places=2,
+                        default=Decimal("0.00"),
+                        help_text="Total amount due on open invoices",
+                        max_digits=12,
+                        verbose_name="Balance",
+                    ),
+                ),
+                (
+                    "oldest_open_invoice_date",
+                    models.DateField(
+                        blank=True,
+                        help_text="Issue date of the oldest invoice with an amount due",
+                        null=True,
+                        verbose_name="Oldest Open Invoice Date",
+                    ),
+                ),
+                (
+                    "open_invoice_count",
+                    models.PositiveIntegerField(
+                        default=0,
+                        help_text="Number of invoices with an amount due",
+                        verbose_name="Open Invoice Count",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Student Balance",
+                "verbose_name_plural": "Student Balances",
+                "db_table": "finance_student_balance",
+                "ordering": ["-balance"],
+                "indexes": [
+                    models.Index(fields=["balance"], name="finance_student_balance_idx"),
+                    models.Index(fields=["oldest_open_invoice_date"], name="finance_student_oldest_idx"),
+                ],
+            },
+        ),
+        migrations.RunPython(backfill_balances, migrations.RunPython.noop),
+    ]
@@ -17,6 +17,7 @@ from .ar_reconstruction import (
     LegacyReceiptMapping,
     ReconstructionScholarshipEntry,
 )
+from .balances import StudentBalance
 from .core import (
     CashierSession,
     Currency,
@@ -108,4 +109,6 @@ __all__ = [
     "ReconstructionScholarshipEntry",
     "SeniorProjectCourse",
     "SeniorProjectPricing",
+    # Denormalized balances
+    "StudentBalance",
 ]
@@ -0,0 +1,188 @@
+"""Denormalized per-student account balances.
+
+One ``StudentBalance`` row per student summarizes the student's open
+invoices so that the student locator and balance reports can filter and
+sort on an indexed column instead of aggregating the invoice table. Rows
+are recomputed from the student's invoices inside the transaction that
+changes them (see ``connect_balance_refresh``); ``reconcile`` repairs
+drift from writes that bypass those hooks.
+"""
+
+from collections.abc import Iterable
+from decimal import Decimal
+from typing import Any, ClassVar
+
+from django.db import models, transaction
+from django.db.models import (
+    Count,
+    DateField,
+    DecimalField,
+    ExpressionWrapper,
+    F,
+    Min,
+    OneToOneField,
+    OuterRef,
+    PositiveIntegerField,
+    Q,
+    Subquery,
+    Sum,
+    Value,
+)
+from django.db.models.functions import Coalesce
+from django.db.models.signals import post_delete, post_save
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+
+from apps.common.models import TimestampedModel
+
+OPEN_INVOICE_STATUSES = ("SENT", "PARTIALLY_PAID", "OVERDUE")
+ZERO = Decimal("0.00")
+
+
+def open_invoices_q(prefix: str = "") -> Q:
+    """Invoices that still have an amount due, optionally via a relation prefix."""
+    return Q(**{f"{prefix}status__in": OPEN_INVOICE_STATUSES, f"{prefix}total_amount__gt": F(f"{prefix}paid_amount")})
+
+
+class StudentBalance(TimestampedModel):
+    """Outstanding balance summary of a student's open invoices."""
+
+    student: OneToOneField = models.OneToOneField(
+        "people.StudentProfile",
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="balance_summary",
+        verbose_name=_("Student"),
+    )
+    balance: DecimalField = models.DecimalField(
+        _("Balance"),
+        max_digits=12,
+        decimal_places=2,
+        default=ZERO,
+        help_text=_("Total amount due on open invoices"),
+    )
+    oldest_open_invoice_date: DateField = models.DateField(
+        _("Oldest Open Invoice Date"),
+        null=True,
+        blank=True,
+        help_text=_("Issue date of the oldest invoice with an amount due"),
+    )
+    open_invoice_count: PositiveIntegerField = models.PositiveIntegerField(
+        _("Open Invoice Count"),
+        default=0,
+        help_text=_("Number of invoices with an amount due"),
+    )
+
+    class Meta:
+        db_table = "finance_student_balance"
+        verbose_name = _("Student Balance")
+        verbose_name_plural = _("Student Balances")
+        ordering = ["-balance"]
+        indexes: ClassVar[list[models.Index]] = [
+            models.Index(fields=["balance"], name="finance_student_balance_idx"),
+            models.Index(fields=["oldest_open_invoice_date"], name="finance_student_oldest_idx"),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.student_id}: {self.balance}"
+
+    @classmethod
+    def refresh_for_students(cls, student_ids: Iterable[int]) -> None:
+        """Recompute the summary rows of the given students from their invoices.
+
+        The rows are locked before the invoices are aggregated, so concurrent
+        refreshes for the same student serialize and the later one sees the
+        earlier one's committed invoice changes.
+        """
+        from .core import Invoice
+
+        student_ids = sorted(set(student_ids))
+        if not student_ids:
+            return
+
+        with transaction.atomic():
+            cls.objects.bulk_create([cls(student_id=student_id) for student_id in student_ids], ignore_conflicts=True)
+            summaries = {
+                summary.student_id: summary
+                for summary in cls.objects.select_for_update().filter(student_id__in=student_ids)
+            }
+            totals = {
+                row["student_id"]: row
+                for row in Invoice.objects.filter(open_invoices_q(), student_id__in=student_ids)
+                .order_by()
+                .values("student_id")
+                .annotate(
+                    balance=Sum(F("total_amount") - F("paid_amount")),
+                    oldest=Min("issue_date"),
+                    count=Count("id"),
+                )
+            }
+            now = timezone.now()
+            for student_id, summary in summaries.items():
+                row = totals.get(student_id, {})
+                summary.updated_at = now
+                summary.balance = row.get("balance") or ZERO
+                summary.oldest_open_invoice_date = row.get("oldest")
+                summary.open_invoice_count = row.get("count", 0)
+            cls.objects.bulk_update(
+                summaries.values(), ["balance", "oldest_open_invoice_date", "open_invoice_count", "updated_at"]
+            )
+
+    @classmethod
+    def reconcile(cls) -> tuple[int, int]:
+        """Create missing rows and repair drifted ones for all students.
+
+        Returns:
+            Number of rows created and number of drifted rows corrected
+        """
+        from apps.people.models import StudentProfile
+
+        from .core import Invoice
+
+        open_invoices = (
+            Invoice.objects.filter(open_invoices_q(), student_id=OuterRef("student_id"))
+            .order_by()
+            .values("student_id")
+        )
+        amount_due = ExpressionWrapper(F("total_amount") - F("paid_amount"), output_field=models.DecimalField())
+        balance = Coalesce(
+            Subquery(open_invoices.annotate(total=Sum(amount_due)).values("total")),
+            Value(ZERO),
+            output_field=models.DecimalField(),
+        )
+        oldest = Subquery(open_invoices.annotate(oldest=Min("issue_date")).values("oldest"))
+        count = Coalesce(Subquery(open_invoices.annotate(count=Count("id")).values("count")), 0)
+
+        with transaction.atomic():
+            missing = StudentProfile.objects.filter(balance_summary__isnull=True).values_list("id", flat=True)
+            created = len(
+                cls.objects.bulk_create([cls(student_id=student_id) for student_id in missing], ignore_conflicts=True)
+            )
+            drifted = (
+                cls.objects.annotate(actual_balance=balance, actual_oldest=oldest, actual_count=count)
+                .exclude(
+                    balance=F("actual_balance"),
+                    open_invoice_count=F("actual_count"),
+                    oldest_open_invoice_date=F("actual_oldest"),
+                )
+                .values_list("student_id", flat=True)
+            )
+            drifted_ids = list(drifted)
+            cls.refresh_for_students(drifted_ids)
+        return created, len(drifted_ids)
+
+
+def _invoice_changed(sender: type, instance: Any, **kwargs: Any) -> None:
+    """Recompute the student's balance summary in the invoice's transaction."""
+    StudentBalance.refresh_for_students([instance.student_id])
+
+
+def connect_balance_refresh() -> None:
+    """Keep balance summaries in step with invoice saves and deletes.
+
+    Idempotent: receivers use fixed ``dispatch_uid`` values.
+    """
+    from .core import Invoice
+
+    post_save.connect(_invoice_changed, sender=Invoice, dispatch_uid="student_balance_invoice_saved")
+    post_delete.connect(_invoice_changed, sender=Invoice, dispatch_uid="student_balance_invoice_deleted")
@@ -13,6 +13,7 @@ that validates the entire SIS financial system against historical payment data.
 
 import logging
 from dataclasses import dataclass
+from datetime import datetime
 from decimal import Decimal
 from typing import Any
 
@@ -29,6 +30,7 @@ from apps.finance.models import (
     ReconciliationStatus,
 )
 from apps.finance.models.discounts import DiscountRule
+from apps.finance.services.reconciliation_resolver import ENROLLMENT_STATUSES, ReconciliationResolver
 from apps.finance.services.separated_pricing_service import SeparatedPricingService
 from apps.people.models import StudentProfile
 
@@ -49,7 +51,7 @@ class CSVPaymentData:
     net_discount: Decimal
     notes: str
     payment_type: str
-    payment_date: str
+    payment_date: datetime
     receipt_number: str
 
 
@@ -136,6 +138,7 @@ class ComprehensiveReconciliationService:
 
         self.invoice_service = InvoiceService()
         self.payment_service = PaymentService()
+        self.resolver: ReconciliationResolver | None = None
         self._load_discount_rules()
 
     def _get_system_user(self) -> Any:
@@ -160,6 +163,36 @@ class ComprehensiveReconciliationService:
         for rule in rules:
             self.discount_rules_cache[rule.pattern_text.lower()] = rule
 
+    def process_csv_batch(self, rows: list[CSVPaymentData], batch: ReconciliationBatch) -> dict[str, int]:
+        """Process all CSV payment records of a run against one preloaded resolver.
+
+        Students, terms and enrollments for every row are loaded up front, so
+        each row is resolved without further lookups. A row that raises is
+        logged and counted as failed. The number of rows resolved by each
+        student match method is stored in the batch's results summary.
+
+        Returns:
+            Counts of successful and failed rows
+        """
+        self.resolver = ReconciliationResolver.for_rows(rows)
+        counts = {"successful": 0, "failed": 0}
+        try:
+            for csv_data in rows:
+                try:
+                    success, _status, _errors = self.process_csv_payment(csv_data, batch)
+                except Exception:
+                    logger.exception("Failed to reconcile CSV payment %s", csv_data.receipt_number)
+                    success = False
+                counts["successful" if success else "failed"] += 1
+        finally:
+            batch.results_summary = {
+                **batch.results_summary,
+                "student_match_methods": self.resolver.match_report(),
+            }
+            batch.save(update_fields=["results_summary", "updated_at"])
+            self.resolver = None
+        return counts
+
     @transaction.atomic
     def process_csv_payment(
         self, csv_data: CSVPaymentData, batch: ReconciliationBatch
@@ -173,7 +206,7 @@ class ComprehensiveReconciliationService:
 
         try:
             # Step 1: Find or resolve student
-            student = self._find_student(csv_data.student_id)  # Use student_id not student_name
+            student = self._find_student(csv_data)
             if not student:
                 error = ReconciliationError(
                     error_type="STUDENT_NOT_FOUND",
@@ -701,74 +734,31 @@ class ComprehensiveReconciliationService:
             errors.append(error)
             return False, self._create_error_status(csv_data, batch, errors), errors
 
-    def _find_student(self, student_name: str) -> StudentProfile | None:
-        """Find student by name with fuzzy matching."""
-        try:
-            # Try exact match first
-            students = StudentProfile.objects.filter(person__full_name__iexact=student_name).select_related("person")
-
-            if students.exists():
-                return students.first()
-
-            # Try partial matches
-            name_parts = student_name.split()
-            if len(name_parts) >= 2:
-                first_name = name_parts[0]
-                last_name = " ".join(name_parts[1:])
+    def _get_resolver(self, csv_data: CSVPaymentData) -> ReconciliationResolver:
+        """The run's resolver, or one preloading only the row's student outside ``process_csv_batch``."""
+        if self.resolver is None:
+            return ReconciliationResolver.for_rows([csv_data], terms=())
+        return self.resolver
 
-                students = StudentProfile.objects.filter(
-                    person__first_name__icontains=first_name, person__last_name__icontains=last_name
-                ).select_related("person")
-
-                if students.exists():
-                    return students.first()
-
-            return None
-
-        except Exception as e:
-            logger.error(f"Error finding student {student_name}: {e}")
-            return None
+    def _find_student(self, csv_data: CSVPaymentData) -> StudentProfile | None:
+        """Find the row's student by ID, exact name or fuzzy name match."""
+        return self._get_resolver(csv_data).resolve_student(csv_data.student_id, csv_data.student_name)
 
     def _find_term(self, term_id: str) -> Term | None:
-        """Find term by ID with fallback strategies."""
-        try:
-            # Try exact match
-            if hasattr(Term.objects.model, "code"):
-                term = Term.objects.filter(code=term_id).first()
-                if term:
-                    return term
-
-            # Try description match
-            if hasattr(Term.objects.model, "description"):
-                term = Term.objects.filter(description__icontains=term_id).first()
-                if term:
-                    return term
-
-            # Try ID match if numeric
-            try:
-                term_pk = int(term_id)
-                return Term.objects.filter(pk=term_pk).first()
-            except ValueError:
-                pass
-
-            return None
-
-        except Exception as e:
-            logger.error(f"Error finding term {term_id}: {e}")
-            return None
+        """Find term by code, description or ID."""
+        if self.resolver is None:
+            return ReconciliationResolver.find_term(term_id)
+        return self.resolver.resolve_term(term_id)
 
     def _find_enrollments(self, student: StudentProfile, term: Term) -> list[ClassHeaderEnrollment]:
         """Find enrollments for student in term."""
-        try:
+        if self.resolver is None:
             return list(
                 ClassHeaderEnrollment.objects.filter(
-                    student=student, class_header__term=term, status__in=["ENROLLED", "COMPLETED", "AUDIT"]
+                    student=student, class_header__term=term, status__in=ENROLLMENT_STATUSES
                 ).select_related("class_header__course")
             )
-
-        except Exception as e:
-            logger.error(f"Error finding enrollments for {student} in {term}: {e}")
-            return []
+        return self.resolver.resolve_enrollments(student, term)
 
     def _create_error_status(
         self, csv_data: CSVPaymentData, batch: ReconciliationBatch, errors: list[ReconciliationError]
@@ -778,12 +768,6 @@ class ComprehensiveReconciliationService:
             # Create a placeholder payment for tracking
             # We need this for the reconciliation status
 
-            # Try to find student and term for better tracking
-            # Try to find student and term for better tracking
-            # These are intentionally not used but help with debugging
-            _ = self._find_student(csv_data.student_name)
-            _ = self._find_term(csv_data.term_id)
-
             # For unprocessable records, we'll create a minimal tracking record
             # This is primarily for error tracking and batch completeness
 
@@ -793,7 +777,7 @@ class ComprehensiveReconciliationService:
                     "student_name": csv_data.student_name,
                     "term_id": csv_data.term_id,
                     "amount": str(csv_data.amount),
-                    "payment_date": csv_data.payment_date.isoformat(),  # type: ignore[attr-defined]
+                    "payment_date": csv_data.payment_date.isoformat(),
                     "notes": csv_data.notes,
                 },
                 "errors": [
@@ -867,6 +851,7 @@ class ComprehensiveReconciliationService:
             variance_analysis = self._analyze_batch_variances(batch)
 
             summary = {
+                "student_match_methods": batch.results_summary.get("student_match_methods", {}),
                 "batch_info": {
                     "batch_id": batch.batch_id,
                     "batch_type": batch.batch_type,
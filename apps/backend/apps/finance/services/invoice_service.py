@@ -13,6 +13,7 @@ from django.db import IntegrityError, transaction
 from django.db.models import F
 from django.utils import timezone
 
+from apps.analytics.rollups import schedule_refresh
 from apps.common.utils import get_current_date
 from apps.finance.models import (
     FeePricing,
@@ -20,6 +21,7 @@ from apps.finance.models import (
     Invoice,
     InvoiceLineItem,
     Payment,
+    StudentBalance,
 )
 
 from .separated_pricing_service import (
@@ -436,4 +438,9 @@ class InvoiceService:
             invoice.status = new_status
             invoice.refresh_from_db(fields=["version"])
 
+        # Paid amounts are changed with queryset updates, which skip the
+        # invoice save hooks that maintain the balance summary and rollups
+        StudentBalance.refresh_for_students([invoice.student_id])
+        schedule_refresh("receivables", invoice.term_id)
+
         return invoice
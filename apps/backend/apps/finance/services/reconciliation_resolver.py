@@ -0,0 +1,226 @@
+"""Per-run student, term and enrollment resolution for reconciliation imports.
+
+A reconciliation run resolves every CSV row to a student, a term and the
+student's enrollments in that term. Instead of querying row by row,
+``ReconciliationResolver.for_rows`` preloads everything the batch can refer
+to in a few queries:
+
+- students by numeric student ID;
+- students by normalized name, via the ``PersonMatchKey`` name keys;
+- all terms (a small table) by code, description and primary key;
+- enrollments of the resolved students in the resolved terms.
+
+Rows whose student is still unresolved are sent together to
+``fuzzy_match_names``, which compares them only against students sharing a
+phonetic name key. Every row records how its student was found; the counts
+are reported in the batch results summary.
+"""
+
+import logging
+from collections import Counter, defaultdict
+from collections.abc import Hashable, Iterable
+from difflib import SequenceMatcher
+from typing import Any
+
+from apps.curriculum.models import Term
+from apps.enrollment.models import ClassHeaderEnrollment
+from apps.people.match_keys import KEY_NAME, KEY_PHONETIC, name_key, name_words, soundex
+from apps.people.models import PersonMatchKey, StudentProfile
+
+logger = logging.getLogger(__name__)
+
+ENROLLMENT_STATUSES = ("ENROLLED", "COMPLETED", "AUDIT")
+FUZZY_MATCH_THRESHOLD = 0.85
+
+MATCH_STUDENT_ID = "student_id"
+MATCH_EXACT_NAME = "exact_name"
+MATCH_FUZZY_NAME = "fuzzy_name"
+MATCH_AMBIGUOUS = "ambiguous"
+MATCH_UNMATCHED = "unmatched"
+
+
+def fuzzy_match_names(
+    names: dict[Hashable, str],
+    candidates: dict[int, str],
+    threshold: float = FUZZY_MATCH_THRESHOLD,
+) -> dict[Hashable, int]:
+    """Match names to candidate IDs by similarity of their normalized names.
+
+    Each name is compared only with candidates sharing a Soundex code of at
+    least one name word. A name matches the single best candidate scoring at
+    least ``threshold``; names whose best score is shared by several
+    candidates are left unmatched.
+    """
+    by_code: dict[str, set[int]] = defaultdict(set)
+    candidate_keys = {}
+    for candidate_id, candidate_name in candidates.items():
+        candidate_keys[candidate_id] = name_key(candidate_name)
+        for code in filter(None, map(soundex, name_words(candidate_name))):
+            by_code[code].add(candidate_id)
+
+    matches = {}
+    for key, name in names.items():
+        normalized = name_key(name)
+        pool = set().union(*(by_code.get(code, set()) for code in map(soundex, name_words(name))))
+        scores = sorted(
+            (
+                (SequenceMatcher(None, normalized, candidate_keys[candidate_id]).ratio(), candidate_id)
+                for candidate_id in pool
+            ),
+            reverse=True,
+        )
+        if scores and scores[0][0] >= threshold and (len(scores) == 1 or scores[1][0] < scores[0][0]):
+            matches[key] = scores[0][1]
+    return matches
+
+
+def parse_student_id(value: str | None) -> int | None:
+    """Numeric student ID from a CSV value such as ``"01234"``."""
+    value = (value or "").strip()
+    return int(value) if value.isdigit() else None
+
+
+class ReconciliationResolver:
+    """In-memory lookups for one reconciliation run."""
+
+    def __init__(self, terms: Iterable[Term] = ()) -> None:
+        self.students_by_id: dict[int, StudentProfile] = {}
+        self.students_by_name: dict[str, list[StudentProfile]] = defaultdict(list)
+        self.fuzzy_students: dict[str, StudentProfile] = {}
+        self.terms = list(terms)
+        self.terms_by_code = {term.code: term for term in self.terms}
+        self.terms_by_pk = {term.pk: term for term in self.terms}
+        self.enrollments: dict[tuple[int, int], list[ClassHeaderEnrollment]] = defaultdict(list)
+        self.match_methods: Counter[str] = Counter()
+        self._term_cache: dict[str, Term | None] = {}
+
+    @classmethod
+    def for_rows(cls, rows: Iterable[Any], terms: Iterable[Term] | None = None) -> "ReconciliationResolver":
+        """Preload students, terms and enrollments referenced by CSV rows.
+
+        Rows need ``student_id``, ``student_name`` and ``term_id`` attributes.
+        All terms are loaded unless ``terms`` is given.
+        """
+        rows = list(rows)
+        resolver = cls(Term.objects.all() if terms is None else terms)
+
+        student_ids = {parse_student_id(row.student_id) for row in rows} - {None}
+        for student in StudentProfile.objects.filter(student_id__in=student_ids).select_related("person"):
+            resolver.students_by_id[student.student_id] = student
+
+        names = {name_key(row.student_name) for row in rows if row.student_name} - {""}
+        person_ids = PersonMatchKey.objects.filter(kind=KEY_NAME, value__in=names).values("person_id")
+        for student in StudentProfile.objects.filter(person_id__in=person_ids).select_related("person"):
+            resolver.students_by_name[name_key(str(student.person))].append(student)
+
+        resolver._match_unresolved_names(rows)
+        resolver._load_enrollments(rows)
+        return resolver
+
+    def _match_unresolved_names(self, rows: list[Any]) -> None:
+        """Fuzzy-match, in bulk, the names of rows no exact lookup resolves."""
+        unresolved = {
+            row.student_name
+            for row in rows
+            if row.student_name
+            and parse_student_id(row.student_id) not in self.students_by_id
+            and name_key(row.student_name) not in self.students_by_name
+        }
+        if not unresolved:
+            return
+
+        codes = {code for name in unresolved for code in map(soundex, name_words(name)) if code}
+        person_ids = PersonMatchKey.objects.filter(kind=KEY_PHONETIC, value__in=codes).values("person_id")
+        students = {
+            student.pk: student
+            for student in StudentProfile.objects.filter(person_id__in=person_ids).select_related("person")
+        }
+        matches = fuzzy_match_names(
+            {name: name for name in unresolved},
+            {pk: str(student.person) for pk, student in students.items()},
+        )
+        self.fuzzy_students = {name: students[pk] for name, pk in matches.items()}
+        logger.info("Fuzzy-matched %d of %d unresolved student names", len(matches), len(unresolved))
+
+    def _load_enrollments(self, rows: list[Any]) -> None:
+        student_pks = set()
+        term_pks = set()
+        for row in rows:
+            student, _method = self._lookup_student(row.student_id, row.student_name)
+            term = self.resolve_term(row.term_id)
+            if student and term:
+                student_pks.add(student.pk)
+                term_pks.add(term.pk)
+        if not student_pks:
+            return
+
+        enrollments = ClassHeaderEnrollment.objects.filter(
+            student_id__in=student_pks,
+            class_header__term_id__in=term_pks,
+            status__in=ENROLLMENT_STATUSES,
+        ).select_related("class_header__course")
+        for enrollment in enrollments:
+            self.enrollments[(enrollment.student_id, enrollment.class_header.term_id)].append(enrollment)
+
+    def _lookup_student(self, student_id: str, student_name: str) -> tuple[StudentProfile | None, str]:
+        student = self.students_by_id.get(parse_student_id(student_id))
+        if student:
+            return student, MATCH_STUDENT_ID
+
+        same_name = self.students_by_name.get(name_key(student_name), [])
+        if len(same_name) == 1:
+            return same_name[0], MATCH_EXACT_NAME
+        if len(same_name) > 1:
+            return None, MATCH_AMBIGUOUS
+
+        student = self.fuzzy_students.get(student_name)
+        if student:
+            return student, MATCH_FUZZY_NAME
+        return None, MATCH_UNMATCHED
+
+    def resolve_student(self, student_id: str, student_name: str = "") -> StudentProfile | None:
+        """Resolve a row's student and count the method that found it.
+
+        Tries the student ID, then a unique exact normalized name, then the
+        bulk fuzzy match. Names shared by several students are not resolved.
+        """
+        student, method = self._lookup_student(student_id, student_name)
+        self.match_methods[method] += 1
+        return student
+
+    @staticmethod
+    def find_term(term_id: str) -> Term | None:
+        """Look up a single term by code, then description, then primary key.
+
+        Used outside a run; resolves with one indexed query when ``term_id``
+        is a term code.
+        """
+        term_id = (term_id or "").strip()
+        if not term_id:
+            return None
+        term = Term.objects.filter(code=term_id).first()
+        if term is None:
+            term = Term.objects.filter(description__icontains=term_id).first()
+        if term is None and term_id.isdigit():
+            term = Term.objects.filter(pk=int(term_id)).first()
+        return term
+
+    def resolve_term(self, term_id: str) -> Term | None:
+        """Resolve a term by code, then description, then primary key."""
+        term_id = (term_id or "").strip()
+        if term_id not in self._term_cache:
+            term = self.terms_by_code.get(term_id)
+            if term is None and term_id:
+                term = next((term for term in self.terms if term_id.lower() in term.description.lower()), None)
+            if term is None and term_id.isdigit():
+                term = self.terms_by_pk.get(int(term_id))
+            self._term_cache[term_id] = term
+        return self._term_cache[term_id]
+
+    def resolve_enrollments(self, student: StudentProfile, term: Term) -> list[ClassHeaderEnrollment]:
+        """Preloaded enrollments of a student in a term."""
+        return self.enrollments.get((student.pk, term.pk), [])
+
+    def match_report(self) -> dict[str, int]:
+        """Number of rows resolved by each student match method."""
+        return dict(self.match_methods)
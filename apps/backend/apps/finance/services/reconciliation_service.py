@@ -7,6 +7,7 @@ validation, monitoring, and error reporting for legacy data migration.
 from __future__ import annotations
 
 import logging
+from collections import defaultdict
 from datetime import datetime, timedelta
 from decimal import Decimal
 from typing import TYPE_CHECKING, Any
@@ -23,13 +24,33 @@ from apps.finance.models import (
     ReconciliationBatch,
     ReconciliationStatus,
 )
+from apps.finance.services.separated_pricing_service import TermPriceTable
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from apps.curriculum.models import Term
     from apps.people.models import StudentProfile
 
 logger = logging.getLogger(__name__)
 
+MATCHABLE_ENROLLMENT_STATUSES = ("ENROLLED", "COMPLETED")
+
+# Fields written when a reconciliation outcome is applied to an existing status
+STATUS_RESULT_FIELDS = [
+    "status",
+    "confidence_score",
+    "confidence_level",
+    "variance_amount",
+    "variance_percentage",
+    "pricing_method_applied",
+    "reconciled_date",
+    "notes",
+    "error_category",
+    "error_details",
+    "updated_at",
+]
+
 
 class ReconciliationMatchResult:
     """Container for reconciliation match results."""
@@ -76,65 +97,209 @@ class ReconciliationService:
             return status  # Already reconciled
 
         try:
-            # Tier 1: Perfect matches
-            if result := self.try_perfect_match(payment):
-                return self._mark_reconciled(
-                    status,
-                    result,
-                    confidence="HIGH",
-                    status_value=ReconciliationStatus.Status.FULLY_RECONCILED,
-                )
-
-            # Tier 2: Good matches with minor variances
-            if result := self.try_good_match(payment):
-                if result.variance_percentage and result.variance_percentage <= 5:  # Within 5% tolerance
-                    return self._mark_reconciled(
-                        status,
-                        result,
-                        confidence="HIGH",
-                        status_value=ReconciliationStatus.Status.AUTO_ALLOCATED,
-                    )
-
-            # Tier 3: Pattern-based allocation
-            if result := self.try_pattern_match(payment):
-                confidence = self._calculate_confidence(result)
-                return self._mark_reconciled(
-                    status,
-                    result,
-                    confidence=confidence,
-                    status_value=ReconciliationStatus.Status.AUTO_ALLOCATED,
-                )
+            enrollments = self._find_enrollments(payment)
+            expected_amount = (
+                self._calculate_expected_amount(enrollments, payment.invoice.term)  # type: ignore[attr-defined]
+                if enrollments
+                else None
+            )
+            tier = self._evaluate_tiers(payment, enrollments, expected_amount)
 
             # Tier 4: Mark for manual review
-            return self._mark_for_review(status, "No automated match found")
+            if tier is None:
+                return self._mark_for_review(status, "No automated match found")
+
+            result, confidence, status_value = tier
+            return self._mark_reconciled(status, result, confidence=confidence, status_value=status_value)
 
         except Exception as e:
             logger.error(f"Error reconciling payment {payment.payment_reference}: {e}")
             return self._mark_error(status, str(e))
 
+    def reconcile_batch(
+        self, payments: Iterable[Payment], batch: ReconciliationBatch | None = None
+    ) -> list[ReconciliationStatus]:
+        """Apply tiered reconciliation logic to many payments at once.
+
+        Enrollment sets for every payment's student and term are loaded in one
+        query and expected amounts come from one ``TermPriceTable`` per term,
+        so tiers 1 and 2 cost no queries per payment. Only payments that fall
+        through to pattern matching are looked at individually. Statuses,
+        matched enrollments and adjustments are written in bulk.
+
+        Payments should have ``invoice__student__person`` and ``invoice__term``
+        selected.
+        """
+        payments = list(payments)
+        statuses = {status.payment_id: status for status in ReconciliationStatus.objects.filter(payment__in=payments)}
+        pending = [
+            payment
+            for payment in payments
+            if payment.id not in statuses
+            or statuses[payment.id].status != ReconciliationStatus.Status.FULLY_RECONCILED
+        ]
+
+        enrollment_sets = self._load_enrollment_sets(pending)
+        price_tables = self._load_price_tables(pending, enrollment_sets)
+
+        new_statuses = []
+        results = {}
+        for payment in pending:
+            status = statuses.get(payment.id)
+            if status is None:
+                status = ReconciliationStatus(
+                    payment=payment,
+                    reconciliation_batch=batch,
+                    status=ReconciliationStatus.Status.UNMATCHED,
+                )
+                statuses[payment.id] = status
+                new_statuses.append(status)
+
+            try:
+                invoice = payment.invoice
+                enrollments = enrollment_sets.get((invoice.student_id, invoice.term_id), [])  # type: ignore[union-attr]
+                expected_amount = (
+                    price_tables[invoice.term_id].total_cost(invoice.student, enrollments)  # type: ignore[union-attr]
+                    if enrollments
+                    else None
+                )
+                tier = self._evaluate_tiers(payment, enrollments, expected_amount)
+            except Exception as e:
+                logger.error(f"Error reconciling payment {payment.payment_reference}: {e}")
+                self._apply_error(status, str(e))
+                continue
+
+            if tier is None:
+                self._apply_review(status, "No automated match found")
+                continue
+
+            result, confidence, status_value = tier
+            self._apply_result(status, result, confidence, status_value)
+            results[payment.id] = result
+
+        with transaction.atomic():
+            ReconciliationStatus.objects.bulk_create(new_statuses)
+            new_ids = {status.payment_id for status in new_statuses}
+            ReconciliationStatus.objects.bulk_update(
+                [statuses[payment.id] for payment in pending if payment.id not in new_ids],
+                STATUS_RESULT_FIELDS,
+            )
+
+            matched = ReconciliationStatus.matched_enrollments.through
+            matched.objects.filter(reconciliationstatus_id__in=[statuses[pid].pk for pid in results]).delete()
+            matched.objects.bulk_create(
+                matched(reconciliationstatus_id=statuses[payment_id].pk, classheaderenrollment_id=enrollment.pk)
+                for payment_id, result in results.items()
+                for enrollment in result.enrollments
+            )
+
+            with_variance = [
+                (statuses[payment_id], result)
+                for payment_id, result in results.items()
+                if result.variance_amount > Decimal("0")
+            ]
+            if with_variance:
+                recon_account = self._get_reconciliation_account()
+                threshold = MaterialityThreshold.get_threshold(
+                    MaterialityThreshold.ThresholdContext.INDIVIDUAL_PAYMENT
+                )
+                ReconciliationAdjustment.objects.bulk_create(
+                    self._build_adjustment(status, result, recon_account, threshold)
+                    for status, result in with_variance
+                )
+
+        return [statuses[payment.id] for payment in payments]
+
+    def _load_enrollment_sets(self, payments: list[Payment]) -> dict[tuple[int, int], list[ClassHeaderEnrollment]]:
+        """Matchable enrollments per invoice student and term, in one query."""
+        keys = {
+            (payment.invoice.student_id, payment.invoice.term_id)  # type: ignore[attr-defined]
+            for payment in payments
+            if payment.invoice_id
+        }
+        enrollment_sets: dict[tuple[int, int], list[ClassHeaderEnrollment]] = defaultdict(list)
+        if not keys:
+            return enrollment_sets
+
+        enrollments = ClassHeaderEnrollment.objects.filter(
+            student_id__in={student_id for student_id, _term_id in keys},
+            class_header__term_id__in={term_id for _student_id, term_id in keys},
+            status__in=MATCHABLE_ENROLLMENT_STATUSES,
+        ).select_related("class_header__course", "student__person")
+        for enrollment in enrollments:
+            key = (enrollment.student_id, enrollment.class_header.term_id)
+            if key in keys:
+                enrollment_sets[key].append(enrollment)
+        return enrollment_sets
+
+    def _load_price_tables(
+        self,
+        payments: list[Payment],
+        enrollment_sets: dict[tuple[int, int], list[ClassHeaderEnrollment]],
+    ) -> dict[int, TermPriceTable]:
+        """One price table per term referenced by the payments' invoices."""
+        terms = {payment.invoice.term_id: payment.invoice.term for payment in payments if payment.invoice_id}  # type: ignore[attr-defined]
+        by_term: dict[int, list[ClassHeaderEnrollment]] = defaultdict(list)
+        for (_student_id, term_id), enrollments in enrollment_sets.items():
+            by_term[term_id].extend(enrollments)
+        return {term_id: TermPriceTable.load(term, by_term[term_id]) for term_id, term in terms.items()}
+
+    def _evaluate_tiers(
+        self,
+        payment: Payment,
+        enrollments: list[ClassHeaderEnrollment],
+        expected_amount: Decimal | None,
+    ) -> tuple[ReconciliationMatchResult, str, str] | None:
+        """Run tiers 1-3 for a payment.
+
+        Returns:
+            Tuple of (result, confidence, status) for the first tier that
+            matches, or None if the payment needs manual review
+        """
+        if enrollments and expected_amount is not None:
+            # Tier 1: Perfect matches
+            if result := self._perfect_match_result(payment, enrollments, expected_amount):
+                return result, "HIGH", ReconciliationStatus.Status.FULLY_RECONCILED
+
+            # Tier 2: Good matches with minor variances
+            result = self._good_match_result(payment, enrollments, expected_amount)
+            if result and result.variance_percentage and result.variance_percentage <= 5:  # Within 5% tolerance
+                return result, "HIGH", ReconciliationStatus.Status.AUTO_ALLOCATED
+
+        # Tier 3: Pattern-based allocation
+        if result := self.try_pattern_match(payment):
+            return result, self._calculate_confidence(result), ReconciliationStatus.Status.AUTO_ALLOCATED
+
+        return None
+
     def try_perfect_match(self, payment: Payment) -> ReconciliationMatchResult | None:
         """Attempt perfect match based on exact amount and student enrollments."""
+        enrollments = self._find_enrollments(payment)
+        if not enrollments:
+            return None
 
-        # Find enrollments for the same student and term
-        enrollments = ClassHeaderEnrollment.objects.filter(
-            student__user_id=payment.invoice.student.user,  # type: ignore[attr-defined]
-            class_header__term=payment.invoice.term,  # type: ignore[attr-defined]
-            status__in=["ENROLLED", "COMPLETED"],
-        )
+        expected_amount = self._calculate_expected_amount(enrollments, payment.invoice.term)  # type: ignore[attr-defined]
+        return self._perfect_match_result(payment, enrollments, expected_amount)
 
-        if not enrollments.exists():
+    def try_good_match(self, payment: Payment) -> ReconciliationMatchResult | None:
+        """Attempt good match with allowable variance."""
+        enrollments = self._find_enrollments(payment)
+        if not enrollments:
             return None
 
-        # Calculate expected amount based on pricing
-        expected_amount = self._calculate_expected_amount(list(enrollments.all()), payment.invoice.term)  # type: ignore[attr-defined]
+        expected_amount = self._calculate_expected_amount(enrollments, payment.invoice.term)  # type: ignore[attr-defined]
+        return self._good_match_result(payment, enrollments, expected_amount)
 
-        # Check for perfect match (within $1 tolerance for rounding)
+    def _perfect_match_result(
+        self, payment: Payment, enrollments: list[ClassHeaderEnrollment], expected_amount: Decimal
+    ) -> ReconciliationMatchResult | None:
+        """Perfect match if the payment is within $1 of the expected amount."""
         variance = abs(payment.amount - expected_amount)
         if variance <= Decimal("1.00"):
             variance_percentage = (variance / payment.amount * 100) if payment.amount > 0 else Decimal("0")
 
             return ReconciliationMatchResult(
-                enrollments=list(enrollments),
+                enrollments=enrollments,
                 confidence_score=Decimal("100"),
                 variance_amount=variance,
                 variance_percentage=variance_percentage,
@@ -144,23 +309,10 @@ class ReconciliationService:
 
         return None
 
-    def try_good_match(self, payment: Payment) -> ReconciliationMatchResult | None:
-        """Attempt good match with allowable variance."""
-
-        # Find enrollments for the same student and term
-        enrollments = ClassHeaderEnrollment.objects.filter(
-            student__user_id=payment.invoice.student.user,  # type: ignore[attr-defined]
-            class_header__term=payment.invoice.term,  # type: ignore[attr-defined]
-            status__in=["ENROLLED", "COMPLETED"],
-        )
-
-        if not enrollments.exists():
-            return None
-
-        # Calculate expected amount
-        expected_amount = self._calculate_expected_amount(list(enrollments.all()), payment.invoice.term)  # type: ignore[attr-defined]
-
-        # Check variance within acceptable range (≤10%)
+    def _good_match_result(
+        self, payment: Payment, enrollments: list[ClassHeaderEnrollment], expected_amount: Decimal
+    ) -> ReconciliationMatchResult | None:
+        """Good match if the payment is within 10% of the expected amount."""
         variance = abs(payment.amount - expected_amount)
         variance_percentage = (variance / payment.amount * 100) if payment.amount > 0 else Decimal("0")
 
@@ -168,7 +320,7 @@ class ReconciliationService:
             confidence_score = max(Decimal("60"), Decimal("100") - variance_percentage * 2)
 
             return ReconciliationMatchResult(
-                enrollments=list(enrollments),
+                enrollments=enrollments,
                 confidence_score=confidence_score,
                 variance_amount=variance,
                 variance_percentage=variance_percentage,
@@ -178,6 +330,16 @@ class ReconciliationService:
 
         return None
 
+    def _find_enrollments(self, payment: Payment) -> list[ClassHeaderEnrollment]:
+        """Matchable enrollments of the invoice's student in the invoice's term."""
+        return list(
+            ClassHeaderEnrollment.objects.filter(
+                student=payment.invoice.student,  # type: ignore[attr-defined]
+                class_header__term=payment.invoice.term,  # type: ignore[attr-defined]
+                status__in=MATCHABLE_ENROLLMENT_STATUSES,
+            ).select_related("class_header__course", "student__person")
+        )
+
     def try_pattern_match(self, payment: Payment) -> ReconciliationMatchResult | None:
         """Attempt pattern-based matching using historical data."""
 
@@ -216,16 +378,18 @@ class ReconciliationService:
 
         return None
 
-    def _calculate_expected_amount(self, enrollments: list[ClassHeaderEnrollment], term: Term) -> Decimal:
-        """Calculate expected payment amount based on enrollments."""
-        total = Decimal("0")
-
-        for _enrollment in enrollments:
-            # Use basic pricing calculation - this would be enhanced with actual pricing service
-            # For now, use a simple default amount per course
-            total += Decimal("500.00")  # Placeholder amount
+    def _calculate_expected_amount(
+        self,
+        enrollments: list[ClassHeaderEnrollment],
+        term: Term,
+        price_table: TermPriceTable | None = None,
+    ) -> Decimal:
+        """Calculate expected payment amount from SIS pricing for the enrollments."""
+        if not enrollments:
+            return Decimal("0")
 
-        return total
+        price_table = price_table or TermPriceTable.load(term, enrollments)
+        return price_table.total_cost(enrollments[0].student, enrollments)
 
     def _find_common_enrollment_patterns(
         self, student: StudentProfile, amount: Decimal
@@ -252,6 +416,46 @@ class ReconciliationService:
         else:
             return "NONE"
 
+    def _apply_result(
+        self,
+        status: ReconciliationStatus,
+        result: ReconciliationMatchResult,
+        confidence: str,
+        status_value: str,
+    ) -> None:
+        """Copy a match result onto a status without saving it."""
+        now = timezone.now()
+        status.status = status_value
+        status.confidence_score = result.confidence_score
+        status.confidence_level = confidence
+        status.variance_amount = result.variance_amount
+        status.variance_percentage = result.variance_percentage
+        status.pricing_method_applied = result.pricing_method
+        status.reconciled_date = now
+        status.notes = result.match_reason
+        status.updated_at = now
+
+    def _apply_review(self, status: ReconciliationStatus, reason: str) -> None:
+        """Flag a status for manual review without saving it."""
+        status.status = ReconciliationStatus.Status.PENDING_REVIEW
+        status.confidence_level = ReconciliationStatus.ConfidenceLevel.NONE
+        status.confidence_score = Decimal("0")
+        status.notes = reason
+        status.updated_at = timezone.now()
+
+    def _apply_error(self, status: ReconciliationStatus, error_message: str) -> None:
+        """Record a processing error on a status without saving it."""
+        now = timezone.now()
+        status.status = ReconciliationStatus.Status.EXCEPTION_ERROR
+        status.confidence_level = ReconciliationStatus.ConfidenceLevel.NONE
+        status.confidence_score = Decimal("0")
+        status.error_category = "PROCESSING_ERROR"
+        status.error_details = {
+            "error": error_message,
+            "timestamp": now.isoformat(),
+        }
+        status.updated_at = now
+
     def _mark_reconciled(
         self,
         status: ReconciliationStatus,
@@ -262,14 +466,7 @@ class ReconciliationService:
         """Mark payment as reconciled with given result."""
 
         with transaction.atomic():
-            status.status = status_value
-            status.confidence_score = result.confidence_score
-            status.confidence_level = confidence
-            status.variance_amount = result.variance_amount
-            status.variance_percentage = result.variance_percentage
-            status.pricing_method_applied = result.pricing_method
-            status.reconciled_date = timezone.now()
-            status.notes = result.match_reason
+            self._apply_result(status, result, confidence, status_value)
             status.save()
 
             # Set matched enrollments
@@ -284,10 +481,7 @@ class ReconciliationService:
     def _mark_for_review(self, status: ReconciliationStatus, reason: str) -> ReconciliationStatus:
         """Mark payment for manual review."""
 
-        status.status = ReconciliationStatus.Status.PENDING_REVIEW
-        status.confidence_level = ReconciliationStatus.ConfidenceLevel.NONE
-        status.confidence_score = Decimal("0")
-        status.notes = reason
+        self._apply_review(status, reason)
         status.save()
 
         return status
@@ -295,22 +489,13 @@ class ReconciliationService:
     def _mark_error(self, status: ReconciliationStatus, error_message: str) -> ReconciliationStatus:
         """Mark payment as having an error."""
 
-        status.status = ReconciliationStatus.Status.EXCEPTION_ERROR
-        status.confidence_level = ReconciliationStatus.ConfidenceLevel.NONE
-        status.confidence_score = Decimal("0")
-        status.error_category = "PROCESSING_ERROR"
-        status.error_details = {
-            "error": error_message,
-            "timestamp": timezone.now().isoformat(),
-        }
+        self._apply_error(status, error_message)
         status.save()
 
         return status
 
-    def _create_adjustment(self, status: ReconciliationStatus, result: ReconciliationMatchResult):
-        """Create reconciliation adjustment for variance."""
-
-        # Get reconciliation GL account (create a default one if needed)
+    def _get_reconciliation_account(self):
+        """Get reconciliation GL account (create a default one if needed)."""
         from apps.finance.models import GLAccount
 
         recon_account, _ = GLAccount.objects.get_or_create(
@@ -322,6 +507,21 @@ class ReconciliationService:
                 "description": "Temporary account for reconciliation adjustments",
             },
         )
+        return recon_account
+
+    def _create_adjustment(self, status: ReconciliationStatus, result: ReconciliationMatchResult):
+        """Create reconciliation adjustment for variance."""
+        threshold = MaterialityThreshold.get_threshold(MaterialityThreshold.ThresholdContext.INDIVIDUAL_PAYMENT)
+        self._build_adjustment(status, result, self._get_reconciliation_account(), threshold).save()
+
+    def _build_adjustment(
+        self,
+        status: ReconciliationStatus,
+        result: ReconciliationMatchResult,
+        recon_account,
+        threshold: MaterialityThreshold | None,
+    ) -> ReconciliationAdjustment:
+        """Build an unsaved reconciliation adjustment for a status's variance."""
 
         # Determine adjustment type based on variance
         if result.variance_percentage and result.variance_percentage <= 5:
@@ -330,10 +530,9 @@ class ReconciliationService:
             adjustment_type = ReconciliationAdjustment.AdjustmentType.CLERICAL_ERROR
 
         # Check if adjustment requires approval based on materiality
-        threshold = MaterialityThreshold.get_threshold(MaterialityThreshold.ThresholdContext.INDIVIDUAL_PAYMENT)
-        requires_approval = threshold and abs(result.variance_amount) >= threshold.absolute_threshold
+        requires_approval = bool(threshold and abs(result.variance_amount) >= threshold.absolute_threshold)
 
-        ReconciliationAdjustment.objects.create(
+        return ReconciliationAdjustment(
             gl_account=recon_account,
             adjustment_type=adjustment_type,
             description=f"Reconciliation variance: {result.match_reason}",
@@ -8,14 +8,16 @@ from datetime import date, datetime, timedelta
 from decimal import Decimal
 from typing import Any
 
-from django.db.models import Count, Q, Sum
+from django.db.models import Count, Prefetch, Q, Sum
 
 from apps.common.utils import get_current_date
 from apps.finance.models import (
     FinancialTransaction,
     Invoice,
     Payment,
+    StudentBalance,
 )
+from apps.finance.models.balances import open_invoices_q
 
 
 class FinancialReportService:
@@ -172,8 +174,8 @@ class FinancialReportService:
 
         # Get all transactions for the month
         transactions = FinancialTransaction.objects.filter(
-            transaction_date__gte=start_date,
-            transaction_date__lte=end_date,
+            transaction_date__date__gte=start_date,
+            transaction_date__date__lte=end_date,
         )
 
         # Revenue (payments received)
@@ -239,49 +241,52 @@ class FinancialReportService:
         Returns:
             Dictionary with outstanding balance information
         """
-        outstanding_invoices = Invoice.objects.filter(
-            Q(status=Invoice.InvoiceStatus.SENT)
-            | Q(status=Invoice.InvoiceStatus.PARTIALLY_PAID)
-            | Q(status=Invoice.InvoiceStatus.OVERDUE),
-        ).select_related("student__person")
-
-        # Group by student
-        student_balances: dict[int, dict[str, Any]] = {}
-        for invoice in outstanding_invoices:
-            student_key = invoice.student.id
-            if student_key not in student_balances:
-                student_balances[student_key] = {
-                    "student_id": invoice.student.student_id,
-                    "student_name": str(invoice.student),
-                    "invoices": [],
-                    "total_outstanding": Decimal("0.00"),
-                }
-
-            amount_due = invoice.amount_due
-            student_balances[student_key]["invoices"].append(
+        # Students ordered on the indexed balance summary, with their open
+        # invoices prefetched in one query
+        summaries = (
+            StudentBalance.objects.filter(balance__gt=0)
+            .select_related("student__person")
+            .prefetch_related(
+                Prefetch(
+                    "student__invoices",
+                    queryset=Invoice.objects.filter(open_invoices_q()).order_by("issue_date"),
+                    to_attr="open_invoices",
+                )
+            )
+            .order_by("-balance")
+        )
+
+        student_list: list[dict[str, Any]] = []
+        for summary in summaries:
+            student = summary.student
+            student_list.append(
                 {
-                    "invoice_number": invoice.invoice_number,
-                    "issue_date": invoice.issue_date,
-                    "due_date": invoice.due_date,
-                    "total_amount": invoice.total_amount,
-                    "paid_amount": invoice.paid_amount,
-                    "amount_due": amount_due,
-                    "status": invoice.status,
-                    "is_overdue": invoice.is_overdue,
+                    "student_id": student.student_id,
+                    "student_name": str(student),
+                    "invoices": [
+                        {
+                            "invoice_number": invoice.invoice_number,
+                            "issue_date": invoice.issue_date,
+                            "due_date": invoice.due_date,
+                            "total_amount": invoice.total_amount,
+                            "paid_amount": invoice.paid_amount,
+                            "amount_due": invoice.amount_due,
+                            "status": invoice.status,
+                            "is_overdue": invoice.is_overdue,
+                        }
+                        for invoice in student.open_invoices
+                    ],
+                    "total_outstanding": summary.balance,
+                    "oldest_invoice_date": summary.oldest_open_invoice_date,
                 },
             )
-            student_balances[student_key]["total_outstanding"] += amount_due
-
-        # Convert to list and sort by total outstanding
-        student_list = list(student_balances.values())
-        student_list.sort(key=lambda x: x["total_outstanding"], reverse=True)
 
         return {
             "report_date": get_current_date(),
             "summary": {
                 "total_students": len(student_list),
-                "total_outstanding": sum(s["total_outstanding"] for s in student_list),
-                "total_invoices": outstanding_invoices.count(),
+                "total_outstanding": sum((s["total_outstanding"] for s in student_list), Decimal("0.00")),
+                "total_invoices": sum(len(s["invoices"]) for s in student_list),
             },
             "students": student_list,
         }
@@ -6,6 +6,7 @@ against scholarship records and generates variance reports for audit purposes.
 """
 
 import logging
+from collections.abc import Iterable
 from datetime import date as datetime_date
 from decimal import Decimal
 
@@ -100,6 +101,12 @@ class ScholarshipReconciliationService(ReconciliationService):
             logger.error(f"Error reconciling payment {payment.payment_reference}: {e}")
             return self._mark_error(status, str(e))
 
+    def reconcile_batch(
+        self, payments: Iterable[Payment], batch: ReconciliationBatch | None = None
+    ) -> list[ReconciliationStatus]:
+        """Reconcile payments one at a time; the scholarship tier is not batched."""
+        return [self.reconcile_payment(payment, batch) for payment in payments]
+
     def try_scholarship_verification(self, payment: Payment) -> ReconciliationMatchResult | None:
         """Verify payment against active scholarship records."""
 
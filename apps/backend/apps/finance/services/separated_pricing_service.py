@@ -13,13 +13,14 @@ Key Business Rules Implemented:
 
 import logging
 import time
+from dataclasses import dataclass, field
 from datetime import date
 from decimal import ROUND_HALF_UP, Decimal
 from functools import wraps
 from typing import TYPE_CHECKING, Any, Optional, cast
 
 from django.core.exceptions import ValidationError
-from django.db.models import Q
+from django.db.models import Count, Q
 from django.utils import timezone
 
 from apps.common.utils import get_current_date
@@ -708,3 +709,136 @@ class PricingReportService:
             "total_amount": float(total_amount),
             "currency": Currency.USD,  # Note: USD default - multi-currency support via term price lists
         }
+
+
+def _active_pricing_by(queryset, pricing_date: date, key) -> dict:
+    """Pricing records active on a date, keeping the latest effective one per key."""
+    active: dict = {}
+    records = (
+        queryset.filter(effective_date__lte=pricing_date)
+        .filter(Q(end_date__isnull=True) | Q(end_date__gte=pricing_date))
+        .order_by("-effective_date")
+    )
+    for record in records:
+        active.setdefault(key(record), record)
+    return active
+
+
+@dataclass
+class TermPriceTable:
+    """Prices of one term, loaded once to price many enrollments in memory.
+
+    Applies the same rules as ``SeparatedPricingService.calculate_course_price``
+    and ``PricingReportService.calculate_total_cost`` (senior project, reading
+    class, fixed course and default cycle pricing, then mandatory fees) from
+    a handful of queries per term instead of several per enrollment.
+    """
+
+    term: "Term"
+    default_prices: dict[int, DefaultPricing] = field(default_factory=dict)
+    fixed_prices: dict[int, CourseFixedPricing] = field(default_factory=dict)
+    senior_project_course_ids: set[int] = field(default_factory=set)
+    senior_project_prices: dict[str, SeniorProjectPricing] = field(default_factory=dict)
+    senior_project_group_sizes: dict[tuple[int, int], int] = field(default_factory=dict)
+    reading_class_prices: dict[tuple[int, str], ReadingClassPricing] = field(default_factory=dict)
+    reading_class_sizes: dict[int, int] = field(default_factory=dict)
+    fees: list[FeePricing] = field(default_factory=list)
+
+    @classmethod
+    def load(cls, term: "Term", enrollments: list[ClassHeaderEnrollment]) -> "TermPriceTable":
+        """Load the prices the given enrollments of a term can need.
+
+        Enrollments should have ``class_header__course`` selected.
+        """
+        from apps.enrollment.models import SeniorProjectGroup
+        from apps.scheduling.models import ReadingClass
+
+        pricing_date = SeparatedPricingService.get_pricing_date(term)
+        today = get_current_date()
+        course_ids = {enrollment.class_header.course_id for enrollment in enrollments}
+        class_header_ids = {enrollment.class_header_id for enrollment in enrollments}
+
+        table = cls(
+            term=term,
+            default_prices=_active_pricing_by(DefaultPricing.objects.all(), pricing_date, lambda p: p.cycle_id),
+            fixed_prices=_active_pricing_by(
+                CourseFixedPricing.objects.filter(course_id__in=course_ids), pricing_date, lambda p: p.course_id
+            ),
+            senior_project_course_ids=set(
+                SeniorProjectCourse.objects.filter(course_id__in=course_ids, is_active=True).values_list(
+                    "course_id", flat=True
+                )
+            ),
+            fees=list(
+                FeePricing.objects.filter(effective_date__lte=today, is_mandatory=True).filter(
+                    Q(end_date__isnull=True) | Q(end_date__gte=today)
+                )
+            ),
+        )
+
+        if table.senior_project_course_ids:
+            table.senior_project_prices = _active_pricing_by(
+                SeniorProjectPricing.objects.all(), pricing_date, lambda p: p.tier
+            )
+            groups = SeniorProjectGroup.objects.filter(
+                term=term, course_id__in=table.senior_project_course_ids
+            ).prefetch_related("students")
+            for group in groups:
+                members = list(group.students.all())
+                for student in members:
+                    table.senior_project_group_sizes.setdefault((student.id, group.course_id), len(members))
+
+        reading_class_ids = set(
+            ReadingClass.objects.filter(class_header_id__in=class_header_ids).values_list("class_header_id", flat=True)
+        )
+        if reading_class_ids:
+            table.reading_class_prices = _active_pricing_by(
+                ReadingClassPricing.objects.all(), pricing_date, lambda p: (p.cycle_id, p.tier)
+            )
+            table.reading_class_sizes = dict.fromkeys(reading_class_ids, 0)
+            table.reading_class_sizes.update(
+                ClassHeaderEnrollment.objects.filter(
+                    class_header_id__in=reading_class_ids,
+                    status=ClassHeaderEnrollment.EnrollmentStatus.ENROLLED,
+                )
+                .order_by()
+                .values("class_header_id")
+                .annotate(count=Count("id"))
+                .values_list("class_header_id", "count")
+            )
+        return table
+
+    def course_price(self, enrollment: ClassHeaderEnrollment, is_foreign: bool) -> Decimal | None:
+        """Price of one enrollment, or ``None`` when no pricing applies."""
+        course = enrollment.class_header.course
+        try:
+            if course.id in self.senior_project_course_ids:
+                size = self.senior_project_group_sizes.get((enrollment.student_id, course.id), 1)
+                pricing = self.senior_project_prices.get(SeniorProjectPricingService._get_tier_for_size(size))
+                return pricing.get_individual_price(is_foreign) if pricing else None
+
+            if enrollment.class_header_id in self.reading_class_sizes:
+                tier = ReadingClassPricingService._get_tier_for_size(
+                    self.reading_class_sizes[enrollment.class_header_id]
+                )
+                pricing = self.reading_class_prices.get((course.cycle_id, tier))
+                return pricing.get_price_for_student(is_foreign) if pricing else None
+
+            pricing = self.fixed_prices.get(course.id) or self.default_prices.get(course.cycle_id)
+            return pricing.get_price_for_student(is_foreign) if pricing else None
+        except ValueError:
+            return None
+
+    def total_cost(self, student: StudentProfile, enrollments: list[ClassHeaderEnrollment]) -> Decimal:
+        """Expected charge for a student's enrollments: course prices plus mandatory fees."""
+        is_foreign = student.person.citizenship != "KH"
+        total = safe_decimal_add(*(self.course_price(enrollment, is_foreign) for enrollment in enrollments))
+
+        for fee in self.fees:
+            try:
+                amount = fee.get_amount_for_student(is_foreign)
+            except ValueError:
+                continue
+            quantity = len(enrollments) if fee.is_per_course and enrollments else 1
+            total = safe_decimal_add(total, amount * quantity)
+        return total
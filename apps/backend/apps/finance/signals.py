@@ -21,9 +21,10 @@ from django.db.models.signals import post_delete, post_save, pre_save
 from django.dispatch import Signal, receiver
 from django.utils import timezone
 
+from apps.analytics.rollups import schedule_refresh
 from apps.enrollment.models import ClassHeaderEnrollment
 
-from .models import FinancialTransaction, Invoice, InvoiceLineItem, Payment
+from .models import FinancialTransaction, Invoice, InvoiceLineItem, Payment, StudentBalance
 from .services import FinancialError, FinancialTransactionService, InvoiceService
 
 User = get_user_model()
@@ -34,6 +35,7 @@ class InvoiceLike(Protocol):
     id: int
     invoice_number: str
     student: Any
+    student_id: int
     currency: Any
     version: int
     tax_amount: Any
@@ -370,6 +372,9 @@ def recalculate_invoice_totals(
                 version=F("version") + 1,
             )
 
+        StudentBalance.refresh_for_students([invoice.student_id])
+        schedule_refresh("receivables", invoice.term_id)
+
         if created:
             logger.info(
                 "Invoice %s totals recalculated atomically: subtotal=%s, total=%s",
@@ -464,6 +469,9 @@ def recalculate_invoice_totals_on_delete(
                 version=F("version") + 1,
             )
 
+        StudentBalance.refresh_for_students([invoice.student_id])
+        schedule_refresh("receivables", invoice.term_id)
+
         logger.info(
             "Invoice %s totals recalculated after line item deletion: subtotal=%s, total=%s",
             invoice.invoice_number,
@@ -0,0 +1,85 @@
+"""
+Tests for denormalized student balance summaries.
+
+Verifies that invoice saves and payment status updates keep the summary in
+step with the student's open invoices, and that reconciliation repairs
+rows changed behind its back.
+"""
+
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from django.test import TestCase
+
+from apps.curriculum.models import Term
+from apps.finance.models import Invoice, StudentBalance
+from apps.finance.services.invoice_service import InvoiceService
+from apps.people.models import Person, StudentProfile
+
+
+@pytest.mark.django_db
+class TestStudentBalance(TestCase):
+    """Test maintaining and reconciling balance summaries."""
+
+    def setUp(self):
+        person = Person.objects.create(personal_name="Dara", family_name="Sok", date_of_birth="2000-01-01")
+        self.student = StudentProfile.objects.create(person=person, student_id=10001)
+        self.term = Term.objects.create(
+            code="SPRING25", term_type=Term.TermType.BACHELORS, start_date="2025-01-06", end_date="2025-05-30"
+        )
+
+    def create_invoice(self, number, total, status=Invoice.InvoiceStatus.SENT, issue_date=date(2025, 1, 10)):
+        return Invoice.objects.create(
+            invoice_number=number,
+            student=self.student,
+            term=self.term,
+            status=status,
+            issue_date=issue_date,
+            due_date=issue_date,
+            subtotal=total,
+            total_amount=total,
+        )
+
+    def summary(self):
+        return StudentBalance.objects.get(student=self.student)
+
+    def test_open_invoices_are_summarized_on_save(self):
+        self.create_invoice("INV-1", Decimal("100.00"), issue_date=date(2025, 1, 10))
+        self.create_invoice("INV-2", Decimal("50.00"), issue_date=date(2025, 2, 10))
+        self.create_invoice("INV-3", Decimal("70.00"), status=Invoice.InvoiceStatus.DRAFT)
+
+        summary = self.summary()
+        self.assertEqual(summary.balance, Decimal("150.00"))
+        self.assertEqual(summary.open_invoice_count, 2)
+        self.assertEqual(summary.oldest_open_invoice_date, date(2025, 1, 10))
+
+    def test_deleting_an_invoice_refreshes_the_summary(self):
+        self.create_invoice("INV-1", Decimal("100.00"))
+        invoice = self.create_invoice("INV-2", Decimal("40.00"))
+
+        invoice.delete()
+
+        self.assertEqual(self.summary().balance, Decimal("100.00"))
+        self.assertEqual(self.summary().open_invoice_count, 1)
+
+    def test_payment_updates_refresh_the_summary(self):
+        invoice = self.create_invoice("INV-1", Decimal("100.00"))
+
+        Invoice.objects.filter(pk=invoice.pk).update(paid_amount=Decimal("100.00"))
+        invoice.refresh_from_db()
+        InvoiceService.update_invoice_payment_status(invoice)
+
+        summary = self.summary()
+        self.assertEqual(summary.balance, Decimal("0.00"))
+        self.assertEqual(summary.open_invoice_count, 0)
+        self.assertIsNone(summary.oldest_open_invoice_date)
+
+    def test_reconcile_repairs_drift(self):
+        self.create_invoice("INV-1", Decimal("100.00"))
+        StudentBalance.objects.filter(student=self.student).update(balance=Decimal("5.00"))
+
+        created, corrected = StudentBalance.reconcile()
+
+        self.assertEqual((created, corrected), (0, 1))
+        self.assertEqual(self.summary().balance, Decimal("100.00"))
@@ -0,0 +1,179 @@
+"""
+Tests for batched payment reconciliation.
+
+Verifies that ``ReconciliationService.reconcile_batch`` and the
+``run_reconciliation_batch`` command leave every payment with the same
+status, matched enrollments and adjustments as reconciling the payments one
+at a time with ``reconcile_payment``.
+"""
+
+from datetime import date, datetime
+from decimal import Decimal
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.utils import timezone
+
+from apps.curriculum.models import Course, Cycle, Division, Term
+from apps.enrollment.models import ClassHeaderEnrollment
+from apps.finance.management.commands.production.run_reconciliation_batch import Command
+from apps.finance.models import (
+    DefaultPricing,
+    Invoice,
+    MaterialityThreshold,
+    Payment,
+    ReconciliationAdjustment,
+    ReconciliationStatus,
+)
+from apps.finance.services.reconciliation_service import ReconciliationService
+from apps.people.models import Person, StudentProfile
+from apps.scheduling.models import ClassHeader
+
+
+@pytest.mark.django_db
+class TestBatchMatchesPerPaymentReconciliation:
+    """Bulk reconciliation must produce what per-payment reconciliation does."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, user):
+        self.user = user
+        self.term = Term.objects.create(
+            code="SPRING25", term_type=Term.TermType.BACHELORS, start_date="2025-01-06", end_date="2025-05-30"
+        )
+        cycle = Cycle.objects.create(division=Division.objects.create(name="Academic"), name="Bachelor")
+        DefaultPricing.objects.create(
+            cycle=cycle,
+            domestic_price=Decimal("500.00"),
+            foreign_price=Decimal("700.00"),
+            effective_date=date(2020, 1, 1),
+        )
+        MaterialityThreshold.objects.create(
+            context=MaterialityThreshold.ThresholdContext.INDIVIDUAL_PAYMENT,
+            absolute_threshold=Decimal("30.00"),
+            effective_date=date(2020, 1, 1),
+        )
+        self.headers = [
+            ClassHeader.objects.create(
+                course=Course.objects.create(code=code, title=code, short_title=code, cycle=cycle),
+                term=self.term,
+                section_id="A",
+            )
+            for code in ("ENG-101", "MATH-101")
+        ]
+
+        # One payment per reconciliation outcome
+        self.payments = [
+            # Tier 1: exact amount for one course
+            self.pay(self.student(10001, courses=1), "500.00"),
+            # Tier 1 within a dollar, with a small adjustment
+            self.pay(self.student(10002, courses=1), "500.50"),
+            # Tier 2: two courses within 5%, with an adjustment above the threshold
+            self.pay(self.student(10003, courses=2), "1040.00"),
+            # Tier 3: 8% over, matched from the student's similar earlier payment
+            *self.pay_twice(self.student(10004, courses=1), "540.00"),
+            # Manual review: no enrollments and no similar payments
+            self.pay(self.student(10005, courses=0), "300.00"),
+        ]
+
+    def student(self, student_id, courses):
+        person = Person.objects.create(personal_name=f"S{student_id}", family_name="Test", date_of_birth="2000-01-01")
+        student = StudentProfile.objects.create(person=person, student_id=student_id)
+        for header in self.headers[:courses]:
+            ClassHeaderEnrollment.objects.create(
+                student=student, class_header=header, status="ENROLLED", enrolled_by=self.user
+            )
+        return student
+
+    def pay(self, student, amount, number=1):
+        invoice = Invoice.objects.create(
+            student=student,
+            term=self.term,
+            invoice_number=f"INV-{student.student_id}-{number}",
+            due_date=date(2025, 2, 1),
+            status=Invoice.InvoiceStatus.SENT,
+            subtotal=Decimal(amount),
+            total_amount=Decimal(amount),
+        )
+        return Payment.objects.create(
+            invoice=invoice,
+            payment_reference=f"PAY-{student.student_id}-{number}",
+            amount=Decimal(amount),
+            payment_date=timezone.make_aware(datetime(2025, 1, 10 + number)),
+            payment_method=Payment.PaymentMethod.CASH,
+            status=Payment.PaymentStatus.COMPLETED,
+            processed_by=self.user,
+        )
+
+    def pay_twice(self, student, amount):
+        return [self.pay(student, amount, number) for number in (1, 2)]
+
+    def outcomes(self):
+        """Reconciliation results per payment reference."""
+        results = {}
+        for status in ReconciliationStatus.objects.select_related("payment").prefetch_related(
+            "matched_enrollments", "adjustments"
+        ):
+            results[status.payment.payment_reference] = {
+                "status": status.status,
+                "confidence_level": status.confidence_level,
+                "confidence_score": status.confidence_score,
+                "variance_amount": status.variance_amount,
+                "variance_percentage": status.variance_percentage,
+                "pricing_method": status.pricing_method_applied,
+                "notes": status.notes,
+                "enrollments": sorted(enrollment.pk for enrollment in status.matched_enrollments.all()),
+                "adjustments": sorted(
+                    (
+                        adjustment.adjustment_type,
+                        adjustment.original_amount,
+                        adjustment.adjusted_amount,
+                        adjustment.variance,
+                        adjustment.requires_approval,
+                        adjustment.student_id,
+                        adjustment.term_id,
+                    )
+                    for adjustment in status.adjustments.all()
+                ),
+            }
+        return results
+
+    def reconcile_one_by_one(self):
+        service = ReconciliationService()
+        for payment in self.payments:
+            service.reconcile_payment(payment)
+        outcomes = self.outcomes()
+        ReconciliationAdjustment.objects.all().delete()
+        ReconciliationStatus.objects.all().delete()
+        return outcomes
+
+    def test_reconcile_batch_matches_reconcile_payment(self):
+        expected = self.reconcile_one_by_one()
+
+        payments = Payment.objects.select_related("invoice__student__person", "invoice__term").order_by("id")
+        ReconciliationService().reconcile_batch(payments)
+
+        assert self.outcomes() == expected
+        assert {outcome["status"] for outcome in expected.values()} == {
+            ReconciliationStatus.Status.FULLY_RECONCILED,
+            ReconciliationStatus.Status.AUTO_ALLOCATED,
+            ReconciliationStatus.Status.PENDING_REVIEW,
+        }
+        assert sum(len(outcome["adjustments"]) for outcome in expected.values()) == 4
+
+    def test_command_matches_reconcile_payment(self):
+        expected = self.reconcile_one_by_one()
+
+        call_command(Command(), batch_size=2, stdout=StringIO())
+
+        assert self.outcomes() == expected
+
+    def test_fully_reconciled_payments_are_left_alone(self):
+        service = ReconciliationService()
+        status = service.reconcile_payment(self.payments[0])
+        assert status.status == ReconciliationStatus.Status.FULLY_RECONCILED
+        ReconciliationStatus.objects.filter(pk=status.pk).update(notes="Reviewed")
+
+        service.reconcile_batch([self.payments[0]])
+
+        assert ReconciliationStatus.objects.get(pk=status.pk).notes == "Reviewed"
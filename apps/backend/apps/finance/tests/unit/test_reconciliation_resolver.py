@@ -0,0 +1,128 @@
+"""
+Tests for the reconciliation resolver's pure helpers.
+
+Verifies that the bulk fuzzy matcher accepts close spellings and word-order
+changes, rejects distant and ambiguous names, that CSV student IDs are parsed
+leniently, that single rows look their term up without loading every term,
+and that ``run_sis_integration_test`` reconciles its rows as one batch.
+"""
+
+from datetime import date
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+
+from apps.curriculum.models import Term
+from apps.finance.management.commands.ephemeral.run_sis_integration_test import Command
+from apps.finance.models import ReconciliationBatch
+from apps.finance.services.comprehensive_reconciliation_service import ComprehensiveReconciliationService
+from apps.finance.services.reconciliation_resolver import (
+    ReconciliationResolver,
+    fuzzy_match_names,
+    parse_student_id,
+)
+from apps.people.models import Person, StudentProfile
+
+CANDIDATES = {
+    1: "CHAN SOPHAL",
+    2: "KEO DARA",
+    3: "SOK DAVID",
+    4: "SOK DAVIT",
+}
+
+
+@pytest.mark.unit
+class TestFuzzyMatchNames:
+    """Test bulk fuzzy matching of unresolved names."""
+
+    def test_matches_misspelling_and_word_order(self):
+        matches = fuzzy_match_names({"a": "Sophall Chan", "b": "Dara Keo"}, CANDIDATES)
+
+        assert matches == {"a": 1, "b": 2}
+
+    def test_rejects_distant_names(self):
+        assert fuzzy_match_names({"a": "Pich Sreymom"}, CANDIDATES) == {}
+
+    def test_rejects_ties(self):
+        assert fuzzy_match_names({"a": "Sok Davix"}, CANDIDATES) == {}
+
+    def test_prefers_closest_candidate(self):
+        assert fuzzy_match_names({"a": "Sok David"}, CANDIDATES) == {"a": 3}
+
+
+@pytest.mark.unit
+class TestParseStudentId:
+    """Test parsing student IDs from CSV values."""
+
+    def test_parses_padded_ids(self):
+        assert parse_student_id(" 01234 ") == 1234
+
+    def test_rejects_non_numeric_values(self):
+        assert parse_student_id("CHAN SOPHAL") is None
+        assert parse_student_id(None) is None
+
+
+@pytest.mark.django_db
+class TestFindTerm:
+    """Test single-row term lookups outside a run."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.terms = [
+            Term.objects.create(
+                code=code,
+                description=description,
+                term_type=Term.TermType.BACHELORS,
+                start_date=start,
+                end_date=end,
+            )
+            for code, description, start, end in [
+                ("2024T1", "Term 1 of 2024", date(2024, 1, 8), date(2024, 4, 26)),
+                ("2024T2", "Term 2 of 2024", date(2024, 5, 6), date(2024, 8, 23)),
+            ]
+        ]
+
+    def test_code_lookup_is_one_query(self, django_assert_num_queries):
+        with django_assert_num_queries(1):
+            assert ReconciliationResolver.find_term(" 2024T2 ") == self.terms[1]
+
+    def test_matches_preloaded_resolution(self):
+        resolver = ReconciliationResolver(Term.objects.all())
+
+        for term_id in ["2024T1", "term 2 of", str(self.terms[0].pk), "2030T1", ""]:
+            assert ReconciliationResolver.find_term(term_id) == resolver.resolve_term(term_id)
+
+
+@pytest.mark.django_db
+class TestIntegrationTestCommand:
+    """Test that the CSV import reconciles its rows as one batch."""
+
+    def test_rows_are_reconciled_in_one_batch(self, user, tmp_path, monkeypatch):
+        person = Person.objects.create(personal_name="Dara", family_name="Sok", date_of_birth=date(2000, 1, 1))
+        StudentProfile.objects.create(person=person, student_id=10001)
+        Term.objects.create(
+            code="2024T1", term_type=Term.TermType.BACHELORS, start_date=date(2024, 1, 8), end_date=date(2024, 4, 26)
+        )
+        csv_path = tmp_path / "receipts.csv"
+        csv_path.write_text(
+            "ReceiptNo,name,TermID,Amount,NetAmount,NetDiscount,Notes,PmtType,PmtDate\n"
+            "R-1,10001,2024T1,500.00,450.00,50.00,Early bird,CASH,2024-01-15 09:30:00.000\n"
+            "R-2,Nobody Known,2024T1,500.00,500.00,0,,CASH,2024-01-16\n"
+            "R-3,10001,NULL,500.00,500.00,0,,CASH,2024-01-16\n"
+        )
+        batches = []
+        process_csv_batch = ComprehensiveReconciliationService.process_csv_batch
+
+        def spy(service, rows, batch):
+            batches.append([row.receipt_number for row in rows])
+            return process_csv_batch(service, rows, batch)
+
+        monkeypatch.setattr(ComprehensiveReconciliationService, "process_csv_batch", spy)
+
+        call_command(Command(), str(csv_path), batch_name="CSV-TEST", stdout=StringIO())
+
+        assert batches == [["R-1", "R-2"]]
+        batch = ReconciliationBatch.objects.get(batch_id="CSV-TEST")
+        assert batch.processed_payments == 2
+        assert batch.results_summary["student_match_methods"] == {"student_id": 1, "unmatched": 1}
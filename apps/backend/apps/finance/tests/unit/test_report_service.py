@@ -0,0 +1,122 @@
+"""
+Tests for the monthly financial statement and outstanding balances report.
+
+Verifies that the statement totals the month's receipts, refunds and
+invoicing into a collection rate, and that the outstanding balances report
+lists students from their balance summaries, largest balance first, with
+each student's open invoices.
+"""
+
+from datetime import date, datetime
+from decimal import Decimal
+
+import pytest
+from django.utils import timezone
+
+from apps.curriculum.models import Term
+from apps.finance.models import FinancialTransaction, Invoice
+from apps.finance.services.report_service import FinancialReportService
+from apps.people.models import Person, StudentProfile
+
+Status = Invoice.InvoiceStatus
+
+
+@pytest.mark.django_db
+class TestFinancialReports:
+    """Test the statement and balance reports against known ledgers."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, user):
+        self.user = user
+        self.term = Term.objects.create(
+            code="SPRING25", term_type=Term.TermType.BACHELORS, start_date="2025-01-06", end_date="2025-05-30"
+        )
+        self.dara = self.create_student(10001, "Dara")
+        self.sophea = self.create_student(10002, "Sophea")
+
+    def create_student(self, student_id, name):
+        person = Person.objects.create(personal_name=name, family_name="Sok", date_of_birth="2000-01-01")
+        return StudentProfile.objects.create(person=person, student_id=student_id)
+
+    def create_invoice(self, student, number, total, status=Status.SENT, issue_date=date(2025, 3, 5), paid="0.00"):
+        return Invoice.objects.create(
+            invoice_number=number,
+            student=student,
+            term=self.term,
+            status=status,
+            issue_date=issue_date,
+            due_date=issue_date,
+            subtotal=Decimal(total),
+            total_amount=Decimal(total),
+            paid_amount=Decimal(paid),
+        )
+
+    def create_transaction(self, number, transaction_type, amount, day):
+        return FinancialTransaction.objects.create(
+            transaction_id=f"TXN-{number}",
+            transaction_type=transaction_type,
+            student=self.dara,
+            amount=Decimal(amount),
+            transaction_date=timezone.make_aware(datetime(2025, day.month, day.day, 10)),
+            description="Test transaction",
+            processed_by=self.user,
+        )
+
+    def test_monthly_statement_totals_the_month(self):
+        self.create_invoice(self.dara, "INV-1", "400.00", status=Status.PAID, paid="400.00")
+        self.create_invoice(self.sophea, "INV-2", "200.00", status=Status.PARTIALLY_PAID, paid="50.00")
+        self.create_invoice(self.sophea, "INV-3", "80.00", status=Status.OVERDUE, issue_date=date(2025, 2, 5))
+        received = FinancialTransaction.TransactionType.PAYMENT_RECEIVED
+        self.create_transaction(1, received, "250.00", date(2025, 3, 10))
+        self.create_transaction(2, received, "50.00", date(2025, 3, 20))
+        self.create_transaction(3, FinancialTransaction.TransactionType.PAYMENT_REFUNDED, "-30.00", date(2025, 3, 21))
+        self.create_transaction(4, received, "999.00", date(2025, 4, 2))
+
+        statement = FinancialReportService.get_monthly_financial_statement(2025, 3)
+
+        assert statement["period"] == {
+            "year": 2025,
+            "month": 3,
+            "start_date": date(2025, 3, 1),
+            "end_date": date(2025, 3, 31),
+        }
+        assert statement["revenue"] == {
+            "gross_receipts": Decimal("300.00"),
+            "refunds": Decimal("30.00"),
+            "net_receipts": Decimal("270.00"),
+        }
+        assert statement["invoicing"] == {
+            "invoices_created": 2,
+            "total_invoiced": Decimal("600.00"),
+            "invoices_paid": 1,
+            "collection_rate": 50.0,
+        }
+        assert statement["outstanding"] == {"count": 2, "total_amount": Decimal("230.00")}
+        assert statement["transaction_summary"]["total_transactions"] == 3
+
+    def test_monthly_statement_without_invoices_has_zero_collection_rate(self):
+        statement = FinancialReportService.get_monthly_financial_statement(2025, 12)
+
+        assert statement["period"]["end_date"] == date(2025, 12, 31)
+        assert statement["invoicing"]["collection_rate"] == 0.0
+        assert statement["revenue"]["net_receipts"] == Decimal("0.00")
+
+    def test_outstanding_balances_are_listed_by_balance(self):
+        self.create_invoice(self.dara, "INV-1", "100.00", issue_date=date(2025, 2, 1))
+        self.create_invoice(self.sophea, "INV-2", "300.00", status=Status.PARTIALLY_PAID, paid="100.00")
+        self.create_invoice(self.sophea, "INV-3", "150.00", status=Status.OVERDUE, issue_date=date(2025, 1, 15))
+        self.create_invoice(self.sophea, "INV-4", "500.00", status=Status.DRAFT)
+        self.create_invoice(self.dara, "INV-5", "70.00", status=Status.PAID, paid="70.00")
+
+        report = FinancialReportService.get_outstanding_balances_report()
+
+        assert report["summary"] == {
+            "total_students": 2,
+            "total_outstanding": Decimal("450.00"),
+            "total_invoices": 3,
+        }
+        sophea, dara = report["students"]
+        assert (sophea["student_id"], sophea["total_outstanding"]) == (10002, Decimal("350.00"))
+        assert [invoice["invoice_number"] for invoice in sophea["invoices"]] == ["INV-3", "INV-2"]
+        assert sophea["oldest_invoice_date"] == date(2025, 1, 15)
+        assert [invoice["amount_due"] for invoice in dara["invoices"]] == [Decimal("100.00")]
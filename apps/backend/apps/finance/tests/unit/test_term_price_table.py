@@ -0,0 +1,108 @@
+"""
+Tests for in-memory pricing from a preloaded term price table.
+
+Verifies that the table applies the same precedence as
+``SeparatedPricingService.calculate_course_price`` (senior project, reading
+class, fixed course price, default cycle price) and adds mandatory fees the
+way ``calculate_total_cost`` does, without touching the database.
+"""
+
+from decimal import Decimal
+from types import SimpleNamespace
+
+import pytest
+
+from apps.finance.models import (
+    CourseFixedPricing,
+    DefaultPricing,
+    FeePricing,
+    ReadingClassPricing,
+    SeniorProjectPricing,
+)
+from apps.finance.services.separated_pricing_service import TermPriceTable
+
+CYCLE_ID = 10
+
+
+def enrollment(course_id, class_header_id=None, student_id=1):
+    course = SimpleNamespace(id=course_id, cycle_id=CYCLE_ID)
+    return SimpleNamespace(
+        class_header=SimpleNamespace(course=course),
+        class_header_id=class_header_id or course_id * 100,
+        student_id=student_id,
+    )
+
+
+def student(citizenship="KH"):
+    return SimpleNamespace(person=SimpleNamespace(citizenship=citizenship))
+
+
+def price_table(**overrides):
+    table = TermPriceTable(
+        term=None,
+        default_prices={CYCLE_ID: DefaultPricing(domestic_price=Decimal("500.00"), foreign_price=Decimal("700.00"))},
+        fixed_prices={2: CourseFixedPricing(domestic_price=Decimal("350.00"), foreign_price=Decimal("450.00"))},
+        senior_project_course_ids={3},
+        senior_project_prices={
+            SeniorProjectPricing.GroupSizeTier.ONE_STUDENT: SeniorProjectPricing(
+                individual_price=Decimal("900.00"), foreign_individual_price=Decimal("1100.00")
+            ),
+            SeniorProjectPricing.GroupSizeTier.TWO_STUDENTS: SeniorProjectPricing(
+                individual_price=Decimal("800.00"), foreign_individual_price=Decimal("1000.00")
+            ),
+        },
+        senior_project_group_sizes={(1, 3): 2},
+        reading_class_prices={
+            (CYCLE_ID, ReadingClassPricing.ClassSizeTier.TUTORIAL): ReadingClassPricing(
+                domestic_price=Decimal("600.00"), foreign_price=Decimal("800.00")
+            )
+        },
+        reading_class_sizes={400: 2},
+    )
+    for name, value in overrides.items():
+        setattr(table, name, value)
+    return table
+
+
+@pytest.mark.unit
+class TestCoursePrice:
+    """Test pricing precedence for single enrollments."""
+
+    def test_default_cycle_price(self):
+        assert price_table().course_price(enrollment(1), is_foreign=False) == Decimal("500.00")
+        assert price_table().course_price(enrollment(1), is_foreign=True) == Decimal("700.00")
+
+    def test_fixed_price_overrides_default(self):
+        assert price_table().course_price(enrollment(2), is_foreign=False) == Decimal("350.00")
+
+    def test_senior_project_priced_by_group_size(self):
+        table = price_table()
+
+        assert table.course_price(enrollment(3), is_foreign=False) == Decimal("800.00")
+        assert table.course_price(enrollment(3, student_id=2), is_foreign=False) == Decimal("900.00")
+
+    def test_reading_class_priced_by_class_size(self):
+        assert price_table().course_price(enrollment(4, class_header_id=400), is_foreign=False) == Decimal("600.00")
+
+    def test_missing_pricing_is_none(self):
+        assert price_table(default_prices={}).course_price(enrollment(1), is_foreign=False) is None
+
+
+@pytest.mark.unit
+class TestTotalCost:
+    """Test expected totals with mandatory fees."""
+
+    def test_adds_per_course_and_per_term_fees(self):
+        fees = [
+            FeePricing(name="Lab", local_amount=Decimal("20.00"), is_per_course=True),
+            FeePricing(name="Registration", local_amount=Decimal("15.00"), is_per_term=True),
+            FeePricing(name="Foreign only", foreign_amount=Decimal("99.00"), is_per_term=True),
+        ]
+        table = price_table(fees=fees)
+
+        total = table.total_cost(student(), [enrollment(1), enrollment(2)])
+
+        assert total == Decimal("500.00") + Decimal("350.00") + Decimal("40.00") + Decimal("15.00")
+
+    def test_foreign_student_prices(self):
+        assert price_table().total_cost(student("US"), [enrollment(1)]) == Decimal("700.00")
@@ -18,7 +18,6 @@ from django.db.models import (
     Avg,
     Case,
     Count,
-    F,
     IntegerField,
     Q,
     Sum,
@@ -28,6 +27,8 @@ from django.urls import reverse
 from django.utils import timezone
 from django.views.generic import TemplateView
 
+from apps.analytics import rollups
+from apps.analytics.models import DailyMetricRollup, TermMetricRollup
 from apps.curriculum.models import Term
 from apps.enrollment.models import ClassHeaderEnrollment
 from apps.finance.models import (
@@ -98,12 +99,8 @@ class FinanceDashboardView(LoginRequiredMixin, PermissionRequiredMixin, Template
         return context
 
     def _get_revenue_for_period(self, start_date: date, end_date: date) -> Decimal:
-        """Calculate total revenue for a given period."""
-        return Payment.objects.filter(
-            payment_date__gte=start_date,
-            payment_date__lte=end_date,
-            status=Payment.PaymentStatus.COMPLETED,
-        ).aggregate(total=Sum("amount", default=Decimal("0.00")))["total"]
+        """Calculate total revenue for a given period from the daily rollups."""
+        return rollups.sum_daily(DailyMetricRollup.Metric.REVENUE, start_date, end_date)["total"]
 
     def _get_term_revenue(self, term: Term) -> dict[str, Decimal]:
         """Get revenue breakdown for the current term."""
@@ -139,19 +136,20 @@ class FinanceDashboardView(LoginRequiredMixin, PermissionRequiredMixin, Template
         }
 
     def _get_total_outstanding(self) -> Decimal:
-        """Calculate total outstanding balance across all students."""
-        return Invoice.objects.filter(
-            status__in=[
-                Invoice.InvoiceStatus.SENT,
-                Invoice.InvoiceStatus.PARTIALLY_PAID,
-            ],
-        ).aggregate(total=Sum(F("total_amount") - F("paid_amount"), default=Decimal("0.00")))["total"]
+        """Calculate total outstanding balance across all students from the receivables rollup."""
+        receivables = rollups.get_term_breakdown(TermMetricRollup.Metric.RECEIVABLES, None)
+        return sum(
+            (
+                receivables.get(status, {}).get("total", Decimal("0.00"))
+                for status in (Invoice.InvoiceStatus.SENT, Invoice.InvoiceStatus.PARTIALLY_PAID)
+            ),
+            Decimal("0.00"),
+        )
 
     def _get_overdue_amount(self) -> Decimal:
-        """Calculate total overdue amount."""
-        return Invoice.objects.filter(status=Invoice.InvoiceStatus.OVERDUE).aggregate(
-            total=Sum(F("total_amount") - F("paid_amount"), default=Decimal("0.00")),
-        )["total"]
+        """Calculate total overdue amount from the receivables rollup."""
+        receivables = rollups.get_term_breakdown(TermMetricRollup.Metric.RECEIVABLES, None)
+        return receivables.get(Invoice.InvoiceStatus.OVERDUE, {}).get("total", Decimal("0.00"))
 
     def _get_students_with_balance_count(self) -> int:
         """Count students with outstanding balances."""
@@ -168,54 +166,39 @@ class FinanceDashboardView(LoginRequiredMixin, PermissionRequiredMixin, Template
         )
 
     def _get_payment_method_breakdown(self, start_date: date, end_date: date) -> list[dict]:
-        """Get payment breakdown by method for the period."""
-        breakdown = (
-            Payment.objects.filter(
-                payment_date__gte=start_date,
-                payment_date__lte=end_date,
-                status=Payment.PaymentStatus.COMPLETED,
-            )
-            .values("payment_method")
-            .annotate(total=Sum("amount"), count=Count("id"))
-            .order_by("-total")
-        )
+        """Get payment breakdown by method for the period from the daily rollups."""
+        totals: dict[str, dict[str, Any]] = {}
+        for methods in rollups.get_daily_totals(DailyMetricRollup.Metric.REVENUE, start_date, end_date).values():
+            for method, bucket in methods.items():
+                item = totals.setdefault(method, {"payment_method": method, "total": Decimal("0.00"), "count": 0})
+                item["total"] += bucket["total"]
+                item["count"] += bucket["count"]
 
         # Add display names
+        method_names = dict(Payment.PaymentMethod.choices)
+        breakdown = sorted(totals.values(), key=lambda item: item["total"], reverse=True)
         for item in breakdown:
-            item["display_name"] = dict(Payment.PaymentMethod.choices).get(
-                item["payment_method"],
-                item["payment_method"],
-            )
+            item["display_name"] = method_names.get(item["payment_method"], item["payment_method"])
 
-        return list(breakdown)
+        return breakdown
 
     def _get_daily_revenue_trend(self, days: int = 30) -> list[dict]:
-        """Get daily revenue trend for the last N days."""
-        end_date = timezone.now().date()
-        start_date = end_date - timedelta(days=days - 1)
-
-        # Get daily totals
-        daily_totals = (
-            Payment.objects.filter(
-                payment_date__gte=start_date,
-                payment_date__lte=end_date,
-                status=Payment.PaymentStatus.COMPLETED,
-            )
-            .values("payment_date")
-            .annotate(total=Sum("amount"))
-            .order_by("payment_date")
-        )
+        """Get daily revenue trend for the last N days from the daily rollups."""
+        start_date, end_date = rollups.daily_range(days, timezone.now().date())
+        daily_totals = rollups.get_daily_totals(DailyMetricRollup.Metric.REVENUE, start_date, end_date)
 
         # Create complete date range
         date_range = []
         current_date = start_date
-        totals_dict = {item["payment_date"]: item["total"] for item in daily_totals}
-
         while current_date <= end_date:
+            day_total = sum(
+                (bucket["total"] for bucket in daily_totals.get(current_date, {}).values()),
+                Decimal("0.00"),
+            )
             date_range.append(
                 {
                     "date": current_date.isoformat(),
-                    "total": float(totals_dict.get(current_date, Decimal("0.00"))),
+                    "total": float(day_total),
                 },
             )
             current_date += timedelta(days=1)
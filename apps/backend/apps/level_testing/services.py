@@ -43,6 +43,9 @@ class DuplicateDetectionService:
     PROVINCE_MATCH_WEIGHT = 0.6  # Increased per user requirements
     PROGRAM_LEVEL_MATCH_WEIGHT = 0.4  # New: program/level matching
 
+    # Upper bound on people scored per registration (see find_candidate_ids)
+    MAX_CANDIDATES = 50
+
     def __init__(self):
         """Initialize the duplicate detection service."""
         self.person_model = None
@@ -75,9 +78,13 @@ class DuplicateDetectionService:
 
         potential_duplicates = []
 
-        # Get all existing persons for comparison (optimized to prevent N+1 queries)
+        candidate_ids = self.find_candidate_ids(potential_student)
+        if not candidate_ids:
+            return []
+
+        # Only people sharing blocking keys are scored (optimized to prevent N+1 queries)
         existing_persons = (
-            self.person_model.objects.filter(is_deleted=False)
+            self.person_model.objects.filter(is_deleted=False, id__in=candidate_ids)
             .select_related(
                 "student_profile",  # Optimize debt checking
             )
@@ -97,6 +104,29 @@ class DuplicateDetectionService:
 
         return potential_duplicates[:10]  # Return top 10 matches
 
+    def find_candidate_ids(self, potential_student) -> list[int]:
+        """IDs of the people worth scoring against a potential student.
+
+        Looks up the registration's blocking keys (normalized and phonetic
+        name, name trigrams, birth date and the months within the similar
+        birth-date window, email and phone) in the ``PersonMatchKey`` index
+        and keeps the ``MAX_CANDIDATES`` people sharing the most heavily
+        weighted keys. Exact name, birth date, email and phone matches always
+        outrank name-fragment overlap, and people sharing only trigrams are
+        not candidates.
+        """
+        from apps.people.match_keys import SIMILAR_BIRTH_DATE_DAYS, match_keys
+        from apps.people.models import PersonMatchKey
+
+        keys = match_keys(
+            potential_student.full_name_eng,
+            potential_student.date_of_birth,
+            emails=[potential_student.personal_email],
+            phones=[potential_student.phone_number],
+            birth_window_days=SIMILAR_BIRTH_DATE_DAYS,
+        )
+        return PersonMatchKey.rank_candidates(keys, self.MAX_CANDIDATES)
+
     def _analyze_potential_match(self, potential_student, person) -> dict[str, Any]:
         """Analyze a potential match between a potential student and existing person.
 
@@ -6,12 +6,13 @@ user-student ID mapping.
 """
 
 import logging
-from datetime import timedelta
+from datetime import date, datetime, timedelta
 from uuid import uuid4
 
 import jwt
 from django.conf import settings
 from django.core.cache import cache
+from django.db import transaction
 from django.utils import timezone
 from google.auth.transport import requests
 from google.oauth2 import id_token
@@ -425,15 +426,94 @@ class MobileAttendanceService:
     def bulk_record_attendance(cls, attendance_records: list) -> dict:
         """Record multiple attendance records at once.
 
+        Each dict follows ``AttendanceCreateSchema``: ``student_id`` (the
+        student number), ``class_header_id``, ``session_date``, ``status`` and
+        optional ``notes``. The status is written to every attendance session
+        of the class on that date. Students, sessions and existing records
+        are loaded in three queries, records are written with one bulk
+        insert and one bulk update, and each session's statistics are
+        aggregated once for the batch.
+
         Args:
             attendance_records: List of attendance data dicts
 
         Returns:
             dict: Bulk operation result
         """
-        # Stub implementation for tests
+        from apps.attendance.models import AttendanceRecord, AttendanceSession
+        from apps.attendance.statistics import deferred_session_statistics
+        from apps.people.models import StudentProfile
+
+        errors = []
+        entries = []
+        for index, data in enumerate(attendance_records):
+            status = data.get("status")
+            if status not in AttendanceRecord.AttendanceStatus.values:
+                errors.append({"index": index, "error": f"Invalid attendance status: {status}"})
+                continue
+            session_date = data["session_date"]
+            if isinstance(session_date, str):
+                session_date = datetime.fromisoformat(session_date)
+            if isinstance(session_date, datetime):
+                session_date = session_date.date()
+            entries.append((index, int(data["student_id"]), int(data["class_header_id"]), session_date, status, data))
+
+        students = dict(
+            StudentProfile.objects.filter(student_id__in={entry[1] for entry in entries}).values_list(
+                "student_id", "id"
+            )
+        )
+        sessions_by_class_day: dict[tuple[int, date], list[int]] = {}
+        for session_id, class_header_id, session_date in AttendanceSession.objects.filter(
+            class_part__class_session__class_header_id__in={entry[2] for entry in entries},
+            session_date__in={entry[3] for entry in entries},
+        ).values_list("id", "class_part__class_session__class_header_id", "session_date"):
+            sessions_by_class_day.setdefault((class_header_id, session_date), []).append(session_id)
+
+        session_ids = {session_id for ids in sessions_by_class_day.values() for session_id in ids}
+        existing = {
+            (record.attendance_session_id, record.student_id): record
+            for record in AttendanceRecord.objects.filter(
+                attendance_session_id__in=session_ids, student_id__in=students.values()
+            )
+        }
+
+        # Later entries for the same student and session win
+        to_write: dict[tuple[int, int], AttendanceRecord] = {}
+        processed = 0
+        for index, student_number, class_header_id, session_date, status, data in entries:
+            student_pk = students.get(student_number)
+            if student_pk is None:
+                errors.append({"index": index, "error": f"Student {student_number} not found"})
+                continue
+            day_sessions = sessions_by_class_day.get((class_header_id, session_date))
+            if not day_sessions:
+                errors.append(
+                    {"index": index, "error": f"No attendance session for class {class_header_id} on {session_date}"}
+                )
+                continue
+
+            for session_id in day_sessions:
+                key = (session_id, student_pk)
+                record = to_write.get(key) or existing.get(key)
+                if record is None:
+                    record = AttendanceRecord(attendance_session_id=session_id, student_id=student_pk)
+                record.status = status
+                record.data_source = AttendanceRecord.DataSource.MOBILE_MANUAL
+                if data.get("notes"):
+                    record.notes = data["notes"]
+                to_write[key] = record
+            processed += 1
+
+        created = [record for record in to_write.values() if record.pk is None]
+        updated = [record for record in to_write.values() if record.pk is not None]
+        with transaction.atomic(), deferred_session_statistics() as pending_sessions:
+            AttendanceRecord.objects.bulk_create(created, batch_size=500)
+            AttendanceRecord.objects.bulk_update(updated, ["status", "data_source", "notes"], batch_size=500)
+            pending_sessions.update(session_id for session_id, _student_pk in to_write)
+
         return {
-            "success": True,
-            "processed": len(attendance_records),
-            "errors": [],
+            "success": not errors,
+            "processed": processed,
+            "errors": errors,
         }
@@ -0,0 +1,109 @@
+"""
+Tests for bulk attendance recording from the mobile service.
+
+Verifies that ``MobileAttendanceService.bulk_record_attendance`` inserts new
+records and updates existing ones, reports entries it cannot record, and
+leaves the session counters matching the written records.
+"""
+
+from datetime import date, time, timedelta
+
+import pytest
+from django.utils import timezone
+
+from apps.attendance.models import AttendanceRecord, AttendanceSession
+from apps.curriculum.models import Course, Cycle, Division, Term
+from apps.mobile.services import MobileAttendanceService
+from apps.people.models import Person, StudentProfile, TeacherProfile
+from apps.scheduling.models import ClassHeader, ClassPart, ClassSession
+
+SESSION_DATE = date(2024, 10, 7)
+
+
+def person(name):
+    return Person.objects.create(personal_name=name, family_name="Sok", date_of_birth=date(2000, 1, 1))
+
+
+@pytest.mark.django_db
+class TestBulkRecordAttendance:
+    """Bulk records must be written and counted like individual records."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        cycle = Cycle.objects.create(division=Division.objects.create(name="Academic"), name="Bachelor")
+        term = Term.objects.create(
+            code="FALL24", term_type=Term.TermType.BACHELORS, start_date="2024-09-01", end_date="2024-12-15"
+        )
+        course = Course.objects.create(code="ENG-101", title="English", short_title="English", cycle=cycle)
+        self.class_header = ClassHeader.objects.create(course=course, term=term, section_id="A")
+        part = ClassPart.objects.create(
+            class_session=ClassSession.objects.create(class_header=self.class_header),
+            meeting_days="MON",
+            start_time=time(9, 0),
+            end_time=time(10, 0),
+        )
+        now = timezone.now()
+        self.session = AttendanceSession.objects.create(
+            class_part=part,
+            teacher=TeacherProfile.objects.create(person=person("Teacher")),
+            session_date=SESSION_DATE,
+            start_time=time(9, 0),
+            attendance_code="12345",
+            code_generated_at=now,
+            code_expires_at=now + timedelta(minutes=15),
+        )
+        self.dara = StudentProfile.objects.create(person=person("Dara"), student_id=10001)
+        self.sophea = StudentProfile.objects.create(person=person("Sophea"), student_id=10002)
+        AttendanceRecord.objects.create(
+            attendance_session=self.session,
+            student=self.dara,
+            status=AttendanceRecord.AttendanceStatus.ABSENT,
+            data_source=AttendanceRecord.DataSource.AUTO_ABSENT,
+        )
+
+    def entry(self, student_id, status, **extra):
+        return {
+            "student_id": str(student_id),
+            "class_header_id": self.class_header.pk,
+            "session_date": SESSION_DATE.isoformat(),
+            "status": status,
+            **extra,
+        }
+
+    def test_records_and_session_counters_are_written(self):
+        result = MobileAttendanceService.bulk_record_attendance(
+            [
+                self.entry(10001, "PRESENT", notes="Arrived on time"),
+                self.entry(10002, "LATE"),
+                self.entry(99999, "PRESENT"),
+                self.entry(10002, "SLEEPING"),
+            ]
+        )
+
+        assert result["processed"] == 2
+        assert result["success"] is False
+        assert sorted(error["index"] for error in result["errors"]) == [2, 3]
+
+        records = {
+            record.student_id: record for record in AttendanceRecord.objects.filter(attendance_session=self.session)
+        }
+        assert set(records) == {self.dara.pk, self.sophea.pk}
+        assert records[self.dara.pk].status == "PRESENT"
+        assert records[self.dara.pk].notes == "Arrived on time"
+        assert records[self.sophea.pk].status == "LATE"
+        assert {record.data_source for record in records.values()} == {AttendanceRecord.DataSource.MOBILE_MANUAL}
+
+        self.session.refresh_from_db()
+        assert (self.session.total_students, self.session.present_count, self.session.absent_count) == (2, 1, 1)
+
+    def test_batch_writes_and_aggregates_once(self, django_assert_max_num_queries):
+        entries = [self.entry(10001, "PRESENT"), self.entry(10002, "PRESENT")]
+
+        # students, sessions, existing records, savepoint, insert, update, release,
+        # then one aggregate, read and save for the session
+        with django_assert_max_num_queries(10):
+            result = MobileAttendanceService.bulk_record_attendance(entries)
+
+        assert result == {"success": True, "processed": 2, "errors": []}
+        self.session.refresh_from_db()
+        assert (self.session.total_students, self.session.present_count, self.session.absent_count) == (2, 2, 0)
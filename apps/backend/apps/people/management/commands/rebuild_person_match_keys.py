@@ -0,0 +1,31 @@
+"""Management command to rebuild the duplicate-detection key index.
+
+``PersonMatchKey`` rows are rewritten whenever a person's name, birth date,
+personal email or phone numbers are saved. Use this command to repair the
+index after bulk imports or raw updates that bypass those hooks.
+
+Usage:
+    python manage.py rebuild_person_match_keys
+    python manage.py rebuild_person_match_keys --batch-size 1000
+"""
+
+from django.core.management.base import BaseCommand
+
+from apps.people.models import PersonMatchKey
+
+
+class Command(BaseCommand):
+    help = "Rebuild the blocking keys used for duplicate-person detection"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Number of people re-indexed per transaction (default: 500)",
+        )
+
+    def handle(self, *args, **options):
+        """Re-index every person."""
+        count = PersonMatchKey.rebuild(batch_size=options["batch_size"])
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt duplicate-detection keys for {count} people"))
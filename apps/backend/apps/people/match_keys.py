@@ -0,0 +1,159 @@
+"""Blocking keys for duplicate-person detection.
+
+Scoring every person against a new registration does not scale with the
+population, so each person is indexed under a handful of cheap keys
+(stored in ``PersonMatchKey``) and only people sharing keys with the
+registration are scored. Keys are ``(kind, value)`` pairs:
+
+    name        order-insensitive normalized name ("chan sophal")
+    phonetic    Soundex code of each Latin name word ("C500")
+    trigram     character trigrams inside each name word, unpadded
+    dob         exact birth date
+    dob_month   birth month; probes cover every month within the
+                similar-birth-date window
+    email       case-folded personal email
+    phone       last eight digits of a phone number
+
+Candidates are ranked by ``MATCH_KEY_WEIGHTS`` summed over shared keys, so
+exact keys always outrank name-fragment overlap. Trigrams only rank people
+who also share an ``ANCHOR_KEY_KINDS`` key: a common name fragment alone
+would otherwise make much of the population a candidate.
+"""
+
+from collections.abc import Iterable
+from datetime import date, timedelta
+
+from apps.common.utils.search_text import normalize_search_text
+
+KEY_NAME = "name"
+KEY_PHONETIC = "phonetic"
+KEY_TRIGRAM = "trigram"
+KEY_BIRTH_DATE = "dob"
+KEY_BIRTH_MONTH = "dob_month"
+KEY_EMAIL = "email"
+KEY_PHONE = "phone"
+
+MATCH_KEY_KINDS = (
+    (KEY_NAME, "Normalized Name"),
+    (KEY_PHONETIC, "Phonetic Name"),
+    (KEY_TRIGRAM, "Name Trigram"),
+    (KEY_BIRTH_DATE, "Birth Date"),
+    (KEY_BIRTH_MONTH, "Birth Month"),
+    (KEY_EMAIL, "Email"),
+    (KEY_PHONE, "Phone"),
+)
+
+MATCH_KEY_WEIGHTS = {
+    KEY_NAME: 100,
+    KEY_BIRTH_DATE: 100,
+    KEY_EMAIL: 100,
+    KEY_PHONE: 100,
+    KEY_PHONETIC: 5,
+    KEY_BIRTH_MONTH: 3,
+    KEY_TRIGRAM: 1,
+}
+
+# Keys of which a candidate must share at least one
+ANCHOR_KEY_KINDS = (KEY_NAME, KEY_PHONETIC, KEY_BIRTH_DATE, KEY_BIRTH_MONTH, KEY_EMAIL, KEY_PHONE)
+
+SIMILAR_BIRTH_DATE_DAYS = 30
+PHONE_KEY_DIGITS = 8
+
+MatchKeys = dict[str, set[str]]
+
+_SOUNDEX_CODES = {
+    **dict.fromkeys("bfpv", "1"),
+    **dict.fromkeys("cgjkqsxz", "2"),
+    **dict.fromkeys("dt", "3"),
+    "l": "4",
+    **dict.fromkeys("mn", "5"),
+    "r": "6",
+}
+
+
+def name_words(name: str | None) -> list[str]:
+    """Normalized alphanumeric words of a name."""
+    text = normalize_search_text(name)
+    return ["".join(char for char in word if char.isalnum()) for word in text.split() if any(map(str.isalnum, word))]
+
+
+def name_key(name: str | None) -> str:
+    """Name words in sorted order, so "Sophal Chan" and "CHAN SOPHAL" agree."""
+    return " ".join(sorted(name_words(name)))
+
+
+def soundex(word: str) -> str:
+    """American Soundex code of a Latin word; empty for other scripts."""
+    letters = [char for char in word.lower() if "a" <= char <= "z"]
+    if not letters:
+        return ""
+    code = letters[0].upper()
+    previous = _SOUNDEX_CODES.get(letters[0], "")
+    for char in letters[1:]:
+        digit = _SOUNDEX_CODES.get(char, "")
+        if digit and digit != previous:
+            code += digit
+            if len(code) == 4:
+                break
+        # "h" and "w" do not separate letters with the same code
+        if char not in "hw":
+            previous = digit
+    return code.ljust(4, "0")
+
+
+def name_trigrams(name: str | None) -> set[str]:
+    """Character trigrams inside each name word.
+
+    Unlike ``pg_trgm``, words are not padded: edge trigrams such as ``"  s"``
+    are shared by everyone whose name has a word starting with that letter.
+    """
+    return {word[index : index + 3] for word in name_words(name) for index in range(len(word) - 2)}
+
+
+def birth_months(date_of_birth: date, window_days: int = 0) -> set[str]:
+    """``YYYY-MM`` buckets of every day within ``window_days`` of a birth date."""
+    first = date_of_birth - timedelta(days=window_days)
+    last = date_of_birth + timedelta(days=window_days)
+    months = set()
+    year, month = first.year, first.month
+    while (year, month) <= (last.year, last.month):
+        months.add(f"{year:04d}-{month:02d}")
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+    return months
+
+
+def phone_key(number: str | None) -> str:
+    """Last digits of a phone number; empty when too short to compare."""
+    digits = "".join(filter(str.isdigit, number or ""))
+    return digits[-PHONE_KEY_DIGITS:] if len(digits) >= PHONE_KEY_DIGITS else ""
+
+
+def email_key(email: str | None) -> str:
+    """Case-folded email address."""
+    return (email or "").strip().casefold()
+
+
+def match_keys(
+    name: str | None,
+    date_of_birth: date | None = None,
+    emails: Iterable[str | None] = (),
+    phones: Iterable[str | None] = (),
+    birth_window_days: int = 0,
+) -> MatchKeys:
+    """Blocking keys of a person or registration, grouped by kind.
+
+    People are indexed with ``birth_window_days=0``; registrations probe
+    with ``SIMILAR_BIRTH_DATE_DAYS`` so that people born in neighbouring
+    months are found too.
+    """
+    words = name_words(name)
+    keys: MatchKeys = {
+        KEY_NAME: {name_key(name)} if words else set(),
+        KEY_PHONETIC: {code for code in map(soundex, words) if code},
+        KEY_TRIGRAM: name_trigrams(name),
+        KEY_BIRTH_DATE: {date_of_birth.isoformat()} if date_of_birth else set(),
+        KEY_BIRTH_MONTH: birth_months(date_of_birth, birth_window_days) if date_of_birth else set(),
+        KEY_EMAIL: {key for key in map(email_key, emails) if key},
+        KEY_PHONE: {key for key in map(phone_key, phones) if key},
+    }
+    return {kind: values for kind, values in keys.items() if values}
@@ -0,0 +1,59 @@
+# Generated by Django 5.2 on 2025-08-01
+
+from django.db import migrations, models
+
+from apps.common.utils.search_text import normalize_search_text
+
+SEARCH_TEXT_FIELDS = ("full_name", "family_name", "personal_name", "khmer_name", "school_email", "personal_email")
+BATCH_SIZE = 2000
+
+
+def build_search_text(apps, schema_editor):
+    Person = apps.get_model("people", "Person")
+    batch = []
+    for person in Person.objects.only("pk", *SEARCH_TEXT_FIELDS).iterator(chunk_size=BATCH_SIZE):
+        person.search_text = normalize_search_text(*(getattr(person, field) for field in SEARCH_TEXT_FIELDS))
+        batch.append(person)
+        if len(batch) >= BATCH_SIZE:
+            Person.objects.bulk_update(batch, ["search_text"])
+            batch = []
+    Person.objects.bulk_update(batch, ["search_text"])
+
+
+def create_trigram_index(apps, schema_editor):
+    # GIN trigram indexes are PostgreSQL-only; SQLite test databases search
+    # the same column without an index.
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    schema_editor.execute(
+        "CREATE INDEX IF NOT EXISTS people_person_search_text_trgm "
+        "ON people_person USING gin (search_text gin_trgm_ops)"
+    )
+
+
+def drop_trigram_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("DROP INDEX IF EXISTS people_person_search_text_trgm")
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("people", "0004_person_khmer_name_approximated_at_and_more"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="person",
+            name="search_text",
+            field=models.TextField(
+                blank=True,
+                editable=False,
+                help_text="Normalized names and emails, trigram-indexed for student search",
+                verbose_name="Search Text",
+            ),
+        ),
+        migrations.RunPython(build_search_text, migrations.RunPython.noop),
+        migrations.RunPython(create_trigram_index, drop_trigram_index),
+    ]
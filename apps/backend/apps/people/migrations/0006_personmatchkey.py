@@ -0,0 +1,66 @@
+# Generated by Django 5.2 on 2025-08-01
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+from apps.people.match_keys import MATCH_KEY_KINDS, match_keys
+
+BATCH_SIZE = 2000
+
+
+def build_match_keys(apps, schema_editor):
+    Person = apps.get_model("people", "Person")
+    PersonMatchKey = apps.get_model("people", "PersonMatchKey")
+    rows = []
+    people = Person.objects.prefetch_related("phone_numbers").order_by("pk")
+    for person in people.iterator(chunk_size=BATCH_SIZE):
+        keys = match_keys(
+            person.full_name or f"{person.family_name} {person.personal_name}".strip(),
+            person.date_of_birth,
+            emails=[person.personal_email],
+            phones=[phone.number for phone in person.phone_numbers.all()],
+        )
+        rows.extend(
+            PersonMatchKey(person_id=person.pk, kind=kind, value=value)
+            for kind, values in keys.items()
+            for value in values
+        )
+        if len(rows) >= BATCH_SIZE:
+            PersonMatchKey.objects.bulk_create(rows)
+            rows = []
+    PersonMatchKey.objects.bulk_create(rows)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("people", "0005_person_search_text"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PersonMatchKey",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("kind", models.CharField(choices=MATCH_KEY_KINDS, max_length=10, verbose_name="Kind")),
+                ("value", models.CharField(max_length=255, verbose_name="Value")),
+                (
+                    "person",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="match_keys",
+                        to="people.person",
+                        verbose_name="Person",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Person Match Key",
+                "verbose_name_plural": "Person Match Keys",
+                "db_table": "people_person_match_key",
+                "constraints": [
+                    models.UniqueConstraint(fields=("kind", "value", "person"), name="unique_person_match_key")
+                ],
+            },
+        ),
+        migrations.RunPython(build_match_keys, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 5.2 on 2025-08-01
+
+from django.conf import settings
+from django.db import migrations
+from django.utils import timezone
+
+from apps.common.partitioning import PARTITIONED_LOG_TABLES, convert_to_partitioned
+
+TABLES = ("people_personeventlog", "people_studentauditlog")
+
+
+def partition_tables(apps, schema_editor):
+    # Declarative partitioning is PostgreSQL-only; other databases keep the
+    # plain tables.
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    today = timezone.now().date()
+    months_ahead = getattr(settings, "LOG_PARTITION_MONTHS_AHEAD", 3)
+    with schema_editor.connection.cursor() as cursor:
+        for spec in PARTITIONED_LOG_TABLES:
+            if spec.table in TABLES:
+                convert_to_partitioned(cursor, spec, today, months_ahead)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("people", "0006_personmatchkey"),
+    ]
+
+    operations = [
+        migrations.RunPython(partition_tables, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2 on 2025-08-01
+
+from django.db import migrations
+from django.db.models import Q
+
+
+def drop_edge_trigrams(apps, schema_editor):
+    # Name trigrams are no longer padded at word edges; padded values all
+    # start or end with a space.
+    PersonMatchKey = apps.get_model("people", "PersonMatchKey")
+    PersonMatchKey.objects.filter(Q(value__startswith=" ") | Q(value__endswith=" "), kind="trigram").delete()
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("people", "0007_partition_audit_logs"),
+    ]
+
+    operations = [
+        migrations.RunPython(drop_edge_trigrams, migrations.RunPython.noop),
+    ]
@@ -20,11 +20,13 @@ Models:
 - PersonEventLog: Audit log for person-related events
 - StudentAuditLog: Student-specific audit trail
 - PhoneNumber: Multiple phone numbers per person
+- PersonMatchKey: Blocking keys for duplicate-person detection
 - EmergencyContact: Emergency contact information
 - TeacherLeaveRequest: Teacher leave requests with substitute tracking
 - StudentPhoto: Versioned photo storage with history tracking
 """
 
+from collections.abc import Iterable
 from datetime import date
 from typing import TYPE_CHECKING, ClassVar
 
@@ -33,10 +35,12 @@ from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import ValidationError
 from django.core.validators import RegexValidator
-from django.db import models
+from django.db import models, transaction
 from django.db.models import (
     BooleanField,
+    Case,
     CharField,
+    Count,
     DateField,
     DateTimeField,
     EmailField,
@@ -45,17 +49,30 @@ from django.db.models import (
     IntegerField,
     OneToOneField,
     PositiveIntegerField,
+    Q,
+    Sum,
     TextField,
     UUIDField,
+    Value,
+    When,
 )
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 from django_countries.fields import CountryField
 from django_countries.fields import CountryField as CountryFieldType
 
+from apps.common.audit_sink import record_audit_entry
 from apps.common.constants import BIRTH_PLACE_CHOICES, is_cambodian_province
 from apps.common.models import AuditModel
+from apps.common.utils.search_text import normalize_search_text
 from apps.common.utils.uuid_utils import generate_uuid
+from apps.people.match_keys import (
+    ANCHOR_KEY_KINDS,
+    MATCH_KEY_KINDS,
+    MATCH_KEY_WEIGHTS,
+    MatchKeys,
+    match_keys,
+)
 
 if TYPE_CHECKING:
     from users.models import User
@@ -219,6 +236,30 @@ class Person(AuditModel):
     )
     citizenship: CountryFieldType = CountryField(default="KH", verbose_name=_("Citizenship"))
 
+    # Search support
+    search_text: models.TextField = models.TextField(
+        _("Search Text"),
+        blank=True,
+        editable=False,
+        help_text=_("Normalized names and emails, trigram-indexed for student search"),
+    )
+
+    SEARCH_TEXT_FIELDS: ClassVar[tuple[str, ...]] = (
+        "full_name",
+        "family_name",
+        "personal_name",
+        "khmer_name",
+        "school_email",
+        "personal_email",
+    )
+    MATCH_KEY_FIELDS: ClassVar[tuple[str, ...]] = (
+        "full_name",
+        "family_name",
+        "personal_name",
+        "date_of_birth",
+        "personal_email",
+    )
+
     class Meta:
         verbose_name = _("Person")
         verbose_name_plural = _("People")
@@ -262,12 +303,24 @@ class Person(AuditModel):
         if is_new or name_changed or not self.full_name:
             self.full_name = f"{new_family_name} {new_personal_name}".strip()
 
+        self.search_text = self.build_search_text()
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and not set(update_fields).isdisjoint(self.SEARCH_TEXT_FIELDS):
+            kwargs["update_fields"] = {*update_fields, "search_text"}
+
         super().save(*args, **kwargs)
 
         # Update tracked original values after successful save
         self._original_family_name = self.family_name
         self._original_personal_name = self.personal_name
 
+        if update_fields is None or not set(update_fields).isdisjoint(self.MATCH_KEY_FIELDS):
+            PersonMatchKey.refresh_for_people([self.pk])
+
+    def build_search_text(self) -> str:
+        """Normalized search text from the name and email fields."""
+        return normalize_search_text(*(getattr(self, field) for field in self.SEARCH_TEXT_FIELDS))
+
     @classmethod
     def from_db(cls, db, field_names, values):
         """Initialize field tracking when loading from database."""
@@ -968,7 +1021,7 @@ class PersonEventLog(models.Model):
     @classmethod
     def log_role_change(cls, person, role, old_status, new_status, user, notes=""):
         """Log the activation/deactivation of a person's role."""
-        cls.objects.create(
+        entry = cls(
             person=person,
             action=cls.ActionType.ROLE_CHANGE,
             changed_by=user,
@@ -979,6 +1032,7 @@ class PersonEventLog(models.Model):
             },
             notes=notes or f"Role '{role}' status changed to {new_status}",
         )
+        record_audit_entry(entry)
 
     @classmethod
     def log_leave(
@@ -999,13 +1053,14 @@ class PersonEventLog(models.Model):
             },
         )
 
-        cls.objects.create(
+        entry = cls(
             person=person,
             action=cls.ActionType.LEAVE,
             changed_by=user,
             details=event_details,
             notes=notes or str(_("Leave of absence recorded")),
         )
+        record_audit_entry(entry)
 
 
 class StudentAuditLog(models.Model):
@@ -1090,7 +1145,7 @@ class StudentAuditLog(models.Model):
     @classmethod
     def log_status_change(cls, student, old_status, new_status, user, notes=""):
         """Log a change in the StudentProfile.current_status field."""
-        return cls.objects.create(
+        entry = cls(
             student=student,
             action=cls.ActionType.STATUS,
             changed_by=user,
@@ -1101,6 +1156,7 @@ class StudentAuditLog(models.Model):
             },
             notes=notes or str(_("Status changed")),
         )
+        return record_audit_entry(entry)
 
     @classmethod
     def log_monk_status_change(cls, student, old_status, new_status, user, notes=""):
@@ -1120,7 +1176,7 @@ class StudentAuditLog(models.Model):
         old_status_desc = "Monk" if old_status else "Not a Monk"
         new_status_desc = "Monk" if new_status else "Not a Monk"
 
-        return cls.objects.create(
+        entry = cls(
             student=student,
             action=cls.ActionType.MONK_STATUS,
             changed_by=user,
@@ -1134,6 +1190,7 @@ class StudentAuditLog(models.Model):
             },
             notes=notes or str(_("Monk status changed")),
         )
+        return record_audit_entry(entry)
 
     def get_readable_changes(self):
         """Format the changes data in a human-readable way."""
@@ -1184,6 +1241,116 @@ class PhoneNumber(AuditModel):
     def __str__(self) -> str:
         return f"{self.number} ({'Preferred' if self.is_preferred else 'Secondary'})"
 
+    def save(self, *args, **kwargs):
+        """Save the number and refresh the person's duplicate-detection keys."""
+        super().save(*args, **kwargs)
+        PersonMatchKey.refresh_for_people([self.person_id])
+
+    def delete(self, *args, **kwargs):
+        """Delete the number and refresh the person's duplicate-detection keys."""
+        person_id = self.person_id
+        result = super().delete(*args, **kwargs)
+        PersonMatchKey.refresh_for_people([person_id])
+        return result
+
+
+class PersonMatchKey(models.Model):
+    """Blocking key under which a person is found by duplicate detection.
+
+    Each person is indexed under the keys produced by
+    ``apps.people.match_keys.match_keys`` for their name, birth date,
+    personal email and phone numbers. Rows are rewritten whenever those
+    change through ``Person.save`` or ``PhoneNumber.save``/``delete``; the
+    ``rebuild_person_match_keys`` command repairs rows after bulk writes.
+    """
+
+    person: ForeignKey = models.ForeignKey(
+        Person,
+        on_delete=models.CASCADE,
+        related_name="match_keys",
+        verbose_name=_("Person"),
+    )
+    kind: CharField = models.CharField(_("Kind"), max_length=10, choices=MATCH_KEY_KINDS)
+    value: CharField = models.CharField(_("Value"), max_length=255)
+
+    class Meta:
+        db_table = "people_person_match_key"
+        verbose_name = _("Person Match Key")
+        verbose_name_plural = _("Person Match Keys")
+        constraints: ClassVar[list[models.BaseConstraint]] = [
+            models.UniqueConstraint(fields=["kind", "value", "person"], name="unique_person_match_key"),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.person_id} {self.kind}:{self.value}"
+
+    @staticmethod
+    def keys_for_person(person: Person) -> MatchKeys:
+        """Blocking keys of a person and their phone numbers."""
+        return match_keys(
+            str(person),
+            person.date_of_birth,
+            emails=[person.personal_email],
+            phones=[phone.number for phone in person.phone_numbers.all()],
+        )
+
+    @classmethod
+    def refresh_for_people(cls, person_ids: Iterable[int]) -> None:
+        """Rewrite the keys of the given people from their current data."""
+        person_ids = sorted(set(person_ids))
+        if not person_ids:
+            return
+
+        people = Person.objects.filter(id__in=person_ids).prefetch_related("phone_numbers")
+        rows = [
+            cls(person_id=person.id, kind=kind, value=value)
+            for person in people
+            for kind, values in cls.keys_for_person(person).items()
+            for value in values
+        ]
+        with transaction.atomic():
+            cls.objects.filter(person_id__in=person_ids).delete()
+            cls.objects.bulk_create(rows, batch_size=1000)
+
+    @classmethod
+    def rebuild(cls, batch_size: int = 500) -> int:
+        """Rewrite the keys of every person in batches.
+
+        Returns:
+            Number of people re-indexed
+        """
+        person_ids = list(Person.objects.order_by("pk").values_list("pk", flat=True))
+        for start in range(0, len(person_ids), batch_size):
+            cls.refresh_for_people(person_ids[start : start + batch_size])
+        return len(person_ids)
+
+    @classmethod
+    def rank_candidates(cls, keys: MatchKeys, limit: int) -> list[int]:
+        """IDs of the people sharing the most heavily weighted keys, best first.
+
+        People sharing only name trigrams are not candidates; see
+        ``ANCHOR_KEY_KINDS``.
+        """
+        if not any(kind in ANCHOR_KEY_KINDS for kind in keys):
+            return []
+
+        shared = Q()
+        for kind, values in keys.items():
+            shared |= Q(kind=kind, value__in=list(values))
+        weight = Case(
+            *(When(kind=kind, then=Value(points)) for kind, points in MATCH_KEY_WEIGHTS.items()),
+            default=Value(0),
+            output_field=IntegerField(),
+        )
+        return list(
+            cls.objects.filter(shared)
+            .values("person_id")
+            .annotate(score=Sum(weight), anchors=Count("pk", filter=Q(kind__in=ANCHOR_KEY_KINDS)))
+            .filter(anchors__gt=0)
+            .order_by("-score", "person_id")
+            .values_list("person_id", flat=True)[:limit]
+        )
+
 
 class Contact(AuditModel):
     """Contact information for any person.
@@ -20,6 +20,7 @@ from django.core.exceptions import ValidationError
 from django.db import connection, transaction
 from django.utils import timezone
 
+from apps.common.audit_sink import record_audit_entry
 from apps.common.constants import is_cambodian_province
 from apps.people.models import (
     EmergencyContact,
@@ -368,33 +369,37 @@ class StudentConversionService:
     ) -> None:
         """Create audit logs for the student conversion."""
         # Log in PersonEventLog
-        PersonEventLog.objects.create(
-            person=person,
-            action=PersonEventLog.ActionType.OTHER,
-            changed_by=converted_by,
-            details={
-                "conversion_type": "level_testing_to_student",
-                "original_test_number": potential_student.test_number,
-                "student_number": student_profile.student_id,
-                "conversion_date": timezone.now().isoformat(),
-            },
-            notes=(
-                f"Converted from level testing applicant {potential_student.test_number} "
-                f"to student {student_profile.student_id}"
-            ),
+        record_audit_entry(
+            PersonEventLog(
+                person=person,
+                action=PersonEventLog.ActionType.OTHER,
+                changed_by=converted_by,
+                details={
+                    "conversion_type": "level_testing_to_student",
+                    "original_test_number": potential_student.test_number,
+                    "student_number": student_profile.student_id,
+                    "conversion_date": timezone.now().isoformat(),
+                },
+                notes=(
+                    f"Converted from level testing applicant {potential_student.test_number} "
+                    f"to student {student_profile.student_id}"
+                ),
+            )
         )
 
         # Log in StudentAuditLog
-        StudentAuditLog.objects.create(
-            student=student_profile,
-            action=StudentAuditLog.ActionType.OTHER,
-            changed_by=converted_by,
-            changes={
-                "action": "student_creation_from_level_testing",
-                "original_test_number": potential_student.test_number,
-                "conversion_date": timezone.now().isoformat(),
-            },
-            notes=f"Student profile created from level testing application {potential_student.test_number}",
+        record_audit_entry(
+            StudentAuditLog(
+                student=student_profile,
+                action=StudentAuditLog.ActionType.OTHER,
+                changed_by=converted_by,
+                changes={
+                    "action": "student_creation_from_level_testing",
+                    "original_test_number": potential_student.test_number,
+                    "conversion_date": timezone.now().isoformat(),
+                },
+                notes=f"Student profile created from level testing application {potential_student.test_number}",
+            )
         )
 
     @classmethod
@@ -920,15 +925,17 @@ class StudentProfileService:
 
         # Create audit log
         if created_by:
-            StudentAuditLog.objects.create(
-                student=student_profile,
-                action=StudentAuditLog.ActionType.CREATE,
-                changed_by=created_by,
-                changes={
-                    "student_id": student_profile.student_id,
-                    "person_id": person.id,
-                },
-                notes="Student profile created",
+            record_audit_entry(
+                StudentAuditLog(
+                    student=student_profile,
+                    action=StudentAuditLog.ActionType.CREATE,
+                    changed_by=created_by,
+                    changes={
+                        "student_id": student_profile.student_id,
+                        "person_id": person.id,
+                    },
+                    notes="Student profile created",
+                )
             )
 
         return student_profile
@@ -966,17 +973,19 @@ class PersonMergeService:
             raise ValidationError(msg)
 
         # Log the merge operation
-        PersonEventLog.objects.create(
-            person=primary_person,
-            action=PersonEventLog.ActionType.OTHER,
-            changed_by=merged_by,
-            details={
-                "action": "person_merge",
-                "duplicate_person_id": duplicate_person.id,
-                "duplicate_person_name": duplicate_person.full_name,
-                "merge_strategy": merge_strategy,
-            },
-            notes=f"Merged duplicate person record {duplicate_person.full_name} (ID: {duplicate_person.id})",
+        record_audit_entry(
+            PersonEventLog(
+                person=primary_person,
+                action=PersonEventLog.ActionType.OTHER,
+                changed_by=merged_by,
+                details={
+                    "action": "person_merge",
+                    "duplicate_person_id": duplicate_person.id,
+                    "duplicate_person_name": duplicate_person.full_name,
+                    "merge_strategy": merge_strategy,
+                },
+                notes=f"Merged duplicate person record {duplicate_person.full_name} (ID: {duplicate_person.id})",
+            )
         )
 
         # Merge related records
@@ -1039,17 +1048,19 @@ class PersonMergeService:
             try:
                 primary_student = primary_person.student_profile
                 # Both have student profiles - this is complex, log for manual review
-                PersonEventLog.objects.create(
-                    person=primary_person,
-                    action=PersonEventLog.ActionType.OTHER,
-                    changed_by=merged_by,
-                    details={
-                        "action": "manual_review_required",
-                        "reason": "both_persons_have_student_profiles",
-                        "duplicate_student_id": duplicate_student.student_id,
-                        "primary_student_id": primary_student.student_id,
-                    },
-                    notes="Manual review required: both persons have student profiles",
+                record_audit_entry(
+                    PersonEventLog(
+                        person=primary_person,
+                        action=PersonEventLog.ActionType.OTHER,
+                        changed_by=merged_by,
+                        details={
+                            "action": "manual_review_required",
+                            "reason": "both_persons_have_student_profiles",
+                            "duplicate_student_id": duplicate_student.student_id,
+                            "primary_student_id": primary_student.student_id,
+                        },
+                        notes="Manual review required: both persons have student profiles",
+                    )
                 )
             except AttributeError:
                 # Only duplicate has student profile - transfer it
@@ -0,0 +1,117 @@
+"""
+Tests for duplicate-detection blocking keys.
+
+Verifies that name keys ignore word order and case, that phonetic and
+trigram keys tolerate small spelling differences, that birth-month probes
+cover the similar-birth-date window, that phone keys line up with the
+last-eight-digit comparison used by the scorer, and that candidates must
+share more than name trigrams.
+"""
+
+from datetime import date
+
+import pytest
+
+from apps.people.match_keys import (
+    KEY_BIRTH_DATE,
+    KEY_BIRTH_MONTH,
+    KEY_EMAIL,
+    KEY_NAME,
+    KEY_PHONE,
+    KEY_TRIGRAM,
+    birth_months,
+    match_keys,
+    name_key,
+    name_trigrams,
+    phone_key,
+    soundex,
+)
+from apps.people.models import Person, PersonMatchKey
+
+
+@pytest.mark.unit
+class TestNameKeys:
+    """Test name normalization, phonetic codes and trigrams."""
+
+    def test_name_key_ignores_order_case_and_punctuation(self):
+        assert name_key("Sophal Chan") == name_key("CHAN, SOPHAL") == "chan sophal"
+
+    def test_soundex(self):
+        assert soundex("Robert") == soundex("Rupert") == "R163"
+        assert soundex("Ashcraft") == "A261"
+        assert soundex("Sophal") == soundex("Sophall")
+
+    def test_soundex_skips_non_latin_words(self):
+        assert soundex("សុផល") == ""
+
+    def test_trigrams_overlap_for_misspellings(self):
+        shared = name_trigrams("Sokha Chan") & name_trigrams("Sokhaa Chann")
+
+        assert {"sok", "okh", "kha", "cha", "han"} <= shared
+
+    def test_trigrams_are_not_padded_at_word_edges(self):
+        assert name_trigrams("Sokha Ly") == {"sok", "okh", "kha"}
+
+
+@pytest.mark.unit
+class TestMatchKeys:
+    """Test the keys indexed for people and probed for registrations."""
+
+    def test_birth_months_cover_window(self):
+        assert birth_months(date(2005, 1, 15)) == {"2005-01"}
+        assert birth_months(date(2005, 1, 15), 30) == {"2004-12", "2005-01", "2005-02"}
+
+    def test_phone_key_uses_last_eight_digits(self):
+        assert phone_key("+855 12 345 678") == phone_key("012345678") == "12345678"
+        assert phone_key("1234") == ""
+
+    def test_match_keys(self):
+        keys = match_keys(
+            "Sophal Chan",
+            date(2005, 3, 10),
+            emails=[" Sophal@Example.com", None],
+            phones=["012 345 678"],
+            birth_window_days=30,
+        )
+
+        assert keys[KEY_NAME] == {"chan sophal"}
+        assert keys[KEY_BIRTH_DATE] == {"2005-03-10"}
+        assert keys[KEY_BIRTH_MONTH] == {"2005-02", "2005-03", "2005-04"}
+        assert keys[KEY_EMAIL] == {"sophal@example.com"}
+        assert keys[KEY_PHONE] == {"12345678"}
+
+    def test_missing_values_produce_no_keys(self):
+        assert match_keys("", None, emails=[""], phones=[None]) == {}
+
+
+@pytest.mark.django_db
+class TestRankCandidates:
+    """Test ranking people by the keys they share with a registration."""
+
+    def create_person(self, personal_name, family_name, date_of_birth):
+        person = Person.objects.create(
+            personal_name=personal_name, family_name=family_name, date_of_birth=date_of_birth
+        )
+        PersonMatchKey.refresh_for_people([person.pk])
+        return person
+
+    def test_trigram_overlap_alone_is_not_a_candidate(self):
+        self.create_person("Dara", "Chanthy", date(1990, 6, 1))
+
+        keys = match_keys("Sophal Chan", date(2005, 3, 10), birth_window_days=30)
+
+        assert PersonMatchKey.rank_candidates(keys, 10) == []
+
+    def test_trigrams_rank_candidates_sharing_a_stronger_key(self):
+        close = self.create_person("Sophall", "Chann", date(2005, 3, 12))
+        distant = self.create_person("Vanna", "Keo", date(2005, 3, 20))
+        exact = self.create_person("Sophal", "Chan", date(2005, 3, 10))
+
+        keys = match_keys("Sophal Chan", date(2005, 3, 10), birth_window_days=30)
+
+        assert PersonMatchKey.rank_candidates(keys, 10) == [exact.pk, close.pk, distant.pk]
+
+    def test_trigram_only_keys_rank_nobody(self):
+        self.create_person("Sophal", "Chan", date(2005, 3, 10))
+
+        assert PersonMatchKey.rank_candidates({KEY_TRIGRAM: {"cha", "oph"}}, 10) == []
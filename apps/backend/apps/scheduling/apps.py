@@ -8,4 +8,7 @@ class SchedulingConfig(AppConfig):
     verbose_name = _("Scheduling")
 
     def ready(self):
-        """Import signals when the app is ready."""
+        """Connect the receivers that drop cached room occupancy indexes."""
+        from .room_occupancy import connect_occupancy_invalidation
+
+        connect_occupancy_invalidation()
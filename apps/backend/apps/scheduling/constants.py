@@ -17,6 +17,7 @@ READING_CLASS_TIER_THRESHOLDS = {
 
 # Class Configuration
 DEFAULT_MAX_ENROLLMENT = 30
+SEAT_HOLDING_ENROLLMENT_STATUSES = ["ENROLLED", "ACTIVE"]  # Count toward ClassHeader.enrolled_count
 SECTION_ID_PATTERN = r"^[A-Z]$"
 
 # Session Configuration
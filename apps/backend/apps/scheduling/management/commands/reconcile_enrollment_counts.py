@@ -0,0 +1,37 @@
+"""Management command to reconcile class header seat counters.
+
+``ClassHeader.enrolled_count`` is maintained by enrollment saves and
+deletes. Use this command to repair drift after bulk imports or raw
+updates that bypass them.
+
+Usage:
+    # Reconcile every class
+    python manage.py reconcile_enrollment_counts
+
+    # Reconcile one term only
+    python manage.py reconcile_enrollment_counts --term 2025T1
+"""
+
+from django.core.management.base import BaseCommand
+
+from apps.scheduling.models import ClassHeader
+
+
+class Command(BaseCommand):
+    help = "Recount enrolled students and repair drifted class seat counters"
+
+    def add_arguments(self, parser):
+        """Add command arguments."""
+        parser.add_argument(
+            "--term",
+            help="Only reconcile classes in the term with this code",
+        )
+
+    def handle(self, *args, **options):
+        """Repair drifted counters in a single update."""
+        queryset = ClassHeader.objects.all()
+        if options["term"]:
+            queryset = queryset.filter(term__code=options["term"])
+
+        corrected = ClassHeader.reconcile_enrolled_counts(queryset)
+        self.stdout.write(self.style.SUCCESS(f"Reconciled seat counters; corrected {corrected} classes"))
@@ -0,0 +1,41 @@
+# Generated by Django 5.2 on 2025-08-01
+
+from django.db import migrations, models
+
+from apps.scheduling.time_bitmap import compile_weekly_bitmap, to_bytes
+
+
+def compile_bitmaps(apps, schema_editor):
+    ClassPart = apps.get_model("scheduling", "ClassPart")
+    parts = ClassPart.objects.only("id", "meeting_days", "start_time", "end_time")
+    batch = []
+    for part in parts.iterator(chunk_size=2000):
+        part.schedule_bitmap = to_bytes(compile_weekly_bitmap(part.meeting_days, part.start_time, part.end_time))
+        batch.append(part)
+        if len(batch) >= 2000:
+            ClassPart.objects.bulk_update(batch, ["schedule_bitmap"])
+            batch = []
+    if batch:
+        ClassPart.objects.bulk_update(batch, ["schedule_bitmap"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("scheduling", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="classpart",
+            name="schedule_bitmap",
+            field=models.BinaryField(
+                blank=True,
+                default=bytes,
+                editable=False,
+                help_text="Weekly 5-minute slot bitmap of the meeting pattern, refreshed on save",
+                verbose_name="Schedule Bitmap",
+            ),
+        ),
+        migrations.RunPython(compile_bitmaps, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,46 @@
+# Generated by Django 5.2 on 2025-08-01
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+from apps.scheduling.constants import SEAT_HOLDING_ENROLLMENT_STATUSES
+
+
+def count_enrolled(apps, schema_editor):
+    ClassHeader = apps.get_model("scheduling", "ClassHeader")
+    ClassHeaderEnrollment = apps.get_model("enrollment", "ClassHeaderEnrollment")
+    seats = (
+        ClassHeaderEnrollment.objects.filter(
+            class_header=OuterRef("pk"),
+            status__in=SEAT_HOLDING_ENROLLMENT_STATUSES,
+            is_deleted=False,
+        )
+        .order_by()
+        .values("class_header")
+        .annotate(count=Count("pk"))
+        .values("count")
+    )
+    ClassHeader.objects.update(enrolled_count=Coalesce(Subquery(seats), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("enrollment", "0002_initial"),
+        ("scheduling", "0002_classpart_schedule_bitmap"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="classheader",
+            name="enrolled_count",
+            field=models.PositiveIntegerField(
+                default=0,
+                editable=False,
+                help_text="Seats held by enrolled and active students, maintained by enrollments",
+                verbose_name="Enrolled Count",
+            ),
+        ),
+        migrations.RunPython(count_enrolled, migrations.RunPython.noop),
+    ]
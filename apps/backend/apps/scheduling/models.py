@@ -27,6 +27,8 @@ from django.conf import settings
 from django.core.exceptions import ValidationError
 from django.core.validators import MaxValueValidator, MinValueValidator, RegexValidator
 from django.db import models, transaction
+from django.db.models import Count, F, OuterRef, Subquery
+from django.db.models.functions import Coalesce
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 from uuid_extensions import uuid7
@@ -47,9 +49,11 @@ from .constants import (
     READING_CLASS_CONVERSION_THRESHOLD,
     READING_CLASS_MAX_TARGET_ENROLLMENT,
     READING_CLASS_TIER_THRESHOLDS,
+    SEAT_HOLDING_ENROLLMENT_STATUSES,
     SECTION_ID_PATTERN,
     VALID_MEETING_DAYS,
 )
+from .time_bitmap import compile_weekly_bitmap, from_bytes, to_bytes
 
 
 class CombinedCourseTemplate(AuditModel):
@@ -566,6 +570,12 @@ class ClassHeader(AuditModel):
         validators=[MinValueValidator(1), MaxValueValidator(100)],
         help_text=_("Maximum number of students allowed"),
     )
+    enrolled_count: models.PositiveIntegerField = models.PositiveIntegerField(
+        _("Enrolled Count"),
+        default=0,
+        editable=False,
+        help_text=_("Seats held by enrolled and active students, maintained by enrollments"),
+    )
 
     # Administrative details
     notes: models.TextField = models.TextField(
@@ -598,6 +608,9 @@ class ClassHeader(AuditModel):
             ),
         ]
 
+    # Maintained with conditional UPDATEs; excluded from ordinary saves
+    COUNTER_FIELDS = ("enrolled_count",)
+
     def __str__(self) -> str:
         return f"{self.course.code} {self.section_id} ({self.term})"
 
@@ -608,13 +621,8 @@ class ClassHeader(AuditModel):
 
     @property
     def enrollment_count(self) -> int:
-        """Get current enrollment count."""
-        # This will work once enrollment models are properly connected
-        return (
-            getattr(self, "class_header_enrollments", models.Manager())
-            .filter(status__in=["ENROLLED", "WAITLISTED"])
-            .count()
-        )
+        """Get current enrollment count from the seat counter."""
+        return self.enrolled_count
 
     @property
     def is_full(self) -> bool:
@@ -626,6 +634,60 @@ class ClassHeader(AuditModel):
         """Get number of available enrollment spots."""
         return max(0, self.max_enrollment - self.enrollment_count)
 
+    def reserve_seat(self) -> bool:
+        """Take a seat if one is free.
+
+        Issues a single conditional ``UPDATE ... WHERE enrolled_count <
+        max_enrollment``, so concurrent enrollments never oversell the
+        class and no row lock is held beforehand.
+
+        Returns:
+            Whether a seat was taken
+        """
+        reserved = ClassHeader.objects.filter(pk=self.pk, enrolled_count__lt=F("max_enrollment")).update(
+            enrolled_count=F("enrolled_count") + 1
+        )
+        if reserved:
+            self.enrolled_count += 1
+        return bool(reserved)
+
+    @classmethod
+    def adjust_enrolled_count(cls, class_header_id: int, delta: int) -> None:
+        """Unconditionally add ``delta`` seats to a class's counter, never going below zero."""
+        queryset = cls.objects.filter(pk=class_header_id)
+        if delta < 0:
+            queryset = queryset.filter(enrolled_count__gte=-delta)
+        queryset.update(enrolled_count=F("enrolled_count") + delta)
+
+    @classmethod
+    def reconcile_enrolled_counts(cls, queryset: models.QuerySet | None = None) -> int:
+        """Recount seat holders and repair drifted counters.
+
+        Args:
+            queryset: Class headers to check (defaults to all)
+
+        Returns:
+            Number of class headers whose counter was corrected
+        """
+        from apps.enrollment.models import ClassHeaderEnrollment
+
+        actual = Coalesce(
+            Subquery(
+                ClassHeaderEnrollment.objects.filter(
+                    class_header=OuterRef("pk"),
+                    status__in=SEAT_HOLDING_ENROLLMENT_STATUSES,
+                )
+                .order_by()
+                .values("class_header")
+                .annotate(count=Count("pk"))
+                .values("count"),
+            ),
+            0,
+        )
+        queryset = cls.objects.all() if queryset is None else queryset
+        drifted = queryset.annotate(actual_count=actual).exclude(enrolled_count=F("actual_count"))
+        return cls.objects.filter(pk__in=drifted.values("pk")).update(enrolled_count=actual)
+
     @property
     def is_combined(self) -> bool:
         """Check if this class is part of a combined class instance."""
@@ -830,6 +892,19 @@ class ClassHeader(AuditModel):
                     days.update(part_days)
         return sorted(days)
 
+    def _do_update(self, base_qs, using, pk_val, values, update_fields, forced_update):
+        """Leave ``enrolled_count`` out of updates of an existing class.
+
+        The counter is maintained by conditional ``UPDATE`` statements, so
+        writing back the value loaded with a stale instance would undo
+        concurrent enrollments and drops. It is still written when named in
+        ``update_fields``, and by the insert Django falls back to when the
+        row no longer exists.
+        """
+        if update_fields is None and not self._state.adding:
+            values = [value for value in values if value[0].name not in self.COUNTER_FIELDS]
+        return super()._do_update(base_qs, using, pk_val, values, update_fields, forced_update)
+
     def save(self, *args, **kwargs):
         """Ensure pairing symmetry on save."""
         # Use transaction to ensure consistency
@@ -1096,6 +1171,13 @@ class ClassPart(AuditModel):
         blank=True,
         help_text=_("When this part ends (filled by scheduler)"),
     )
+    schedule_bitmap: models.BinaryField = models.BinaryField(
+        _("Schedule Bitmap"),
+        default=bytes,
+        blank=True,
+        editable=False,
+        help_text=_("Weekly 5-minute slot bitmap of the meeting pattern, refreshed on save"),
+    )
 
     # Academic configuration
     grade_weight: models.DecimalField = models.DecimalField(
@@ -1182,6 +1264,13 @@ class ClassPart(AuditModel):
             return [day.strip() for day in self.meeting_days.split(",") if day.strip()]
         return []
 
+    @property
+    def weekly_bitmap(self) -> int:
+        """Get the weekly slot bitmap, compiling it if it has not been stored yet."""
+        if self.schedule_bitmap:
+            return from_bytes(self.schedule_bitmap)
+        return compile_weekly_bitmap(self.meeting_days, self.start_time, self.end_time)
+
     @property
     def enrollment_count(self) -> int:
         """Get current enrollment count for this part."""
@@ -1219,43 +1308,40 @@ class ClassPart(AuditModel):
         if self.room and self.start_time and self.end_time and self.meeting_days:
             self._validate_room_conflicts()
 
+    def save(self, *args, **kwargs):
+        """Refresh the schedule bitmap from the meeting pattern before saving."""
+        self.schedule_bitmap = to_bytes(compile_weekly_bitmap(self.meeting_days, self.start_time, self.end_time))
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None:
+            kwargs["update_fields"] = {*update_fields, "schedule_bitmap"}
+        super().save(*args, **kwargs)
+
     def _validate_room_conflicts(self) -> None:
-        """Check for room conflicts with other class parts."""
-        my_days = {day.strip().upper() for day in self.meeting_days.split(",")}
-
-        # More efficient approach: build database query to find day overlaps
-        from django.db.models import Q
-
-        # Build Q objects for each day overlap check
-        day_queries = Q()
-        for day in my_days:
-            # Use contains to match days in comma-separated format
-            day_queries |= Q(meeting_days__icontains=day)
-
-        # Find conflicting parts with database-level filtering
-        conflicting_parts = (
-            ClassPart.objects.filter(
-                room=self.room,
-                start_time__lt=self.end_time,
-                end_time__gt=self.start_time,
-            )
-            .filter(day_queries)
-            .exclude(pk=self.pk)
+        """Check for room conflicts with other class parts in the same term."""
+        from .room_occupancy import build_room_occupancy
+
+        occupancy = build_room_occupancy(
+            self.class_session.class_header.term_id,
+            self.room_id,
+            exclude_part_id=self.pk,
         )
+        conflicts = occupancy.conflicts(self.meeting_days, self.start_time, self.end_time)
+        if not conflicts:
+            return
 
-        # Verify actual conflicts (since __icontains can have false positives)
-        for part in conflicting_parts:
-            if part.meeting_days:
-                other_days = {day.strip().upper() for day in part.meeting_days.split(",")}
-                overlapping_days = my_days & other_days
-                if overlapping_days:  # If days actually overlap
-                    raise ValidationError(
-                        {
-                            "room": _(
-                                f"Room conflict with {part.class_session} on {', '.join(overlapping_days)}",
-                            ),
-                        },
-                    )
+        first_part_id = conflicts[0].part_id
+        overlapping_days = sorted(
+            {interval.day for interval in conflicts if interval.part_id == first_part_id},
+            key=VALID_MEETING_DAYS.index,
+        )
+        part = ClassPart.objects.select_related("class_session__class_header").get(pk=first_part_id)
+        raise ValidationError(
+            {
+                "room": _(
+                    f"Room conflict with {part.class_session} on {', '.join(overlapping_days)}",
+                ),
+            },
+        )
 
 
 # RoomSchedule model removed - using simple conflict validation in ClassPart instead
@@ -0,0 +1,76 @@
+"""Sweep-line overlap detection for weekly meeting intervals.
+
+Intervals are grouped by resource (a room, a teacher, a student) and each
+group is swept in start order while an end-ordered heap holds the meetings
+still in progress. Every pair that shares time is reported once with the
+minutes it overlaps, in O(n log n + k) for n intervals and k overlaps.
+"""
+
+import heapq
+from collections import defaultdict
+from collections.abc import Hashable, Iterable
+from dataclasses import dataclass
+
+from .room_occupancy import Interval
+
+
+@dataclass(frozen=True)
+class Overlap:
+    """Two intervals on the same resource that share time."""
+
+    resource: Hashable
+    first: Interval
+    second: Interval
+
+    @property
+    def start(self) -> int:
+        return max(self.first.start, self.second.start)
+
+    @property
+    def end(self) -> int:
+        return min(self.first.end, self.second.end)
+
+    @property
+    def minutes(self) -> int:
+        return self.end - self.start
+
+    @property
+    def day(self) -> str:
+        return Interval(self.start, self.end).day
+
+
+def sweep_overlaps(intervals: Iterable[Interval]) -> list[tuple[Interval, Interval]]:
+    """Return every overlapping pair among ``intervals``.
+
+    Intervals belonging to the same part never overlap each other, and
+    back-to-back intervals do not overlap.
+    """
+    pairs: list[tuple[Interval, Interval]] = []
+    active: list[tuple[int, int, Interval]] = []
+    for order, interval in enumerate(sorted(intervals)):
+        while active and active[0][0] <= interval.start:
+            heapq.heappop(active)
+        for _end, _order, other in active:
+            if other.part_id is None or other.part_id != interval.part_id:
+                pairs.append((other, interval))
+        heapq.heappush(active, (interval.end, order, interval))
+    return pairs
+
+
+def find_overlaps(keyed_intervals: Iterable[tuple[Hashable, Interval]]) -> list[Overlap]:
+    """Find overlapping intervals per resource.
+
+    Args:
+        keyed_intervals: ``(resource, interval)`` pairs
+
+    Returns:
+        Overlaps ordered by resource insertion order and start time
+    """
+    by_resource: dict[Hashable, list[Interval]] = defaultdict(list)
+    for resource, interval in keyed_intervals:
+        by_resource[resource].append(interval)
+    return [
+        Overlap(resource, first, second)
+        for resource, intervals in by_resource.items()
+        for first, second in sweep_overlaps(intervals)
+    ]
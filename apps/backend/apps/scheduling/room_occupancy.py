@@ -0,0 +1,284 @@
+"""Per-term room occupancy indexes.
+
+Class part meeting patterns are normalized into weekly intervals measured
+in minutes from Monday 00:00, one interval per meeting day. Each room's
+intervals for a term are held in a static interval tree (an implicit
+balanced tree over the start-sorted intervals, augmented with subtree
+maximum end times) for O(log n + k) conflict lookups, alongside the merged
+busy periods used for free-slot and utilization queries.
+
+Indexes are built from a single query scoped to a term (and optionally a
+room), so conflict checks never scan class parts from other terms. Single
+room indexes are cached per (term, room) and dropped whenever a class part
+in that slot is saved, moved or deleted; bulk ``QuerySet.update`` calls
+bypass the signals, so entries also expire after
+``ROOM_OCCUPANCY_CACHE_TIMEOUT``.
+"""
+
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import time
+from typing import Any
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import post_save, pre_delete, pre_save
+
+from .constants import VALID_MEETING_DAYS
+
+ROOM_OCCUPANCY_CACHE_KEY = "scheduling:room_occupancy:{term_id}:{room_id}"
+ROOM_OCCUPANCY_CACHE_TIMEOUT = 3600
+
+MINUTES_PER_DAY = 24 * 60
+DAY_INDEX = {day: index for index, day in enumerate(VALID_MEETING_DAYS)}
+
+# Teaching window assumed by the utilization report
+UTILIZATION_DAYS = ("MON", "TUE", "WED", "THU", "FRI", "SAT")
+UTILIZATION_DAY_START = time(7, 0)
+UTILIZATION_DAY_END = time(21, 0)
+
+
+@dataclass(frozen=True, order=True)
+class Interval:
+    """One weekly meeting of a class part, in minutes from Monday 00:00."""
+
+    start: int
+    end: int
+    part_id: int | None = None
+
+    @property
+    def day(self) -> str:
+        return VALID_MEETING_DAYS[self.start // MINUTES_PER_DAY]
+
+
+def minutes(value: time) -> int:
+    """Minutes since midnight."""
+    return value.hour * 60 + value.minute
+
+
+def meeting_intervals(
+    meeting_days: str, start_time: time | None, end_time: time | None, part_id: int | None = None
+) -> list[Interval]:
+    """Normalize a meeting pattern into one weekly interval per meeting day."""
+    if not meeting_days or start_time is None or end_time is None:
+        return []
+    start, end = minutes(start_time), minutes(end_time)
+    if end <= start:
+        return []
+    days = {day.strip().upper() for day in meeting_days.split(",")}
+    return [
+        Interval(DAY_INDEX[day] * MINUTES_PER_DAY + start, DAY_INDEX[day] * MINUTES_PER_DAY + end, part_id)
+        for day in sorted(days & DAY_INDEX.keys(), key=DAY_INDEX.__getitem__)
+    ]
+
+
+class RoomOccupancy:
+    """Static interval index of one room's meetings in one term."""
+
+    def __init__(self, intervals: Iterable[Interval] = ()):
+        self.intervals = sorted(intervals)
+        self._max_end = [0] * len(self.intervals)
+        self._build(0, len(self.intervals))
+
+        self.busy: list[tuple[int, int]] = []
+        for interval in self.intervals:
+            if self.busy and interval.start <= self.busy[-1][1]:
+                if interval.end > self.busy[-1][1]:
+                    self.busy[-1] = (self.busy[-1][0], interval.end)
+            else:
+                self.busy.append((interval.start, interval.end))
+        self._busy_starts = [start for start, _end in self.busy]
+
+    def _build(self, lo: int, hi: int) -> int:
+        if lo >= hi:
+            return 0
+        mid = (lo + hi) // 2
+        self._max_end[mid] = max(self.intervals[mid].end, self._build(lo, mid), self._build(mid + 1, hi))
+        return self._max_end[mid]
+
+    def overlapping(self, start: int, end: int) -> list[Interval]:
+        """Intervals that overlap ``[start, end)``."""
+        found: list[Interval] = []
+        stack = [(0, len(self.intervals))]
+        while stack:
+            lo, hi = stack.pop()
+            if lo >= hi:
+                continue
+            mid = (lo + hi) // 2
+            if self._max_end[mid] <= start:
+                continue
+            stack.append((lo, mid))
+            interval = self.intervals[mid]
+            if interval.start < end:
+                if interval.end > start:
+                    found.append(interval)
+                stack.append((mid + 1, hi))
+        return sorted(found)
+
+    def is_free(self, start: int, end: int) -> bool:
+        """Whether nothing is booked in ``[start, end)``."""
+        index = bisect_left(self._busy_starts, end)
+        return index == 0 or self.busy[index - 1][1] <= start
+
+    def conflicts(self, meeting_days: str, start_time: time | None, end_time: time | None) -> list[Interval]:
+        """Booked intervals that clash with a meeting pattern."""
+        found: list[Interval] = []
+        for interval in meeting_intervals(meeting_days, start_time, end_time):
+            found.extend(self.overlapping(interval.start, interval.end))
+        return found
+
+    def free_slots(self, day: str, earliest: time, latest: time, min_minutes: int = 0) -> list[tuple[time, time]]:
+        """Free periods of at least ``min_minutes`` on ``day`` between two times."""
+        offset = DAY_INDEX[day.upper()] * MINUTES_PER_DAY
+        window_start, window_end = offset + minutes(earliest), offset + minutes(latest)
+
+        slots = []
+        cursor = window_start
+        first = max(bisect_right(self._busy_starts, window_start) - 1, 0)
+        for busy_start, busy_end in self.busy[first:]:
+            if busy_start >= window_end:
+                break
+            if busy_end <= cursor:
+                continue
+            if busy_start - cursor >= max(min_minutes, 1):
+                slots.append((cursor, busy_start))
+            cursor = max(cursor, busy_end)
+        if window_end - cursor >= max(min_minutes, 1):
+            slots.append((cursor, window_end))
+        return [(_to_time(start - offset), _to_time(end - offset)) for start, end in slots]
+
+    def busy_minutes(self, window_start: int = 0, window_end: int | None = None) -> int:
+        """Minutes booked per week, optionally clipped to a window."""
+        window_end = 7 * MINUTES_PER_DAY if window_end is None else window_end
+        return sum(max(0, min(end, window_end) - max(start, window_start)) for start, end in self.busy)
+
+    def double_booked_minutes(self) -> int:
+        """Minutes per week in which two or more meetings share the room."""
+        total = sum(interval.end - interval.start for interval in self.intervals)
+        return total - self.busy_minutes()
+
+
+def _to_time(value: int) -> time:
+    if value >= MINUTES_PER_DAY:
+        return time(23, 59)
+    return time(value // 60, value % 60)
+
+
+def _class_parts(term_id: int):
+    from .models import ClassPart
+
+    return ClassPart.objects.filter(
+        class_session__class_header__term_id=term_id,
+        room__isnull=False,
+        start_time__isnull=False,
+        end_time__isnull=False,
+    ).exclude(meeting_days="")
+
+
+def build_room_occupancy(term_id: int, room_id: int, exclude_part_id: int | None = None) -> RoomOccupancy:
+    """Index one room's meetings in a term, from the cache when possible."""
+    key = ROOM_OCCUPANCY_CACHE_KEY.format(term_id=term_id, room_id=room_id)
+    occupancy = cache.get(key)
+    if occupancy is None:
+        intervals: list[Interval] = []
+        for part_id, meeting_days, start_time, end_time in (
+            _class_parts(term_id).filter(room_id=room_id).values_list("id", "meeting_days", "start_time", "end_time")
+        ):
+            intervals.extend(meeting_intervals(meeting_days, start_time, end_time, part_id))
+        occupancy = RoomOccupancy(intervals)
+        cache.set(key, occupancy, ROOM_OCCUPANCY_CACHE_TIMEOUT)
+
+    if exclude_part_id is not None and any(interval.part_id == exclude_part_id for interval in occupancy.intervals):
+        return RoomOccupancy(interval for interval in occupancy.intervals if interval.part_id != exclude_part_id)
+    return occupancy
+
+
+def invalidate_room_occupancy(term_id: int, room_id: int) -> None:
+    """Drop a cached room index now and again once the transaction commits.
+
+    The second delete covers readers that rebuilt the index from
+    pre-commit data while the transaction was open.
+    """
+    key = ROOM_OCCUPANCY_CACHE_KEY.format(term_id=term_id, room_id=room_id)
+    cache.delete(key)
+    transaction.on_commit(lambda: cache.delete(key))
+
+
+def _occupancy_slot(class_session_id: int | None, room_id: int | None) -> tuple[int, int] | None:
+    """The (term, room) index a class part belongs to, if it has a room."""
+    if room_id is None or class_session_id is None:
+        return None
+    from .models import ClassSession
+
+    term_id = ClassSession.objects.filter(pk=class_session_id).values_list("class_header__term_id", flat=True).first()
+    return None if term_id is None else (term_id, room_id)
+
+
+def _remember_occupancy_slot(sender: Any, instance: Any, **kwargs: Any) -> None:
+    previous = None
+    if instance.pk:
+        previous = sender.objects.filter(pk=instance.pk).values_list("class_session_id", "room_id").first()
+    instance._previous_occupancy_slot = _occupancy_slot(*previous) if previous else None
+
+
+def _class_part_saved(sender: Any, instance: Any, **kwargs: Any) -> None:
+    slots = {
+        getattr(instance, "_previous_occupancy_slot", None),
+        _occupancy_slot(instance.class_session_id, instance.room_id),
+    }
+    for slot in slots - {None}:
+        invalidate_room_occupancy(*slot)
+
+
+def _class_part_deleted(sender: Any, instance: Any, **kwargs: Any) -> None:
+    slot = _occupancy_slot(instance.class_session_id, instance.room_id)
+    if slot is not None:
+        invalidate_room_occupancy(*slot)
+
+
+def connect_occupancy_invalidation() -> None:
+    """Drop cached room indexes when class parts change.
+
+    Idempotent: receivers use fixed ``dispatch_uid`` values. ``pre_delete``
+    is used so the part's term can still be read during cascades.
+    """
+    from .models import ClassPart
+
+    pre_save.connect(_remember_occupancy_slot, sender=ClassPart, dispatch_uid="room_occupancy_remember_slot")
+    post_save.connect(_class_part_saved, sender=ClassPart, dispatch_uid="room_occupancy_part_saved")
+    pre_delete.connect(_class_part_deleted, sender=ClassPart, dispatch_uid="room_occupancy_part_deleted")
+
+
+def build_term_occupancy(term_id: int) -> dict[int, RoomOccupancy]:
+    """Index every room's meetings in a term with one query."""
+    intervals: dict[int, list[Interval]] = defaultdict(list)
+    for part_id, room_id, meeting_days, start_time, end_time in _class_parts(term_id).values_list(
+        "id", "room_id", "meeting_days", "start_time", "end_time"
+    ):
+        intervals[room_id].extend(meeting_intervals(meeting_days, start_time, end_time, part_id))
+    return {room_id: RoomOccupancy(room_intervals) for room_id, room_intervals in intervals.items()}
+
+
+def utilization_summary(
+    occupancy: RoomOccupancy,
+    days: Iterable[str] = UTILIZATION_DAYS,
+    day_start: time = UTILIZATION_DAY_START,
+    day_end: time = UTILIZATION_DAY_END,
+) -> dict[str, float | int]:
+    """Booked, available and double-booked minutes per week for one room."""
+    available = booked = 0
+    for day in days:
+        offset = DAY_INDEX[day] * MINUTES_PER_DAY
+        window_start, window_end = offset + minutes(day_start), offset + minutes(day_end)
+        available += window_end - window_start
+        booked += occupancy.busy_minutes(window_start, window_end)
+    return {
+        "meeting_count": len(occupancy.intervals),
+        "part_count": len({interval.part_id for interval in occupancy.intervals}),
+        "booked_minutes": booked,
+        "available_minutes": available,
+        "double_booked_minutes": occupancy.double_booked_minutes(),
+        "utilization_rate": round(booked / available * 100, 1) if available else 0.0,
+    }
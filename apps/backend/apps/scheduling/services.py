@@ -25,6 +25,7 @@ from .models import (
     ReadingClass,
     TestPeriodReset,
 )
+from .room_occupancy import build_room_occupancy, build_term_occupancy, meeting_intervals, utilization_summary
 
 User = get_user_model()
 logger = logging.getLogger(__name__)
@@ -348,11 +349,12 @@ class SchedulingService:
         return class1, class2
 
     @classmethod
-    def get_room_availability(cls, room, start_time, end_time, meeting_days: str, exclude_part=None):
-        """Check room availability for given time slots.
+    def get_room_availability(cls, room, term, start_time, end_time, meeting_days: str, exclude_part=None):
+        """Check room availability for given time slots within a term.
 
         Args:
             room: Room instance
+            term: Term whose class parts are checked
             start_time: Start time
             end_time: End time
             meeting_days: Comma-separated meeting days
@@ -361,38 +363,51 @@ class SchedulingService:
         Returns:
             Boolean indicating if room is available
         """
-        from django.db.models import Q
-
-        from .models import ClassPart
+        occupancy = build_room_occupancy(term.pk, room.pk, exclude_part_id=exclude_part.pk if exclude_part else None)
+        return all(
+            occupancy.is_free(interval.start, interval.end)
+            for interval in meeting_intervals(meeting_days, start_time, end_time)
+        )
 
-        if not meeting_days:
-            return True
+    @classmethod
+    def get_room_free_slots(cls, room, term, day: str, earliest, latest, min_minutes: int = 0) -> list[tuple]:
+        """List free periods for a room on one weekday of a term.
 
-        my_days = {day.strip().upper() for day in meeting_days.split(",")}
+        Args:
+            room: Room instance
+            term: Term whose class parts are checked
+            day: Weekday code (MON, TUE, ...)
+            earliest: Start of the window to search
+            latest: End of the window to search
+            min_minutes: Shortest free period to report
 
-        # Build query for day overlaps
-        day_queries = Q()
-        for day in my_days:
-            day_queries |= Q(meeting_days__icontains=day)
+        Returns:
+            List of (start_time, end_time) tuples
+        """
+        return build_room_occupancy(term.pk, room.pk).free_slots(day, earliest, latest, min_minutes)
 
-        # Check for conflicts
-        conflicts = ClassPart.objects.filter(
-            room=room,
-            start_time__lt=end_time,
-            end_time__gt=start_time,
-        ).filter(day_queries)
+    @classmethod
+    def get_room_utilization_report(cls, term) -> list[dict]:
+        """Report weekly utilization of every booked room in a term.
 
-        if exclude_part:
-            conflicts = conflicts.exclude(pk=exclude_part.pk)
+        Loads the term's class parts once and indexes them per room.
 
-        # Verify actual day overlaps
-        for part in conflicts:
-            if part.meeting_days:
-                other_days = {day.strip().upper() for day in part.meeting_days.split(",")}
-                if my_days & other_days:
-                    return False
+        Args:
+            term: Term to report on
 
-        return True
+        Returns:
+            List of per-room utilization dictionaries, busiest first
+        """
+        from apps.common.models import Room
+
+        occupancy_by_room = build_term_occupancy(term.pk)
+        rooms = Room.objects.in_bulk(list(occupancy_by_room))
+        report = [
+            {"room": rooms.get(room_id), "room_id": room_id, **utilization_summary(occupancy)}
+            for room_id, occupancy in occupancy_by_room.items()
+        ]
+        report.sort(key=lambda row: row["utilization_rate"], reverse=True)
+        return report
 
 
 class ReadingClassService:
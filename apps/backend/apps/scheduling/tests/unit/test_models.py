@@ -0,0 +1,112 @@
+"""
+Tests for ClassHeader seat counter persistence.
+
+Verifies that editing a class through an instance loaded before concurrent
+enrollments or drops does not write its stale ``enrolled_count`` back, and
+that inserts, including re-saving a deleted class, still write it.
+"""
+
+import pytest
+
+from apps.curriculum.models import Course, Cycle, Division, Term
+from apps.enrollment.models import ClassHeaderEnrollment
+from apps.people.models import Person, StudentProfile
+from apps.scheduling.models import ClassHeader
+
+
+@pytest.mark.django_db
+class TestClassHeaderSeatCounter:
+    """Test that header edits leave the seat counter alone."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, user):
+        self.user = user
+        term = Term.objects.create(
+            code="FALL24", term_type=Term.TermType.BACHELORS, start_date="2024-09-01", end_date="2024-12-15"
+        )
+        cycle = Cycle.objects.create(division=Division.objects.create(name="Academic"), name="Bachelor")
+        course = Course.objects.create(code="ENG-101", title="English", short_title="ENG", cycle=cycle)
+        self.header = ClassHeader.objects.create(course=course, term=term, section_id="A", max_enrollment=10)
+
+    def _enroll(self, number):
+        person = Person.objects.create(
+            personal_name=f"Student{number}", family_name="Test", date_of_birth="2000-01-01"
+        )
+        student = StudentProfile.objects.create(person=person, student_id=30000 + number)
+        return ClassHeaderEnrollment.objects.create(
+            student=student, class_header=self.header, status="ENROLLED", enrolled_by=self.user
+        )
+
+    def _stored_count(self):
+        return ClassHeader.objects.values_list("enrolled_count", flat=True).get(pk=self.header.pk)
+
+    def test_edit_after_concurrent_enrollments_keeps_counter(self):
+        edited = ClassHeader.objects.get(pk=self.header.pk)
+        self._enroll(1)
+        self._enroll(2)
+
+        edited.notes = "Moved to the afternoon"
+        edited.save()
+
+        assert self._stored_count() == 2
+        assert ClassHeader.objects.get(pk=self.header.pk).notes == "Moved to the afternoon"
+
+    def test_edit_after_concurrent_drop_keeps_counter(self):
+        enrollments = [self._enroll(1), self._enroll(2)]
+        edited = ClassHeader.objects.get(pk=self.header.pk)
+        assert edited.enrolled_count == 2
+
+        enrollments[0].status = "DROPPED"
+        enrollments[0].save()
+        edited.max_enrollment = 20
+        edited.save()
+
+        assert self._stored_count() == 1
+
+    def test_edit_after_concurrent_seat_reservation_keeps_counter(self):
+        edited = ClassHeader.objects.get(pk=self.header.pk)
+        assert ClassHeader.objects.get(pk=self.header.pk).reserve_seat()
+
+        edited.section_id = "B"
+        edited.save()
+
+        assert self._stored_count() == 1
+
+    def test_counter_is_written_when_named(self):
+        self.header.enrolled_count = 5
+        self.header.save(update_fields=["enrolled_count"])
+
+        assert self._stored_count() == 5
+
+    def test_new_class_with_explicit_pk_writes_counter(self):
+        header = ClassHeader(
+            pk=self.header.pk + 100,
+            course=self.header.course,
+            term=self.header.term,
+            section_id="B",
+            enrolled_count=3,
+        )
+        header.save()
+
+        assert ClassHeader.objects.values_list("enrolled_count", flat=True).get(pk=header.pk) == 3
+
+    def test_resaving_deleted_class_inserts_it(self):
+        pk = self.header.pk
+        ClassHeader.objects.filter(pk=pk).delete()
+        self.header.enrolled_count = 2
+
+        self.header.save()
+
+        assert self._stored_count() == 2
+        assert self.header.pk == pk
+
+    def test_copying_loaded_class_inserts_it(self):
+        copy = ClassHeader.objects.get(pk=self.header.pk)
+        copy.pk = None
+        copy.section_id = "C"
+        copy.enrolled_count = 4
+
+        copy.save()
+
+        assert copy.pk != self.header.pk
+        assert ClassHeader.objects.values_list("enrolled_count", flat=True).get(pk=copy.pk) == 4
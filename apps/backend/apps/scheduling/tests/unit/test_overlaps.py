@@ -0,0 +1,68 @@
+"""
+Tests for sweep-line overlap detection.
+
+Verifies that partial overlaps are found with their overlap minutes, that
+resources are swept independently, and that results match a brute-force
+pairwise scan.
+"""
+
+import random
+from datetime import time
+
+import pytest
+
+from apps.scheduling.overlaps import find_overlaps, sweep_overlaps
+from apps.scheduling.room_occupancy import MINUTES_PER_DAY, Interval, meeting_intervals
+
+
+@pytest.mark.unit
+class TestSweepOverlaps:
+    """Test overlap detection on one resource."""
+
+    def test_partial_overlap_is_found(self):
+        first = meeting_intervals("MON", time(8, 0), time(9, 30), part_id=1)
+        second = meeting_intervals("MON", time(9, 0), time(10, 30), part_id=2)
+
+        overlaps = find_overlaps(("room", interval) for interval in first + second)
+
+        assert len(overlaps) == 1
+        assert overlaps[0].minutes == 30
+        assert overlaps[0].day == "MON"
+
+    def test_back_to_back_and_same_part_do_not_overlap(self):
+        intervals = [Interval(0, 60, 1), Interval(60, 120, 2), Interval(30, 90, 2)]
+
+        assert sweep_overlaps(intervals) == [(Interval(0, 60, 1), Interval(30, 90, 2))]
+
+    def test_matches_brute_force(self):
+        rng = random.Random(7)
+        intervals = []
+        for part_id in range(200):
+            start = rng.randrange(0, 7 * MINUTES_PER_DAY - 180)
+            intervals.append(Interval(start, start + rng.randrange(15, 180), part_id))
+
+        found = {frozenset(pair) for pair in sweep_overlaps(intervals)}
+        expected = {
+            frozenset((a, b))
+            for index, a in enumerate(intervals)
+            for b in intervals[index + 1 :]
+            if a.start < b.end and b.start < a.end
+        }
+
+        assert found == expected
+
+
+@pytest.mark.unit
+class TestFindOverlaps:
+    """Test grouping by resource."""
+
+    def test_resources_are_swept_independently(self):
+        keyed = [
+            ("room-1", Interval(0, 60, 1)),
+            ("room-2", Interval(0, 60, 2)),
+            ("room-1", Interval(45, 90, 3)),
+        ]
+
+        overlaps = find_overlaps(keyed)
+
+        assert [(overlap.resource, overlap.minutes) for overlap in overlaps] == [("room-1", 15)]
@@ -0,0 +1,209 @@
+"""
+Tests for per-term room occupancy indexes.
+
+Verifies interval normalization, conflict lookups against a brute-force
+scan, free-slot queries, utilization figures, and that cached room indexes
+are dropped when class parts are saved, moved or deleted.
+"""
+
+import random
+from datetime import time
+
+import pytest
+from django.core.cache import cache
+
+from apps.common.models import Room
+from apps.curriculum.models import Course, Cycle, Division, Term
+from apps.scheduling.models import ClassHeader, ClassPart, ClassSession
+from apps.scheduling.room_occupancy import (
+    MINUTES_PER_DAY,
+    Interval,
+    RoomOccupancy,
+    build_room_occupancy,
+    meeting_intervals,
+    utilization_summary,
+)
+
+LOCMEM_CACHE = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+
+def occupancy(*patterns):
+    intervals = []
+    for part_id, (days, start, end) in enumerate(patterns, start=1):
+        intervals.extend(meeting_intervals(days, start, end, part_id))
+    return RoomOccupancy(intervals)
+
+
+@pytest.mark.unit
+class TestMeetingIntervals:
+    """Test normalizing meeting patterns."""
+
+    def test_one_interval_per_day(self):
+        intervals = meeting_intervals("WED, mon", time(9, 0), time(10, 30), part_id=7)
+
+        assert intervals == [
+            Interval(540, 630, 7),
+            Interval(2 * MINUTES_PER_DAY + 540, 2 * MINUTES_PER_DAY + 630, 7),
+        ]
+        assert [interval.day for interval in intervals] == ["MON", "WED"]
+
+    def test_incomplete_patterns_are_empty(self):
+        assert meeting_intervals("", time(9, 0), time(10, 0)) == []
+        assert meeting_intervals("MON", None, time(10, 0)) == []
+        assert meeting_intervals("MON", time(10, 0), time(10, 0)) == []
+
+
+@pytest.mark.unit
+class TestRoomOccupancy:
+    """Test conflict and free-slot queries."""
+
+    def test_conflicts_only_on_shared_days(self):
+        room = occupancy(("MON,WED", time(9, 0), time(10, 0)), ("TUE", time(9, 0), time(12, 0)))
+
+        conflicts = room.conflicts("WED,FRI", time(9, 30), time(11, 0))
+
+        assert [(interval.part_id, interval.day) for interval in conflicts] == [(1, "WED")]
+
+    def test_back_to_back_meetings_do_not_conflict(self):
+        room = occupancy(("MON", time(9, 0), time(10, 0)))
+
+        assert room.conflicts("MON", time(10, 0), time(11, 0)) == []
+        assert room.is_free(10 * 60, 11 * 60)
+        assert not room.is_free(9 * 60 + 59, 11 * 60)
+
+    def test_overlapping_matches_brute_force(self):
+        rng = random.Random(42)
+        intervals = []
+        for part_id in range(300):
+            start = rng.randrange(0, 7 * MINUTES_PER_DAY - 240)
+            intervals.append(Interval(start, start + rng.randrange(30, 240), part_id))
+        room = RoomOccupancy(intervals)
+
+        for _ in range(200):
+            start = rng.randrange(0, 7 * MINUTES_PER_DAY - 120)
+            end = start + rng.randrange(1, 120)
+            expected = sorted(i for i in intervals if i.start < end and i.end > start)
+
+            assert room.overlapping(start, end) == expected
+            assert room.is_free(start, end) == (not expected)
+
+    def test_free_slots_between_meetings(self):
+        room = occupancy(
+            ("MON", time(9, 0), time(10, 0)),
+            ("MON", time(9, 30), time(11, 0)),
+            ("MON", time(13, 0), time(14, 0)),
+        )
+
+        assert room.free_slots("MON", time(8, 0), time(15, 0)) == [
+            (time(8, 0), time(9, 0)),
+            (time(11, 0), time(13, 0)),
+            (time(14, 0), time(15, 0)),
+        ]
+        assert room.free_slots("MON", time(8, 0), time(15, 0), min_minutes=90) == [(time(11, 0), time(13, 0))]
+        assert room.free_slots("TUE", time(8, 0), time(9, 0)) == [(time(8, 0), time(9, 0))]
+
+
+@pytest.mark.unit
+class TestUtilizationSummary:
+    """Test weekly utilization figures."""
+
+    def test_counts_union_and_double_booking(self):
+        room = occupancy(("MON", time(9, 0), time(11, 0)), ("MON", time(10, 0), time(12, 0)))
+
+        summary = utilization_summary(room, days=("MON",), day_start=time(8, 0), day_end=time(18, 0))
+
+        assert summary["booked_minutes"] == 180
+        assert summary["available_minutes"] == 600
+        assert summary["double_booked_minutes"] == 60
+        assert summary["part_count"] == 2
+        assert summary["utilization_rate"] == 30.0
+
+
+@pytest.mark.django_db
+class TestCachedRoomOccupancy:
+    """Test the per-(term, room) index cache and its invalidation."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, settings, django_capture_on_commit_callbacks):
+        settings.CACHES = LOCMEM_CACHE
+        cache.clear()
+        self.committed = lambda: django_capture_on_commit_callbacks(execute=True)
+
+        self.term = Term.objects.create(
+            code="FALL24", term_type=Term.TermType.BACHELORS, start_date="2024-09-01", end_date="2024-12-15"
+        )
+        cycle = Cycle.objects.create(division=Division.objects.create(name="Academic"), name="Bachelor")
+        course = Course.objects.create(code="ENG-101", title="English", short_title="ENG", cycle=cycle)
+        header = ClassHeader.objects.create(course=course, term=self.term, section_id="A")
+        self.session = ClassSession.objects.create(class_header=header)
+        self.room = Room.objects.create(building="MAIN", name="Room 101", code="M101", capacity=30)
+        self.other_room = Room.objects.create(building="MAIN", name="Room 102", code="M102", capacity=30)
+
+    def _part(self, room, start=time(9, 0), end=time(10, 0)):
+        with self.committed():
+            return ClassPart.objects.create(
+                class_session=self.session, room=room, meeting_days="MON,WED", start_time=start, end_time=end
+            )
+
+    def test_repeat_lookups_are_served_from_cache(self, django_assert_num_queries):
+        self._part(self.room)
+        build_room_occupancy(self.term.pk, self.room.pk)
+
+        with django_assert_num_queries(0):
+            occupancy = build_room_occupancy(self.term.pk, self.room.pk)
+
+        assert len(occupancy.intervals) == 2
+
+    def test_excluding_a_part_uses_the_cached_index(self, django_assert_num_queries):
+        part = self._part(self.room)
+        build_room_occupancy(self.term.pk, self.room.pk)
+
+        with django_assert_num_queries(0):
+            assert build_room_occupancy(self.term.pk, self.room.pk, exclude_part_id=part.pk).intervals == []
+
+    def test_saving_a_part_refreshes_its_room(self):
+        build_room_occupancy(self.term.pk, self.room.pk)
+
+        self._part(self.room)
+
+        assert len(build_room_occupancy(self.term.pk, self.room.pk).intervals) == 2
+
+    def test_moving_a_part_refreshes_both_rooms(self):
+        part = self._part(self.room)
+        build_room_occupancy(self.term.pk, self.room.pk)
+        build_room_occupancy(self.term.pk, self.other_room.pk)
+
+        part.room = self.other_room
+        with self.committed():
+            part.save()
+
+        assert build_room_occupancy(self.term.pk, self.room.pk).intervals == []
+        assert len(build_room_occupancy(self.term.pk, self.other_room.pk).intervals) == 2
+
+    def test_changing_meeting_times_refreshes_the_room(self):
+        part = self._part(self.room)
+        build_room_occupancy(self.term.pk, self.room.pk)
+
+        part.start_time, part.end_time = time(14, 0), time(15, 0)
+        with self.committed():
+            part.save()
+
+        assert build_room_occupancy(self.term.pk, self.room.pk).is_free(9 * 60, 10 * 60)
+
+    def test_deleting_a_part_refreshes_its_room(self):
+        part = self._part(self.room)
+        build_room_occupancy(self.term.pk, self.room.pk)
+
+        with self.committed():
+            part.delete()
+
+        assert build_room_occupancy(self.term.pk, self.room.pk).intervals == []
+
+    def test_cascade_delete_refreshes_the_room(self):
+        self._part(self.room)
+        build_room_occupancy(self.term.pk, self.room.pk)
+
+        with self.committed():
+            self.session.delete()
+
+        assert build_room_occupancy(self.term.pk, self.room.pk).intervals == []
@@ -0,0 +1,79 @@
+"""
+Tests for weekly time bitmaps.
+
+Verifies that meeting patterns compile to the expected slots, that overlap
+detection matches interval semantics, and that buffers widen conflicts.
+"""
+
+from datetime import time
+
+import pytest
+
+from apps.scheduling.time_bitmap import (
+    BITMAP_BYTES,
+    SLOTS_PER_DAY,
+    bitmaps_overlap,
+    compile_weekly_bitmap,
+    from_bytes,
+    to_bytes,
+)
+
+
+@pytest.mark.unit
+class TestCompileWeeklyBitmap:
+    """Test compiling meeting patterns."""
+
+    def test_single_day_sets_one_slot_per_five_minutes(self):
+        bitmap = compile_weekly_bitmap("MON", time(9, 0), time(10, 0))
+
+        assert bitmap.bit_count() == 12
+        assert bitmap & (1 << (9 * 12))
+
+    def test_days_are_offset_by_a_day_of_slots(self):
+        monday = compile_weekly_bitmap("MON", time(9, 0), time(10, 0))
+        wednesday = compile_weekly_bitmap("wed", time(9, 0), time(10, 0))
+
+        assert wednesday == monday << (2 * SLOTS_PER_DAY)
+
+    def test_incomplete_pattern_is_empty(self):
+        assert compile_weekly_bitmap("", time(9, 0), time(10, 0)) == 0
+        assert compile_weekly_bitmap("MON", None, time(10, 0)) == 0
+        assert compile_weekly_bitmap("MON", time(10, 0), time(9, 0)) == 0
+
+    def test_round_trips_through_bytes(self):
+        bitmap = compile_weekly_bitmap("MON,WED,FRI,SUN", time(7, 30), time(23, 55))
+
+        assert len(to_bytes(bitmap)) == BITMAP_BYTES
+        assert from_bytes(memoryview(to_bytes(bitmap))) == bitmap
+        assert from_bytes(b"") == 0
+
+
+@pytest.mark.unit
+class TestBitmapsOverlap:
+    """Test conflict detection between bitmaps."""
+
+    def test_overlapping_times_on_common_day_conflict(self):
+        first = compile_weekly_bitmap("MON,WED", time(9, 0), time(10, 30))
+        second = compile_weekly_bitmap("WED,FRI", time(10, 0), time(11, 0))
+
+        assert bitmaps_overlap(first, second)
+
+    def test_back_to_back_classes_do_not_conflict(self):
+        first = compile_weekly_bitmap("MON", time(9, 0), time(10, 0))
+        second = compile_weekly_bitmap("MON", time(10, 0), time(11, 0))
+
+        assert not bitmaps_overlap(first, second)
+
+    def test_same_time_on_different_days_does_not_conflict(self):
+        first = compile_weekly_bitmap("MON,WED", time(9, 0), time(10, 0))
+        second = compile_weekly_bitmap("TUE,THU", time(9, 0), time(10, 0))
+
+        assert not bitmaps_overlap(first, second)
+
+    def test_buffer_turns_a_short_gap_into_a_conflict(self):
+        first = compile_weekly_bitmap("MON", time(9, 0), time(10, 0))
+        second = compile_weekly_bitmap("MON", time(10, 5), time(11, 0))
+
+        assert not bitmaps_overlap(first, second)
+        assert bitmaps_overlap(first, second, buffer_minutes=5)
+        assert not bitmaps_overlap(first, second, buffer_minutes=0)
@@ -0,0 +1,77 @@
+"""Weekly time bitmaps for class part meeting patterns.
+
+A meeting pattern (days plus start/end time) is compiled into a bitmap of
+5-minute slots covering one week, Monday 00:00 first. Two patterns overlap
+exactly when their bitmaps share a set bit, so a schedule conflict check is
+a single bitwise AND.
+
+Start times round down and end times round up to a slot boundary, so
+patterns separated by less than one slot are reported as overlapping.
+"""
+
+import math
+from datetime import time
+
+from .constants import VALID_MEETING_DAYS
+
+SLOT_MINUTES = 5
+SLOTS_PER_DAY = 24 * 60 // SLOT_MINUTES
+WEEK_SLOTS = SLOTS_PER_DAY * len(VALID_MEETING_DAYS)
+BITMAP_BYTES = WEEK_SLOTS // 8
+WEEK_MASK = (1 << WEEK_SLOTS) - 1
+
+DAY_OFFSETS = {day: index * SLOTS_PER_DAY for index, day in enumerate(VALID_MEETING_DAYS)}
+
+
+def parse_meeting_days(meeting_days: str) -> list[str]:
+    """Return the recognised day codes in a comma-separated meeting day string."""
+    days = (day.strip().upper() for day in (meeting_days or "").split(","))
+    return [day for day in days if day in DAY_OFFSETS]
+
+
+def compile_weekly_bitmap(meeting_days: str, start_time: time | None, end_time: time | None) -> int:
+    """Compile a meeting pattern into a weekly slot bitmap.
+
+    Returns 0 when the pattern is incomplete, which never conflicts.
+    """
+    if not meeting_days or start_time is None or end_time is None:
+        return 0
+
+    start_slot = (start_time.hour * 60 + start_time.minute) // SLOT_MINUTES
+    end_slot = math.ceil((end_time.hour * 60 + end_time.minute) / SLOT_MINUTES)
+    if end_slot <= start_slot:
+        return 0
+
+    day_mask = ((1 << (end_slot - start_slot)) - 1) << start_slot
+    bitmap = 0
+    for day in parse_meeting_days(meeting_days):
+        bitmap |= day_mask << DAY_OFFSETS[day]
+    return bitmap
+
+
+def dilate(bitmap: int, minutes: int) -> int:
+    """Widen every busy period in ``bitmap`` by ``minutes`` on both sides."""
+    slots = math.ceil(minutes / SLOT_MINUTES)
+    if slots <= 0 or not bitmap:
+        return bitmap
+    widened = bitmap
+    for shift in range(1, slots + 1):
+        widened |= (bitmap << shift) | (bitmap >> shift)
+    return widened & WEEK_MASK
+
+
+def bitmaps_overlap(first: int, second: int, buffer_minutes: int = 0) -> bool:
+    """Whether two bitmaps conflict when each side keeps ``buffer_minutes`` free."""
+    return bool(dilate(first, 2 * buffer_minutes) & second)
+
+
+def to_bytes(bitmap: int) -> bytes:
+    """Serialize a bitmap for storage."""
+    return bitmap.to_bytes(BITMAP_BYTES, "little")
+
+
+def from_bytes(data: bytes | memoryview | None) -> int:
+    """Deserialize a stored bitmap."""
+    if not data:
+        return 0
+    return int.from_bytes(bytes(data), "little")
@@ -0,0 +1,181 @@
+"""Shared producer for real-time dashboard metrics.
+
+Dashboard consumers no longer compute aggregates per connection. One
+producer (the ``broadcast_dashboard_metrics`` Dramatiq actor) computes the
+metric set once per interval, stores the snapshot in the cache and fans it
+out to the ``dashboard_metrics`` channel group and to GraphQL dashboard
+subscriptions. When only a few metrics changed, clients receive a delta
+instead of the full snapshot.
+
+Every message carries a ``version``; deltas also carry ``base_version`` so
+a client that missed a message can ask for the cached snapshot again.
+"""
+
+import logging
+from datetime import datetime
+from decimal import Decimal
+from typing import Any
+
+from asgiref.sync import async_to_sync
+from channels.layers import get_channel_layer
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import F, Sum
+
+from apps.common.realtime import DASHBOARD_GROUP, publish
+
+logger = logging.getLogger(__name__)
+
+DASHBOARD_METRICS_GROUP = "dashboard_metrics"
+SNAPSHOT_CACHE_KEY = "dashboard_metrics:snapshot"
+LEADER_CACHE_KEY = "dashboard_metrics:leader"
+
+# Send a full snapshot instead of a delta once this share of metrics changed.
+FULL_SNAPSHOT_RATIO = 0.5
+
+# Metadata keys that change on every run and never count as a metric change.
+VOLATILE_KEYS = frozenset({"last_updated"})
+
+
+def get_interval_seconds() -> int:
+    """Seconds between metric computations."""
+    return int(getattr(settings, "DASHBOARD_METRICS_INTERVAL_SECONDS", 60))
+
+
+def compute_dashboard_metrics() -> dict[str, Any]:
+    """Compute the dashboard metric set in one pass of aggregate queries."""
+    from apps.enrollment.models import ClassHeaderEnrollment
+    from apps.finance.models import Invoice
+    from apps.people.models import StudentProfile
+    from apps.scheduling.models import ClassHeader
+
+    outstanding = Invoice.objects.filter(
+        status__in=[
+            Invoice.InvoiceStatus.SENT,
+            Invoice.InvoiceStatus.PARTIALLY_PAID,
+            Invoice.InvoiceStatus.OVERDUE,
+        ]
+    ).aggregate(total=Sum(F("total_amount") - F("paid_amount")))["total"] or Decimal("0.00")
+
+    return {
+        "total_students": StudentProfile.objects.count(),
+        "total_classes": ClassHeader.objects.count(),
+        "active_enrollments": ClassHeaderEnrollment.objects.filter(
+            status__in=[
+                ClassHeaderEnrollment.EnrollmentStatus.ENROLLED,
+                ClassHeaderEnrollment.EnrollmentStatus.ACTIVE,
+            ]
+        ).count(),
+        "pending_payments": float(outstanding),
+        "last_updated": datetime.now().isoformat(),
+    }
+
+
+def diff_metrics(previous: dict[str, Any], current: dict[str, Any]) -> dict[str, Any]:
+    """Return the metrics whose values differ between two snapshots."""
+    return {
+        key: value
+        for key, value in current.items()
+        if key not in VOLATILE_KEYS and previous.get(key) != value
+    }
+
+
+def build_broadcast(previous: dict[str, Any] | None, metrics: dict[str, Any]) -> dict[str, Any] | None:
+    """Build the next snapshot or delta message, or ``None`` when nothing changed.
+
+    ``previous`` is the cached envelope ``{"version": int, "metrics": dict}``.
+    """
+    if not previous:
+        return {"type": "metrics.snapshot", "version": 1, "metrics": metrics}
+
+    version = previous["version"] + 1
+    changes = diff_metrics(previous["metrics"], metrics)
+    if not changes:
+        return None
+
+    comparable = [key for key in metrics if key not in VOLATILE_KEYS]
+    if len(changes) >= FULL_SNAPSHOT_RATIO * max(len(comparable), 1):
+        return {"type": "metrics.snapshot", "version": version, "metrics": metrics}
+
+    changes.update({key: metrics[key] for key in VOLATILE_KEYS if key in metrics})
+    return {
+        "type": "metrics.delta",
+        "version": version,
+        "base_version": previous["version"],
+        "changes": changes,
+    }
+
+
+def apply_broadcast(snapshot: dict[str, Any], message: dict[str, Any]) -> dict[str, Any] | None:
+    """Apply a broadcast message to a snapshot envelope held by a consumer.
+
+    Returns the new envelope, or ``None`` when a delta does not follow
+    ``snapshot``, in which case the consumer should re-read the cached one.
+    """
+    if message["type"] == "metrics.snapshot":
+        return {"version": message["version"], "metrics": message["metrics"]}
+    if message.get("base_version") != snapshot["version"]:
+        return None
+    return {"version": message["version"], "metrics": {**snapshot["metrics"], **message["changes"]}}
+
+
+def get_dashboard_snapshot() -> dict[str, Any]:
+    """Return the cached snapshot envelope, computing it only if none exists yet."""
+    snapshot = cache.get(SNAPSHOT_CACHE_KEY)
+    if snapshot is None:
+        snapshot = {"version": 1, "metrics": compute_dashboard_metrics()}
+        cache.add(SNAPSHOT_CACHE_KEY, snapshot, None)
+        snapshot = cache.get(SNAPSHOT_CACHE_KEY, snapshot)
+    return snapshot
+
+
+def publish_dashboard_metrics() -> dict[str, Any] | None:
+    """Compute metrics once and fan the snapshot or delta out to all dashboards.
+
+    Returns the broadcast message, or ``None`` when nothing changed.
+    """
+    metrics = compute_dashboard_metrics()
+    message = build_broadcast(cache.get(SNAPSHOT_CACHE_KEY), metrics)
+    if message is None:
+        return None
+
+    cache.set(SNAPSHOT_CACHE_KEY, {"version": message["version"], "metrics": metrics}, None)
+
+    channel_layer = get_channel_layer()
+    if channel_layer is not None:
+        async_to_sync(channel_layer.group_send)(DASHBOARD_METRICS_GROUP, message)
+    # GraphQL dashboard subscriptions relay the same message
+    publish(DASHBOARD_GROUP, message)
+    return message
+
+
+def claim_leadership(chain_id: str, interval: int) -> bool:
+    """Elect one self-rescheduling producer chain; others stop on their next run.
+
+    The leader key expires after a few missed intervals, so a crashed chain
+    is replaced by the next one started from a dashboard connection.
+    """
+    ttl = interval * 3
+    cache.add(LEADER_CACHE_KEY, chain_id, ttl)
+    if cache.get(LEADER_CACHE_KEY) != chain_id:
+        return False
+    cache.touch(LEADER_CACHE_KEY, ttl)
+    return True
+
+
+def producer_is_running() -> bool:
+    """Whether a producer chain currently holds leadership."""
+    return cache.get(LEADER_CACHE_KEY) is not None
+
+
+def ensure_dashboard_producer() -> None:
+    """Start the producer chain if no leader is currently scheduled."""
+    if producer_is_running():
+        return
+
+    from apps.web_interface.tasks import broadcast_dashboard_metrics
+
+    try:
+        broadcast_dashboard_metrics.send()
+    except Exception:
+        logger.exception("Could not start dashboard metrics producer")
@@ -0,0 +1,45 @@
+"""Dramatiq background tasks for the web interface.
+
+This module contains the periodic producer for real-time dashboard metrics.
+"""
+
+import logging
+import uuid
+
+import dramatiq
+
+from apps.web_interface.dashboard_metrics import (
+    claim_leadership,
+    get_interval_seconds,
+    publish_dashboard_metrics,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dramatiq.actor(queue_name="default", max_retries=0)
+def broadcast_dashboard_metrics(chain_id: str | None = None):
+    """Compute dashboard metrics once per interval and broadcast them.
+
+    The actor reschedules itself with the same ``chain_id``. Only the chain
+    holding leadership keeps running, so starting the producer twice or on
+    several workers still computes metrics once per interval.
+
+    Args:
+        chain_id: Identifier of the self-rescheduling chain (new chain if omitted)
+    """
+    chain_id = chain_id or uuid.uuid4().hex
+    interval = get_interval_seconds()
+
+    if not claim_leadership(chain_id, interval):
+        logger.debug("Dashboard metrics chain %s is not the leader; stopping", chain_id)
+        return
+
+    try:
+        message = publish_dashboard_metrics()
+        if message:
+            logger.debug("Broadcast dashboard %s v%s", message["type"], message["version"])
+    except Exception:
+        logger.exception("Failed to broadcast dashboard metrics")
+    finally:
+        broadcast_dashboard_metrics.send_with_options(args=(chain_id,), delay=interval * 1000)
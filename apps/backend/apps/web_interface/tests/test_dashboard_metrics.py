@@ -0,0 +1,74 @@
+"""
+Tests for the shared dashboard metrics producer.
+
+Verifies snapshot/delta selection and that only one producer chain is
+elected leader.
+"""
+
+import pytest
+from django.core.cache import cache
+
+from apps.web_interface.dashboard_metrics import build_broadcast, claim_leadership, diff_metrics
+
+LOCMEM_CACHE = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+METRICS = {
+    "total_students": 100,
+    "total_classes": 20,
+    "active_enrollments": 300,
+    "pending_payments": 1500.0,
+    "last_updated": "2024-01-01T00:00:00",
+}
+
+
+@pytest.mark.unit
+class TestBuildBroadcast:
+    """Test snapshot and delta message construction."""
+
+    def test_first_broadcast_is_full_snapshot(self):
+        message = build_broadcast(None, METRICS)
+
+        assert message["type"] == "metrics.snapshot"
+        assert message["version"] == 1
+        assert message["metrics"] == METRICS
+
+    def test_unchanged_metrics_send_nothing(self):
+        current = {**METRICS, "last_updated": "2024-01-01T00:01:00"}
+
+        assert build_broadcast({"version": 3, "metrics": METRICS}, current) is None
+
+    def test_small_change_sends_delta(self):
+        current = {**METRICS, "active_enrollments": 301, "last_updated": "2024-01-01T00:01:00"}
+
+        message = build_broadcast({"version": 3, "metrics": METRICS}, current)
+
+        assert message["type"] == "metrics.delta"
+        assert message["version"] == 4
+        assert message["base_version"] == 3
+        assert message["changes"] == {"active_enrollments": 301, "last_updated": "2024-01-01T00:01:00"}
+
+    def test_large_change_sends_snapshot(self):
+        current = {**METRICS, "total_students": 101, "total_classes": 21, "active_enrollments": 301}
+
+        message = build_broadcast({"version": 3, "metrics": METRICS}, current)
+
+        assert message["type"] == "metrics.snapshot"
+        assert message["version"] == 4
+
+    def test_diff_ignores_volatile_keys(self):
+        assert diff_metrics(METRICS, {**METRICS, "last_updated": "later"}) == {}
+
+
+@pytest.mark.unit
+class TestProducerLeadership:
+    """Test that a single producer chain keeps running."""
+
+    @pytest.fixture(autouse=True)
+    def locmem_cache(self, settings):
+        settings.CACHES = LOCMEM_CACHE
+        cache.clear()
+
+    def test_only_first_chain_is_leader(self):
+        assert claim_leadership("chain-a", 60)
+        assert not claim_leadership("chain-b", 60)
+        assert claim_leadership("chain-a", 60)
@@ -0,0 +1,89 @@
+"""
+Tests for student locator exports.
+
+Verifies that result sets above ``EXPORT_BACKGROUND_THRESHOLD`` are handed to
+the ``build_export`` job with the original filters, and that the job writes
+the same rows the streamed export returns.
+"""
+
+from datetime import date
+from unittest.mock import Mock
+
+import pytest
+from django.http import HttpResponseRedirect, StreamingHttpResponse
+from django.test import RequestFactory
+from django.urls import include, path, resolve, reverse
+
+from apps.common import tasks
+from apps.common.crud.export import get_export_storage
+from apps.common.models import Notification
+from apps.people.models import Person, StudentProfile
+from apps.web_interface.views.student_locator_views import StudentLocatorExportView
+
+VIEW_PATH = "apps.web_interface.views.student_locator_views.StudentLocatorExportView"
+
+urlpatterns = [path("", include("apps.web_interface.urls", namespace="web_interface"))]
+
+
+@pytest.mark.django_db
+@pytest.mark.urls(__name__)
+class TestStudentLocatorExport:
+    @pytest.fixture(autouse=True)
+    def _students(self, settings, tmp_path, admin_user):
+        settings.EXPORT_ROOT = str(tmp_path / "exports")
+        self.admin = admin_user
+        for student_id, name, status in [
+            (10001, "Dara", StudentProfile.Status.ACTIVE),
+            (10002, "Sophea", StudentProfile.Status.INACTIVE),
+        ]:
+            person = Person.objects.create(personal_name=name, family_name="Sok", date_of_birth=date(2000, 1, 1))
+            StudentProfile.objects.create(person=person, student_id=student_id, current_status=status)
+
+    def _export(self, query):
+        request = RequestFactory().get(reverse("web_interface:student-locator-export"), data=query)
+        request.user = self.admin
+        request._messages = Mock()
+        return StudentLocatorExportView.as_view()(request)
+
+    def test_small_results_are_streamed(self, settings, monkeypatch):
+        settings.EXPORT_BACKGROUND_THRESHOLD = 10
+        send = Mock()
+        monkeypatch.setattr(tasks.build_export, "send", send)
+
+        response = self._export({"status": StudentProfile.Status.ACTIVE})
+
+        assert isinstance(response, StreamingHttpResponse)
+        lines = b"".join(response.streaming_content).decode().splitlines()
+        assert len(lines) == 2 and lines[1].startswith("10001,")
+        send.assert_not_called()
+
+    def test_large_results_are_exported_in_background(self, settings, monkeypatch):
+        settings.EXPORT_BACKGROUND_THRESHOLD = 0
+        send = Mock()
+        monkeypatch.setattr(tasks.build_export, "send", send)
+
+        response = self._export({"status": StudentProfile.Status.ACTIVE, "export": "excel"})
+
+        assert isinstance(response, HttpResponseRedirect)
+        assert response.url == reverse("web_interface:student-locator")
+        send.assert_called_once_with(
+            VIEW_PATH,
+            {},
+            f"status={StudentProfile.Status.ACTIVE}&export=excel",
+            self.admin.pk,
+            "xlsx",
+            "students_export.xlsx",
+        )
+
+    def test_background_export_matches_streamed_export(self, settings, monkeypatch):
+        query = {"status": StudentProfile.Status.ACTIVE}
+        settings.EXPORT_BACKGROUND_THRESHOLD = 10
+        streamed = b"".join(self._export(query).streaming_content).decode()
+        settings.EXPORT_BACKGROUND_THRESHOLD = 0
+        monkeypatch.setattr(tasks.build_export, "send", tasks.build_export.fn)
+
+        self._export(query)
+
+        notification = Notification.objects.get(user=self.admin)
+        with get_export_storage().open(resolve(notification.action_url).kwargs["path"]) as file:
+            assert file.read().decode() == streamed
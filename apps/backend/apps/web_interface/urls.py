@@ -8,6 +8,8 @@ URLs are organized by functionality with proper namespacing.
 from django.urls import include, path
 from django.views.generic import TemplateView
 
+from apps.common.crud import ExportDownloadView
+
 from .views import (
     academic_views,
     auth_views,
@@ -32,6 +34,8 @@ urlpatterns = [
     path("role-switch/", auth_views.RoleSwitchView.as_view(), name="role-switch"),
     # Dashboard (role-specific)
     path("dashboard/", dashboard_views.DashboardView.as_view(), name="dashboard"),
+    # Background export downloads
+    path("exports/<path:path>", ExportDownloadView.as_view(), name="export-download"),
     # Student Management
     path(
         "students/",
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+from collections import defaultdict
 from datetime import datetime, timedelta
 from typing import Any
 
@@ -18,7 +19,8 @@ from django.views.decorators.http import require_http_methods
 from django.views.generic import TemplateView
 
 from apps.common.models import ActivityLog, Notification
-from apps.finance.models import Invoice, Payment
+from apps.finance.models import Invoice, Payment, StudentBalance
+from apps.finance.models.balances import open_invoices_q
 
 
 class ReportsDashboardView(LoginRequiredMixin, TemplateView):
@@ -219,37 +221,32 @@ def daily_cash_report(request: HttpRequest) -> HttpResponse:
 @require_http_methods(["GET"])
 def student_balances_report(request: HttpRequest) -> HttpResponse:
     """Generate student outstanding balances report."""
-    # Get all students with outstanding balances
+    # Students with outstanding balances, ordered on the indexed summary
+    summaries = StudentBalance.objects.filter(balance__gt=0).select_related("student").order_by("-balance")
+
+    # Open invoices grouped by student for the detail rows
+    invoices_by_student: dict[int, list[Invoice]] = defaultdict(list)
     outstanding_invoices = (
-        Invoice.objects.filter(
-            total_amount__gt=F("paid_amount"), status__in=[Invoice.InvoiceStatus.SENT, Invoice.InvoiceStatus.OVERDUE]
-        )
-        .select_related("student")
+        Invoice.objects.filter(open_invoices_q())
         .annotate(amount_due=F("total_amount") - F("paid_amount"))
         .order_by("-amount_due")
     )
-
-    # Group by student
-    student_balances = {}
     for invoice in outstanding_invoices:
-        student_id = invoice.student.id
-        if student_id not in student_balances:
-            student_balances[student_id] = {
-                "student": invoice.student,
-                "total_due": 0,
-                "invoice_count": 0,
-                "overdue_count": 0,
-                "invoices": [],
-            }
+        invoices_by_student[invoice.student_id].append(invoice)
 
-        student_balances[student_id]["total_due"] += invoice.amount_due
-        student_balances[student_id]["invoice_count"] += 1
-        if invoice.status == Invoice.InvoiceStatus.OVERDUE:
-            student_balances[student_id]["overdue_count"] += 1
-        student_balances[student_id]["invoices"].append(invoice)
-
-    # Convert to list and sort by total due
-    balances_list = sorted(student_balances.values(), key=lambda x: float(str(x["total_due"] or 0)), reverse=True)
+    balances_list = []
+    for summary in summaries:
+        invoices = invoices_by_student[summary.student_id]
+        balances_list.append(
+            {
+                "student": summary.student,
+                "total_due": summary.balance,
+                "invoice_count": summary.open_invoice_count,
+                "overdue_count": sum(1 for invoice in invoices if invoice.status == Invoice.InvoiceStatus.OVERDUE),
+                "oldest_invoice_date": summary.oldest_open_invoice_date,
+                "invoices": invoices,
+            }
+        )
 
     # Calculate summary
     total_outstanding = sum(balance["total_due"] for balance in balances_list)
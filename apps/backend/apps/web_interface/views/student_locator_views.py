@@ -4,25 +4,25 @@ Student Locator views - Advanced search system for students.
 Based on the attractive design by Claude Desktop Opus.
 """
 
-import csv
 from datetime import date, timedelta
 from decimal import Decimal
-from io import BytesIO
 
-try:
-    import xlsxwriter
-
-    HAS_XLSXWRITER = True
-except ImportError:
-    HAS_XLSXWRITER = False
-
-from django.db.models import F, Q, Sum, Value
+from django.contrib import messages
+from django.db.models import F, Q, Value
 from django.db.models.functions import Coalesce
-from django.http import HttpResponse
+from django.shortcuts import redirect
 from django.utils import timezone
 from django.utils.translation import gettext as _
 from django.views.generic import ListView, TemplateView
 
+from apps.common.crud.export import (
+    EXPORT_CHUNK_SIZE,
+    HAS_OPENPYXL,
+    csv_response,
+    get_background_threshold,
+    xlsx_response,
+)
+from apps.common.services.student_search import StudentSearchService, student_id_prefix_q
 from apps.curriculum.models import Major
 from apps.people.models import StudentProfile
 
@@ -85,33 +85,23 @@ class StudentLocatorResultsView(StaffRequiredMixin, ListView):
                 "invoices",  # Invoice has related_name='invoices'
             )
             .annotate(
-                current_balance=Coalesce(
-                    Sum(F("invoices__total_amount") - F("invoices__paid_amount")), Value(Decimal("0.00"))
-                )
+                # Maintained per student by invoice and payment changes
+                current_balance=Coalesce(F("balance_summary__balance"), Value(Decimal("0.00")))
             )
         )
 
         # Get filter parameters
         params = self.request.GET
 
-        # Student ID search
+        # Student ID search (formatted ID prefix over the student_id index)
         if student_id := params.get("student_id", "").strip():
-            queryset = queryset.filter(student_id__startswith=student_id)  # Optimized: students search by ID prefix
-
-        # Name search (handles both English and Khmer names)
-        if name := params.get("name", "").strip():
-            queryset = queryset.filter(
-                Q(person__full_name__icontains=name)
-                | Q(person__family_name__icontains=name)
-                | Q(person__personal_name__icontains=name)
-                | Q(person__khmer_name__icontains=name)
-            )
+            queryset = queryset.filter(student_id_prefix_q(student_id)) if student_id.isdigit() else queryset.none()
 
-        # Email search (check both school_email and personal_email)
-        if email := params.get("email", "").strip():
-            queryset = queryset.filter(
-                Q(person__school_email__icontains=email) | Q(person__personal_email__icontains=email)
-            )
+        # Name and email search (English and Khmer names, school and personal
+        # email) through the trigram-indexed search text
+        search_term = " ".join(filter(None, [params.get("name", "").strip(), params.get("email", "").strip()]))
+        if search_term:
+            queryset = StudentSearchService.search(queryset, search_term)
 
         # Program filter
         if program_id := params.get("program"):
@@ -148,18 +138,25 @@ class StudentLocatorResultsView(StaffRequiredMixin, ListView):
             except (ValueError, TypeError):
                 pass
 
-        # Balance range filter
+        # Balance range filter on the indexed balance summary; students
+        # without a summary row have a zero balance
         if balance_min := params.get("balance_min"):
             try:
                 min_balance = Decimal(balance_min)
-                queryset = queryset.filter(current_balance__gte=min_balance)
+                in_range = Q(balance_summary__balance__gte=min_balance)
+                if min_balance <= 0:
+                    in_range |= Q(balance_summary__isnull=True)
+                queryset = queryset.filter(in_range)
             except (ValueError, TypeError):
                 pass
 
         if balance_max := params.get("balance_max"):
             try:
                 max_balance = Decimal(balance_max)
-                queryset = queryset.filter(current_balance__lte=max_balance)
+                in_range = Q(balance_summary__balance__lte=max_balance)
+                if max_balance >= 0:
+                    in_range |= Q(balance_summary__isnull=True)
+                queryset = queryset.filter(in_range)
             except (ValueError, TypeError):
                 pass
 
@@ -183,9 +180,9 @@ class StudentLocatorResultsView(StaffRequiredMixin, ListView):
         # Has balance filter
         if has_balance := params.get("has_balance"):
             if has_balance == "yes":
-                queryset = queryset.filter(current_balance__gt=0)
+                queryset = queryset.filter(balance_summary__balance__gt=0)
             elif has_balance == "no":
-                queryset = queryset.filter(Q(current_balance__lte=0) | Q(current_balance__isnull=True))
+                queryset = queryset.filter(Q(balance_summary__balance__lte=0) | Q(balance_summary__isnull=True))
 
         # Checkbox filters
         if params.get("missing_email"):
@@ -206,8 +203,11 @@ class StudentLocatorResultsView(StaffRequiredMixin, ListView):
         # Get the most recent active program enrollment
         queryset = queryset.annotate(current_program=F("program_enrollments__program__name"))
 
-        # Order by most recent enrollment
-        queryset = queryset.order_by("-last_enrollment_date", "-created_at")
+        # Order by search relevance, then most recent enrollment
+        if search_term:
+            queryset = queryset.order_by("-search_rank", "-last_enrollment_date", "-created_at")
+        else:
+            queryset = queryset.order_by("-last_enrollment_date", "-created_at")
 
         return queryset
 
@@ -222,110 +222,96 @@ class StudentLocatorResultsView(StaffRequiredMixin, ListView):
 
 
 class StudentLocatorExportView(StudentLocatorResultsView):
-    """Export student search results to CSV or Excel."""
+    """Export student search results to CSV or Excel.
+
+    Files are streamed; result sets above ``EXPORT_BACKGROUND_THRESHOLD`` are
+    exported by a background job that notifies the user when the file is ready.
+    """
 
     paginate_by = None  # Export all results
 
+    EXPORT_HEADER = [
+        "Student ID",
+        "Name",
+        "Khmer Name",
+        "Email",
+        "Phone",
+        "Program",
+        "Status",
+        "Balance",
+        "Last Enrollment",
+    ]
+    # Student ID, Name, Khmer Name, Email, Phone, Program, Status, Balance, Enrollment
+    EXPORT_COLUMN_WIDTHS = [12, 25, 25, 30, 15, 20, 10, 12, 12]
+
     def render_to_response(self, context, **response_kwargs):
         """Generate CSV or Excel file."""
         export_format = self.request.GET.get("export", "csv")
-        students = context["students"]
+        # Fall back to CSV if openpyxl is not available
+        format_type = "xlsx" if export_format == "excel" and HAS_OPENPYXL else "csv"
 
-        if export_format == "excel":
-            return self.export_excel(students)
-        else:
-            return self.export_csv(students)
-
-    def export_csv(self, students):
-        """Export to CSV format."""
-        response = HttpResponse(content_type="text/csv")
-        response["Content-Disposition"] = 'attachment; filename="students_export.csv"'
+        if context["result_count"] > get_background_threshold():
+            return self.export_in_background(format_type, context["result_count"])
 
-        writer = csv.writer(response)
-        writer.writerow(
-            ["Student ID", "Name", "Khmer Name", "Email", "Phone", "Program", "Status", "Balance", "Last Enrollment"]
+        students = context["students"]
+        if format_type == "xlsx":
+            return self.export_excel(students)
+        return self.export_csv(students)
+
+    def export_in_background(self, format_type, result_count):
+        """Queue a ``build_export`` job and return to the locator page."""
+        from apps.common.tasks import build_export
+
+        build_export.send(
+            f"{type(self).__module__}.{type(self).__qualname__}",
+            self.kwargs,
+            self.request.GET.urlencode(),
+            self.request.user.pk,
+            format_type,
+            f"students_export.{format_type}",
         )
-
-        for student in students:
-            writer.writerow(
-                [
-                    student.student_id,
-                    student.person.full_name,
-                    student.person.khmer_name or "",
-                    student.person.school_email
-                    or student.person.personal_email
-                    or "",  # Clean: use empty string instead of "No email"
-                    "No phone",  # Person model doesn't have phone field
-                    student.current_program or "TBD",
-                    student.get_current_status_display(),
-                    f"${float(student.current_balance or 0):.2f}",
-                    student.last_enrollment_date.strftime("%Y-%m-%d") if student.last_enrollment_date else "",
-                ]
+        messages.info(
+            self.request,
+            _(
+                "Exporting %(count)s students in the background. "
+                "You will get a notification with a download link when the file is ready."
             )
+            % {"count": f"{result_count:,}"},
+        )
+        return redirect("web_interface:student-locator")
+
+    def get_export_header(self):
+        return self.EXPORT_HEADER
+
+    def get_export_rows(self, students, format_type="csv"):
+        """Export values per student, read from the database in chunks."""
+        for student in students.iterator(chunk_size=EXPORT_CHUNK_SIZE):
+            balance = float(student.current_balance or 0)
+            yield [
+                student.student_id,
+                student.person.full_name,
+                student.person.khmer_name or "",
+                student.person.school_email
+                or student.person.personal_email
+                or "",  # Clean: use empty string instead of "No email"
+                "No phone",  # Person model doesn't have phone field
+                student.current_program or "TBD",
+                student.get_current_status_display(),
+                balance if format_type == "xlsx" else f"${balance:.2f}",
+                student.last_enrollment_date.strftime("%Y-%m-%d") if student.last_enrollment_date else "",
+            ]
 
-        return response
+    def export_csv(self, students):
+        """Export to CSV format, streamed row by row."""
+        return csv_response("students_export.csv", self.EXPORT_HEADER, self.get_export_rows(students))
 
     def export_excel(self, students):
-        """Export to Excel format."""
-        if not HAS_XLSXWRITER:
-            # Fall back to CSV if xlsxwriter is not available
-            return self.export_csv(students)
-
-        output = BytesIO()
-        workbook = xlsxwriter.Workbook(output)
-        worksheet = workbook.add_worksheet("Students")
-
-        # Define formats
-        header_format = workbook.add_format({"bold": True, "bg_color": "#667eea", "font_color": "white", "border": 1})
-
-        # Write headers
-        headers = [
-            "Student ID",
-            "Name",
-            "Khmer Name",
-            "Email",
-            "Phone",
-            "Program",
-            "Status",
-            "Balance",
-            "Last Enrollment",
-        ]
-        for col, header in enumerate(headers):
-            worksheet.write(0, col, header, header_format)
-
-        # Write data
-        for row, student in enumerate(students, start=1):
-            worksheet.write(row, 0, student.student_id)
-            worksheet.write(row, 1, student.person.full_name)
-            worksheet.write(row, 2, student.person.khmer_name or "")
-            worksheet.write(
-                row, 3, student.person.school_email or student.person.personal_email or ""
-            )  # Clean: use empty string instead of "No email"
-            worksheet.write(row, 4, "No phone")  # Person model doesn't have phone field
-            worksheet.write(row, 5, student.current_program or "TBD")
-            worksheet.write(row, 6, student.get_current_status_display())
-            worksheet.write(row, 7, float(student.current_balance or 0))
-            worksheet.write(
-                row, 8, student.last_enrollment_date.strftime("%Y-%m-%d") if student.last_enrollment_date else ""
-            )
-
-        # Adjust column widths
-        worksheet.set_column(0, 0, 12)  # Student ID
-        worksheet.set_column(1, 1, 25)  # Name
-        worksheet.set_column(2, 2, 25)  # Khmer Name
-        worksheet.set_column(3, 3, 30)  # Email
-        worksheet.set_column(4, 4, 15)  # Phone
-        worksheet.set_column(5, 5, 20)  # Program
-        worksheet.set_column(6, 6, 10)  # Status
-        worksheet.set_column(7, 7, 12)  # Balance
-        worksheet.set_column(8, 8, 12)  # Enrollment
-
-        workbook.close()
-        output.seek(0)
-
-        response = HttpResponse(
-            output.read(), content_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+        """Export to Excel format, written in write-only mode."""
+        return xlsx_response(
+            "students_export.xlsx",
+            self.EXPORT_HEADER,
+            self.get_export_rows(students, "xlsx"),
+            title="Students",
+            header_color="667EEA",
+            widths=self.EXPORT_COLUMN_WIDTHS,
         )
-        response["Content-Disposition"] = 'attachment; filename="students_export.xlsx"'
-
-        return response
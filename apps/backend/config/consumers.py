@@ -16,6 +16,12 @@ from channels.generic.websocket import AsyncWebsocketConsumer
 from channels.db import database_sync_to_async
 from django.core.cache import cache
 
+from apps.web_interface.dashboard_metrics import (
+    DASHBOARD_METRICS_GROUP,
+    ensure_dashboard_producer,
+    get_dashboard_snapshot,
+)
+
 logger = logging.getLogger(__name__)
 
 
@@ -220,25 +226,31 @@ class GradeEntryCollaborationConsumer(AsyncWebsocketConsumer):
 
 
 class DashboardMetricsConsumer(AsyncWebsocketConsumer):
-    """WebSocket consumer for real-time dashboard metrics updates."""
+    """WebSocket consumer for real-time dashboard metrics updates.
+
+    Metrics are computed once per interval by the shared producer in
+    ``apps.web_interface.dashboard_metrics``; this consumer only relays the
+    cached snapshot and the deltas broadcast to the group.
+    """
 
     async def connect(self):
         """Accept WebSocket connection for dashboard updates."""
         await self.channel_layer.group_add(
-            "dashboard_metrics",
+            DASHBOARD_METRICS_GROUP,
             self.channel_name
         )
         await self.accept()
 
-        # Send initial metrics
+        # Send the shared snapshot and make sure a producer is broadcasting
         await self.send_metrics_update()
+        await database_sync_to_async(ensure_dashboard_producer)()
 
         logger.info("Dashboard metrics consumer connected")
 
     async def disconnect(self, close_code):
         """Handle WebSocket disconnection."""
         await self.channel_layer.group_discard(
-            "dashboard_metrics",
+            DASHBOARD_METRICS_GROUP,
             self.channel_name
         )
 
@@ -262,25 +274,13 @@ class DashboardMetricsConsumer(AsyncWebsocketConsumer):
             }))
 
     async def send_metrics_update(self):
-        """Send current dashboard metrics."""
-        # Get cached metrics or generate fresh ones
-        cache_key = "dashboard_metrics_realtime"
-        metrics = cache.get(cache_key)
-
-        if not metrics:
-            # Generate mock metrics (in production, this would fetch real data)
-            metrics = {
-                'student_count': 1247,
-                'active_enrollments': 890,
-                'pending_payments': 23450.00,
-                'system_health': 0.98,
-                'last_updated': datetime.now().isoformat()
-            }
-            cache.set(cache_key, metrics, 300)  # Cache for 5 minutes
+        """Send the current shared metrics snapshot."""
+        snapshot = await database_sync_to_async(get_dashboard_snapshot)()
 
         await self.send(text_data=json.dumps({
             'type': 'metrics_update',
-            'data': metrics,
+            'data': snapshot['metrics'],
+            'version': snapshot['version'],
             'timestamp': datetime.now().isoformat()
         }))
 
@@ -297,6 +297,25 @@ class DashboardMetricsConsumer(AsyncWebsocketConsumer):
         }))
 
     # Message handlers
+    async def metrics_snapshot(self, event):
+        """Relay a full metrics snapshot from the shared producer."""
+        await self.send(text_data=json.dumps({
+            'type': 'metrics_update',
+            'data': event['metrics'],
+            'version': event['version'],
+            'timestamp': datetime.now().isoformat()
+        }))
+
+    async def metrics_delta(self, event):
+        """Relay changed metrics from the shared producer."""
+        await self.send(text_data=json.dumps({
+            'type': 'metrics_delta',
+            'changes': event['changes'],
+            'version': event['version'],
+            'base_version': event['base_version'],
+            'timestamp': datetime.now().isoformat()
+        }))
+
     async def metrics_broadcast(self, event):
         """Handle metrics broadcast from external triggers."""
         await self.send(text_data=json.dumps(event))
@@ -9,10 +9,13 @@ from channels.db import database_sync_to_async
 from django.core.cache import cache
 from django.shortcuts import get_object_or_404
 
-from apps.scheduling.models import ClassHeader
-from apps.people.models import StudentProfile
 from apps.grading.models import Grade, Assignment
 from apps.enrollment.models import ClassHeaderEnrollment
+from apps.web_interface.dashboard_metrics import (
+    DASHBOARD_METRICS_GROUP,
+    ensure_dashboard_producer,
+    get_dashboard_snapshot,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -443,7 +446,11 @@ class EnhancedGradeEntryCollaborationConsumer(AsyncWebsocketConsumer):
 
 
 class RealTimeDashboardConsumer(AsyncWebsocketConsumer):
-    """Real-time dashboard metrics consumer."""
+    """Real-time dashboard metrics consumer.
+
+    Relays the snapshot and deltas broadcast by the shared producer in
+    ``apps.web_interface.dashboard_metrics`` instead of querying per client.
+    """
 
     async def connect(self):
         """Handle WebSocket connection for dashboard."""
@@ -454,7 +461,7 @@ class RealTimeDashboardConsumer(AsyncWebsocketConsumer):
             return
 
         # Join dashboard metrics room
-        self.room_group_name = 'dashboard_metrics'
+        self.room_group_name = DASHBOARD_METRICS_GROUP
 
         await self.channel_layer.group_add(
             self.room_group_name,
@@ -463,8 +470,9 @@ class RealTimeDashboardConsumer(AsyncWebsocketConsumer):
 
         await self.accept()
 
-        # Send initial metrics
+        # Send the shared snapshot and make sure a producer is broadcasting
         await self.send_dashboard_metrics()
+        await database_sync_to_async(ensure_dashboard_producer)()
 
     async def disconnect(self, close_code):
         """Handle WebSocket disconnection."""
@@ -492,11 +500,31 @@ class RealTimeDashboardConsumer(AsyncWebsocketConsumer):
             await self.send_error("Invalid JSON data")
 
     async def send_dashboard_metrics(self):
-        """Send current dashboard metrics."""
-        metrics = await self.get_dashboard_metrics()
+        """Send the current shared dashboard metrics snapshot."""
+        snapshot = await database_sync_to_async(get_dashboard_snapshot)()
         await self.send(text_data=json.dumps({
             'type': 'dashboard_metrics',
-            'metrics': metrics,
+            'metrics': snapshot['metrics'],
+            'version': snapshot['version'],
+            'timestamp': datetime.now().isoformat()
+        }))
+
+    async def metrics_snapshot(self, event):
+        """Relay a full metrics snapshot from the shared producer."""
+        await self.send(text_data=json.dumps({
+            'type': 'dashboard_metrics',
+            'metrics': event['metrics'],
+            'version': event['version'],
+            'timestamp': datetime.now().isoformat()
+        }))
+
+    async def metrics_delta(self, event):
+        """Relay changed metrics from the shared producer."""
+        await self.send(text_data=json.dumps({
+            'type': 'dashboard_metrics_delta',
+            'changes': event['changes'],
+            'version': event['version'],
+            'base_version': event['base_version'],
             'timestamp': datetime.now().isoformat()
         }))
 
@@ -514,17 +542,6 @@ class RealTimeDashboardConsumer(AsyncWebsocketConsumer):
         # Store subscription preferences
         pass
 
-    @database_sync_to_async
-    def get_dashboard_metrics(self):
-        """Get current dashboard metrics from database."""
-        # Implementation would calculate real-time metrics
-        return {
-            'total_students': StudentProfile.objects.count(),
-            'total_classes': ClassHeader.objects.count(),
-            'active_enrollments': ClassHeaderEnrollment.objects.filter(status='enrolled').count(),
-            'last_updated': datetime.now().isoformat()
-        }
-
     async def send_error(self, message: str):
         """Send error message to client."""
         await self.send(text_data=json.dumps({
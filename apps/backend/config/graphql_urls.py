@@ -6,12 +6,12 @@ for queries, mutations, and subscriptions.
 """
 
 from django.urls import path
-from strawberry.django.views import GraphQLView
 
-from graphql.schema import schema
+from api.graphql.dataloaders import LoaderGraphQLView
+from api.graphql.schema import schema
 
-# GraphQL view with subscription support
-graphql_view = GraphQLView.as_view(
+# GraphQL view with subscription support and per-request loaders
+graphql_view = LoaderGraphQLView.as_view(
     schema=schema,
     graphiql=True,  # Enable GraphiQL playground in development
     subscription_path="/ws/graphql/"  # WebSocket path for subscriptions
@@ -95,6 +95,7 @@ DJANGO_APPS = [
     "django.contrib.staticfiles",
     "django.contrib.humanize",  # Handy template tags
     "django.contrib.admin",
+    "django.contrib.postgres",  # Trigram lookups for student search
     "django.forms",
 ]
 THIRD_PARTY_APPS = [
@@ -131,6 +132,7 @@ LOCAL_APPS = [
     "apps.level_testing",
     "apps.mobile",
     "apps.web_interface",
+    "apps.analytics",  # Pre-aggregated dashboard metric rollups
     # "apps.moodle",  # Keep disabled - missing model references
     "apps.data_pipeline",  # Data pipeline for legacy data processing
     # Your stuff: custom apps go here
@@ -195,6 +197,8 @@ MIDDLEWARE = [
     "apps.common.middleware.security.CSRFEnhancementMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "apps.common.middleware.security.APISecurityMiddleware",
+    "apps.common.middleware.policy_scope.PolicyEvaluationScopeMiddleware",
+    "apps.common.middleware.audit_buffer.AuditBufferMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
     "allauth.account.middleware.AccountMiddleware",
@@ -351,6 +355,47 @@ DRAMATIQ_BROKER = {
 DRAMATIQ_TASK_TIME_LIMIT = 5 * 60 * 1000  # 5 minutes in milliseconds
 DRAMATIQ_TASK_MAX_AGE = 60 * 60 * 1000  # 1 hour in milliseconds
 DRAMATIQ_TASK_MAX_RETRIES = 3
+
+# Buffered audit log entries are written by a worker instead of in the request
+AUDIT_SINK_ASYNC = env.bool("AUDIT_SINK_ASYNC", default=False)
+
+# Monthly log partitions (PostgreSQL): created ahead of time by
+# manage_log_partitions, which retires months older than the retention period
+# into the archive schema (dropped instead when the schema is empty)
+LOG_PARTITION_MONTHS_AHEAD = env.int("LOG_PARTITION_MONTHS_AHEAD", default=3)
+LOG_PARTITION_RETENTION_MONTHS = env.int("LOG_PARTITION_RETENTION_MONTHS", default=24)
+LOG_PARTITION_ARCHIVE_SCHEMA = env("LOG_PARTITION_ARCHIVE_SCHEMA", default="log_archive")
+
+# List exports with more rows than this are built by a worker and delivered
+# as a download link in a notification
+EXPORT_BACKGROUND_THRESHOLD = env.int("EXPORT_BACKGROUND_THRESHOLD", default=10000)
+# Background exports hold personal data: they are stored outside MEDIA_ROOT,
+# served only to the requesting user and deleted by cleanup_exports after the
+# retention period
+EXPORT_ROOT = env("EXPORT_ROOT", default=str(BASE_DIR / "private" / "exports"))
+EXPORT_RETENTION_HOURS = env.int("EXPORT_RETENTION_HOURS", default=24)
+
+# Real-time dashboard metrics are computed once per interval and broadcast
+DASHBOARD_METRICS_INTERVAL_SECONDS = env.int("DASHBOARD_METRICS_INTERVAL_SECONDS", default=60)
+
+# Attendance session statistics are recounted once per interval to repair
+# drift from writes that bypass the model
+ATTENDANCE_RECONCILE_INTERVAL_SECONDS = env.int("ATTENDANCE_RECONCILE_INTERVAL_SECONDS", default=24 * 60 * 60)
+
+# POLICIES
+# ------------------------------------------------------------------------------
+# Share of ALLOW policy evaluations logged; denials are always logged
+POLICY_EVALUATION_LOG_SAMPLE_RATE = env.float("POLICY_EVALUATION_LOG_SAMPLE_RATE", default=0.1)
+
+# GRAPHQL
+# ------------------------------------------------------------------------------
+# Static query limits enforced before execution (see apps/common/graphql_cost.py)
+GRAPHQL_MAX_QUERY_DEPTH = env.int("GRAPHQL_MAX_QUERY_DEPTH", default=10)
+GRAPHQL_MAX_QUERY_COST = env.int("GRAPHQL_MAX_QUERY_COST", default=5000)
+# Total cost each user may spend per window
+GRAPHQL_USER_COST_BUDGET = env.int("GRAPHQL_USER_COST_BUDGET", default=50000)
+GRAPHQL_COST_BUDGET_WINDOW_SECONDS = env.int("GRAPHQL_COST_BUDGET_WINDOW_SECONDS", default=60)
+
 # CACHING
 # ------------------------------------------------------------------------------
 # https://docs.djangoproject.com/en/dev/ref/settings/#caches
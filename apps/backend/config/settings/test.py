@@ -31,6 +31,11 @@ TEMPLATES[0]["OPTIONS"]["debug"] = True  # type: ignore[index]
 # ------------------------------------------------------------------------------
 # https://docs.djangoproject.com/en/dev/ref/settings/#media-url
 MEDIA_URL = "http://media.testserver/"
+# CHANNELS
+# ------------------------------------------------------------------------------
+# Subscription publishers are connected at startup; keep their events in-process.
+CHANNEL_LAYERS = {"default": {"BACKEND": "channels.layers.InMemoryChannelLayer"}}
+
 # DISABLE DEBUG TOOLBAR FOR TESTING
 # ------------------------------------------------------------------------------
 # Remove debug toolbar to avoid template errors in test environment
@@ -19,19 +19,33 @@ sys.path.insert(0, str(Path(__file__).parent))
 # Configure Django settings for testing
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings.test")
 
+# Tests run on in-memory SQLite unless TEST_DATABASE_URL names another database,
+# which PostgreSQL-only tests (e.g. log partitioning) need.
+TEST_DATABASE_URL = os.environ.get("TEST_DATABASE_URL")
+
+
+def _test_database():
+    if TEST_DATABASE_URL:
+        import environ
+
+        return environ.Env.db_url_config(TEST_DATABASE_URL)
+    return {"ENGINE": "django.db.backends.sqlite3", "NAME": ":memory:"}
+
 
 def pytest_configure(config):
     """Configure pytest with Django settings."""
     import django
 
     # Override settings for testing
-    settings.DATABASES["default"] = {
-        "ENGINE": "django.db.backends.sqlite3",
-        "NAME": ":memory:",
-        "TEST": {
-            "NAME": ":memory:",
-        },
-    }
+    settings.DATABASES["default"] = _test_database()
+    if TEST_DATABASE_URL:
+        from django.db import connections
+
+        # The default connection may already exist for the settings database
+        connections.configure_settings(settings.DATABASES)
+        connections["default"] = connections.create_connection("default")
+    else:
+        settings.DATABASES["default"]["TEST"] = {"NAME": ":memory:"}
 
     # Disable migrations for speed
     settings.MIGRATION_MODULES = {app: None for app in settings.INSTALLED_APPS if app.startswith("apps.")}
@@ -61,13 +75,17 @@ def pytest_configure(config):
 
 
 @pytest.fixture(scope="session")
-def django_db_setup():
-    """Override django_db_setup to use SQLite in-memory database for all tests."""
+def django_db_setup(django_db_setup):
+    """Override django_db_setup to use SQLite in-memory database unless TEST_DATABASE_URL is set.
 
-    settings.DATABASES["default"] = {
-        "ENGINE": "django.db.backends.sqlite3",
-        "NAME": ":memory:",
-    }
+    Chains to pytest-django's fixture so the test tables are still created.
+    """
+
+    if not TEST_DATABASE_URL:
+        settings.DATABASES["default"] = {
+            "ENGINE": "django.db.backends.sqlite3",
+            "NAME": ":memory:",
+        }
 
 
 @pytest.fixture
@@ -1,109 +0,0 @@
-"""Real-time GraphQL subscriptions."""
-
-import strawberry
-from typing import AsyncGenerator
-import asyncio
-
-from ..types.academic import GradeType
-from ..types.analytics import DashboardMetrics
-from ..types.finance import PaymentType
-
-
-@strawberry.type
-class GradeUpdateNotification:
-    """Grade update notification for real-time collaboration."""
-    student_id: strawberry.ID
-    assignment_id: strawberry.ID
-    new_score: float
-    updated_by: str
-    timestamp: strawberry.datetime.datetime
-    conflict: bool = False
-
-
-@strawberry.type
-class DashboardUpdate:
-    """Dashboard metrics update notification."""
-    metrics: DashboardMetrics
-    updated_fields: list[str]
-    timestamp: strawberry.datetime.datetime
-
-
-@strawberry.type
-class RealTimeSubscriptions:
-    """Real-time GraphQL subscriptions."""
-
-    @strawberry.subscription
-    async def grade_entry_updates(
-        self,
-        info,
-        class_id: strawberry.ID
-    ) -> AsyncGenerator[GradeUpdateNotification, None]:
-        """Subscribe to real-time grade entry updates for collaborative editing."""
-
-        # Mock subscription - in production this would connect to Redis or WebSocket
-        while True:
-            await asyncio.sleep(5)  # Wait 5 seconds between updates
-
-            import uuid
-            from datetime import datetime
-
-            # Mock grade update notification
-            yield GradeUpdateNotification(
-                student_id=str(uuid.uuid4()),
-                assignment_id=str(uuid.uuid4()),
-                new_score=85.5,
-                updated_by="teacher@example.com",
-                timestamp=datetime.now(),
-                conflict=False
-            )
-
-    @strawberry.subscription
-    async def dashboard_metrics_updates(
-        self,
-        info
-    ) -> AsyncGenerator[DashboardUpdate, None]:
-        """Subscribe to real-time dashboard metrics updates."""
-
-        while True:
-            await asyncio.sleep(30)  # Update every 30 seconds
-
-            # Mock dashboard update
-            from ..queries.dashboard import DashboardQueries
-            dashboard_queries = DashboardQueries()
-
-            # Get fresh metrics
-            metrics = dashboard_queries.dashboard_metrics(info, 30)
-
-            yield DashboardUpdate(
-                metrics=metrics,
-                updated_fields=["student_metrics", "financial_metrics"],
-                timestamp=strawberry.datetime.datetime.now()
-            )
-
-    @strawberry.subscription
-    async def payment_notifications(
-        self,
-        info,
-        student_id: strawberry.ID
-    ) -> AsyncGenerator[PaymentType, None]:
-        """Subscribe to payment notifications for a student."""
-
-        while True:
-            await asyncio.sleep(60)  # Check every minute
-
-            # Mock payment notification
-            from ..types.finance import CurrencyType
-
-            yield PaymentType(
-                unique_id=str(strawberry.ID("mock-payment")),
-                amount="100.00",
-                currency=CurrencyType(
-                    code="USD",
-                    name="US Dollar",
-                    symbol="$"
-                ),
-                payment_method="credit_card",
-                status="completed",
-                payment_date=strawberry.datetime.datetime.now(),
-                notes="Mock payment notification"
-            )
\ No newline at end of file
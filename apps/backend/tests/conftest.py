@@ -20,8 +20,8 @@ os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings.test")
 
 # Database fixtures
 @pytest.fixture(scope="session")
-def django_db_setup():
-    """Set up test database with basic fixtures."""
+def django_db_setup(django_db_setup):
+    """Set up test database with basic fixtures, after pytest-django creates the tables."""
     settings.DATABASES["default"] = {
         "ENGINE": "django.db.backends.sqlite3",
         "NAME": ":memory:",
@@ -0,0 +1,119 @@
+"""
+Query-count regression tests for nested GraphQL student queries.
+
+Nested fields are resolved through per-request loaders, so listing a page
+of students with enrollments, grades, invoices and payments must issue a
+fixed number of statements no matter how many students are on the page.
+"""
+
+from datetime import date
+from decimal import Decimal
+
+import pytest
+import strawberry
+from django.utils import timezone
+
+from api.graphql.queries.student import StudentQueries
+from apps.curriculum.models import Course, Cycle, Division, Term
+from apps.enrollment.models import ClassHeaderEnrollment
+from apps.finance.models import Invoice, Payment
+from apps.people.models import Person, StudentProfile
+from apps.scheduling.models import ClassHeader
+
+schema = strawberry.Schema(query=StudentQueries)
+
+STUDENT_PAGE_QUERY = """
+query StudentPage($first: Int!) {
+    students(pagination: {first: $first}) {
+        totalCount
+        edges {
+            node {
+                studentId
+                person { fullName }
+                enrollmentCount
+                enrollments {
+                    courseCode
+                    term
+                    grades { letterGrade score }
+                }
+                invoices { invoiceNumber status }
+                payments { amount method }
+            }
+        }
+    }
+}
+"""
+
+# students, count, enrollments, class headers, grades, invoices, payments
+QUERY_BUDGET = 7
+
+
+@pytest.fixture
+def student_page(db, user):
+    """Create students, each with enrollments, an invoice and a payment."""
+    term = Term.objects.create(
+        code="FALL24", term_type=Term.TermType.BACHELORS, start_date="2024-09-01", end_date="2024-12-15"
+    )
+    cycle = Cycle.objects.create(division=Division.objects.create(name="Academic"), name="Bachelor")
+    class_headers = [
+        ClassHeader.objects.create(
+            course=Course.objects.create(code=f"ENG-10{number}", title="English", short_title="ENG", cycle=cycle),
+            term=term,
+            section_id="A",
+        )
+        for number in range(3)
+    ]
+
+    def create(count):
+        students = []
+        for number in range(count):
+            person = Person.objects.create(
+                personal_name=f"Student{number}", family_name="Test", date_of_birth="2000-01-01"
+            )
+            student = StudentProfile.objects.create(person=person, student_id=20000 + number)
+            for class_header in class_headers[:2]:
+                ClassHeaderEnrollment.objects.create(
+                    student=student, class_header=class_header, status="ENROLLED", enrolled_by=user
+                )
+            invoice = Invoice.objects.create(
+                student=student,
+                term=term,
+                invoice_number=f"INV-{number:04d}",
+                due_date=date(2024, 9, 30),
+                status="SENT",
+                subtotal=Decimal("100.00"),
+                total_amount=Decimal("100.00"),
+            )
+            Payment.objects.create(
+                invoice=invoice,
+                payment_reference=f"PAY-{number:04d}",
+                amount=Decimal("40.00"),
+                payment_date=timezone.now(),
+                payment_method="CASH",
+                processed_by=user,
+            )
+            students.append(student)
+        return students
+
+    return create
+
+
+@pytest.mark.django_db
+@pytest.mark.performance
+class TestStudentPageQueryBudget:
+    """Nested student list queries stay within a fixed statement budget."""
+
+    @pytest.mark.parametrize("page_size", [5, 50])
+    def test_nested_student_page(self, student_page, django_assert_max_num_queries, page_size):
+        student_page(page_size)
+
+        with django_assert_max_num_queries(QUERY_BUDGET):
+            result = schema.execute_sync(STUDENT_PAGE_QUERY, variable_values={"first": page_size}, context_value={})
+
+        assert result.errors is None
+        edges = result.data["students"]["edges"]
+        assert len(edges) == page_size
+        for edge in edges:
+            assert edge["node"]["enrollmentCount"] == 2
+            assert len(edge["node"]["invoices"]) == 1
+            assert len(edge["node"]["payments"]) == 1
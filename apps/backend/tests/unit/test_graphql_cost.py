@@ -0,0 +1,223 @@
+"""
+Unit tests for GraphQL static query cost analysis and per-user budgets.
+"""
+
+import functools
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Annotated
+
+import pytest
+import strawberry
+from django.core.cache import cache
+from graphql import parse
+
+from apps.common import graphql_cost
+from apps.common.graphql_cost import DEFAULT_LIST_SIZE, FIELD_COSTS, MAX_LIST_SIZE, CostEstimator, charge_budget
+
+LOCMEM_CACHE = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+
+@strawberry.type
+class Grade:
+    letter: str
+
+
+@strawberry.type
+class Enrollment:
+    code: str
+
+    @strawberry.field
+    def grades(self) -> list[Grade]:
+        return []
+
+
+@strawberry.type
+class Student:
+    name: str
+
+    @strawberry.field
+    def enrollments(self, limit: int = 10) -> list[Enrollment]:
+        return []
+
+
+@strawberry.type
+class StudentEdge:
+    node: Student
+
+
+@strawberry.type
+class StudentConnection:
+    edges: list[StudentEdge]
+    total_count: int
+
+
+@strawberry.interface
+class Member:
+    name: str
+
+
+@strawberry.type
+class Staff(Member):
+    @strawberry.field
+    def students(self, limit: int = 10) -> list[Student]:
+        return []
+
+
+@strawberry.type
+class Guest(Member):
+    pass
+
+
+SearchResult = Annotated[Staff | Grade, strawberry.union("SearchResult")]
+
+
+@strawberry.input
+class Page:
+    first: int | None = 25
+
+
+@strawberry.type
+class Query:
+    @strawberry.field
+    def students(self, pagination: Page | None = None) -> StudentConnection:
+        return StudentConnection(edges=[], total_count=0)
+
+    @strawberry.field
+    def tags(self) -> list[str]:
+        return []
+
+    @strawberry.field
+    def member(self) -> Member:
+        return Guest(name="")
+
+    @strawberry.field
+    def search(self) -> SearchResult:
+        return Grade(letter="")
+
+
+SCHEMA = strawberry.Schema(query=Query, types=[Staff, Guest])._schema
+
+
+def estimate(query: str, variables: dict | None = None) -> int:
+    return CostEstimator(SCHEMA, parse(query), variables).estimate().cost
+
+
+# Weighted root field plus its edges list; each edge below costs its node (1)
+STUDENTS = FIELD_COSTS["Query.students"] + 1
+
+
+@pytest.mark.unit
+class TestCostEstimator:
+    """Test static cost computation."""
+
+    def test_scalars_are_free(self):
+        assert estimate("{ tags }") == 0
+
+    def test_connection_pages_edges_by_pagination_argument(self):
+        assert estimate("{ students(pagination: {first: 10}) { edges { node { name } } } }") == STUDENTS + 10
+
+    def test_pagination_from_variables(self):
+        query = "query($n: Int) { students(pagination: {first: $n}) { edges { node { name } } } }"
+
+        assert estimate(query, {"n": 5}) == STUDENTS + 5
+
+    def test_input_default_is_used_when_argument_omitted(self):
+        assert estimate("{ students { edges { node { name } } } }") == STUDENTS + DEFAULT_LIST_SIZE
+
+    def test_nested_lists_multiply(self):
+        query = """
+        { students(pagination: {first: 2}) { edges { node {
+            enrollments(limit: 3) { grades { letter } }
+        } } } }
+        """
+        grades = 1  # scalar children are free
+        enrollments = 1 + 3 * grades
+        node = 1 + enrollments
+
+        assert estimate(query) == STUDENTS + 2 * node
+
+    def test_page_size_is_capped(self):
+        capped = estimate("{ students(pagination: {first: 100000}) { edges { node { name } } } }")
+
+        assert capped == STUDENTS + MAX_LIST_SIZE
+
+    def test_fragments_are_costed(self):
+        query = """
+        { students(pagination: {first: 4}) { edges { ...EdgeFields } } }
+        fragment EdgeFields on StudentEdge { node { name } }
+        """
+
+        assert estimate(query) == STUDENTS + 4
+
+    def test_interface_fields_cost_the_most_expensive_implementation(self, monkeypatch):
+        monkeypatch.setitem(FIELD_COSTS, "Staff.name", 7)
+
+        assert estimate("{ member { name } }") == 1 + 7
+
+    def test_fragments_on_implementations_are_costed(self):
+        # each student costs its enrollments list (1); their scalar children are free
+        students = 1 + 4 * 1
+
+        assert estimate("{ member { ... on Staff { students(limit: 4) { enrollments { code } } } } }") == 1 + students
+
+    def test_union_costs_the_most_expensive_member(self):
+        query = """
+        { search {
+            ... on Grade { letter }
+            ...StaffFields
+        } }
+        fragment StaffFields on Staff { students(limit: 4) { enrollments { code } } }
+        """
+
+        assert estimate(query) == 1 + (1 + 4 * 1)
+
+
+@pytest.mark.unit
+class TestChargeBudget:
+    """Test per-user budget accounting."""
+
+    @pytest.fixture(autouse=True)
+    def locmem_cache(self, settings):
+        settings.CACHES = LOCMEM_CACHE
+        cache.clear()
+
+    def test_charges_until_budget_is_spent(self):
+        assert charge_budget("user:1", 60, 100, 60) == (True, 40)
+        assert charge_budget("user:1", 50, 100, 60) == (False, 40)
+        assert charge_budget("user:1", 40, 100, 60) == (True, 0)
+
+    def test_budgets_are_per_user(self):
+        charge_budget("user:1", 100, 100, 60)
+
+        assert charge_budget("user:2", 100, 100, 60) == (True, 0)
+
+    def test_concurrent_charges_cannot_overspend(self):
+        start = threading.Barrier(10)
+
+        def charge(_):
+            start.wait()
+            return charge_budget("user:1", 30, 100, 60)[0]
+
+        with ThreadPoolExecutor(max_workers=10) as pool:
+            accepted = list(pool.map(charge, range(10)))
+
+        assert accepted.count(True) == 3
+        # Rejected charges were refunded, so the remainder can still be spent
+        assert charge_budget("user:1", 10, 100, 60) == (True, 0)
+
+
+@pytest.mark.unit
+class TestMetrics:
+    """Prometheus is a production-only dependency."""
+
+    def test_recording_is_a_noop_without_prometheus(self, monkeypatch):
+        monkeypatch.setitem(sys.modules, "prometheus_client", None)
+        # A fresh cache, so metrics already registered in this process are left alone
+        monkeypatch.setattr(graphql_cost, "_get_metrics", functools.cache(graphql_cost._get_metrics.__wrapped__))
+
+        graphql_cost.record_cost("query", 10)
+        graphql_cost.record_rejection("budget")
+
+        assert graphql_cost._get_metrics() is None